@@ -71,14 +71,10 @@ def _print_summary(filepath: str) -> None:
         print(f"\nNode tree root: \"{sco.root_node.name}\"")
 
         # Count by type
-        type_counts: dict = {}
-        wp_count = 0
-        from .mcp_server import _walk_tree
-        for node, path, depth in _walk_tree(sco.root_node, max_depth=-1):
-            tn = node.node_type_name()
-            type_counts[tn] = type_counts.get(tn, 0) + 1
-            if node.waypoint:
-                wp_count += 1
+        from .index import ScoIndex
+        index = ScoIndex(sco)
+        type_counts = {tn: len(nodes) for tn, nodes in index.by_type.items()}
+        wp_count = len(index.waypoints)
 
         print(f"  Node types:")
         for tn, count in sorted(type_counts.items(), key=lambda x: -x[1]):
@@ -0,0 +1,205 @@
+"""Lookup indexes over the node tree of a parsed .sco file."""
+
+import os
+import re
+import fnmatch
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import chain
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+from .models import ScoFile, SceneNode, WaypointTable, node_type_name
+from .spatial import KDTree
+from .navigation import NavGraph
+
+_WILDCARD = re.compile(r'[*?\[]')
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> Callable:
+    return re.compile(fnmatch.translate(pattern)).match
+
+
+def _flatten(root: Optional[SceneNode]):
+    """Nodes of a tree in preorder and, for each, the index after its subtree."""
+    nodes: List[SceneNode] = []
+    ends: List[int] = []
+    if root is None:
+        return nodes, ends
+    # (node, index) pairs; index is None on the way down
+    stack = [(root, None)]
+    while stack:
+        node, index = stack.pop()
+        if index is not None:
+            ends[index] = len(nodes)
+            continue
+        stack.append((node, len(nodes)))
+        nodes.append(node)
+        ends.append(0)
+        stack.extend((child, None) for child in reversed(node.children))
+    return nodes, ends
+
+
+class ScoIndex:
+    """Node lookup tables of a ScoFile, built once per opened file.
+
+    Nodes are numbered in tree preorder (node 0 is the root), the order the
+    MCP tools report them in, so merged index lists are sorted back into
+    that order. A lazily parsed file is indexed from its NodeTable without
+    decoding any node; an eagerly parsed tree is flattened first.
+
+    - paths[i]: tree path of node i ("/root/child"); by_path maps a path
+      to the first node with that path
+    - by_name: name -> nodes; names are compared as fnmatch compares them
+      (os.path.normcase), and kept sorted for prefix search
+    - by_type: type name -> nodes
+    - positioned / coords: positioned nodes and their x, y, z;
+      positioned_by_type holds positions (indexes into positioned) by type
+    - waypoint_table: waypoint data (WaypointTable); waypoints: its nodes
+    - spatial(): KD-trees over the positioned nodes, built on first use
+    - navigation(): the waypoint graph, built on first use
+    """
+
+    def __init__(self, sco: ScoFile):
+        table = sco.nodes
+        if table is not None:
+            self.node: Callable[[int], SceneNode] = table.node
+            names, types, self.ends = table.names, table.types, table.ends
+            self.positioned, self.coords = table.positioned()
+            self.waypoint_table = table.waypoint_table()
+        else:
+            nodes, self.ends = _flatten(sco.root_node)
+            self.node = nodes.__getitem__
+            names = [node.name for node in nodes]
+            types = [node.node_type for node in nodes]
+            self.positioned, self.coords = array('I'), array('d')
+            for i, node in enumerate(nodes):
+                pos = node.position
+                if pos is not None:
+                    self.positioned.append(i)
+                    self.coords.extend(pos)
+            self.waypoint_table = WaypointTable.build(
+                (i, node.waypoint) for i, node in enumerate(nodes) if node.waypoint is not None)
+
+        self.names: Sequence[str] = names
+        self.types: Sequence[int] = types
+        self.paths: List[str] = []
+        self.by_path: Dict[str, int] = {}
+        self.by_name: Dict[str, List[int]] = {}
+        self.by_type: Dict[str, List[int]] = {}
+        self.positioned_by_type: Dict[str, List[int]] = {}
+        self.waypoints: Sequence[int] = self.waypoint_table.nodes
+        self._trees: Dict[Optional[tuple], KDTree] = {}
+        self._navigation: Optional[NavGraph] = None
+
+        normcase = os.path.normcase
+        ends = self.ends
+        paths = self.paths
+        stack: List[int] = []
+        for i, name in enumerate(names):
+            while stack and i >= ends[stack[-1]]:
+                stack.pop()
+            path = f"{paths[stack[-1]]}/{name}" if stack else "/" + name
+            paths.append(path)
+            stack.append(i)
+            self.by_path.setdefault(path, i)
+            self.by_name.setdefault(normcase(name), []).append(i)
+            self.by_type.setdefault(node_type_name(types[i]), []).append(i)
+        for slot, i in enumerate(self.positioned):
+            self.positioned_by_type.setdefault(node_type_name(types[i]), []).append(slot)
+        self._sorted_names = sorted(self.by_name)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def children(self, index: int) -> Iterator[int]:
+        """Indexes of the children of node index."""
+        child = index + 1
+        end = self.ends[index]
+        while child < end:
+            yield child
+            child = self.ends[child]
+
+    def type_name(self, index: int) -> str:
+        return node_type_name(self.types[index])
+
+    @staticmethod
+    def _type_groups(groups: Dict[str, List[int]], node_type: str) -> List[int]:
+        """Merged groups whose type name contains node_type (case-insensitive)."""
+        needle = node_type.lower()
+        selected = [group for type_name, group in groups.items() if needle in type_name.lower()]
+        if len(selected) == 1:
+            return selected[0]
+        return sorted(chain.from_iterable(selected))
+
+    def of_type(self, node_type: Optional[str]) -> List[int]:
+        """Nodes whose type name contains node_type (all nodes if empty)."""
+        if not node_type:
+            return list(range(len(self)))
+        return self._type_groups(self.by_type, node_type)
+
+    def find(self, name_pattern: str, node_type: Optional[str] = None) -> List[int]:
+        """Nodes whose name matches a glob pattern, optionally of a type (see of_type)."""
+        pattern = os.path.normcase(name_pattern)
+        wildcard = _WILDCARD.search(pattern)
+        if wildcard is None:
+            found = self.by_name.get(pattern, [])
+        elif node_type and wildcard.start() == 0:
+            # No literal prefix to narrow the names: scan the type instead
+            match = _compile_pattern(pattern)
+            normcase = os.path.normcase
+            return [i for i in self.of_type(node_type) if match(normcase(self.names[i]))]
+        else:
+            prefix = pattern[:wildcard.start()]
+            match = _compile_pattern(pattern)
+            names = self._sorted_names
+            groups = []
+            for k in range(bisect_left(names, prefix), len(names)):
+                name = names[k]
+                if not name.startswith(prefix):
+                    break
+                if match(name):
+                    groups.append(self.by_name[name])
+            found = groups[0] if len(groups) == 1 else sorted(chain.from_iterable(groups))
+        if node_type:
+            needle = node_type.lower()
+            found = [i for i in found if needle in self.type_name(i).lower()]
+        return found
+
+    def positions(self, node_type: Optional[str] = None) -> Iterator[tuple]:
+        """(node, x, y, z) of positioned nodes, optionally of a type (see of_type)."""
+        if node_type:
+            slots = self._type_groups(self.positioned_by_type, node_type)
+        else:
+            slots = range(len(self.positioned))
+        coords = self.coords
+        for slot in slots:
+            yield (self.positioned[slot], coords[3 * slot], coords[3 * slot + 1], coords[3 * slot + 2])
+
+    def position(self, index: int) -> Optional[tuple]:
+        """(x, y, z) of node index, or None if it has no position."""
+        slot = bisect_left(self.positioned, index)
+        if slot == len(self.positioned) or self.positioned[slot] != index:
+            return None
+        return tuple(self.coords[3 * slot:3 * slot + 3])
+
+    def spatial(self, node_type: Optional[str] = None) -> KDTree:
+        """KD-tree over the positioned nodes, optionally of a type (see of_type).
+
+        Point IDs are node indexes. Trees are cached per set of matching types.
+        """
+        key = None
+        if node_type:
+            needle = node_type.lower()
+            key = tuple(t for t in self.positioned_by_type if needle in t.lower())
+        tree = self._trees.get(key)
+        if tree is None:
+            tree = self._trees[key] = KDTree(self.positions(node_type))
+        return tree
+
+    def navigation(self) -> NavGraph:
+        """Navigation graph of the waypoints (built on first use)."""
+        if self._navigation is None:
+            self._navigation = NavGraph(self)
+        return self._navigation
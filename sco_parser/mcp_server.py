@@ -1,17 +1,21 @@
 """MCP server for interactive .sco file querying."""
 
 import os
-import fnmatch
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Union
 from mcp.server.fastmcp import FastMCP
 
 from .parser import parse_sco
 from .models import ScoFile, SceneNode
+from .index import ScoIndex
+from .navigation import NavGraph
+from .snapshot import default_snapshot_dir
 
 mcp = FastMCP("sco-parser", instructions="Vietcong .sco scene file parser. Use sco_open to load a file, then query nodes, waypoints, entities, and metadata.")
 
 # Loaded files keyed by handle (basename without extension)
 _files: Dict[str, ScoFile] = {}
+# Node indexes of the loaded files, built by sco_open
+_indexes: Dict[str, ScoIndex] = {}
 
 
 def _get_file(handle: str) -> ScoFile:
@@ -20,6 +24,11 @@ def _get_file(handle: str) -> ScoFile:
     return _files[handle]
 
 
+def _get_index(handle: str) -> ScoIndex:
+    _get_file(handle)
+    return _indexes[handle]
+
+
 def _make_handle(path: str) -> str:
     base = os.path.basename(path)
     name = os.path.splitext(base)[0].lower()
@@ -47,26 +56,24 @@ def _node_summary(node: SceneNode, path: str = "") -> dict:
     }
 
 
-def _walk_tree(node: SceneNode, path: str = "", max_depth: int = -1, depth: int = 0):
-    """Yield (node, path, depth) for all nodes."""
-    current_path = path + "/" + node.name if path else "/" + node.name
-    yield node, current_path, depth
-    if max_depth >= 0 and depth >= max_depth:
-        return
-    for child in node.children:
-        yield from _walk_tree(child, current_path, max_depth, depth + 1)
-
-
 @mcp.tool()
-def sco_open(path: str) -> dict:
+def sco_open(path: str, use_cache: bool = True) -> dict:
     """Open and parse a .sco file. Returns handle, header summary, and counts.
 
+    The node tree is parsed lazily: node data is decoded when a query first
+    touches the node. The scanned tree is kept in a snapshot cache
+    (~/.cache/sco_parser or $SCO_CACHE_DIR), so reopening an unchanged file
+    skips the scan.
+
     Args:
         path: Absolute or relative path to the .sco file
+        use_cache: False to scan the file without reading or writing a snapshot
     """
-    sco = parse_sco(path)
+    snapshot_dir = str(default_snapshot_dir()) if use_cache else None
+    sco = parse_sco(path, lazy=True, snapshot_dir=snapshot_dir)
     handle = _make_handle(path)
     _files[handle] = sco
+    _indexes[handle] = ScoIndex(sco)
 
     h = sco.header
     result = {
@@ -98,7 +105,8 @@ def sco_close(handle: str) -> dict:
         handle: Handle returned by sco_open
     """
     if handle in _files:
-        del _files[handle]
+        del _indexes[handle]
+        _files.pop(handle).close()
         return {"status": "ok", "handle": handle}
     return {"status": "not_found", "handle": handle}
 
@@ -164,19 +172,9 @@ def sco_find_nodes(handle: str, name_pattern: str, node_type: Optional[str] = No
         name_pattern: Glob pattern to match node names (e.g., "USSpawn*", "WayPoint*")
         node_type: Optional type filter (e.g., "Dummy", "Event", "Mesh")
     """
-    sco = _get_file(handle)
-    if not sco.root_node:
-        return []
-
-    results = []
-    for node, path, depth in _walk_tree(sco.root_node):
-        if not fnmatch.fnmatch(node.name, name_pattern):
-            continue
-        if node_type and node_type.lower() not in node.node_type_name().lower():
-            continue
-        results.append(_node_summary(node, path))
-
-    return results
+    index = _get_index(handle)
+    return [_node_summary(index.node(i), index.paths[i])
+            for i in index.find(name_pattern, node_type)]
 
 
 @mcp.tool()
@@ -191,15 +189,11 @@ def sco_node_detail(handle: str, node_path: str) -> dict:
     if not sco.root_node:
         return {"error": "No node tree parsed"}
 
-    # Find node by path
-    target = None
-    for node, path, depth in _walk_tree(sco.root_node, max_depth=-1):
-        if path == node_path:
-            target = node
-            break
-
-    if not target:
+    index = _indexes[handle]
+    node_index = index.by_path.get(node_path)
+    if node_index is None:
         return {"error": f"Node not found at path: {node_path}"}
+    target = index.node(node_index)
 
     result = _node_summary(target, node_path)
     result["node_version"] = target.node_version
@@ -290,26 +284,25 @@ def sco_waypoints(handle: str) -> dict:
     if not sco.root_node:
         return {"error": "No node tree parsed"}
 
+    index = _indexes[handle]
     nodes = []
     edges = []
-    id_to_name = {}
-
-    for node, path, depth in _walk_tree(sco.root_node, max_depth=-1):
-        if node.waypoint:
-            wp = node.waypoint
-            pos = node.position
-            id_to_name[wp.wp_id] = node.name
-            entry = {
-                "wp_id": wp.wp_id,
-                "name": node.name,
-                "position": [round(p, 2) for p in pos] if pos else None,
-                "wp_param": wp.wp_param,
-                "connections": wp.connections,
-                "path": path,
-            }
-            nodes.append(entry)
-            for conn in wp.connections:
-                edges.append([wp.wp_id, conn])
+
+    for i in index.waypoints:
+        node = index.node(i)
+        wp = node.waypoint
+        pos = node.position
+        entry = {
+            "wp_id": wp.wp_id,
+            "name": node.name,
+            "position": [round(p, 2) for p in pos] if pos else None,
+            "wp_param": wp.wp_param,
+            "connections": wp.connections,
+            "path": index.paths[i],
+        }
+        nodes.append(entry)
+        for conn in wp.connections:
+            edges.append([wp.wp_id, conn])
 
     return {
         "waypoint_count": len(nodes),
@@ -387,25 +380,260 @@ def sco_positions(handle: str, node_type: Optional[str] = None) -> list:
         handle: Handle returned by sco_open
         node_type: Optional type filter (e.g., "Dummy", "Event", "Mesh", "Player")
     """
-    sco = _get_file(handle)
-    if not sco.root_node:
-        return []
+    index = _get_index(handle)
+    return [{
+        "name": index.names[i],
+        "type": index.type_name(i),
+        "x": round(x, 2),
+        "y": round(y, 2),
+        "z": round(z, 2),
+        "path": index.paths[i],
+    } for i, x, y, z in index.positions(node_type)]
+
+
+def _spatial_entry(index: ScoIndex, node_index: int, distance: float) -> dict:
+    x, y, z = index.position(node_index)
+    return {
+        "name": index.names[node_index],
+        "type": index.type_name(node_index),
+        "x": round(x, 2),
+        "y": round(y, 2),
+        "z": round(z, 2),
+        "path": index.paths[node_index],
+        "distance": round(distance, 2),
+    }
 
-    results = []
-    for node, path, depth in _walk_tree(sco.root_node, max_depth=-1):
-        pos = node.position
-        if pos is None:
-            continue
-        type_name = node.node_type_name()
-        if node_type and node_type.lower() not in type_name.lower():
-            continue
-        results.append({
-            "name": node.name,
-            "type": type_name,
-            "x": round(pos[0], 2),
-            "y": round(pos[1], 2),
-            "z": round(pos[2], 2),
-            "path": path,
-        })
-
-    return results
+
+@mcp.tool()
+def sco_nearest(handle: str, x: float, y: float, z: float, k: int = 5,
+                node_type: Optional[str] = None) -> list:
+    """Find the k positioned nodes nearest to a point, nearest first.
+
+    Args:
+        handle: Handle returned by sco_open
+        x: Query point X
+        y: Query point Y
+        z: Query point Z
+        k: Number of nodes to return (default 5)
+        node_type: Optional type filter (e.g., "Dummy", "Event", "Mesh", "Player")
+    """
+    index = _get_index(handle)
+    return [_spatial_entry(index, i, d) for d, i in index.spatial(node_type).nearest(x, y, z, k)]
+
+
+@mcp.tool()
+def sco_within_radius(handle: str, x: float, y: float, z: float, radius: float,
+                      node_type: Optional[str] = None, limit: int = 100) -> dict:
+    """Find positioned nodes within a radius of a point, nearest first.
+
+    Args:
+        handle: Handle returned by sco_open
+        x: Query point X
+        y: Query point Y
+        z: Query point Z
+        radius: Search radius in world units
+        node_type: Optional type filter (e.g., "Dummy", "Event", "Mesh", "Player")
+        limit: Maximum number of nodes to return (default 100). Use -1 for unlimited.
+
+    Returns:
+        count (all nodes in the radius) and nodes (the nearest `limit` of them).
+    """
+    index = _get_index(handle)
+    hits = index.spatial(node_type).within(x, y, z, radius)
+    shown = hits[:limit] if limit >= 0 else hits
+    return {
+        "count": len(hits),
+        "nodes": [_spatial_entry(index, i, d) for d, i in shown],
+    }
+
+
+@mcp.tool()
+def sco_nearest_many(handle: str, points: List[List[float]], k: int = 1,
+                     node_type: Optional[str] = None) -> Union[list, dict]:
+    """Batched sco_nearest: the k nearest positioned nodes for each point.
+
+    Args:
+        handle: Handle returned by sco_open
+        points: Query points as [x, y, z] lists
+        k: Number of nodes per point (default 1)
+        node_type: Optional type filter (e.g., "Dummy", "Event", "Mesh", "Player")
+
+    Returns:
+        One list of nodes (as sco_nearest) per query point, in order.
+    """
+    index = _get_index(handle)
+    for n, point in enumerate(points):
+        if (not isinstance(point, (list, tuple)) or len(point) != 3
+                or not all(isinstance(c, (int, float)) and not isinstance(c, bool) for c in point)):
+            return {"error": f"Point {n} is not an [x, y, z] list: {point!r}"}
+    tree = index.spatial(node_type)
+    return [[_spatial_entry(index, i, d) for d, i in tree.nearest(x, y, z, k)]
+            for x, y, z in points]
+
+
+def _waypoint_vertex(index: ScoIndex, graph: NavGraph, waypoint: str) -> int:
+    """Graph vertex of a waypoint given by tree path or name (first match)."""
+    if waypoint.startswith("/"):
+        nodes = [index.by_path[waypoint]] if waypoint in index.by_path else []
+    else:
+        nodes = index.find(waypoint)
+    for node in nodes:
+        if node in graph.vertex_of_node:
+            return graph.vertex_of_node[node]
+    raise ValueError(f"No waypoint node matches '{waypoint}'")
+
+
+def _waypoint_name(index: ScoIndex, graph: NavGraph, vertex: int) -> str:
+    return index.names[graph.nodes[vertex]]
+
+
+def _round_distance(distance: float) -> Optional[float]:
+    return round(distance, 2) if distance != float("inf") else None
+
+
+@mcp.tool()
+def sco_nav_route(handle: str, start: str, goal: str) -> dict:
+    """Shortest route between two waypoints along their connections.
+
+    Edge lengths are straight-line distances between the waypoints.
+
+    Args:
+        handle: Handle returned by sco_open
+        start: Waypoint node name (e.g., "WayPoint12") or tree path
+        goal: Waypoint node name or tree path
+    """
+    index = _get_index(handle)
+    graph = index.navigation()
+    try:
+        source = _waypoint_vertex(index, graph, start)
+        target = _waypoint_vertex(index, graph, goal)
+    except ValueError as e:
+        return {"error": str(e)}
+
+    result = {"start": _waypoint_name(index, graph, source),
+              "goal": _waypoint_name(index, graph, target)}
+    found = graph.route(source, target)
+    if found is None:
+        result["reachable"] = False
+        return result
+    distance, vertices = found
+    result.update({
+        "reachable": True,
+        "distance": round(distance, 2),
+        "hops": len(vertices) - 1,
+        "route": [_waypoint_name(index, graph, v) for v in vertices],
+        "wp_ids": [graph.wp_ids[v] for v in vertices],
+    })
+    return result
+
+
+@mcp.tool()
+def sco_nav_components(handle: str, max_members: int = 20) -> dict:
+    """Connectivity report of the waypoint graph.
+
+    Components ignore connection direction; one_way_edges counts
+    connections that are not listed back by their target.
+
+    Args:
+        handle: Handle returned by sco_open
+        max_members: Waypoint names listed per component (default 20). Use -1 for all.
+    """
+    index = _get_index(handle)
+    graph = index.navigation()
+    components = graph.components()
+    return {
+        "waypoint_count": len(graph),
+        "edge_count": graph.edge_count,
+        "component_count": len(components),
+        "one_way_edges": graph.one_way_edges(),
+        "dangling_connections": graph.dangling,
+        "duplicate_wp_ids": graph.duplicate_ids,
+        "components": [{
+            "size": len(members),
+            "members": [_waypoint_name(index, graph, v)
+                        for v in (members if max_members < 0 else members[:max_members])],
+        } for members in components],
+    }
+
+
+@mcp.tool()
+def sco_nav_reachability(handle: str, from_pattern: str, to_pattern: str) -> dict:
+    """Check which nodes of one group can be reached from another over the waypoint graph.
+
+    Each node (e.g., a spawn point) is snapped to its nearest waypoint. A
+    target is reachable if a route leads to its waypoint from the waypoint
+    of any source node; distance is the length of the shortest such route.
+
+    Args:
+        handle: Handle returned by sco_open
+        from_pattern: Glob pattern of the source nodes (e.g., "USSpawn*")
+        to_pattern: Glob pattern of the target nodes (e.g., "VCSpawn*")
+    """
+    index = _get_index(handle)
+    graph = index.navigation()
+
+    def snap(pattern: str) -> list:
+        """(node, (distance, vertex) of its nearest waypoint or None) per matching node."""
+        result = []
+        for node in index.find(pattern):
+            pos = index.position(node)
+            result.append((node, graph.nearest_vertex(*pos) if pos is not None else None))
+        return result
+
+    sources = snap(from_pattern)
+    dist, _ = graph.shortest_paths(nearest[1] for _, nearest in sources if nearest is not None)
+    targets = []
+    for node, nearest in snap(to_pattern):
+        entry = {"name": index.names[node], "path": index.paths[node], "reachable": False}
+        if nearest is not None:
+            snap_distance, vertex = nearest
+            entry["waypoint"] = _waypoint_name(index, graph, vertex)
+            entry["snap_distance"] = round(snap_distance, 2)
+            entry["distance"] = _round_distance(dist[vertex])
+            entry["reachable"] = entry["distance"] is not None
+        targets.append(entry)
+
+    return {
+        "source_count": len(sources),
+        "sources_on_graph": sum(1 for _, s in sources if s is not None),
+        "target_count": len(targets),
+        "reachable_count": sum(1 for t in targets if t["reachable"]),
+        "targets": targets,
+    }
+
+
+@mcp.tool()
+def sco_nav_distances(handle: str, waypoints: List[str], all_pairs: bool = False) -> dict:
+    """Route distances between waypoints as a matrix (null where unreachable).
+
+    Args:
+        handle: Handle returned by sco_open
+        waypoints: Waypoint node names or tree paths
+        all_pairs: Compute (once, kept until sco_close) the distances
+            between all waypoints first, so later calls are lookups. Limited
+            to graphs of at most 1024 waypoints.
+    """
+    index = _get_index(handle)
+    graph = index.navigation()
+    try:
+        vertices = [_waypoint_vertex(index, graph, w) for w in waypoints]
+    except ValueError as e:
+        return {"error": str(e)}
+
+    if all_pairs:
+        try:
+            matrix = graph.all_pairs()
+        except ValueError as e:
+            return {"error": str(e)}
+        n = len(graph)
+        rows = [[matrix[v * n + t] for t in vertices] for v in vertices]
+    else:
+        rows = []
+        for v in vertices:
+            dist, _ = graph.shortest_paths((v,))
+            rows.append([dist[t] for t in vertices])
+
+    return {
+        "waypoints": [_waypoint_name(index, graph, v) for v in vertices],
+        "matrix": [[_round_distance(d) for d in row] for row in rows],
+    }
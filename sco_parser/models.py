@@ -1,7 +1,11 @@
 """Data models for parsed .sco file structures."""
 
+from array import array
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, Iterable, List, Optional, Dict, Any, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from .parser import NodeTable
 
 
 @dataclass
@@ -65,6 +69,36 @@ class WaypointData:
     connections: List[int] = field(default_factory=list)
 
 
+@dataclass
+class WaypointTable:
+    """Waypoint data of a node tree in CSR form.
+
+    Waypoint k is node nodes[k] (in tree order) with ID wp_ids[k]; its
+    connections are connections[offsets[k]:offsets[k + 1]].
+    """
+    nodes: Sequence[int]
+    wp_ids: Sequence[int]
+    offsets: Sequence[int]
+    connections: Sequence[int]
+
+    @classmethod
+    def build(cls, waypoints: Iterable[Tuple[int, WaypointData]]) -> 'WaypointTable':
+        """Table of (node index, waypoint data) pairs."""
+        table = cls(array('I'), array('I'), array('I', [0]), array('I'))
+        for node, wp in waypoints:
+            table.nodes.append(node)
+            table.wp_ids.append(wp.wp_id)
+            table.connections.extend(wp.connections)
+            table.offsets.append(len(table.connections))
+        return table
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def connections_of(self, k: int) -> Sequence[int]:
+        return self.connections[self.offsets[k]:self.offsets[k + 1]]
+
+
 @dataclass
 class DummyBasicData:
     """Basic dummy node properties (Chunk 10)."""
@@ -155,6 +189,23 @@ class FogColorData:
     color: int
 
 
+NODE_TYPE_NAMES = {
+    0: "Root", 1: "Mesh", 3: "Light(sub)", 6: "Dummy", 7: "Light",
+    8: "Event", 9: "Dummy(WP)", 10: "SndSw", 13: "WorldSector",
+    14: "Portal", 15: "Occluder", 16: "LevelItem", 17: "FogColor",
+    18: "Model", 19: "ScrHelper",
+    0x101: "Player", 0x102: "AnimPath", 0x103: "MPHelper",
+    0x104: "Recovery", 0x105: "Spectator", 0x106: "Northstar",
+}
+
+
+def node_type_name(node_type: int) -> str:
+    """Human-readable name of a node_type value."""
+    if node_type in NODE_TYPE_NAMES:
+        return NODE_TYPE_NAMES[node_type]
+    return f"Type({node_type:#x})"
+
+
 @dataclass
 class SceneNode:
     """A node in the scene tree."""
@@ -209,17 +260,7 @@ class SceneNode:
 
     def node_type_name(self) -> str:
         """Human-readable node type from node_type field."""
-        type_names = {
-            0: "Root", 1: "Mesh", 3: "Light(sub)", 6: "Dummy", 7: "Light",
-            8: "Event", 9: "Dummy(WP)", 10: "SndSw", 13: "WorldSector",
-            14: "Portal", 15: "Occluder", 16: "LevelItem", 17: "FogColor",
-            18: "Model", 19: "ScrHelper",
-            0x101: "Player", 0x102: "AnimPath", 0x103: "MPHelper",
-            0x104: "Recovery", 0x105: "Spectator", 0x106: "Northstar",
-        }
-        if self.node_type in type_names:
-            return type_names[self.node_type]
-        return f"Type({self.node_type:#x})"
+        return node_type_name(self.node_type)
 
 
 @dataclass
@@ -321,3 +362,10 @@ class ScoFile:
     # Parse diagnostics
     node_count: int = 0
     parse_warnings: List[str] = field(default_factory=list)
+    # Node skeleton of a lazily parsed file (parse_sco(..., lazy=True))
+    nodes: Optional['NodeTable'] = None
+
+    def close(self) -> None:
+        """Release the file mapping of a lazily parsed file."""
+        if self.nodes is not None:
+            self.nodes.close()
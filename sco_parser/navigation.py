@@ -0,0 +1,215 @@
+"""Waypoint navigation graph: routes, connected components and reachability."""
+
+import heapq
+import math
+from array import array
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+from .spatial import KDTree
+
+if TYPE_CHECKING:
+    from .index import ScoIndex
+
+# Largest graph (in waypoints) all_pairs() computes a distance matrix for
+# (8 MiB of doubles, and one Dijkstra per waypoint on the calling thread)
+MAX_ALL_PAIRS = 1024
+
+# Routes kept per graph
+_ROUTE_CACHE_SIZE = 1024
+
+
+class NavGraph:
+    """Directed waypoint graph in CSR form.
+
+    Vertices are the waypoint nodes of a ScoIndex in tree order: vertex v
+    is node nodes[v] with waypoint ID wp_ids[v]. The connections of v are
+    targets[offsets[v]:offsets[v + 1]], with their Euclidean lengths in
+    weights. A connection to an ID no waypoint has is dropped (counted in
+    dangling); an ID used by several waypoints refers to the first of them
+    (the others are counted in duplicate_ids). Waypoints without a finite
+    position have no coordinates, and connections from or to them have
+    infinite length, so routes never use them.
+    """
+
+    def __init__(self, index: 'ScoIndex'):
+        waypoints = index.waypoint_table
+        self.nodes = array('I', waypoints.nodes)
+        self.wp_ids = array('I', waypoints.wp_ids)
+        self.vertex_of_id: Dict[int, int] = {}
+        for v, wp_id in enumerate(self.wp_ids):
+            self.vertex_of_id.setdefault(wp_id, v)
+        self.vertex_of_node: Dict[int, int] = {node: v for v, node in enumerate(self.nodes)}
+        self.duplicate_ids = len(self.wp_ids) - len(self.vertex_of_id)
+
+        self.positions: List[Optional[tuple]] = []
+        for node in self.nodes:
+            pos = index.position(node)
+            if pos is not None and not all(math.isfinite(c) for c in pos):
+                pos = None
+            self.positions.append(pos)
+
+        self.offsets = array('I', [0])
+        self.targets = array('I')
+        self.weights = array('d')
+        self.dangling = 0
+        for v in range(len(self.nodes)):
+            for wp_id in waypoints.connections_of(v):
+                target = self.vertex_of_id.get(wp_id)
+                if target is None:
+                    self.dangling += 1
+                    continue
+                self.targets.append(target)
+                self.weights.append(self.distance(v, target))
+            self.offsets.append(len(self.targets))
+
+        self._routes: 'OrderedDict[Tuple[int, int], Optional[Tuple[float, List[int]]]]' = OrderedDict()
+        self._components: Optional[List[List[int]]] = None
+        self._tree: Optional[KDTree] = None
+        self._matrix: Optional[array] = None  # all_pairs(), freed with the graph
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    def neighbors(self, vertex: int) -> Iterable[int]:
+        return self.targets[self.offsets[vertex]:self.offsets[vertex + 1]]
+
+    def distance(self, a: int, b: int) -> float:
+        """Straight-line distance between two vertices (inf without positions)."""
+        pa, pb = self.positions[a], self.positions[b]
+        if pa is None or pb is None:
+            return math.inf
+        return math.dist(pa, pb)
+
+    def one_way_edges(self) -> int:
+        """Connections whose target does not connect back."""
+        edges = {(v, t) for v in range(len(self)) for t in self.neighbors(v)}
+        return sum(1 for v, t in edges if (t, v) not in edges)
+
+    def shortest_paths(self, sources: Iterable[int]) -> Tuple[array, array]:
+        """Dijkstra from a set of sources.
+
+        Returns (distance, predecessor) per vertex: inf and -1 for vertices
+        that cannot be reached, 0.0 and -1 for the sources.
+        """
+        n = len(self)
+        dist = array('d', [math.inf]) * n
+        pred = array('i', [-1]) * n
+        heap = []
+        for source in sources:
+            if dist[source] != 0.0:
+                dist[source] = 0.0
+                heap.append((0.0, source))
+        heapq.heapify(heap)
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        while heap:
+            d, v = heapq.heappop(heap)
+            if d > dist[v]:
+                continue
+            for e in range(offsets[v], offsets[v + 1]):
+                nd = d + weights[e]
+                t = targets[e]
+                if nd < dist[t]:
+                    dist[t] = nd
+                    pred[t] = v
+                    heapq.heappush(heap, (nd, t))
+        return dist, pred
+
+    def route(self, source: int, target: int) -> Optional[Tuple[float, List[int]]]:
+        """Shortest route as (length, vertices from source to target), or None.
+
+        A* search guided by the straight-line distance to the target.
+        Results are cached, so repeated questions are dictionary lookups.
+        """
+        key = (source, target)
+        if key in self._routes:
+            self._routes.move_to_end(key)
+            return self._routes[key]
+        result = self._astar(source, target)
+        self._routes[key] = result
+        if len(self._routes) > _ROUTE_CACHE_SIZE:
+            self._routes.popitem(last=False)
+        return result
+
+    def _astar(self, source: int, target: int) -> Optional[Tuple[float, List[int]]]:
+        goal = self.positions[target]
+        positions = self.positions
+
+        def estimate(v: int) -> float:
+            pos = positions[v]
+            if goal is None or pos is None:
+                return 0.0
+            return math.dist(pos, goal)
+
+        best = {source: 0.0}
+        pred = {source: -1}
+        heap = [(estimate(source), 0.0, source)]
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        while heap:
+            _, d, v = heapq.heappop(heap)
+            if v == target:
+                path = [v]
+                while pred[path[-1]] != -1:
+                    path.append(pred[path[-1]])
+                path.reverse()
+                return d, path
+            if d > best[v]:
+                continue
+            for e in range(offsets[v], offsets[v + 1]):
+                nd = d + weights[e]
+                t = targets[e]
+                if nd < best.get(t, math.inf):
+                    best[t] = nd
+                    pred[t] = v
+                    heapq.heappush(heap, (nd + estimate(t), nd, t))
+        return None
+
+    def components(self) -> List[List[int]]:
+        """Weakly connected components (connection direction ignored), largest first."""
+        if self._components is None:
+            parent = list(range(len(self)))
+
+            def find(v: int) -> int:
+                while parent[v] != v:
+                    parent[v] = parent[parent[v]]
+                    v = parent[v]
+                return v
+
+            for v in range(len(self)):
+                for t in self.neighbors(v):
+                    a, b = find(v), find(t)
+                    if a != b:
+                        parent[max(a, b)] = min(a, b)
+            groups: Dict[int, List[int]] = {}
+            for v in range(len(self)):
+                groups.setdefault(find(v), []).append(v)
+            self._components = sorted(groups.values(), key=len, reverse=True)
+        return self._components
+
+    def nearest_vertex(self, x: float, y: float, z: float) -> Optional[Tuple[float, int]]:
+        """(distance, vertex) of the positioned waypoint nearest to a point."""
+        if self._tree is None:
+            self._tree = KDTree((v, *pos) for v, pos in enumerate(self.positions) if pos is not None)
+        found = self._tree.nearest(x, y, z, 1)
+        return found[0] if found else None
+
+    def all_pairs(self) -> array:
+        """Distance matrix, row-major (row v holds the distances from v).
+
+        Computed with one Dijkstra per vertex for graphs of at most
+        MAX_ALL_PAIRS waypoints, and kept until the graph (that is, its
+        ScoIndex) is dropped.
+        """
+        if self._matrix is None:
+            n = len(self)
+            if n > MAX_ALL_PAIRS:
+                raise ValueError(f"{n} waypoints is too many for an all-pairs matrix (max {MAX_ALL_PAIRS})")
+            matrix = array('d')
+            for v in range(n):
+                matrix.extend(self.shortest_paths((v,))[0])
+            self._matrix = matrix
+        return self._matrix
@@ -1,9 +1,12 @@
 """Binary parser for Vietcong .sco scene files."""
 
+import mmap
 import struct
 import logging
+from array import array
 from pathlib import Path
-from typing import Tuple, List, Optional
+from types import SimpleNamespace
+from typing import Dict, Iterator, Tuple, List, Optional, Sequence
 
 from .models import (
     ScoFile, ScoHeader, Entity, SceneNode, Transform,
@@ -11,11 +14,16 @@ from .models import (
     SoundSwitchData, PortalData, LevelItemData, StringData,
     SectorParam, OccluderData, RecoveryData, SpectatorData,
     ScrHelperFlag, FogColorData, EditorLighting, SoundArea,
-    ScoTrailer, TerrainData, TerrainSector,
+    ScoTrailer, TerrainData, TerrainSector, WaypointTable,
 )
 
 log = logging.getLogger(__name__)
 
+# Version of what parse_sco extracts; bump it when a change alters the
+# NodeTable of a file (scan results, positions, waypoint decoding), so saved
+# snapshots of it are rebuilt (see snapshot.py)
+FORMAT_VERSION = 1
+
 # Chunk IDs
 CHUNK_NODE_BEGIN = 1
 CHUNK_TRANSFORM = 2
@@ -45,10 +53,26 @@ CHUNK_FOG_COLOR = 25
 CHUNK_NODE_END = 0xFF
 
 
-def parse_sco(filepath: str) -> ScoFile:
-    """Parse a .sco file and return a ScoFile object."""
+def parse_sco(filepath: str, lazy: bool = False, snapshot_dir: Optional[str] = None) -> ScoFile:
+    """Parse a .sco file and return a ScoFile object.
+
+    With lazy=True the file is memory-mapped and the node tree is only
+    scanned into a NodeTable (offsets, names, types and chunk positions);
+    SceneNode objects and their chunk data are decoded from the mapping when
+    first used (see LazySceneNode). Warnings about undecodable chunks are
+    then added to parse_warnings when the node is decoded.
+
+    With a snapshot_dir (which implies lazy=True) the scanned NodeTable is
+    saved there as a binary snapshot, and later calls for the unchanged file
+    load it from the snapshot instead of scanning (see snapshot.py).
+    """
     path = Path(filepath)
-    data = path.read_bytes()
+    if snapshot_dir is not None:
+        lazy = True
+    if lazy:
+        data = _map_file(path)
+    else:
+        data = path.read_bytes()
     warnings: List[str] = []
 
     offset = 0
@@ -57,12 +81,34 @@ def parse_sco(filepath: str) -> ScoFile:
 
     node_count = 0
     root_node = None
+    nodes = None
     # The root node starts directly (no NODE_BEGIN prefix).
     # ED_SCN2_Open calls ED_SCN2_Load_NodeRecursive with the current offset.
-    try:
-        root_node, offset, node_count = _parse_node(data, offset, header.version, warnings)
-    except Exception as e:
-        warnings.append(f"Failed to parse node tree: {e}")
+    if lazy:
+        loaded = None
+        if snapshot_dir is not None:
+            from .snapshot import load_snapshot
+            loaded = load_snapshot(snapshot_dir, path, data, header.version, warnings)
+        if loaded is not None:
+            nodes, offset = loaded
+        else:
+            nodes = NodeTable(data, header.version, warnings)
+            first_warning = len(warnings)
+            try:
+                offset = _scan_node(nodes, data, offset, warnings)
+            except Exception as e:
+                warnings.append(f"Failed to parse node tree: {e}")
+            if snapshot_dir is not None:
+                from .snapshot import save_snapshot
+                save_snapshot(snapshot_dir, path, data, nodes, offset, warnings[first_warning:])
+        node_count = len(nodes)
+        if node_count:
+            root_node = nodes.node(0)
+    else:
+        try:
+            root_node, offset, node_count = _parse_node(data, offset, header.version, warnings)
+        except Exception as e:
+            warnings.append(f"Failed to parse node tree: {e}")
 
     # After node tree, the save function writes an end sentinel.
     # Try to find the post-tree data by looking for the editor lighting state
@@ -93,9 +139,18 @@ def parse_sco(filepath: str) -> ScoFile:
         trailer=trailer,
         node_count=node_count,
         parse_warnings=warnings,
+        nodes=nodes,
     )
 
 
+def _map_file(path: Path):
+    """Read-only memory mapping of a file (bytes for an empty file)."""
+    with open(path, 'rb') as f:
+        if f.seek(0, 2) == 0:
+            return b''
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
 def _parse_header(data: bytes, offset: int) -> Tuple[ScoHeader, int]:
     """Parse the 100-byte header at offset 0x00."""
     version = struct.unpack_from('<I', data, offset)[0]
@@ -273,81 +328,9 @@ def _parse_node(data: bytes, offset: int, file_version: int,
                 warnings.append(f"Bad chunk {chunk_id} total_size={total_size} at node '{name}' offset {offset}")
                 break
             payload = data[offset + 8:offset + total_size]
-            payload_len = len(payload)
 
             try:
-                if chunk_id == CHUNK_TRANSFORM:
-                    node.transform = _parse_transform_payload(payload, file_version)
-                elif chunk_id == CHUNK_MESH_TRANSFORM:
-                    node.mesh_transform = _parse_transform_payload(payload, file_version)
-                elif chunk_id == CHUNK_SOUND and payload_len >= 28:
-                    node.sound = SoundData(params=list(struct.unpack_from('<7f', payload, 0)))
-                elif chunk_id == CHUNK_WAYPOINT and payload_len >= 7:
-                    wp_id = struct.unpack_from('<H', payload, 0)[0]
-                    wp_param = struct.unpack_from('<I', payload, 2)[0]
-                    conn_count = payload[6]
-                    connections = []
-                    for ci in range(conn_count):
-                        if 7 + ci * 2 + 2 <= payload_len:
-                            connections.append(struct.unpack_from('<H', payload, 7 + ci * 2)[0])
-                    node.waypoint = WaypointData(wp_id=wp_id, wp_param=wp_param, connections=connections)
-                elif chunk_id == CHUNK_SECTOR_PARAM and payload_len >= 4:
-                    node.sector_param = SectorParam(value=struct.unpack_from('<I', payload, 0)[0])
-                elif chunk_id == CHUNK_STRING and payload_len >= 4:
-                    str_len = struct.unpack_from('<I', payload, 0)[0]
-                    if str_len > 0 and 4 + str_len <= payload_len:
-                        node.string_data = StringData(value=payload[4:4 + str_len].decode('ascii', errors='replace'))
-                elif chunk_id == CHUNK_SOUND_SWITCH and payload_len >= 28:
-                    node.sound_switch = SoundSwitchData(fields=list(struct.unpack_from('<7I', payload, 0)))
-                elif chunk_id == CHUNK_DUMMY_BASIC and payload_len >= 14:
-                    rx, ry, rz = struct.unpack_from('<3f', payload, 0)
-                    node.dummy_basic = DummyBasicData(
-                        radius_x=rx, radius_y=ry, radius_z=rz,
-                        dummy_type=payload[12], dummy_flags=payload[13],
-                    )
-                elif chunk_id == CHUNK_PORTAL and payload_len >= 31:
-                    node.portal = PortalData(
-                        portal_fields=list(struct.unpack_from('<7I', payload, 0)),
-                        portal_bytes=bytes(payload[28:31]),
-                    )
-                elif chunk_id == CHUNK_OCCLUDER and payload_len >= 4:
-                    node.occluder = OccluderData(value=struct.unpack_from('<I', payload, 0)[0])
-                elif chunk_id == CHUNK_RECOVERY and payload_len >= 4:
-                    node.recovery = RecoveryData(recovery_id=struct.unpack_from('<I', payload, 0)[0])
-                elif chunk_id == CHUNK_SPECTATOR and payload_len >= 8:
-                    node.spectator = SpectatorData(
-                        param1=struct.unpack_from('<I', payload, 0)[0],
-                        param2=struct.unpack_from('<I', payload, 4)[0],
-                    )
-                elif chunk_id == CHUNK_SCRHELPER_FLAG and payload_len >= 4:
-                    node.scrhelper_flag = ScrHelperFlag(flag=struct.unpack_from('<I', payload, 0)[0])
-                elif chunk_id == CHUNK_FOG_COLOR and payload_len >= 4:
-                    node.fog_color = FogColorData(color=struct.unpack_from('<I', payload, 0)[0])
-                elif chunk_id == CHUNK_SCRHELPER and payload_len >= 12:
-                    ht = struct.unpack_from('<I', payload, 0)[0]
-                    hp1 = struct.unpack_from('<I', payload, 4)[0]
-                    hp2 = struct.unpack_from('<I', payload, 8)[0]
-                    hx = hy = hz = 0.0
-                    if payload_len >= 24:
-                        hx, hy, hz = struct.unpack_from('<3f', payload, 12)
-                    node.scrhelper = ScrHelperData(
-                        helper_type=ht, param1=hp1, param2=hp2,
-                        pos_x=hx, pos_y=hy, pos_z=hz,
-                    )
-                elif chunk_id == CHUNK_LEVEL_ITEM and payload_len >= 4:
-                    item_type = struct.unpack_from('<I', payload, 0)[0]
-                    item_name = None
-                    if payload_len >= 8:
-                        name_len = struct.unpack_from('<I', payload, 4)[0]
-                        if name_len > 0 and 8 + name_len <= payload_len:
-                            item_name = payload[8:8 + name_len].decode('ascii', errors='replace')
-                    node.level_item = LevelItemData(item_type=item_type, item_name=item_name)
-                elif chunk_id in (CHUNK_EVENT_LINKS, CHUNK_FLAGS, CHUNK_CHILD_NODES,
-                                  CHUNK_CHILD_NODES_EX, CHUNK_ANIM_PARAM, CHUNK_ANIMPATH_KEYS,
-                                  CHUNK_LIGHT_EXT, CHUNK_SECTOR_DATA):
-                    node.raw_chunks[chunk_id] = bytes(payload)
-                else:
-                    node.raw_chunks[chunk_id] = bytes(payload)
+                _decode_chunk(node, chunk_id, payload, file_version)
             except Exception as e:
                 warnings.append(f"Error parsing chunk {chunk_id} in node '{name}': {e}")
 
@@ -361,6 +344,353 @@ def _parse_node(data: bytes, offset: int, file_version: int,
     return node, offset, node_count
 
 
+def _decode_chunk(node: SceneNode, chunk_id: int, payload, file_version: int) -> None:
+    """Decode one chunk payload (bytes or memoryview) into node's fields.
+
+    Unhandled chunks are kept in raw_chunks as the payload object itself.
+    """
+    payload_len = len(payload)
+    if chunk_id == CHUNK_TRANSFORM:
+        node.transform = _parse_transform_payload(payload, file_version)
+    elif chunk_id == CHUNK_MESH_TRANSFORM:
+        node.mesh_transform = _parse_transform_payload(payload, file_version)
+    elif chunk_id == CHUNK_SOUND and payload_len >= 28:
+        node.sound = SoundData(params=list(struct.unpack_from('<7f', payload, 0)))
+    elif chunk_id == CHUNK_WAYPOINT and payload_len >= 7:
+        wp_id = struct.unpack_from('<H', payload, 0)[0]
+        wp_param = struct.unpack_from('<I', payload, 2)[0]
+        conn_count = payload[6]
+        connections = []
+        for ci in range(conn_count):
+            if 7 + ci * 2 + 2 <= payload_len:
+                connections.append(struct.unpack_from('<H', payload, 7 + ci * 2)[0])
+        node.waypoint = WaypointData(wp_id=wp_id, wp_param=wp_param, connections=connections)
+    elif chunk_id == CHUNK_SECTOR_PARAM and payload_len >= 4:
+        node.sector_param = SectorParam(value=struct.unpack_from('<I', payload, 0)[0])
+    elif chunk_id == CHUNK_STRING and payload_len >= 4:
+        str_len = struct.unpack_from('<I', payload, 0)[0]
+        if str_len > 0 and 4 + str_len <= payload_len:
+            node.string_data = StringData(value=str(payload[4:4 + str_len], 'ascii', 'replace'))
+    elif chunk_id == CHUNK_SOUND_SWITCH and payload_len >= 28:
+        node.sound_switch = SoundSwitchData(fields=list(struct.unpack_from('<7I', payload, 0)))
+    elif chunk_id == CHUNK_DUMMY_BASIC and payload_len >= 14:
+        rx, ry, rz = struct.unpack_from('<3f', payload, 0)
+        node.dummy_basic = DummyBasicData(
+            radius_x=rx, radius_y=ry, radius_z=rz,
+            dummy_type=payload[12], dummy_flags=payload[13],
+        )
+    elif chunk_id == CHUNK_PORTAL and payload_len >= 31:
+        node.portal = PortalData(
+            portal_fields=list(struct.unpack_from('<7I', payload, 0)),
+            portal_bytes=bytes(payload[28:31]),
+        )
+    elif chunk_id == CHUNK_OCCLUDER and payload_len >= 4:
+        node.occluder = OccluderData(value=struct.unpack_from('<I', payload, 0)[0])
+    elif chunk_id == CHUNK_RECOVERY and payload_len >= 4:
+        node.recovery = RecoveryData(recovery_id=struct.unpack_from('<I', payload, 0)[0])
+    elif chunk_id == CHUNK_SPECTATOR and payload_len >= 8:
+        node.spectator = SpectatorData(
+            param1=struct.unpack_from('<I', payload, 0)[0],
+            param2=struct.unpack_from('<I', payload, 4)[0],
+        )
+    elif chunk_id == CHUNK_SCRHELPER_FLAG and payload_len >= 4:
+        node.scrhelper_flag = ScrHelperFlag(flag=struct.unpack_from('<I', payload, 0)[0])
+    elif chunk_id == CHUNK_FOG_COLOR and payload_len >= 4:
+        node.fog_color = FogColorData(color=struct.unpack_from('<I', payload, 0)[0])
+    elif chunk_id == CHUNK_SCRHELPER and payload_len >= 12:
+        ht = struct.unpack_from('<I', payload, 0)[0]
+        hp1 = struct.unpack_from('<I', payload, 4)[0]
+        hp2 = struct.unpack_from('<I', payload, 8)[0]
+        hx = hy = hz = 0.0
+        if payload_len >= 24:
+            hx, hy, hz = struct.unpack_from('<3f', payload, 12)
+        node.scrhelper = ScrHelperData(
+            helper_type=ht, param1=hp1, param2=hp2,
+            pos_x=hx, pos_y=hy, pos_z=hz,
+        )
+    elif chunk_id == CHUNK_LEVEL_ITEM and payload_len >= 4:
+        item_type = struct.unpack_from('<I', payload, 0)[0]
+        item_name = None
+        if payload_len >= 8:
+            name_len = struct.unpack_from('<I', payload, 4)[0]
+            if name_len > 0 and 8 + name_len <= payload_len:
+                item_name = str(payload[8:8 + name_len], 'ascii', 'replace')
+        node.level_item = LevelItemData(item_type=item_type, item_name=item_name)
+    elif chunk_id in (CHUNK_EVENT_LINKS, CHUNK_FLAGS, CHUNK_CHILD_NODES,
+                      CHUNK_CHILD_NODES_EX, CHUNK_ANIM_PARAM, CHUNK_ANIMPATH_KEYS,
+                      CHUNK_LIGHT_EXT, CHUNK_SECTOR_DATA):
+        node.raw_chunks[chunk_id] = payload
+    else:
+        node.raw_chunks[chunk_id] = payload
+
+
+# ---------------------------------------------------------------------------
+# Lazy parsing (parse_sco(..., lazy=True))
+# ---------------------------------------------------------------------------
+
+# Node header up to the name (see _parse_node)
+_NODE_HEADER = struct.Struct('<7If2IB')
+_U32 = struct.Struct('<I')
+# Position in a transform payload (see _parse_transform_payload)
+_POSITION = struct.Struct('<3f')
+
+# SceneNode fields filled from chunk data
+_CHUNK_FIELDS = (
+    'transform', 'mesh_transform', 'waypoint', 'dummy_basic', 'scrhelper',
+    'scrhelper_flag', 'sound', 'sound_switch', 'portal', 'level_item',
+    'string_data', 'sector_param', 'occluder', 'recovery', 'spectator',
+    'fog_color',
+)
+
+
+class NodeTable:
+    """Skeleton of a lazily parsed node tree.
+
+    Nodes are numbered in file (pre-)order; node 0 is the root. For each
+    node the table keeps its header offset, name, type, the index after its
+    last descendant (so the children of node i are i + 1, then end of that
+    child, ...) and its range of chunk records. A chunk record is the chunk
+    ID and the payload's start and end offset in the mapped file.
+    """
+
+    def __init__(self, data, file_version: int, warnings: List[str]):
+        self.data = data
+        self.view = memoryview(data)
+        self.file_version = file_version
+        self.warnings = warnings
+        self.offsets = array('q')
+        self.names: List[str] = []
+        self.types = array('I')
+        self.ends = array('I')
+        self.first_chunk = array('I')
+        self.chunk_counts = array('I')
+        self.chunk_ids = array('I')
+        self.chunk_starts = array('q')
+        self.chunk_stops = array('q')
+        self.errors: Dict[int, str] = {}
+        # Mapped snapshot the columns were loaded from (see snapshot.py)
+        self.snapshot: Optional[mmap.mmap] = None
+        self._nodes: Dict[int, 'LazySceneNode'] = {}
+        self._positioned: Optional[Tuple[Sequence[int], Sequence[float]]] = None
+        self._waypoints: Optional[WaypointTable] = None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def children(self, index: int) -> Iterator[int]:
+        """Indexes of the children of node index."""
+        child = index + 1
+        end = self.ends[index]
+        while child < end:
+            yield child
+            child = self.ends[child]
+
+    def chunks(self, index: int) -> Iterator[Tuple[int, memoryview]]:
+        """(chunk_id, payload) of node index in file order, payloads as views."""
+        first = self.first_chunk[index]
+        view = self.view
+        for c in range(first, first + self.chunk_counts[index]):
+            yield self.chunk_ids[c], view[self.chunk_starts[c]:self.chunk_stops[c]]
+
+    def has_chunk(self, index: int, chunk_id: int, min_size: int = 0) -> bool:
+        """Whether node index has a chunk chunk_id with at least min_size payload bytes."""
+        first = self.first_chunk[index]
+        for c in range(first, first + self.chunk_counts[index]):
+            if self.chunk_ids[c] == chunk_id and self.chunk_stops[c] - self.chunk_starts[c] >= min_size:
+                return True
+        return False
+
+    def position(self, index: int) -> Optional[tuple]:
+        """World position of node index (as SceneNode.position), read without decoding the node."""
+        first = self.first_chunk[index]
+        for c in range(first + self.chunk_counts[index] - 1, first - 1, -1):
+            if self.chunk_ids[c] == CHUNK_TRANSFORM:
+                start = self.chunk_starts[c]
+                if self.chunk_stops[c] - start >= 32:
+                    return _POSITION.unpack_from(self.data, start + 20)
+                return None
+        return None
+
+    def positioned(self) -> Tuple[Sequence[int], Sequence[float]]:
+        """(nodes, coords): the nodes that have a position, with x, y, z of each in coords."""
+        if self._positioned is None:
+            nodes, coords = array('I'), array('d')
+            for i in range(len(self)):
+                pos = self.position(i)
+                if pos is not None:
+                    nodes.append(i)
+                    coords.extend(pos)
+            self._positioned = nodes, coords
+        return self._positioned
+
+    def waypoint(self, index: int) -> Optional[WaypointData]:
+        """Waypoint data of node index (as SceneNode.waypoint), decoded without the rest of the node."""
+        holder = SimpleNamespace(waypoint=None, raw_chunks={})
+        for chunk_id, payload in self.chunks(index):
+            if chunk_id == CHUNK_WAYPOINT:
+                _decode_chunk(holder, chunk_id, payload, self.file_version)
+        return holder.waypoint
+
+    def waypoint_table(self) -> WaypointTable:
+        """The waypoint data of the tree."""
+        if self._waypoints is None:
+            # Shorter waypoint payloads are not decoded (see _decode_chunk)
+            self._waypoints = WaypointTable.build(
+                (i, self.waypoint(i)) for i in range(len(self))
+                if self.has_chunk(i, CHUNK_WAYPOINT, 7))
+        return self._waypoints
+
+    def node(self, index: int) -> 'LazySceneNode':
+        """The SceneNode of node index (created on first request)."""
+        node = self._nodes.get(index)
+        if node is None:
+            node = self._nodes[index] = LazySceneNode(self, index)
+        return node
+
+    def close(self) -> None:
+        """Drop the nodes and unmap the file.
+
+        The mapping stays open while chunk views handed out are still
+        referenced; it is then closed when the last one is released.
+        """
+        self._nodes.clear()
+        self.view.release()
+        for mapping in (self.data, self.snapshot):
+            if isinstance(mapping, mmap.mmap):
+                try:
+                    mapping.close()
+                except BufferError:
+                    pass
+
+
+def _chunk_field(name: str) -> property:
+    def get(self):
+        try:
+            return self.__dict__[name]
+        except KeyError:
+            self._decode()
+            return self.__dict__[name]
+
+    def set(self, value):
+        if not self._decoded:
+            self._decode()
+        self.__dict__[name] = value
+
+    return property(get, set)
+
+
+class LazySceneNode(SceneNode):
+    """SceneNode backed by a NodeTable entry.
+
+    The header fields are read when the node is created. The chunk fields
+    (transform, waypoint, ..., raw_chunks) are decoded together on the first
+    access to any of them, raw chunks as memoryview slices of the mapped
+    file; children are created on first access to `children`.
+    """
+
+    def __init__(self, table: NodeTable, index: int):
+        (self.node_version, self.data_size, self.node_type, self.child_count,
+         self.sector_count, self.bes_index, self.flags, _render_dist,
+         self.param1, self.param2, _name_length) = _NODE_HEADER.unpack_from(
+            table.data, table.offsets[index])
+        self.name = table.names[index]
+        self.parse_error = table.errors.get(index)
+        self.table = table
+        self.index = index
+        self._decoded = False
+
+    def _decode(self) -> None:
+        self._decoded = True
+        values = self.__dict__
+        for name in _CHUNK_FIELDS:
+            values.setdefault(name, None)
+        values.setdefault('raw_chunks', {})
+        table = self.table
+        for chunk_id, payload in table.chunks(self.index):
+            try:
+                _decode_chunk(self, chunk_id, payload, table.file_version)
+            except Exception as e:
+                table.warnings.append(f"Error parsing chunk {chunk_id} in node '{self.name}': {e}")
+
+    @property
+    def children(self) -> List[SceneNode]:
+        children = self.__dict__.get('children')
+        if children is None:
+            table = self.table
+            children = self.__dict__['children'] = [table.node(i) for i in table.children(self.index)]
+        return children
+
+    @children.setter
+    def children(self, value: List[SceneNode]) -> None:
+        self.__dict__['children'] = value
+
+
+for _name in _CHUNK_FIELDS + ('raw_chunks',):
+    setattr(LazySceneNode, _name, _chunk_field(_name))
+del _name
+
+
+def _scan_node(table: NodeTable, data, offset: int, warnings: List[str]) -> int:
+    """Add a node and its subtree to table. Returns the offset after it.
+
+    Walks the same structure as _parse_node, recording chunk positions
+    instead of decoding them.
+    """
+    try:
+        (_node_version, _data_size, node_type, child_count, sector_count,
+         _bes_index, _flags, _render_dist, _param1, _param2,
+         name_length) = _NODE_HEADER.unpack_from(data, offset)
+    except struct.error:
+        # Truncated header: raise the error of _parse_node's field reads
+        for field_offset in range(offset, offset + 40, 4):
+            _U32.unpack_from(data, field_offset)
+        struct.unpack_from('<B', data, offset + 40)
+        raise
+    name_offset = offset + _NODE_HEADER.size
+    name = data[name_offset:name_offset + name_length].decode('ascii', errors='replace')
+
+    index = len(table.names)
+    table.offsets.append(offset)
+    table.names.append(name)
+    table.types.append(node_type)
+    table.ends.append(0)
+    table.first_chunk.append(len(table.chunk_ids))
+    table.chunk_counts.append(0)
+    offset = name_offset + name_length
+
+    size = len(data)
+    chunk_count = 0
+    try:
+        while offset < size:
+            chunk_id = _U32.unpack_from(data, offset)[0]
+
+            if chunk_id == CHUNK_NODE_BEGIN:
+                for _ in range(child_count + sector_count):
+                    offset = _scan_node(table, data, offset, warnings)
+                break
+            elif chunk_id == CHUNK_NODE_END:
+                offset += 4
+                break
+
+            total_size = _U32.unpack_from(data, offset + 4)[0]
+            if total_size < 8 or total_size > 10_000_000:
+                warnings.append(f"Bad chunk {chunk_id} total_size={total_size} at node '{name}' offset {offset}")
+                break
+            table.chunk_ids.append(chunk_id)
+            table.chunk_starts.append(offset + 8)
+            table.chunk_stops.append(min(offset + total_size, size))
+            chunk_count += 1
+            offset += total_size
+
+    except Exception as e:
+        table.errors[index] = str(e)
+        warnings.append(f"Error parsing node '{name}': {e}")
+
+    table.chunk_counts[index] = chunk_count
+    table.ends[index] = len(table.names)
+    return offset
+
+
 def _parse_post_tree(data: bytes, offset: int, file_version: int,
                      warnings: List[str]) -> tuple:
     """Parse post-node-tree data. Returns (lighting, level_name, camera_fov,
@@ -500,6 +830,14 @@ def _parse_post_tree(data: bytes, offset: int, file_version: int,
     return lighting, level_name, camera_fov, layer_vis, sound_areas, terrain, offset
 
 
+def _find_nul(data, offset: int) -> int:
+    """Offset of the next NUL byte (data may be bytes or an mmap)."""
+    nul = data.find(b'\x00', offset)
+    if nul < 0:
+        raise ValueError("subsection not found")
+    return nul
+
+
 def _parse_terrain(data: bytes, offset: int, size: int, warnings: List[str]) -> TerrainData:
     """Parse terrain section data."""
     td = TerrainData()
@@ -512,17 +850,17 @@ def _parse_terrain(data: bytes, offset: int, size: int, warnings: List[str]) ->
 
         if ptrs[0] != 0 and offset < end:
             # Null-terminated heightmap path
-            nul = data.index(b'\x00', offset)
+            nul = _find_nul(data, offset)
             td.heightmap_path = data[offset:nul].decode('ascii', errors='replace')
             offset = nul + 1
 
         if ptrs[1] != 0 and offset < end:
-            nul = data.index(b'\x00', offset)
+            nul = _find_nul(data, offset)
             td.texture_path = data[offset:nul].decode('ascii', errors='replace')
             offset = nul + 1
 
         if ptrs[2] != 0 and offset < end:
-            nul = data.index(b'\x00', offset)
+            nul = _find_nul(data, offset)
             td.detail_path = data[offset:nul].decode('ascii', errors='replace')
             offset = nul + 1
 
@@ -537,7 +875,7 @@ def _parse_terrain(data: bytes, offset: int, size: int, warnings: List[str]) ->
             for f in fields:
                 if f != 0 and offset < end:
                     try:
-                        nul = data.index(b'\x00', offset)
+                        nul = _find_nul(data, offset)
                         paths.append(data[offset:nul].decode('ascii', errors='replace'))
                         offset = nul + 1
                     except ValueError:
@@ -0,0 +1,316 @@
+"""Binary snapshots of lazily parsed node trees.
+
+Scanning the node tree is most of the work of parse_sco(..., lazy=True).
+A snapshot stores the result, the NodeTable, in one file of typed columns
+so that the next open of an unchanged file maps the snapshot instead of
+scanning:
+
+- node columns: header offset, type, subtree end, chunk range
+- chunk columns: chunk ID and the payload's start and end offset in the
+  .sco file (payloads are not copied; they are read from the .sco mapping)
+- names, parse errors and scan warnings as string pools with offsets
+- node positions (float32 x, y, z) and the waypoint table in CSR form
+
+A snapshot is valid for a .sco file of the same size and either the same
+modification time or the same SHA-256, written by the same SNAPSHOT_VERSION
+and parser FORMAT_VERSION on a machine of the same byte order. A damaged
+snapshot (failing its CRC-32 or with inconsistent sections) is treated as
+missing. Anything else rebuilds it. Snapshots are named after the .sco
+path, so each file has at most one.
+
+The default location is ~/.cache/sco_parser, overridable via SCO_CACHE_DIR
+(or XDG_CACHE_HOME).
+"""
+
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import tempfile
+import zlib
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .models import WaypointTable
+from .parser import FORMAT_VERSION, NodeTable
+
+log = logging.getLogger(__name__)
+
+# Bumped when the snapshot layout changes
+SNAPSHOT_VERSION = 2
+
+_MAGIC = b'SCOSNAP\0'
+# Written in native order; reads back differently on the other byte order
+_BYTE_ORDER_MARK = 0x01020304
+# magic, snapshot version, parser version, byte order mark, section count,
+# CRC-32 of the snapshot (see _checksum), source size, source mtime (ns),
+# offset after the node tree, source SHA-256
+_HEADER = struct.Struct('=8s5IQqq32s')
+_MTIME_OFFSET = 8 + 5 * 4 + 8
+# Byte offset and length of each section
+_SECTION = struct.Struct('=QQ')
+
+# Sections in file order: (name, array typecode)
+_SECTIONS = (
+    ('offsets', 'q'),
+    ('types', 'I'),
+    ('ends', 'I'),
+    ('first_chunk', 'I'),
+    ('chunk_counts', 'I'),
+    ('chunk_ids', 'I'),
+    ('chunk_starts', 'q'),
+    ('chunk_stops', 'q'),
+    ('name_pool', 'B'),
+    ('name_offsets', 'I'),
+    ('error_nodes', 'I'),
+    ('error_pool', 'B'),
+    ('error_offsets', 'I'),
+    ('warning_pool', 'B'),
+    ('warning_offsets', 'I'),
+    ('positioned', 'I'),
+    ('coords', 'f'),
+    ('wp_nodes', 'I'),
+    ('wp_ids', 'I'),
+    ('wp_offsets', 'I'),
+    ('wp_connections', 'I'),
+)
+
+
+def default_snapshot_dir() -> Path:
+    env_dir = os.environ.get("SCO_CACHE_DIR")
+    if env_dir:
+        return Path(env_dir)
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg) if xdg else Path.home() / ".cache"
+    return base / "sco_parser"
+
+
+def snapshot_path(snapshot_dir, source: Path) -> Path:
+    """Snapshot file of a .sco file."""
+    name = hashlib.sha256(os.fsencode(os.path.abspath(source))).hexdigest()[:32]
+    return Path(snapshot_dir) / f"{name}.scosnap"
+
+
+def _checksum(fields: Sequence, body) -> int:
+    """CRC-32 of a snapshot's header fields and the body after the header.
+
+    The checksum and source mtime fields are left out: the mtime is updated
+    in place (see _update_mtime).
+    """
+    fields = list(fields)
+    fields[5] = fields[7] = 0
+    return zlib.crc32(body, zlib.crc32(_HEADER.pack(*fields)))
+
+
+def _pack_strings(strings: Sequence[str]) -> Tuple[bytes, array]:
+    """UTF-8 pool of strings and the offsets of each (plus the end)."""
+    encoded = [s.encode('utf-8', 'surrogatepass') for s in strings]
+    offsets = array('I', [0])
+    for s in encoded:
+        offsets.append(offsets[-1] + len(s))
+    return b''.join(encoded), offsets
+
+
+def _unpack_strings(pool: memoryview, offsets: Sequence[int]) -> List[str]:
+    raw = bytes(pool)
+    if raw.isascii():
+        # Byte offsets are character offsets: slice the decoded pool
+        text = raw.decode('ascii')
+        return [text[a:b] for a, b in zip(offsets, offsets[1:])]
+    return [str(raw[a:b], 'utf-8', 'surrogatepass') for a, b in zip(offsets, offsets[1:])]
+
+
+def save_snapshot(snapshot_dir, source: Path, data, table: NodeTable,
+                  tree_end: int, scan_warnings: List[str]) -> bool:
+    """Write the snapshot of a scanned node tree. Returns False on failure."""
+    try:
+        st = os.stat(source)
+    except OSError as e:
+        log.warning(f"Snapshot of {source} not written: {e}")
+        return False
+    if st.st_size != len(data):
+        return False  # Changed while being parsed
+    positioned, coords = table.positioned()
+    waypoints = table.waypoint_table()
+    name_pool, name_offsets = _pack_strings(table.names)
+    error_nodes = sorted(table.errors)
+    error_pool, error_offsets = _pack_strings([table.errors[i] for i in error_nodes])
+    warning_pool, warning_offsets = _pack_strings(scan_warnings)
+    columns = {
+        'name_pool': name_pool, 'name_offsets': name_offsets,
+        'error_nodes': array('I', error_nodes),
+        'error_pool': error_pool, 'error_offsets': error_offsets,
+        'warning_pool': warning_pool, 'warning_offsets': warning_offsets,
+        'positioned': positioned, 'coords': array('f', coords),
+        'wp_nodes': waypoints.nodes, 'wp_ids': waypoints.wp_ids,
+        'wp_offsets': waypoints.offsets, 'wp_connections': waypoints.connections,
+    }
+
+    blobs = []
+    sections = []
+    position = _HEADER.size + _SECTION.size * len(_SECTIONS)
+    for name, typecode in _SECTIONS:
+        column = columns[name] if name in columns else getattr(table, name)
+        blob = bytes(column) if typecode == 'B' else array(typecode, column).tobytes()
+        # Keep every section 8-byte aligned for the typed views
+        padding = -position % 8
+        blobs.append(b'\0' * padding)
+        position += padding
+        sections.append(_SECTION.pack(position, len(blob)))
+        blobs.append(blob)
+        position += len(blob)
+    fields = [_MAGIC, SNAPSHOT_VERSION, FORMAT_VERSION, _BYTE_ORDER_MARK, len(_SECTIONS), 0,
+              len(data), st.st_mtime_ns, tree_end, hashlib.sha256(data).digest()]
+    fields[5] = _checksum(fields, b''.join(sections + blobs))
+    header = _HEADER.pack(*fields)
+
+    target = snapshot_path(snapshot_dir, source)
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        # Write atomically so concurrent readers never see partial files
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=".tmp-")
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.writelines(sections)
+            f.writelines(blobs)
+        os.replace(tmp_name, target)
+    except OSError as e:
+        log.warning(f"Snapshot of {source} not written: {e}")
+        return False
+    return True
+
+
+def load_snapshot(snapshot_dir, source: Path, data, file_version: int,
+                  warnings: List[str]) -> Optional[Tuple[NodeTable, int]]:
+    """NodeTable of a .sco file and the offset after its node tree, from a
+    valid snapshot; None if there is none.
+
+    A damaged snapshot (failing its checksum, or with sections out of bounds
+    or inconsistent with each other) counts as missing, so the caller
+    rescans and rewrites it. The scan warnings stored in the snapshot are
+    added to warnings.
+    """
+    target = snapshot_path(snapshot_dir, source)
+    try:
+        st = os.stat(source)
+        with open(target, 'rb') as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return None
+            fields = _HEADER.unpack(header)
+            (magic, snapshot_version, format_version, byte_order_mark, section_count,
+             checksum, size, mtime_ns, tree_end, digest) = fields
+            if not (magic == _MAGIC and snapshot_version == SNAPSHOT_VERSION
+                    and format_version == FORMAT_VERSION and byte_order_mark == _BYTE_ORDER_MARK
+                    and section_count == len(_SECTIONS) and size == len(data)):
+                return None
+            snapshot = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        if _checksum(fields, memoryview(snapshot)[_HEADER.size:]) != checksum:
+            raise ValueError("checksum mismatch")
+        columns = _read_columns(snapshot)
+        _check_columns(columns, len(data), tree_end)
+        names = _unpack_strings(columns['name_pool'], columns['name_offsets'])
+        errors = _unpack_strings(columns['error_pool'], columns['error_offsets'])
+        scan_warnings = _unpack_strings(columns['warning_pool'], columns['warning_offsets'])
+    except Exception as e:
+        log.debug(f"Discarding unreadable snapshot {target}: {e}")
+        columns = None
+    if columns is None:
+        _close_mapping(snapshot)
+        return None
+
+    if mtime_ns != st.st_mtime_ns:
+        # Touched or copied: still valid if the content is the same
+        if hashlib.sha256(data).digest() != digest:
+            columns = None
+            _close_mapping(snapshot)
+            return None
+        _update_mtime(target, st.st_mtime_ns)
+
+    table = NodeTable(data, file_version, warnings)
+    table.snapshot = snapshot
+    for name in ('offsets', 'types', 'ends', 'first_chunk', 'chunk_counts',
+                 'chunk_ids', 'chunk_starts', 'chunk_stops'):
+        setattr(table, name, columns[name])
+    table.names = names
+    table.errors = dict(zip(columns['error_nodes'], errors))
+    warnings.extend(scan_warnings)
+    table._positioned = columns['positioned'], columns['coords']
+    table._waypoints = WaypointTable(columns['wp_nodes'], columns['wp_ids'],
+                                     columns['wp_offsets'], columns['wp_connections'])
+    return table, tree_end
+
+
+def _read_columns(snapshot: mmap.mmap) -> Dict[str, memoryview]:
+    """Typed views of the sections; ValueError if a section does not fit."""
+    if len(snapshot) < _HEADER.size + _SECTION.size * len(_SECTIONS):
+        raise ValueError("section table truncated")
+    view = memoryview(snapshot)
+    columns = {}
+    for k, (name, typecode) in enumerate(_SECTIONS):
+        start, length = _SECTION.unpack_from(snapshot, _HEADER.size + _SECTION.size * k)
+        itemsize = struct.calcsize(typecode)
+        if start + length > len(snapshot) or start % 8 or length % itemsize:
+            raise ValueError(f"section {name} ({start}+{length}) does not fit")
+        columns[name] = view[start:start + length].cast(typecode)
+    return columns
+
+
+def _check_pool(columns: Dict[str, memoryview], pool: str, offsets: str, count: int) -> None:
+    offsets = columns[offsets]
+    if len(offsets) != count + 1 or offsets[0] != 0 or offsets[-1] != len(columns[pool]):
+        raise ValueError(f"{pool} offsets do not match the pool")
+
+
+def _check_columns(columns: Dict[str, memoryview], data_size: int, tree_end: int) -> None:
+    """ValueError unless the column sizes describe a consistent node table.
+
+    The values themselves are covered by the checksum.
+    """
+    n = len(columns['offsets'])
+    for name in ('types', 'ends', 'first_chunk', 'chunk_counts'):
+        if len(columns[name]) != n:
+            raise ValueError(f"{name} has {len(columns[name])} entries for {n} nodes")
+    chunks = len(columns['chunk_ids'])
+    if len(columns['chunk_starts']) != chunks or len(columns['chunk_stops']) != chunks:
+        raise ValueError("chunk columns differ in length")
+    # Chunk records are stored node by node: the last node's range ends them
+    if n and columns['first_chunk'][-1] + columns['chunk_counts'][-1] != chunks:
+        raise ValueError("chunk ranges do not match the chunk records")
+    if n and columns['ends'][0] != n:
+        raise ValueError("root subtree does not span the nodes")
+    if not 0 <= tree_end <= data_size:
+        raise ValueError("node tree end outside the .sco file")
+
+    _check_pool(columns, 'name_pool', 'name_offsets', n)
+    _check_pool(columns, 'error_pool', 'error_offsets', len(columns['error_nodes']))
+    _check_pool(columns, 'warning_pool', 'warning_offsets', max(len(columns['warning_offsets']) - 1, 0))
+    if len(columns['coords']) != 3 * len(columns['positioned']):
+        raise ValueError("coords do not match the positioned nodes")
+    waypoints = len(columns['wp_nodes'])
+    if len(columns['wp_ids']) != waypoints:
+        raise ValueError("waypoint IDs do not match the waypoint nodes")
+    _check_pool(columns, 'wp_connections', 'wp_offsets', waypoints)
+
+
+def _close_mapping(snapshot: mmap.mmap) -> None:
+    try:
+        snapshot.close()
+    except BufferError:
+        pass  # Still viewed; closed when the views are released
+
+
+def _update_mtime(target: Path, mtime_ns: int) -> None:
+    """Record a new modification time of the source, so it is not hashed again."""
+    try:
+        with open(target, 'r+b') as f:
+            f.seek(_MTIME_OFFSET)
+            f.write(struct.pack('=q', mtime_ns))
+    except OSError as e:
+        log.warning(f"Snapshot {target} not updated: {e}")
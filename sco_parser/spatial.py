@@ -0,0 +1,105 @@
+"""KD-tree for nearest-neighbour and radius queries over node positions."""
+
+import heapq
+import math
+from operator import itemgetter
+from typing import Iterable, List, Tuple
+
+
+class KDTree:
+    """Static 3-D KD-tree over (id, x, y, z) points.
+
+    The tree is implicit: points are reordered so that the point splitting
+    the range [lo, hi) is at (lo + hi) // 2, with the smaller coordinates on
+    the split axis (x, y, z by depth) before it. Queries return
+    (distance, id) pairs ordered by distance, then id, so ties are broken
+    the same way as a brute-force sort would break them. Points with
+    non-finite coordinates are left out.
+    """
+
+    def __init__(self, points: Iterable[Tuple[int, float, float, float]]):
+        isfinite = math.isfinite
+        points = [p for p in points if isfinite(p[1]) and isfinite(p[2]) and isfinite(p[3])]
+        self._ids: List[int] = [0] * len(points)
+        self._axes: Tuple[List[float], ...] = tuple([0.0] * len(points) for _ in range(3))
+        self._build(points, 0, 0)
+
+    def _build(self, points: list, lo: int, depth: int) -> None:
+        # Recurses into the lower half and loops over the upper one
+        while points:
+            axis = depth % 3
+            points.sort(key=itemgetter(axis + 1))
+            mid = len(points) >> 1
+            point = points[mid]
+            self._ids[lo + mid] = point[0]
+            for a in range(3):
+                self._axes[a][lo + mid] = point[a + 1]
+            self._build(points[:mid], lo, depth + 1)
+            points = points[mid + 1:]
+            lo += mid + 1
+            depth += 1
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def nearest(self, x: float, y: float, z: float, k: int = 1) -> List[Tuple[float, int]]:
+        """The k points closest to (x, y, z)."""
+        if k <= 0:
+            return []
+        query = (x, y, z)
+        ids, axes = self._ids, self._axes
+        xs, ys, zs = axes
+        # Max-heap of the best k as (-dist2, -id): the root is the worst kept
+        best: List[Tuple[float, int]] = []
+
+        def search(lo: int, hi: int, depth: int) -> None:
+            while lo < hi:
+                mid = (lo + hi) >> 1
+                dx, dy, dz = x - xs[mid], y - ys[mid], z - zs[mid]
+                entry = (-(dx * dx + dy * dy + dz * dz), -ids[mid])
+                if len(best) < k:
+                    heapq.heappush(best, entry)
+                elif entry > best[0]:
+                    heapq.heapreplace(best, entry)
+                axis = depth % 3
+                delta = query[axis] - axes[axis][mid]
+                if delta < 0:
+                    near, far = (lo, mid), (mid + 1, hi)
+                else:
+                    near, far = (mid + 1, hi), (lo, mid)
+                search(near[0], near[1], depth + 1)
+                # The far side can only hold points at least |delta| away
+                if len(best) < k or delta * delta <= -best[0][0]:
+                    lo, hi = far
+                    depth += 1
+                else:
+                    return
+
+        search(0, len(ids), 0)
+        return [(math.sqrt(-d2), -neg_id) for d2, neg_id in sorted(best, reverse=True)]
+
+    def within(self, x: float, y: float, z: float, radius: float) -> List[Tuple[float, int]]:
+        """All points at most radius away from (x, y, z)."""
+        query = (x, y, z)
+        limit = radius * radius
+        ids, axes = self._ids, self._axes
+        xs, ys, zs = axes
+        found: List[Tuple[float, int]] = []
+        stack = [(0, len(ids), 0)] if radius >= 0 else []
+        while stack:
+            lo, hi, depth = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) >> 1
+            dx, dy, dz = x - xs[mid], y - ys[mid], z - zs[mid]
+            dist2 = dx * dx + dy * dy + dz * dz
+            if dist2 <= limit:
+                found.append((dist2, ids[mid]))
+            axis = depth % 3
+            delta = query[axis] - axes[axis][mid]
+            if delta <= 0 or delta * delta <= limit:
+                stack.append((lo, mid, depth + 1))
+            if delta >= 0 or delta * delta <= limit:
+                stack.append((mid + 1, hi, depth + 1))
+        found.sort()
+        return [(math.sqrt(d2), point_id) for d2, point_id in found]
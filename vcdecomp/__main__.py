@@ -7,6 +7,7 @@ Použití:
     python -m vcdecomp strings <file.scr>                        # Seznam stringů
     python -m vcdecomp validate <orig.scr> <src.c>               # Validace rekompilace
     python -m vcdecomp validate-batch --input-dir ... --original-dir ...  # Batch validace
+    python -m vcdecomp bench [corpus ...]                        # Měření rychlosti pipeline
     python -m vcdecomp gui [file.scr]                            # Otevře GUI
 """
 
@@ -14,6 +15,7 @@ import argparse
 import json
 import sys
 import io
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
 
@@ -170,6 +172,34 @@ def _add_variant_option(subparser):
     )
 
 
+def _add_trace_options(subparser):
+    subparser.add_argument(
+        '--trace',
+        default=None,
+        metavar='CATEGORIES',
+        help='DEBUG výstup jen pro vybrané kategorie, oddělené čárkou '
+             '(structure, switch, variables, fields, types, functions, general)'
+    )
+    subparser.add_argument(
+        '--trace-spans',
+        default=None,
+        metavar='FILE',
+        help='Zapíše časy fází pipeline jako JSON řádky (spany) do souboru'
+    )
+
+
+@contextmanager
+def _trace_spans(args, **attributes):
+    """Zapisuje spany fází do --trace-spans souboru (pokud je zadán)."""
+    path = getattr(args, 'trace_spans', None)
+    if not path:
+        yield
+        return
+    from .core.ir.stage_timing import SpanWriter, recording
+    with open(path, 'a', encoding='utf-8') as stream, recording(SpanWriter(stream, **attributes)):
+        yield
+
+
 def main():
     parser = argparse.ArgumentParser(
         prog='vcdecomp',
@@ -187,6 +217,8 @@ Příklady:
     python -m vcdecomp validate-batch --input-dir decompiled/ --original-dir scripts/ --save-baseline
     python -m vcdecomp validate-batch --input-dir decompiled/ --original-dir scripts/ --regression
     python -m vcdecomp validate-batch --input-dir decompiled/ --original-dir scripts/ --regression --report-file regression.json
+    python -m vcdecomp bench original-resources/ missions/ --save-baseline
+    python -m vcdecomp bench missions/ --regression --baseline-file .bench-baseline.json
     python -m vcdecomp gui level.scr
 """
     )
@@ -320,6 +352,24 @@ Příklady:
         help='Mission-specific header file (e.g., LEVEL_H.H) for constant/function resolution. '
              'If not specified, auto-detects *_H.H in the same directory as the .SCR file.'
     )
+    p_structure.add_argument(
+        '--jobs', '-j',
+        type=int,
+        default=1,
+        help='Structure functions in N worker processes (default: 1, sequential; requires fork)'
+    )
+    p_structure.add_argument(
+        '--no-cache',
+        action='store_true',
+        default=False,
+        help='Do not read or write the persistent decompilation cache'
+    )
+    p_structure.add_argument(
+        '--cache-dir',
+        default=None,
+        help='Decompilation cache directory (default: $VCDECOMP_CACHE_DIR or ~/.cache/vcdecomp)'
+    )
+    _add_trace_options(p_structure)
     _add_variant_option(p_structure)
 
     # structure-folder
@@ -341,6 +391,17 @@ Příklady:
     p_sf.add_argument('--debug-type-inference', action='store_true', default=False)
     p_sf.add_argument('--header', '-H', default=None,
                       help='Mission-specific header file (auto-detected if not specified)')
+    p_sf.add_argument('--jobs', '-j', type=int, default=1,
+                      help='Analyze and decompile files in N worker processes (default: 1, sequential)')
+    p_sf.add_argument('--reuse-ssa', action='store_true', default=False,
+                      help='Keep Pass 1 SSA for Pass 2 instead of lifting every file twice')
+    p_sf.add_argument('--ssa-retain', type=int, default=8, metavar='N',
+                      help='With --reuse-ssa: keep at most N files in memory, spill the rest (default: 8)')
+    p_sf.add_argument('--ssa-spill-dir', default=None,
+                      help='With --reuse-ssa: directory for spilled SSA (default: temporary directory)')
+    p_sf.add_argument('--no-ssa-spill', action='store_true', default=False,
+                      help='With --reuse-ssa: re-lift files over the memory limit instead of spilling them')
+    _add_trace_options(p_sf)
     _add_variant_option(p_sf)
 
     # symbols
@@ -374,6 +435,26 @@ Příklady:
     p_validate_batch.add_argument('--regression', action='store_true', help='Compare results against baseline to detect regressions')
     p_validate_batch.add_argument('--baseline-file', help='Path to baseline file (default: .validation-baseline.json)')
 
+    # bench
+    p_bench = subparsers.add_parser('bench', help='Benchmark decompiler pipeline stages over a corpus')
+    p_bench.add_argument('paths', nargs='*',
+                         help='.scr files or directories to scan recursively (default: original-resources)')
+    p_bench.add_argument('--repeat', type=int, default=1,
+                         help='Decompile each file N times and keep the fastest run (default: 1)')
+    p_bench.add_argument('--trace-memory', action='store_true',
+                         help='Measure peak allocated memory per file with tracemalloc (one extra run)')
+    p_bench.add_argument('--legacy-ssa', action='store_true', default=False)
+    p_bench.add_argument('--no-collapse', action='store_true', default=False)
+    p_bench.add_argument('--no-simplify', action='store_true', default=False)
+    p_bench.add_argument('--report-file', help='Save benchmark report to JSON file')
+    p_bench.add_argument('--save-baseline', action='store_true', help='Save current timings as baseline')
+    p_bench.add_argument('--regression', action='store_true',
+                         help='Compare timings against baseline; exit with status 1 on regressions')
+    p_bench.add_argument('--baseline-file', help='Path to baseline file (default: .bench-baseline.json)')
+    p_bench.add_argument('--threshold', type=float, default=0.25,
+                         help='Allowed slowdown per stage as a fraction of the baseline (default: 0.25)')
+    _add_variant_option(p_bench)
+
     # gui
     p_gui = subparsers.add_parser('gui', help='Spustí GUI aplikaci')
     p_gui.add_argument('file', nargs='?', help='Cesta k SCR souboru (volitelné)')
@@ -424,6 +505,8 @@ Příklady:
             cmd_validate(args)
         elif args.command == 'validate-batch':
             cmd_validate_batch(args)
+        elif args.command == 'bench':
+            cmd_bench(args)
         elif args.command == 'gui':
             cmd_gui(args)
         elif args.command == 'xfn-aggregate':
@@ -581,8 +664,10 @@ def _resolve_mission_header(args) -> Optional[Path]:
 def cmd_structure(args):
     """Strukturovaný výstup - dekompilace všech funkcí"""
     from .core.ir.decompile_file import decompile_single_scr
+    from .core.ir.decompile_cache import get_decompile_cache
 
-    result = decompile_single_scr(Path(args.file), args)
+    with _trace_spans(args, file=Path(args.file).name):
+        result = decompile_single_scr(Path(args.file), args, cache=get_decompile_cache(args))
     print(result)
 
     if args.dump_type_evidence:
@@ -611,12 +696,8 @@ def cmd_structure(args):
 
 def cmd_structure_folder(args):
     """Decompile all .SCR files in a mission folder with cross-file context."""
-    from .core.ir.decompile_file import (
-        decompile_single_scr,
-        resolve_mission_header,
-        run_pass1_analysis,
-    )
-    from .core.ir.cross_file_context import CrossFileContext
+    from .core.ir.decompile_file import resolve_mission_header
+    from .core.ir.ssa_retention import SSARetentionStore
 
     mission_dir = Path(args.directory)
     if not mission_dir.is_dir():
@@ -645,16 +726,71 @@ def cmd_structure_folder(args):
         _reset_constants()
         print(f"Mission header loaded: {header_path.name}", file=sys.stderr)
 
+    jobs = max(1, getattr(args, 'jobs', 1) or 1)
+    parallel = jobs > 1 and len(scr_files) > 1
+
+    store = None
+    if getattr(args, 'reuse_ssa', False):
+        spill_dir = getattr(args, 'ssa_spill_dir', None)
+        store = SSARetentionStore(
+            # Worker processes cannot hand SSA back in memory; they always spill
+            max_resident=0 if parallel else getattr(args, 'ssa_retain', 8),
+            spill=parallel or not getattr(args, 'no_ssa_spill', False),
+            spill_dir=Path(spill_dir) if spill_dir else None,
+        )
+
+    try:
+        with _trace_spans(args, folder=mission_dir.name):
+            _structure_folder_passes(args, scr_files, header_path, jobs, parallel, store)
+    finally:
+        if store is not None:
+            print(store.summary(), file=sys.stderr)
+            store.close()
+
+    print("Done.", file=sys.stderr)
+
+
+def _structure_folder_passes(args, scr_files, header_path, jobs, parallel, store):
+    """Pass 1 (evidence) and Pass 2 (decompilation) for cmd_structure_folder."""
+    from .core.ir.decompile_file import (
+        decompile_single_scr,
+        run_folder_pass1_parallel,
+        run_folder_pass2_parallel,
+        run_pass1_analysis,
+    )
+    from .core.ir.cross_file_context import CrossFileContext
+
+    total = len(scr_files)
+    reuse_ssa = store is not None
+
     # --- Pass 1: Collect evidence from all files ---
     ctx = CrossFileContext()
-    print(f"Pass 1: Analyzing {len(scr_files)} files...", file=sys.stderr)
-    for i, scr_path in enumerate(scr_files, 1):
-        print(f"  [{i}/{len(scr_files)}] {scr_path.name}", file=sys.stderr)
-        try:
-            scr, globals_usage, float_globals = run_pass1_analysis(scr_path, args)
-            ctx.add_file_analysis(scr_path.name, scr, globals_usage, float_globals)
-        except Exception as e:
-            print(f"  WARNING: Failed to analyze {scr_path.name}: {e}", file=sys.stderr)
+    print(f"Pass 1: Analyzing {total} files...", file=sys.stderr)
+    if parallel:
+        # Evidence is merged here in sorted file order, as in the sequential loop
+        results = run_folder_pass1_parallel(
+            scr_files, args, jobs, header_path,
+            spill_dir=store.spill_dir if reuse_ssa else None,
+        )
+        for i, (scr_path, evidence, error, spill_path) in enumerate(results, 1):
+            print(f"  [{i}/{total}] {scr_path.name}", file=sys.stderr)
+            if error is not None:
+                print(f"  WARNING: Failed to analyze {scr_path.name}: {error}", file=sys.stderr)
+                continue
+            ctx.add_file_evidence(evidence)
+            if spill_path is not None:
+                store.mark_spilled(scr_path.name, spill_path)
+    else:
+        for i, scr_path in enumerate(scr_files, 1):
+            print(f"  [{i}/{total}] {scr_path.name}", file=sys.stderr)
+            try:
+                results = run_pass1_analysis(scr_path, args, return_lifted=reuse_ssa)
+                scr, globals_usage, float_globals = results[:3]
+                ctx.add_file_analysis(scr_path.name, scr, globals_usage, float_globals)
+                if reuse_ssa:
+                    store.put(scr_path.name, results[3])
+            except Exception as e:
+                print(f"  WARNING: Failed to analyze {scr_path.name}: {e}", file=sys.stderr)
 
     ctx.resolve()
     print(f"Pass 1 complete. {ctx.summary()}", file=sys.stderr)
@@ -664,31 +800,55 @@ def cmd_structure_folder(args):
     if output_dir:
         output_dir.mkdir(parents=True, exist_ok=True)
 
-    print(f"Pass 2: Decompiling {len(scr_files)} files...", file=sys.stderr)
-    for i, scr_path in enumerate(scr_files, 1):
-        print(f"  [{i}/{len(scr_files)}] {scr_path.name}", file=sys.stderr)
-        try:
-            result = decompile_single_scr(
-                scr_path,
-                args,
-                cross_file_context=ctx,
-                header_path=header_path,
-                header_already_loaded=True,
-            )
-
-            if output_dir:
-                out_file = output_dir / (scr_path.stem + ".c")
-                out_file.write_text(result, encoding='utf-8')
-                print(f"    -> {out_file}", file=sys.stderr)
-            else:
-                # Print to stdout with separator
-                print(f"// ========== {scr_path.name} ==========")
-                print(result)
-                print()
-        except Exception as e:
-            print(f"  ERROR: Failed to decompile {scr_path.name}: {e}", file=sys.stderr)
+    def _emit(scr_path, result):
+        if output_dir:
+            out_file = output_dir / (scr_path.stem + ".c")
+            out_file.write_text(result, encoding='utf-8')
+            print(f"    -> {out_file}", file=sys.stderr)
+        else:
+            # Print to stdout with separator
+            print(f"// ========== {scr_path.name} ==========")
+            print(result)
+            print()
 
-    print("Done.", file=sys.stderr)
+    print(f"Pass 2: Decompiling {total} files...", file=sys.stderr)
+    if parallel:
+        spilled = None
+        if reuse_ssa:
+            spilled = {
+                scr_path.name: store.spilled_path(scr_path.name)
+                for scr_path in scr_files
+                if store.spilled_path(scr_path.name) is not None
+            }
+        results = run_folder_pass2_parallel(
+            scr_files, args, jobs, ctx, header_path, spilled=spilled
+        )
+        for i, (scr_path, result, error, reused) in enumerate(results, 1):
+            print(f"  [{i}/{total}] {scr_path.name}", file=sys.stderr)
+            if reuse_ssa:
+                store.record_reuse(reused)
+            if error is not None:
+                print(f"  ERROR: Failed to decompile {scr_path.name}: {error}", file=sys.stderr)
+                continue
+            try:
+                _emit(scr_path, result)
+            except Exception as e:
+                print(f"  ERROR: Failed to decompile {scr_path.name}: {e}", file=sys.stderr)
+    else:
+        for i, scr_path in enumerate(scr_files, 1):
+            print(f"  [{i}/{total}] {scr_path.name}", file=sys.stderr)
+            try:
+                result = decompile_single_scr(
+                    scr_path,
+                    args,
+                    cross_file_context=ctx,
+                    header_path=header_path,
+                    header_already_loaded=True,
+                    lifted=store.take(scr_path.name) if reuse_ssa else None,
+                )
+                _emit(scr_path, result)
+            except Exception as e:
+                print(f"  ERROR: Failed to decompile {scr_path.name}: {e}", file=sys.stderr)
 
 
 def cmd_symbols(args):
@@ -1149,6 +1309,70 @@ def cmd_validate_batch(args):
             sys.exit(0)  # All passed or partial
 
 
+def cmd_bench(args):
+    """Benchmark the decompiler pipeline stage by stage over a corpus."""
+    from .core.ir.benchmark import (
+        BenchmarkReport,
+        bench_args,
+        compare_reports,
+        find_scr_files,
+        format_report,
+        run_benchmark,
+    )
+
+    paths = [Path(p) for p in args.paths] or [Path(__file__).resolve().parent.parent / 'original-resources']
+    scr_files = find_scr_files(paths)
+    if not scr_files:
+        print(f"Error: No .SCR files found in {', '.join(str(p) for p in paths)}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Benchmarking {len(scr_files)} files (repeat={args.repeat})", file=sys.stderr)
+
+    def _progress(result):
+        status = f"ERROR {result.error}" if result.error else f"{result.total * 1000:.1f} ms"
+        print(f"  {result.file}: {status}", file=sys.stderr)
+
+    decompile_args = bench_args(
+        variant=args.variant,
+        legacy_ssa=args.legacy_ssa,
+        no_collapse=args.no_collapse,
+        no_simplify=args.no_simplify,
+    )
+    report = run_benchmark(scr_files, decompile_args, repeat=args.repeat,
+                           trace_memory=args.trace_memory, progress_callback=_progress)
+    print(format_report(report))
+
+    if args.report_file:
+        report.save(Path(args.report_file))
+        print(f"Report saved to: {args.report_file}")
+
+    baseline_path = Path(args.baseline_file) if args.baseline_file else Path(".bench-baseline.json")
+    if args.save_baseline:
+        report.save(baseline_path)
+        print(f"Baseline saved to: {baseline_path}")
+
+    if args.regression:
+        if not baseline_path.exists():
+            print(f"Error: Baseline file not found: {baseline_path}", file=sys.stderr)
+            print(f"Create a baseline first with --save-baseline", file=sys.stderr)
+            sys.exit(1)
+
+        regressions = compare_reports(BenchmarkReport.load(baseline_path), report,
+                                      threshold=args.threshold)
+        print()
+        print("Regression Testing")
+        print("=" * 60)
+        print(f"Baseline: {baseline_path}")
+        if not regressions:
+            print("No regressions")
+            return
+        for item in regressions:
+            where = item.file or "(all files)"
+            print(f"SLOWER {where} {item.stage}: {item.baseline_seconds * 1000:.1f} ms -> "
+                  f"{item.current_seconds * 1000:.1f} ms ({item.ratio:.2f}x)")
+        sys.exit(1)
+
+
 def cmd_xfn_aggregate(args):
     """Aggregate XFN function signatures from .scr files"""
     from .xfn import XFNAggregator, AggregationResult
@@ -6,10 +6,11 @@ Převádí binární instrukce na čitelný assembler výstup.
 
 from typing import List, Set, Dict, Optional
 from dataclasses import dataclass, field
+from itertools import compress
 import struct
 import math
 
-from ..loader.scr_loader import SCRFile, Instruction
+from ..loader.scr_loader import SCRFile, Instruction, instruction_columns
 from .opcodes import ArgType, OpcodeResolver, DEFAULT_RESOLVER
 
 
@@ -63,16 +64,13 @@ class Disassembler:
         internal_call_opcodes = self.resolver.internal_call_opcodes
         return_opcodes = self.resolver.return_opcodes
         code_count = self.scr.code_segment.code_count
+        opcodes, arg1, _ = instruction_columns(self.scr.code_segment.instructions)
 
-        # Najdeme všechny cíle skoků a volání
-        for instr in self.scr.code_segment.instructions:
-            opcode = instr.opcode
-
-            if opcode in jump_opcodes:
-                label_targets.add(instr.arg1)
-            elif opcode in internal_call_opcodes:
-                # Interní CALL - cíl je lokální funkce
-                call_targets.add(instr.arg1)
+        # Najdeme všechny cíle skoků a volání (maskou přes sloupce, bez objektů Instruction)
+        label_targets.update(compress(arg1, map(jump_opcodes.__contains__, opcodes)))
+        # Interní CALL - cíl je lokální funkce
+        call_only_opcodes = internal_call_opcodes - jump_opcodes
+        call_targets.update(compress(arg1, map(call_only_opcodes.__contains__, opcodes)))
 
         # Vytvoříme labely
         for addr in sorted(label_targets):
@@ -109,10 +107,10 @@ class Disassembler:
                 last_helper_start = sorted_call_targets[-1]
                 # Hledáme RET za posledním helper entry
                 main_start = None
-                for instr in self.scr.code_segment.instructions:
-                    if instr.address > last_helper_start and instr.opcode in return_opcodes:
+                for address in range(max(last_helper_start + 1, 0), len(opcodes)):
+                    if opcodes[address] in return_opcodes:
                         # RET najden, další instrukce je potenciální ScriptMain
-                        next_addr = instr.address + 1
+                        next_addr = address + 1
                         if next_addr < code_count:
                             main_start = next_addr
                             break
@@ -131,20 +129,18 @@ class Disassembler:
 
     def _analyze_data_usage(self) -> None:
         """Analyzuje jak jsou data používána a určí jejich typ"""
-        for instr in self.scr.code_segment.instructions:
-            mnemonic = self.resolver.get_mnemonic(instr.opcode)
-
-            if mnemonic == "GADR":
-                # GADR načítá adresu stringu pro čtení
-                self.data_usage[instr.arg1] = "string"
-            elif mnemonic == "DADR":
-                # DADR načítá adresu pro zápis (cíl assignment) - není string
-                if instr.arg1 not in self.data_usage:
-                    self.data_usage[instr.arg1] = "value"
-            elif mnemonic in ("GCP", "GLD"):
-                # Hodnota - data jsou int/float (nepřepisujeme pokud už je string)
-                if instr.arg1 not in self.data_usage:
-                    self.data_usage[instr.arg1] = "value"
+        opcodes, arg1, _ = instruction_columns(self.scr.code_segment.instructions)
+        opcode_map = self.resolver.opcode_map
+        string_opcodes = {op for op, m in opcode_map.items() if m == "GADR"}
+        # DADR načítá adresu pro zápis (cíl assignment), GCP/GLD hodnotu - není string
+        value_opcodes = {op for op, m in opcode_map.items() if m in ("DADR", "GCP", "GLD")}
+
+        # "value" platí jen pokud data nikde nečte GADR (GADR vždy vyhrává)
+        for index in compress(arg1, map(value_opcodes.__contains__, opcodes)):
+            self.data_usage[index] = "value"
+        # GADR načítá adresu stringu pro čtení
+        for index in compress(arg1, map(string_opcodes.__contains__, opcodes)):
+            self.data_usage[index] = "string"
 
     def _is_reasonable_float(self, f: float) -> bool:
         """Kontroluje zda float hodnota vypadá rozumně (ne náhodná binární data)"""
@@ -45,6 +45,19 @@ def _derive_out_params(parameters: List[Tuple[str, str]]) -> List[int]:
             if _is_out_param(param_type or "", param_name or "")]
 
 
+def parse_mission_header(header_path: Path) -> Dict:
+    """
+    Parse a mission-specific header file without loading it into a database.
+
+    Returns:
+        Parser output with 'constants', 'functions' and 'structures'
+    """
+    from .parser import HeaderParser
+
+    include_dirs = [Path(__file__).parent.parent.parent / 'compiler' / 'inc']
+    return HeaderParser().parse_mission_header(header_path, include_dirs=include_dirs)
+
+
 class HeaderDatabase:
     """
     Database for header information with fast lookup.
@@ -184,11 +197,7 @@ class HeaderDatabase:
         Args:
             header_path: Path to the mission header file
         """
-        from .parser import HeaderParser
-
-        parser = HeaderParser()
-        include_dirs = [Path(__file__).parent.parent.parent / 'compiler' / 'inc']
-        data = parser.parse_mission_header(header_path, include_dirs=include_dirs)
+        data = parse_mission_header(header_path)
 
         self._mission_header_name = header_path.name
 
@@ -0,0 +1,355 @@
+"""
+Whole-Program Analysis Context
+
+Several analyses used while structuring a single function actually look at the
+whole SSA program: quick type inference for PHI resolution, constant
+propagation, global variable naming and the SDK constant resolver. Running
+them once per function makes decompiling a script quadratic in its size.
+
+ProgramAnalysisContext computes those results once per SSAFunction and hands
+each function a cheap FunctionAnalysisView (block membership + shared results).
+It also partitions the SSA program into FunctionViews (a function's blocks,
+instructions and values), so per-function passes never scan the whole
+program.
+
+Type-dependent results are tied to a "type generation" counter. Passes that
+write value_type back into SSA values (float seeding, flat-mode type inference)
+bump the generation, and the cached results are recomputed on next access, so
+output stays identical to running every analysis from scratch per function.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from .ssa import SSAFunction, SSAInstruction
+    from .type_inference import TypeInferenceEngine
+    from .constant_propagation import ConstantPropagator
+
+logger = logging.getLogger(__name__)
+
+_UNSET = object()
+
+
+@dataclass
+class FunctionView:
+    """
+    The SSA blocks of one function, in SSAFunction.instructions order.
+
+    Built by ProgramAnalysisContext.function_views / range_view; iterating
+    it costs the size of the function, not of the program.
+    """
+
+    start: int
+    end: Optional[int]
+    # CFG blocks of the function
+    block_ids: Set[int]
+    # (block_id, instructions) for the function's blocks that have SSA
+    blocks: List[Tuple[int, List["SSAInstruction"]]]
+
+    def __post_init__(self) -> None:
+        self._defined: Optional[Set[str]] = None
+        self._used: Optional[Set[str]] = None
+
+    def instructions(self) -> Iterator["SSAInstruction"]:
+        """The function's instructions in block order."""
+        for _, insts in self.blocks:
+            yield from insts
+
+    @property
+    def defined_values(self) -> Set[str]:
+        """Names of the SSA values defined by the function's instructions."""
+        if self._defined is None:
+            self._collect_values()
+        return self._defined
+
+    @property
+    def used_values(self) -> Set[str]:
+        """Names of the SSA values read by the function's instructions."""
+        if self._used is None:
+            self._collect_values()
+        return self._used
+
+    def _collect_values(self) -> None:
+        defined: Set[str] = set()
+        used: Set[str] = set()
+        for inst in self.instructions():
+            defined.update(value.name for value in inst.outputs if value is not None)
+            used.update(value.name for value in inst.inputs if value is not None)
+        self._defined = defined
+        self._used = used
+
+
+@dataclass
+class FunctionAnalysisView:
+    """Function-scoped view over a ProgramAnalysisContext."""
+
+    context: "ProgramAnalysisContext"
+    func_name: str
+    entry_addr: int
+    end_addr: Optional[int]
+    entry_block: int
+    # Blocks inside [entry_addr, end_addr] (before the reachability filter)
+    range_block_count: int
+    # Reachable blocks inside the function's address range
+    block_ids: Set[int]
+
+
+class ProgramAnalysisContext:
+    """
+    Program-wide analysis results shared by all functions of one SSAFunction.
+
+    Obtain it via get_analysis_context(ssa_func); it is cached on the SSA
+    function so every formatter and structuring pass sees the same instance.
+    """
+
+    def __init__(self, ssa_func: "SSAFunction"):
+        self.ssa_func = ssa_func
+
+        # Bumped whenever SSA value types are rewritten
+        self._type_generation = 0
+
+        self._type_engine: Optional["TypeInferenceEngine"] = None
+        self._type_engine_generation = -1
+
+        self._constant_propagator: Optional["ConstantPropagator"] = None
+        self._constant_propagator_generation = -1
+
+        self._constant_resolver = _UNSET
+        self._symbol_db = _UNSET
+        self._global_map: Optional[Dict[int, str]] = None
+
+        # Sorted block starts for range queries (rebuilt if the CFG grows)
+        self._block_starts: List[int] = []
+        self._block_ids_by_start: List[int] = []
+        self._indexed_block_count = -1
+
+        # SSA partitions: function ranges -> {start: FunctionView}
+        self._partitions: Dict[frozenset, Dict[int, FunctionView]] = {}
+        self._range_views: Dict[Tuple[int, Optional[int]], FunctionView] = {}
+        self._block_order: Dict[int, int] = {}
+
+    # ------------------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------------------
+
+    def invalidate_types(self) -> None:
+        """Record that SSA value types changed; type-dependent caches go stale."""
+        self._type_generation += 1
+
+    # ------------------------------------------------------------------
+    # Shared analyses
+    # ------------------------------------------------------------------
+
+    @property
+    def type_engine(self) -> Optional["TypeInferenceEngine"]:
+        """
+        Quick aggressive type inference over the whole program (PHI resolution).
+
+        The engine writes refined types back into SSA values. If that write-back
+        changed anything, the engine is re-run on the next access so that the
+        cached engine always corresponds to the current SSA state.
+        Returns None if inference fails.
+        """
+        if self._type_engine_generation != self._type_generation:
+            from .type_inference import TypeInferenceEngine
+
+            engine = None
+            try:
+                engine = TypeInferenceEngine(self.ssa_func, aggressive=True)
+                changed = engine.integrate_with_ssa_values()
+            except Exception as e:
+                logger.debug(f"Quick type inference for PHI resolution failed: {e}")
+                engine = None
+                changed = 0
+            self._type_engine = engine
+            if changed:
+                # Types moved under us; the next caller must see a fresh run
+                self._type_generation += 1
+            else:
+                self._type_engine_generation = self._type_generation
+        return self._type_engine
+
+    @property
+    def constant_propagator(self) -> "ConstantPropagator":
+        """Constant propagation results for the whole program."""
+        if self._constant_propagator_generation != self._type_generation:
+            from .constant_propagation import ConstantPropagator
+
+            propagator = ConstantPropagator(self.ssa_func)
+            propagator.analyze()
+            self._constant_propagator = propagator
+            self._constant_propagator_generation = self._type_generation
+        return self._constant_propagator
+
+    @property
+    def constant_resolver(self):
+        """SDK ConstantResolver, or None when the SDK database is unavailable."""
+        if self._constant_resolver is _UNSET:
+            from ..headers.database import get_header_database
+
+            resolver = None
+            header_db = get_header_database()
+            if header_db and header_db.sdk_db:
+                try:
+                    from ...sdk.constant_resolver import ConstantResolver
+                    resolver = ConstantResolver(header_db.sdk_db)
+                except Exception:
+                    # SDK constant resolver not available, continue without it
+                    pass
+            self._constant_resolver = resolver
+        return self._constant_resolver
+
+    @property
+    def symbol_db(self):
+        """Compiler symbol database (compiler/symbol_db.json), if present."""
+        if self._symbol_db is _UNSET:
+            from .structure.utils.helpers import _load_symbol_db
+            self._symbol_db = _load_symbol_db()
+        return self._symbol_db
+
+    @property
+    def global_map(self) -> Dict[int, str]:
+        """Global variable names: data segment offset -> name."""
+        if self._global_map is None:
+            from .global_resolver import resolve_globals
+            self._global_map = resolve_globals(self.ssa_func)
+        return self._global_map
+
+    def warm_up(self) -> None:
+        """
+        Compute every shared analysis now.
+
+        Used before forking worker processes so the results are inherited
+        instead of being recomputed in each worker.
+        """
+        self.type_engine
+        self.constant_propagator
+        self.constant_resolver
+        self.symbol_db
+        self.global_map
+
+    # ------------------------------------------------------------------
+    # Function views
+    # ------------------------------------------------------------------
+
+    def _ensure_block_index(self) -> None:
+        blocks = self.ssa_func.cfg.blocks
+        if self._indexed_block_count == len(blocks):
+            return
+        ordered = sorted(blocks.items(), key=lambda item: (item[1].start, item[0]))
+        self._block_starts = [block.start for _, block in ordered]
+        self._block_ids_by_start = [block_id for block_id, _ in ordered]
+        self._indexed_block_count = len(blocks)
+        self._partitions.clear()
+        self._range_views.clear()
+        self._block_order = {
+            block_id: position for position, block_id in enumerate(self.ssa_func.instructions)
+        }
+
+    def blocks_in_range(self, entry_addr: int, end_addr: Optional[int]) -> List[int]:
+        """Block IDs whose start lies in [entry_addr, end_addr], in address order."""
+        self._ensure_block_index()
+        lo = bisect.bisect_left(self._block_starts, entry_addr)
+        if end_addr is None:
+            hi = len(self._block_starts)
+        else:
+            hi = bisect.bisect_right(self._block_starts, end_addr)
+        return self._block_ids_by_start[lo:hi]
+
+    def _view(self, start: int, end: Optional[int], block_ids: List[int]) -> FunctionView:
+        order = self._block_order
+        instructions = self.ssa_func.instructions
+        ordered = sorted((block_id for block_id in block_ids if block_id in order), key=order.__getitem__)
+        return FunctionView(start, end, set(block_ids),
+                            [(block_id, instructions[block_id]) for block_id in ordered])
+
+    def range_view(self, start: int, end: Optional[int]) -> FunctionView:
+        """SSA blocks whose start lies in [start, end] (end None: to the end)."""
+        self._ensure_block_index()
+        key = (start, end)
+        view = self._range_views.get(key)
+        if view is None:
+            view = self._range_views[key] = self._view(start, end, self.blocks_in_range(start, end))
+        return view
+
+    def function_views(self, function_bounds: Dict[str, Tuple[int, int]]) -> Dict[int, FunctionView]:
+        """
+        Partition the SSA program by function: {function start: FunctionView}.
+
+        A block belongs to the function with the closest start at or before
+        the block's start, if the block lies within that function's end.
+        Computed once per set of function ranges, so renaming functions
+        keeps the partition.
+        """
+        self._ensure_block_index()
+        ranges = frozenset(function_bounds.values())
+        partition = self._partitions.get(ranges)
+        if partition is not None:
+            return partition
+
+        ordered = sorted(ranges)
+        starts = [start for start, _ in ordered]
+        members: Dict[int, List[int]] = {start: [] for start in starts}
+        for block_start, block_id in zip(self._block_starts, self._block_ids_by_start):
+            index = bisect.bisect_right(starts, block_start) - 1
+            if index >= 0 and block_start <= ordered[index][1]:
+                members[ordered[index][0]].append(block_id)
+
+        partition = {
+            start: self._view(start, end, members[start]) for start, end in ordered
+        }
+        self._partitions[ranges] = partition
+        return partition
+
+    def function_view(
+        self,
+        func_name: str,
+        entry_addr: int,
+        end_addr: Optional[int],
+        entry_block: int,
+    ) -> FunctionAnalysisView:
+        """
+        Build the function-scoped view: reachable blocks inside the address range.
+
+        Cost is proportional to the function size, not the program size.
+        """
+        cfg = self.ssa_func.cfg
+        range_ids = self.blocks_in_range(entry_addr, end_addr)
+        in_range: Set[int] = set(range_ids)
+
+        reachable: Set[int] = set()
+        stack = [entry_block]
+        while stack:
+            block_id = stack.pop()
+            if block_id in reachable:
+                continue
+            reachable.add(block_id)
+            block = cfg.blocks.get(block_id)
+            if block:
+                for succ in block.successors:
+                    if succ not in reachable:
+                        stack.append(succ)
+
+        return FunctionAnalysisView(
+            context=self,
+            func_name=func_name,
+            entry_addr=entry_addr,
+            end_addr=end_addr,
+            entry_block=entry_block,
+            range_block_count=len(range_ids),
+            block_ids=in_range & reachable,
+        )
+
+
+def get_analysis_context(ssa_func: "SSAFunction") -> ProgramAnalysisContext:
+    """Return the ProgramAnalysisContext cached on ssa_func, creating it on first use."""
+    context = getattr(ssa_func, "_analysis_context", None)
+    if context is None:
+        context = ProgramAnalysisContext(ssa_func)
+        ssa_func._analysis_context = context
+    return context
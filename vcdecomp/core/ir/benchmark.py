@@ -0,0 +1,343 @@
+"""
+Decompiler pipeline benchmark.
+
+Runs decompile_single_scr() over a corpus of .scr files and records the
+wall-clock time of each pipeline stage (see stage_timing), per file and in
+aggregate, plus peak memory. Reports can be saved as a JSON baseline and
+later runs compared against it to catch performance regressions in CI.
+
+Used by the `bench` CLI command.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import time
+import tracemalloc
+from argparse import Namespace
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from ..memory_usage import peak_rss_bytes
+from .stage_timing import StageRecorder, recording
+
+# Stages in pipeline order; nested stages are dotted (times are inclusive)
+STAGES = (
+    "load",
+    "disassemble",
+    "function_boundaries",
+    "ssa",
+    "global_resolver",
+    "functions",
+    "functions.collapse",
+    "functions.post_processing",
+    "functions.emit",
+)
+
+# Pseudo-stage for the whole decompile_single_scr() call
+TOTAL = "total"
+
+
+def find_scr_files(paths: Iterable[Path]) -> List[Path]:
+    """Collect .scr files (case-insensitive) from files and directory trees."""
+    found = []
+    for path in paths:
+        if path.is_dir():
+            found.extend(p for p in path.rglob("*") if p.is_file() and p.suffix.upper() == ".SCR")
+        elif path.is_file():
+            found.append(path)
+        else:
+            raise FileNotFoundError(path)
+    unique = {p.resolve(): p for p in found}
+    return sorted(unique.values(), key=lambda p: str(p).upper())
+
+
+@dataclass
+class FileBenchmark:
+    """Timings of one .scr file (fastest of the repeated runs)."""
+    file: str
+    stages: Dict[str, float] = field(default_factory=dict)  # seconds, incl. TOTAL
+    calls: Dict[str, int] = field(default_factory=dict)
+    peak_memory_bytes: Optional[int] = None  # tracemalloc peak (--trace-memory)
+    error: Optional[str] = None
+
+    @property
+    def total(self) -> float:
+        return self.stages.get(TOTAL, 0.0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "file": self.file,
+            "stages": self.stages,
+            "calls": self.calls,
+            "peak_memory_bytes": self.peak_memory_bytes,
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> FileBenchmark:
+        """Create from dictionary."""
+        return cls(
+            file=data["file"],
+            stages=dict(data.get("stages", {})),
+            calls=dict(data.get("calls", {})),
+            peak_memory_bytes=data.get("peak_memory_bytes"),
+            error=data.get("error"),
+        )
+
+
+@dataclass
+class BenchmarkReport:
+    """Benchmark results for a corpus; serializable as a baseline."""
+    version: str = "1.0"
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    files: Dict[str, FileBenchmark] = field(default_factory=dict)
+    peak_rss_bytes: Optional[int] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def totals(self) -> Dict[str, float]:
+        """Seconds per stage summed over all files that decompiled."""
+        totals: Dict[str, float] = {}
+        for result in self.files.values():
+            if result.error:
+                continue
+            for stage, seconds in result.stages.items():
+                totals[stage] = totals.get(stage, 0.0) + seconds
+        return totals
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "version": self.version,
+            "created_at": self.created_at,
+            "files": {name: result.to_dict() for name, result in self.files.items()},
+            "totals": self.totals(),
+            "peak_rss_bytes": self.peak_rss_bytes,
+            "metadata": self.metadata,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> BenchmarkReport:
+        """Create from dictionary."""
+        return cls(
+            version=data.get("version", "1.0"),
+            created_at=data.get("created_at", ""),
+            files={
+                name: FileBenchmark.from_dict(entry)
+                for name, entry in data.get("files", {}).items()
+            },
+            peak_rss_bytes=data.get("peak_rss_bytes"),
+            metadata=data.get("metadata", {}),
+        )
+
+    def save(self, path: Path) -> None:
+        """Save report to JSON file."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path: Path) -> BenchmarkReport:
+        """Load report from JSON file."""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+
+@dataclass
+class BenchmarkRegression:
+    """A stage that got slower than the baseline allows."""
+    file: str  # "" for the corpus aggregate
+    stage: str
+    baseline_seconds: float
+    current_seconds: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_seconds / self.baseline_seconds if self.baseline_seconds else float("inf")
+
+
+def bench_args(**overrides) -> Namespace:
+    """Arguments for decompile_single_scr() with the `structure` defaults."""
+    args = Namespace(
+        variant="auto",
+        header=None,
+        debug=False,
+        verbose=False,
+        legacy_ssa=False,
+        no_collapse=False,
+        no_simplify=False,
+        debug_simplify=False,
+        no_array_detection=False,
+        debug_array_detection=False,
+        no_bidirectional_types=False,
+        debug_type_inference=False,
+        jobs=1,
+    )
+    args.__dict__.update(overrides)
+    return args
+
+
+def _run_once(scr_path: Path, args: Namespace) -> StageRecorder:
+    from .decompile_file import decompile_single_scr
+
+    recorder = StageRecorder()
+    with recording(recorder):
+        start = time.perf_counter()
+        decompile_single_scr(scr_path, args)
+        recorder.add(TOTAL, time.perf_counter() - start)
+    return recorder
+
+
+def benchmark_file(
+    scr_path: Path,
+    args: Namespace,
+    repeat: int = 1,
+    trace_memory: bool = False,
+    name: Optional[str] = None,
+) -> FileBenchmark:
+    """
+    Benchmark one file.
+
+    Runs the pipeline `repeat` times and keeps the fastest run. With
+    trace_memory, one extra run under tracemalloc measures peak allocated
+    memory (kept separate because tracing slows the pipeline down).
+    """
+    result = FileBenchmark(file=name or scr_path.name)
+    try:
+        best = None
+        for _ in range(max(1, repeat)):
+            recorder = _run_once(scr_path, args)
+            if best is None or recorder.seconds[TOTAL] < best.seconds[TOTAL]:
+                best = recorder
+        result.stages = dict(best.seconds)
+        result.calls = {stage: count for stage, count in best.calls.items() if stage != TOTAL}
+
+        if trace_memory:
+            tracemalloc.start()
+            try:
+                _run_once(scr_path, args)
+                result.peak_memory_bytes = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    return result
+
+
+def run_benchmark(
+    scr_files: List[Path],
+    args: Namespace,
+    repeat: int = 1,
+    trace_memory: bool = False,
+    progress_callback: Optional[Callable[[FileBenchmark], None]] = None,
+) -> BenchmarkReport:
+    """Benchmark every file; results are keyed by file name (path if ambiguous)."""
+    names = [p.name for p in scr_files]
+    report = BenchmarkReport(metadata={
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "legacy_ssa": bool(getattr(args, "legacy_ssa", False)),
+        "no_collapse": bool(getattr(args, "no_collapse", False)),
+        "variant": getattr(args, "variant", "auto"),
+    })
+    for scr_path in scr_files:
+        name = scr_path.name if names.count(scr_path.name) == 1 else str(scr_path)
+        result = benchmark_file(scr_path, args, repeat, trace_memory, name=name)
+        report.files[name] = result
+        if progress_callback:
+            progress_callback(result)
+    report.peak_rss_bytes = peak_rss_bytes()
+    return report
+
+
+def compare_reports(
+    baseline: BenchmarkReport,
+    current: BenchmarkReport,
+    threshold: float = 0.25,
+    min_seconds: float = 0.01,
+) -> List[BenchmarkRegression]:
+    """
+    Find stages that got slower than the baseline.
+
+    A stage regresses when it takes more than (1 + threshold) times its
+    baseline time and at least min_seconds longer, which keeps timer noise
+    on very fast stages from being reported. Per-file stages and the
+    corpus aggregate (file "") over the files present in both reports are
+    checked.
+    """
+    regressions = []
+
+    def check(file: str, before: Dict[str, float], after: Dict[str, float]) -> None:
+        for stage, seconds in after.items():
+            old = before.get(stage)
+            if old is None:
+                continue
+            if seconds > old * (1.0 + threshold) and seconds - old >= min_seconds:
+                regressions.append(BenchmarkRegression(file, stage, old, seconds))
+
+    common = [
+        name for name, result in current.files.items()
+        if name in baseline.files and not result.error and not baseline.files[name].error
+    ]
+    for name in common:
+        check(name, baseline.files[name].stages, current.files[name].stages)
+
+    def aggregate(report: BenchmarkReport) -> Dict[str, float]:
+        totals: Dict[str, float] = {}
+        for name in common:
+            for stage, seconds in report.files[name].stages.items():
+                totals[stage] = totals.get(stage, 0.0) + seconds
+        return totals
+
+    check("", aggregate(baseline), aggregate(current))
+    return regressions
+
+
+def _format_bytes(size: Optional[int]) -> str:
+    if size is None:
+        return "-"
+    return f"{size / (1024 * 1024):.1f} MiB"
+
+
+def _stage_order(stages: Iterable[str]) -> List[str]:
+    known = [stage for stage in STAGES if stage in stages]
+    return known + sorted(set(stages) - set(STAGES) - {TOTAL}) + [TOTAL]
+
+
+def format_report(report: BenchmarkReport) -> str:
+    """Human-readable per-file and aggregate timing tables."""
+    lines = []
+    totals = report.totals()
+    stages = _stage_order(totals) if totals else [TOTAL]
+    headers = ["stage"] + stages
+    width = max(len(stage) for stage in headers) + 2
+
+    lines.append("Per-file timings (ms)")
+    lines.append("=" * 60)
+    for name, result in report.files.items():
+        if result.error:
+            lines.append(f"{name}: ERROR {result.error}")
+            continue
+        memory = f", peak {_format_bytes(result.peak_memory_bytes)}" if result.peak_memory_bytes else ""
+        functions = result.calls.get("functions", 0)
+        lines.append(f"{name} ({functions} functions, {result.total * 1000:.1f} ms{memory})")
+        for stage in stages:
+            if stage in result.stages and stage != TOTAL:
+                lines.append(f"  {stage:<{width}}{result.stages[stage] * 1000:10.1f}")
+    lines.append("")
+
+    lines.append("Aggregate")
+    lines.append("=" * 60)
+    total = totals.get(TOTAL, 0.0)
+    for stage in stages:
+        seconds = totals.get(stage, 0.0)
+        share = f"{100 * seconds / total:5.1f}%" if total else ""
+        lines.append(f"  {stage:<{width}}{seconds * 1000:10.1f} ms  {share}")
+    failed = sum(1 for result in report.files.values() if result.error)
+    lines.append(f"  files: {len(report.files) - failed} ok, {failed} failed")
+    lines.append(f"  peak RSS: {_format_bytes(report.peak_rss_bytes)}")
+    return "\n".join(lines)
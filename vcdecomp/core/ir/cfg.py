@@ -5,7 +5,7 @@ Control-flow graph builder for Vietcong SCR bytecode.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from ..loader.scr_loader import SCRFile, Instruction
 from ..disasm import opcodes
@@ -33,6 +33,9 @@ class CFG:
     dom_tree: Dict[int, List[int]] = field(default_factory=dict)
     dom_order: List[int] = field(default_factory=list)
     dominance_frontiers: Dict[int, Set[int]] = field(default_factory=dict)
+    # Dominator tree (preorder, postorder) numbers: a dominates b iff a's
+    # interval contains b's (see dominates())
+    dom_interval: Dict[int, Tuple[int, int]] = field(default_factory=dict)
 
     def get_block(self, block_id: int) -> BasicBlock:
         return self.blocks[block_id]
@@ -181,23 +184,71 @@ def _find_block_end(start: int, block_starts: List[int], instr_count: int) -> in
     return instr_count - 1
 
 
-def _reverse_postorder(cfg: CFG) -> List[int]:
-    visited: Set[int] = set()
+def _postorder(entry: int, successors: Callable[[int], Iterable[int]]) -> List[int]:
+    """
+    Depth-first postorder from entry, with an explicit stack.
+
+    Visits successors in the order successors() yields them, like the
+    recursive formulation, but without Python recursion limits on deep CFGs.
+    """
+    visited: Set[int] = {entry}
     order: List[int] = []
+    stack = [(entry, iter(successors(entry)))]
+    while stack:
+        node, pending = stack[-1]
+        for succ in pending:
+            if succ not in visited:
+                visited.add(succ)
+                stack.append((succ, iter(successors(succ))))
+                break
+        else:
+            stack.pop()
+            order.append(node)
+    return order
 
-    def dfs(node: int) -> None:
-        if node in visited or node not in cfg.blocks:
-            return
-        visited.add(node)
-        for succ in sorted(cfg.blocks[node].successors):
-            dfs(succ)
-        order.append(node)
 
-    dfs(cfg.entry_block)
+def _reverse_postorder(cfg: CFG) -> List[int]:
+    if cfg.entry_block not in cfg.blocks:
+        return []
+    order = _postorder(
+        cfg.entry_block,
+        lambda node: [succ for succ in sorted(cfg.blocks[node].successors) if succ in cfg.blocks],
+    )
     order.reverse()
     return order
 
 
+def _dominator_intervals(root: int, children: Dict[int, List[int]]) -> Tuple[List[int], Dict[int, Tuple[int, int]]]:
+    """
+    Preorder of a dominator tree and the (preorder, postorder) number of each node.
+
+    a dominates b iff pre[a] <= pre[b] and post[b] <= post[a].
+    """
+    preorder: List[int] = [root]
+    pre: Dict[int, int] = {root: 0}
+    intervals: Dict[int, Tuple[int, int]] = {}
+    stack = [(root, iter(children.get(root, ())))]
+    while stack:
+        node, pending = stack[-1]
+        child = next(pending, None)
+        if child is not None:
+            pre[child] = len(preorder)
+            preorder.append(child)
+            stack.append((child, iter(children.get(child, ()))))
+        else:
+            stack.pop()
+            intervals[node] = (pre[node], len(intervals))
+    return preorder, intervals
+
+
+def _interval_dominates(intervals: Dict[int, Tuple[int, int]], dominator: int, node: int) -> bool:
+    outer = intervals.get(dominator)
+    inner = intervals.get(node)
+    if outer is None or inner is None:
+        return False
+    return outer[0] <= inner[0] and inner[1] <= outer[1]
+
+
 def _intersect(idom: Dict[int, int], order_index: Dict[int, int], finger1: int, finger2: int) -> int:
     while finger1 != finger2:
         while order_index[finger1] > order_index[finger2]:
@@ -234,19 +285,13 @@ def _compute_dominators(cfg: CFG) -> None:
             continue
         dom_tree.setdefault(parent, []).append(node)
 
-    dom_order: List[int] = []
-
-    def dfs(node: int) -> None:
-        dom_order.append(node)
-        for child in dom_tree.get(node, []):
-            dfs(child)
-
     entry = order[0]
-    dfs(entry)
+    dom_order, dom_interval = _dominator_intervals(entry, dom_tree)
 
     cfg.idom = idom
     cfg.dom_tree = dom_tree
     cfg.dom_order = dom_order
+    cfg.dom_interval = dom_interval
 
     # Compute dominance frontiers after dominators are available
     _compute_dominance_frontiers(cfg)
@@ -343,9 +388,16 @@ def get_iterated_dominance_frontier(cfg: CFG, def_blocks: Set[int]) -> Set[int]:
 
 
 def dominates(cfg: CFG, dominator: int, node: int) -> bool:
-    """Check if 'dominator' dominates 'node'."""
+    """Check if 'dominator' dominates 'node'.
+
+    O(1) with the interval numbering of _compute_dominators; CFGs built by
+    hand with only an idom map fall back to walking the idom chain.
+    """
     if dominator == node:
         return True
+    intervals = getattr(cfg, "dom_interval", None)
+    if intervals:
+        return _interval_dominates(intervals, dominator, node)
     current = node
     while current in cfg.idom:
         parent = cfg.idom[current]
@@ -480,19 +532,10 @@ def compute_local_dominators(cfg: CFG, func_blocks: Set[int], entry_block: int)
         return {}
 
     # Build reverse postorder for the subgraph
-    visited: Set[int] = set()
-    order: List[int] = []
-
-    def dfs(node: int) -> None:
-        if node in visited or node not in func_blocks:
-            return
-        visited.add(node)
-        for succ in sorted(cfg.blocks[node].successors):
-            if succ in func_blocks:
-                dfs(succ)
-        order.append(node)
-
-    dfs(entry_block)
+    order = _postorder(
+        entry_block,
+        lambda node: [succ for succ in sorted(cfg.blocks[node].successors) if succ in func_blocks],
+    )
     order.reverse()
 
     if not order:
@@ -524,19 +567,16 @@ def find_loops_in_function(cfg: CFG, func_blocks: Set[int], entry_block: int) ->
     """
     # Compute local dominators for this function
     local_idom = compute_local_dominators(cfg, func_blocks, entry_block)
+    local_tree: Dict[int, List[int]] = {}
+    for node, parent in local_idom.items():
+        if node != parent:
+            local_tree.setdefault(parent, []).append(node)
+    _order, local_intervals = (
+        _dominator_intervals(entry_block, local_tree) if local_idom else ([], {})
+    )
 
     def local_dominates(dominator: int, node: int) -> bool:
-        if dominator == node:
-            return True
-        current = node
-        while current in local_idom:
-            parent = local_idom[current]
-            if parent == dominator:
-                return True
-            if parent == current:
-                break
-            current = parent
-        return False
+        return dominator == node or _interval_dominates(local_intervals, dominator, node)
 
     # Find back edges within this function
     back_edges = []
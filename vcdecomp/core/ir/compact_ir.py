@@ -0,0 +1,239 @@
+"""
+Compact storage for the SSA IR objects.
+
+SSA construction creates a StackValue, SSAValue and SSAInstruction for
+every stack slot and instruction of a script (the stack lifter many times
+over, until its fixed point), and most of them never get metadata and have
+one or two uses. The IR classes therefore use __slots__ and leave their
+optional parts unallocated until something is stored in them:
+
+- LazyMetadata: the `metadata` of an object without metadata is a view
+  that reads as an empty dict and allocates the dict on the first write.
+- UseList: the `uses` of an SSAValue live in one flat array of
+  (instruction address, operand index) integers and read as a list of
+  pairs.
+- ValueTable: SSAFunction.values, the name -> SSAValue dict, which also
+  numbers the values densely (SSAValue.id) and keeps the id -> name table.
+
+The views keep the attribute API of the former dataclasses (dict and list
+operations, equality, repr), so passes do not need to know about them.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import MutableMapping
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+
+def metadata_dict(metadata: Any) -> Optional[dict]:
+    """The dict to store for a metadata argument (None for "no metadata yet").
+
+    Passing another object's `metadata` shares its dict, as it did when
+    metadata was always a dict.
+    """
+    if isinstance(metadata, LazyMetadata):
+        return metadata.materialize()
+    return metadata
+
+
+class LazyMetadata(MutableMapping):
+    """Empty `metadata` of an IR object; allocates the owner's dict on write.
+
+    Owners keep the dict (or None) in their `_metadata` slot and return it
+    directly once it exists, so only objects without metadata pay for the
+    view, and only while it is being used.
+    """
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner):
+        self._owner = owner
+
+    def materialize(self) -> dict:
+        data = self._owner._metadata
+        if data is None:
+            data = self._owner._metadata = {}
+        return data
+
+    def __getitem__(self, key):
+        data = self._owner._metadata
+        if data is None:
+            raise KeyError(key)
+        return data[key]
+
+    def get(self, key, default=None):
+        data = self._owner._metadata
+        return default if data is None else data.get(key, default)
+
+    def __contains__(self, key) -> bool:
+        data = self._owner._metadata
+        return data is not None and key in data
+
+    def __setitem__(self, key, value) -> None:
+        self.materialize()[key] = value
+
+    def __delitem__(self, key) -> None:
+        data = self._owner._metadata
+        if data is None:
+            raise KeyError(key)
+        del data[key]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._owner._metadata or ())
+
+    def __len__(self) -> int:
+        data = self._owner._metadata
+        return 0 if data is None else len(data)
+
+    def copy(self) -> dict:
+        return dict(self._owner._metadata or {})
+
+    def __repr__(self) -> str:
+        return repr(self._owner._metadata or {})
+
+
+class UseList:
+    """The (instruction address, operand index) uses of an SSAValue.
+
+    A view over the owner's `_uses` slot: None while the value has no uses,
+    then an array('q') holding address, index, address, index, ...
+    """
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner):
+        self._owner = owner
+
+    @staticmethod
+    def pack(uses: Iterable[Tuple[int, int]]) -> Optional[array]:
+        """Flat array for a sequence of uses (None when empty)."""
+        data = array("q")
+        for address, index in uses:
+            data.append(address)
+            data.append(index)
+        return data or None
+
+    def append(self, use: Tuple[int, int]) -> None:
+        address, index = use
+        data = self._owner._uses
+        if data is None:
+            data = self._owner._uses = array("q")
+        data.append(address)
+        data.append(index)
+
+    def extend(self, uses: Iterable[Tuple[int, int]]) -> None:
+        for use in uses:
+            self.append(use)
+
+    def remove(self, use: Tuple[int, int]) -> None:
+        data = self._owner._uses
+        for position, pair in enumerate(self):
+            if pair == use:
+                del data[2 * position:2 * position + 2]
+                if not data:
+                    self._owner._uses = None
+                return
+        raise ValueError("use not in list")
+
+    def clear(self) -> None:
+        self._owner._uses = None
+
+    def copy(self) -> List[Tuple[int, int]]:
+        return list(self)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        data = self._owner._uses
+        if not data:
+            return iter(())
+        pairs = iter(data)
+        return zip(pairs, pairs)
+
+    def __len__(self) -> int:
+        data = self._owner._uses
+        return 0 if data is None else len(data) >> 1
+
+    def __bool__(self) -> bool:
+        return bool(self._owner._uses)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("use index out of range")
+        data = self._owner._uses
+        return (data[2 * index], data[2 * index + 1])
+
+    def __contains__(self, use) -> bool:
+        return any(pair == use for pair in self)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, UseList):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class ValueTable(dict):
+    """SSA values by name, numbered densely in insertion order.
+
+    Inserting a value sets its `id` to the next free number (or to the id
+    of the value it replaces) and `names[id]` is its name. Ids of removed
+    values are not reused.
+    """
+
+    __slots__ = ("names",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self.names: List[str] = []
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, name: str, value) -> None:
+        previous = dict.get(self, name)
+        if previous is not None and 0 <= getattr(previous, "id", -1) < len(self.names):
+            value.id = previous.id
+        else:
+            value.id = len(self.names)
+            self.names.append(name)
+        dict.__setitem__(self, name, value)
+
+    def update(self, *args, **kwargs) -> None:
+        for name, value in dict(*args, **kwargs).items():
+            self[name] = value
+
+    def setdefault(self, name: str, value=None):
+        if name not in self:
+            self[name] = value
+        return dict.__getitem__(self, name)
+
+    def by_id(self, value_id: int):
+        """The value numbered value_id, or None if it was removed."""
+        value = self.get(self.names[value_id])
+        if value is not None and value.id == value_id:
+            return value
+        return None
+
+    def __reduce__(self):
+        return (self.__class__, (), None, None, iter(self.items()))
+
+
+def fields_repr(obj, fields: Tuple[str, ...]) -> str:
+    """Dataclass-style repr: ClassName(field=value, ...)."""
+    body = ", ".join(f"{name}={getattr(obj, name)!r}" for name in fields)
+    return f"{obj.__class__.__qualname__}({body})"
+
+
+def fields_equal(a, b, fields: Tuple[str, ...]) -> bool:
+    """Dataclass-style equality of two objects of the same class."""
+    return tuple(getattr(a, name) for name in fields) == tuple(getattr(b, name) for name in fields)
+
@@ -12,7 +12,7 @@ file's analysis pass and resolves the best name/type for each global variable.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Optional, Set
+from typing import Dict, List, Optional, Set
 
 
 @dataclass
@@ -50,6 +50,72 @@ class GlobalVarEvidence:
     writers: Set[str] = field(default_factory=set)
 
 
+@dataclass
+class GlobalUsageSummary:
+    """The subset of a GlobalUsage that cross-file merging reads."""
+
+    name: str = ""
+    source: str = ""
+    read_count: int = 0
+    write_count: int = 0
+    inferred_type: Optional[str] = None
+    header_type: Optional[str] = None
+    saveinfo_size_dwords: Optional[int] = None
+    array_element_size: Optional[int] = None
+    array_dimensions: Optional[list] = None
+    sgi_index: Optional[int] = None
+    sgi_name: Optional[str] = None
+
+    @classmethod
+    def from_usage(cls, usage) -> 'GlobalUsageSummary':
+        return cls(
+            name=usage.name,
+            source=usage.source,
+            read_count=usage.read_count,
+            write_count=usage.write_count,
+            inferred_type=usage.inferred_type,
+            header_type=usage.header_type,
+            saveinfo_size_dwords=usage.saveinfo_size_dwords,
+            array_element_size=usage.array_element_size,
+            array_dimensions=usage.array_dimensions,
+            sgi_index=usage.sgi_index,
+            sgi_name=usage.sgi_name,
+        )
+
+
+@dataclass
+class FileEvidence:
+    """
+    Compact Pass 1 result for one .scr file.
+
+    Holds only what CrossFileContext.add_file_evidence() needs, so it is cheap
+    to pickle back from a worker process (no SCRFile, no SSA graph).
+    """
+
+    filename: str
+    globals_usage: Dict[int, GlobalUsageSummary] = field(default_factory=dict)
+    float_globals: Set[int] = field(default_factory=set)
+    save_info_items: List[dict] = field(default_factory=list)
+
+    @classmethod
+    def from_analysis(
+        cls,
+        filename: str,
+        scr,
+        globals_usage: Dict[int, object],
+        float_globals: Set[int],
+    ) -> 'FileEvidence':
+        return cls(
+            filename=filename,
+            globals_usage={
+                offset: GlobalUsageSummary.from_usage(usage)
+                for offset, usage in globals_usage.items()
+            },
+            float_globals=set(float_globals),
+            save_info_items=list(scr.save_info.items) if scr.save_info else [],
+        )
+
+
 class CrossFileContext:
     """
     Aggregated cross-file context for a mission folder.
@@ -88,6 +154,20 @@ class CrossFileContext:
             globals_usage: Dict[byte_offset, GlobalUsage] from GlobalResolver
             float_globals: Set of byte offsets known to be float from opcode evidence
         """
+        self.add_file_evidence(
+            FileEvidence.from_analysis(filename, scr, globals_usage, float_globals)
+        )
+
+    def add_file_evidence(self, evidence: FileEvidence) -> None:
+        """
+        Merge one file's compact Pass 1 evidence into the cross-file context.
+
+        Files must be merged in a stable order (first name wins for non
+        save_info sources), regardless of the order Pass 1 finished them in.
+        """
+        filename = evidence.filename
+        globals_usage = evidence.globals_usage
+
         # Merge global variable info
         for byte_offset, usage in globals_usage.items():
             # Skip read-only constants — they are literal values, not variables
@@ -135,13 +215,13 @@ class CrossFileContext:
                 ev.sgi_name = usage.sgi_name
 
         # Merge float evidence
-        for byte_offset in float_globals:
+        for byte_offset in evidence.float_globals:
             ev = self._get_or_create(byte_offset)
             ev.float_evidence += 1
 
         # Merge save_info directly (for globals not in globals_usage)
-        if scr.save_info:
-            for item in scr.save_info.items:
+        if evidence.save_info_items:
+            for item in evidence.save_info_items:
                 byte_offset = item['val1'] * 4
                 size_dwords = item['val2']
                 var_name = item['name']
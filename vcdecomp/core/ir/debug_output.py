@@ -1,50 +1,153 @@
 """
 Debug output control for the decompiler.
 
-This module provides a global debug output flag and utility function
-that can be controlled via the --debug/--verbose CLI flags.
+Debug output is written to stderr by per-subsystem tracers:
+
+    _trace = get_tracer("switch")
+    ...
+    if _trace.enabled:
+        _trace(f"DEBUG: blocks {sorted(blocks)}")
+
+Whether output is produced is context-local state (a ContextVar), set by
+set_debug_enabled() or scoped with debug_scope(). Concurrent decompiles in
+other threads or contexts, and every --jobs worker task (which runs in a
+copy of the parent's context), keep their own setting.
+
+Tracer.enabled is a plain attribute that stays False until debug output for
+its category is enabled in some context, so a disabled call site costs one
+attribute check and formats nothing. Once it is True the call itself checks
+the current context, which is what makes the output context-local.
+
+Categories can be narrowed with set_debug_enabled(True, categories=...) or
+the VCDECOMP_TRACE environment variable (comma-separated, e.g.
+"switch,variables"); by default every category is enabled.
 
 Note: This is a standalone module with no dependencies on other
 vcdecomp modules to avoid circular imports.
 """
 
+import os
 import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, FrozenSet, Iterable, Iterator, Optional
 
-# =============================================================================
-# Global debug output control
-# =============================================================================
-# Set by cmd_structure() based on --debug/--verbose flags:
-# - default (no flags): DEBUG_ENABLED = False (clean output)
-# - --debug or --verbose: DEBUG_ENABLED = True
-DEBUG_ENABLED = False  # Default to disabled (clean output by default)
+# Category of debug_print() messages
+GENERAL = "general"
 
 
-def set_debug_enabled(enabled: bool):
-    """
-    Set global debug output state.
+class DebugSettings:
+    """Debug output settings of one context (None categories: all)."""
+
+    __slots__ = ("categories",)
+
+    def __init__(self, categories: Optional[FrozenSet[str]] = None):
+        self.categories = categories
+
+    def wants(self, category: str) -> bool:
+        return self.categories is None or category in self.categories
+
+
+# Settings of the current context, None when debug output is off
+_SETTINGS: ContextVar[Optional[DebugSettings]] = ContextVar("vcdecomp_debug", default=None)
+
+
+class Tracer:
+    """Debug messages of one subsystem (see get_tracer)."""
+
+    __slots__ = ("category", "enabled")
+
+    def __init__(self, category: str):
+        self.category = category
+        # True once debug output for this category was enabled in any context
+        self.enabled = False
+
+    def __call__(self, msg: str) -> None:
+        """Print msg to stderr if the current context traces this category."""
+        settings = _SETTINGS.get()
+        if settings is not None and settings.wants(self.category):
+            # Normalize message prefix
+            if not msg.startswith("DEBUG"):
+                msg = f"DEBUG: {msg}"
+            print(msg, file=sys.stderr)
+
 
-    Called by orchestrator based on --style CLI flag.
+_TRACERS: Dict[str, Tracer] = {}
+
+
+def get_tracer(category: str) -> Tracer:
+    """The tracer of a debug category (one instance per category)."""
+    tracer = _TRACERS.get(category)
+    if tracer is None:
+        tracer = _TRACERS[category] = Tracer(category)
+        settings = _SETTINGS.get()
+        tracer.enabled = settings is not None and settings.wants(category)
+    return tracer
+
+
+def _env_categories() -> Optional[FrozenSet[str]]:
+    value = os.environ.get("VCDECOMP_TRACE", "")
+    names = frozenset(name.strip() for name in value.split(",") if name.strip())
+    return names or None
+
+
+def _settings(enabled: bool, categories: Optional[Iterable[str]]) -> Optional[DebugSettings]:
+    if not enabled:
+        return None
+    current = _SETTINGS.get()
+    if current is not None and categories is None:
+        return current  # Already on: keep the category selection
+    selected = frozenset(categories) if categories is not None else _env_categories()
+    settings = DebugSettings(selected)
+    for tracer in _TRACERS.values():
+        if settings.wants(tracer.category):
+            tracer.enabled = True
+    return settings
+
+
+def set_debug_enabled(enabled: bool, categories: Optional[Iterable[str]] = None) -> None:
+    """
+    Set debug output state of the current context.
 
     Args:
         enabled: True to enable DEBUG output, False to suppress it
+        categories: Categories to trace (default: the current selection if
+            debug output is already on, else $VCDECOMP_TRACE, else all)
     """
-    global DEBUG_ENABLED
-    DEBUG_ENABLED = enabled
+    _SETTINGS.set(_settings(enabled, categories))
+
+
+@contextmanager
+def debug_scope(enabled: bool, categories: Optional[Iterable[str]] = None) -> Iterator[None]:
+    """Set debug output state for the enclosed block, then restore it."""
+    token = _SETTINGS.set(_settings(enabled, categories))
+    try:
+        yield
+    finally:
+        _SETTINGS.reset(token)
+
+
+def debug_enabled(category: Optional[str] = None) -> bool:
+    """Whether the current context has debug output on (for category, if given)."""
+    settings = _SETTINGS.get()
+    if settings is None:
+        return False
+    return category is None or settings.wants(category)
+
+
+_GENERAL = get_tracer(GENERAL)
 
 
 def debug_print(msg: str):
     """
     Print DEBUG message to stderr if debug output is enabled.
 
-    Use this instead of print(f"DEBUG: ...", file=sys.stderr) to allow
-    the --style flag to control debug output.
+    The message is formatted by the caller even when output is off; hot or
+    expensive call sites use a guarded tracer instead (see module docstring).
 
     Args:
         msg: Message to print (will be prefixed with "DEBUG " automatically
              if not already starting with "DEBUG")
     """
-    if DEBUG_ENABLED:
-        # Normalize message prefix
-        if not msg.startswith("DEBUG"):
-            msg = f"DEBUG: {msg}"
-        print(msg, file=sys.stderr)
+    if _GENERAL.enabled:
+        _GENERAL(msg)
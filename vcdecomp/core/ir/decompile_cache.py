@@ -0,0 +1,342 @@
+"""
+Persistent Decompilation Cache
+
+Game scripts rarely change, yet the CLI, the GUI and the MCP server re-run the
+whole pipeline every time a file is opened. DecompilationCache stores results
+on disk, content-addressed by:
+
+- SHA-256 of the .SCR bytes
+- SHA-256 of the mission header (if one is used)
+- the decompiler version plus a fingerprint of the decompiler sources and
+  bundled SDK data, so any code change invalidates old entries
+- the flags that change the output (variant, collapse, simplify, ...)
+
+Each key maps to an entry directory holding named artifacts: text (final C,
+disassembly), JSON (function bounds, SSA summary, globals usage, per-function
+C text) or pickles (pipeline state for MCP sessions). Entries are evicted in
+least-recently-used order once the cache exceeds its size cap.
+
+Location and size cap default to ~/.cache/vcdecomp and 512 MB, overridable via
+VCDECOMP_CACHE_DIR (or XDG_CACHE_HOME) and VCDECOMP_CACHE_MAX_MB.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Bumped when the entry layout changes
+CACHE_FORMAT_VERSION = 1
+
+# Argument names that influence decompiler output (debug flags bypass the cache)
+OUTPUT_FLAGS = (
+    "variant",
+    "legacy_ssa",
+    "no_collapse",
+    "no_simplify",
+    "no_array_detection",
+    "no_bidirectional_types",
+    "ignore_mp",
+)
+
+_PACKAGE_ROOT = Path(__file__).resolve().parent.parent.parent
+# Sources and data the decompiler output depends on (relative to the package)
+_FINGERPRINT_SOURCES = (
+    ("core", ("*.py", "*.json")),
+    ("parsing", ("*.py", "*.json")),
+    ("data", ("*.TXT", "*.txt")),
+    ("sdk", ("*.py", "*.json")),
+    ("compiler/inc", ("*",)),
+    ("compiler", ("symbol_db.json",)),
+)
+
+_code_fingerprint: Optional[str] = None
+
+
+def code_fingerprint() -> str:
+    """Hash of the package version and every decompiler source/data file."""
+    global _code_fingerprint
+    if _code_fingerprint is None:
+        from ... import __version__
+
+        sha = hashlib.sha256(f"{__version__}:{CACHE_FORMAT_VERSION}".encode())
+        files = set()
+        for rel_dir, patterns in _FINGERPRINT_SOURCES:
+            base = _PACKAGE_ROOT / rel_dir
+            if not base.is_dir():
+                continue
+            for pattern in patterns:
+                if rel_dir == "compiler":
+                    files.update(p for p in base.glob(pattern) if p.is_file())
+                else:
+                    files.update(p for p in base.rglob(pattern) if p.is_file())
+        for path in sorted(files):
+            if "__pycache__" in path.parts:
+                continue
+            sha.update(path.relative_to(_PACKAGE_ROOT).as_posix().encode())
+            sha.update(b"\0")
+            sha.update(path.read_bytes())
+        _code_fingerprint = sha.hexdigest()
+    return _code_fingerprint
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 of a file's contents."""
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 16):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def default_cache_dir() -> Path:
+    env_dir = os.environ.get("VCDECOMP_CACHE_DIR")
+    if env_dir:
+        return Path(env_dir)
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg) if xdg else Path.home() / ".cache"
+    return base / "vcdecomp"
+
+
+def default_max_bytes() -> int:
+    env_mb = os.environ.get("VCDECOMP_CACHE_MAX_MB")
+    if env_mb:
+        try:
+            return int(float(env_mb) * 1024 * 1024)
+        except ValueError:
+            logger.warning(f"Ignoring invalid VCDECOMP_CACHE_MAX_MB={env_mb!r}")
+    return DEFAULT_MAX_BYTES
+
+
+@dataclass
+class DecompileCacheStatistics:
+    """Hit/miss/eviction counters for one DecompilationCache instance."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+
+class DecompilationCache:
+    """
+    Content-addressed on-disk cache of decompilation artifacts.
+
+    Attributes:
+        cache_dir: Root directory of the cache
+        max_bytes: Size cap; least recently used entries are evicted beyond it
+        enabled: When False, every lookup misses and nothing is stored
+        statistics: Hit/miss counters
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path | str] = None,
+        max_bytes: Optional[int] = None,
+        enabled: bool = True,
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.max_bytes = default_max_bytes() if max_bytes is None else max_bytes
+        self.enabled = enabled
+        self.statistics = DecompileCacheStatistics()
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    def make_key(
+        self,
+        scr_path: Path | str,
+        args=None,
+        header_path: Optional[Path | str] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Build the cache key for decompiling scr_path with args.
+
+        extra distinguishes artifact families that depend on more than the
+        common inputs (e.g. the MCP session pipeline state).
+        """
+        flags = {name: bool(getattr(args, name, False)) for name in OUTPUT_FLAGS}
+        flags["variant"] = getattr(args, "variant", None) or "auto"
+        key_data = {
+            "scr": file_sha256(Path(scr_path)),
+            "header": file_sha256(Path(header_path)) if header_path else None,
+            "code": code_fingerprint(),
+            "flags": flags,
+            "extra": extra or {},
+        }
+        encoded = json.dumps(key_data, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _entry_dir(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / key
+
+    # ------------------------------------------------------------------
+    # Artifact access
+    # ------------------------------------------------------------------
+
+    def _read(self, key: str, name: str) -> Optional[bytes]:
+        if not self.enabled:
+            return None
+        path = self._entry_dir(key) / name
+        try:
+            data = path.read_bytes()
+        except OSError:
+            self.statistics.misses += 1
+            return None
+        self.statistics.hits += 1
+        # Directory mtime is the LRU clock
+        try:
+            os.utime(self._entry_dir(key))
+        except OSError:
+            pass
+        return data
+
+    def _write(self, key: str, name: str, data: bytes) -> bool:
+        if not self.enabled:
+            return False
+        entry_dir = self._entry_dir(key)
+        try:
+            entry_dir.mkdir(parents=True, exist_ok=True)
+            # Write atomically so concurrent readers never see partial files
+            fd, tmp_name = tempfile.mkstemp(dir=entry_dir, prefix=".tmp-")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_name, entry_dir / name)
+        except OSError as e:
+            logger.warning(f"Decompilation cache write failed: {e}")
+            return False
+        self.statistics.stores += 1
+        self.evict()
+        return True
+
+    def get_text(self, key: str, name: str) -> Optional[str]:
+        data = self._read(key, name)
+        return data.decode("utf-8") if data is not None else None
+
+    def put_text(self, key: str, name: str, text: str) -> bool:
+        return self._write(key, name, text.encode("utf-8"))
+
+    def get_json(self, key: str, name: str) -> Optional[Any]:
+        data = self._read(key, name)
+        if data is None:
+            return None
+        try:
+            return json.loads(data)
+        except ValueError:
+            return None
+
+    def put_json(self, key: str, name: str, value: Any) -> bool:
+        return self._write(key, name, json.dumps(value, sort_keys=True).encode("utf-8"))
+
+    def get_object(self, key: str, name: str) -> Optional[Any]:
+        """Load a pickled artifact; None if missing or unreadable."""
+        data = self._read(key, name)
+        if data is None:
+            return None
+        try:
+            return pickle.loads(data)
+        except Exception as e:
+            logger.debug(f"Discarding unreadable cache artifact {name}: {e}")
+            return None
+
+    def put_object(self, key: str, name: str, value: Any) -> bool:
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (RecursionError, pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.debug(f"Not caching {name}: {e}")
+            return False
+        return self._write(key, name, data)
+
+    # ------------------------------------------------------------------
+    # Eviction
+    # ------------------------------------------------------------------
+
+    def _entries(self) -> Iterable[Path]:
+        if not self.cache_dir.is_dir():
+            return []
+        return [
+            entry
+            for shard in self.cache_dir.iterdir() if shard.is_dir()
+            for entry in shard.iterdir() if entry.is_dir()
+        ]
+
+    @staticmethod
+    def _entry_size(entry: Path) -> int:
+        total = 0
+        for f in entry.iterdir():
+            try:
+                total += f.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    def size_bytes(self) -> int:
+        return sum(self._entry_size(entry) for entry in self._entries())
+
+    def evict(self) -> int:
+        """Remove least recently used entries until the cache fits max_bytes."""
+        entries = []
+        total = 0
+        for entry in self._entries():
+            try:
+                mtime = entry.stat().st_mtime
+            except OSError:
+                continue
+            size = self._entry_size(entry)
+            entries.append((mtime, size, entry))
+            total += size
+        if total <= self.max_bytes:
+            return 0
+
+        removed = 0
+        for mtime, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            removed += 1
+        self.statistics.evictions += removed
+        logger.info(f"Decompilation cache: evicted {removed} entries")
+        return removed
+
+    def clear(self) -> int:
+        """Remove every entry. Returns the number of entries removed."""
+        entries = list(self._entries())
+        for entry in entries:
+            shutil.rmtree(entry, ignore_errors=True)
+        return len(entries)
+
+
+def get_decompile_cache(args=None) -> Optional[DecompilationCache]:
+    """
+    Cache configured from CLI-style args (no_cache, cache_dir), or None if disabled.
+
+    Debug runs bypass the cache: their value is the diagnostics printed while
+    the pipeline runs.
+    """
+    if getattr(args, "no_cache", False) or os.environ.get("VCDECOMP_NO_CACHE"):
+        return None
+    debug_flags = ("debug", "verbose", "debug_simplify", "debug_array_detection",
+                   "debug_type_inference")
+    if any(getattr(args, name, False) for name in debug_flags):
+        return None
+    return DecompilationCache(cache_dir=getattr(args, "cache_dir", None))
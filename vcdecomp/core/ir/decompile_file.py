@@ -11,9 +11,12 @@ from __future__ import annotations
 import struct
 import sys
 from pathlib import Path
-from typing import Callable, Dict, Optional, Set, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
-from .cross_file_context import CrossFileContext
+from .cross_file_context import CrossFileContext, FileEvidence
+from .decompile_cache import DecompilationCache
+from .stage_timing import timed_stage
+from .ssa_retention import LiftedSCR
 
 
 def resolve_mission_header(
@@ -142,6 +145,8 @@ def decompile_single_scr(
     header_path: Optional[Path] = None,
     header_already_loaded: bool = False,
     progress_callback: Optional[Callable[[str], None]] = None,
+    lifted: Optional[LiftedSCR] = None,
+    cache: Optional[DecompilationCache] = None,
 ) -> str:
     """
     Decompile a single .scr file and return the decompiled C source as a string.
@@ -155,6 +160,10 @@ def decompile_single_scr(
         header_path: Optional mission header path (overrides auto-detection)
         header_already_loaded: Whether the header has already been loaded
         progress_callback: Optional callback for progress updates (receives status messages)
+        lifted: Optional Pass 1 lift of this file (see run_pass1_analysis(return_lifted=True));
+            skips loading, disassembly and SSA construction. Consumed: its SSA is mutated.
+        cache: Optional persistent cache (see get_decompile_cache()). Only used for
+            plain single-file runs: not with cross_file_context, lifted or debug output.
 
     Returns:
         The decompiled C source code as a string
@@ -162,7 +171,6 @@ def decompile_single_scr(
     def _progress(msg: str):
         if progress_callback:
             progress_callback(msg)
-    from ..loader import SCRFile
     from .structure import format_structured_function_named
     from .ssa import build_ssa_all_blocks, build_ssa_incremental
     from ..headers.detector import generate_include_block
@@ -170,30 +178,43 @@ def decompile_single_scr(
     from .debug_output import set_debug_enabled
 
     # Debug output
-    debug_mode = getattr(args, 'debug', False) or getattr(args, 'verbose', False)
-    set_debug_enabled(debug_mode)
-
-    _progress("Loading bytecode...")
-    scr = SCRFile.load(str(scr_path), variant=getattr(args, 'variant', 'auto'))
-
-    # Set flags on SCR object
-    scr.enable_simplify = not getattr(args, 'no_simplify', False)
-    scr.debug_simplify = getattr(args, 'debug_simplify', False)
-    scr.enable_array_detection = not getattr(args, 'no_array_detection', False)
-    scr.debug_array_detection = getattr(args, 'debug_array_detection', False)
-    scr.enable_bidirectional_types = not getattr(args, 'no_bidirectional_types', False)
-    scr.debug_type_inference = getattr(args, 'debug_type_inference', False)
-
-    _progress("Analyzing functions...")
-    from ..disasm import Disassembler
-    disasm = Disassembler(scr)
-    func_bounds = disasm.get_function_boundaries_v2()
+    debug_mode = _debug_mode(args)
+    set_debug_enabled(debug_mode, _trace_categories(args))
 
     # Mission header support
     if header_path is None:
         header_arg = getattr(args, 'header', None)
         header_path = resolve_mission_header(scr_path.parent, header_arg)
 
+    cache_key = None
+    if cache is not None and cross_file_context is None and lifted is None and not debug_mode:
+        cache_key = cache.make_key(scr_path, args, header_path)
+        cached = cache.get_text(cache_key, CACHE_OUTPUT)
+        if cached is not None:
+            _progress("Loaded from cache")
+            # The header still has to be loaded for callers that keep using the database
+            if header_path and not header_already_loaded:
+                from ..headers.database import get_header_database as _get_hdb
+                from ..constants import _reset_constants
+                _get_hdb().load_mission_header(header_path)
+                _reset_constants()
+            return cached
+
+    if lifted is not None:
+        scr = lifted.scr
+        func_bounds = dict(lifted.func_bounds)
+    else:
+        _progress("Loading bytecode...")
+        with timed_stage("load"):
+            scr = _load_scr(scr_path, args)
+
+        _progress("Analyzing functions...")
+        from ..disasm import Disassembler
+        with timed_stage("disassemble"):
+            disasm = Disassembler(scr)
+        with timed_stage("function_boundaries"):
+            func_bounds = disasm.get_function_boundaries_v2()
+
     if header_path and not header_already_loaded:
         from ..headers.database import get_header_database as _get_hdb
         from ..constants import _reset_constants
@@ -204,18 +225,26 @@ def decompile_single_scr(
             print(f"// Mission header loaded: {header_path.name}", file=sys.stderr)
 
     # Build SSA
-    _progress("Building SSA...")
     use_legacy_ssa = getattr(args, 'legacy_ssa', False)
     heritage_metadata = None
-    if not use_legacy_ssa:
-        ssa_func, heritage_metadata = build_ssa_incremental(scr, return_metadata=True)
+    if lifted is not None:
+        ssa_func = lifted.ssa_func
+        heritage_metadata = lifted.heritage_metadata
+        if debug_mode:
+            print(f"// Reusing Pass 1 SSA", file=sys.stderr)
+    elif not use_legacy_ssa:
+        _progress("Building SSA...")
+        with timed_stage("ssa"):
+            ssa_func, heritage_metadata = build_ssa_incremental(scr, return_metadata=True)
         if debug_mode:
             print(f"// Using incremental heritage SSA construction", file=sys.stderr)
             print(f"// Heritage: {len(heritage_metadata.get('variables', {}))} variables, "
                   f"{sum(len(v) for v in heritage_metadata.get('phi_blocks', {}).values())} PHI nodes",
                   file=sys.stderr)
     else:
-        ssa_func = build_ssa_all_blocks(scr)
+        _progress("Building SSA...")
+        with timed_stage("ssa"):
+            ssa_func = build_ssa_all_blocks(scr)
         if debug_mode:
             print(f"// Using legacy single-pass SSA construction", file=sys.stderr)
 
@@ -258,13 +287,14 @@ def decompile_single_scr(
 
     # Resolve globals
     _progress("Resolving globals...")
-    resolver = GlobalResolver(
-        ssa_func,
-        aggressive_typing=True,
-        infer_structs=False,
-        cross_file_context=cross_file_context,
-    )
-    globals_usage = resolver.analyze()
+    with timed_stage("global_resolver"):
+        resolver = GlobalResolver(
+            ssa_func,
+            aggressive_typing=True,
+            infer_structs=False,
+            cross_file_context=cross_file_context,
+        )
+        globals_usage = resolver.analyze()
 
     # Inject cross-file-enriched globals into SSA cache so that expr.py
     # (which calls resolve_globals_with_types()) uses the same data
@@ -479,64 +509,236 @@ def decompile_single_scr(
     sorted_funcs = sorted(func_bounds.items(), key=lambda x: x[1][0])
     total_funcs = len(sorted_funcs)
 
-    for idx, (func_name, (func_start, func_end)) in enumerate(sorted_funcs, 1):
-        _progress(f"Function {idx}/{total_funcs}: {func_name}")
-        text = format_structured_function_named(
-            ssa_func,
-            func_name,
-            func_start,
-            func_end,
-            function_bounds=func_bounds,
-            style=style,
-            heritage_metadata=heritage_metadata,
-            use_collapse=use_collapse
+    jobs = getattr(args, 'jobs', 1) or 1
+    if jobs > 1 and total_funcs > 2 and not _fork_available():
+        if debug_mode:
+            print("// --jobs requires fork(); formatting functions sequentially", file=sys.stderr)
+        jobs = 1
+
+    def _format_one(func_name: str, func_start: int, func_end: int) -> str:
+        with timed_stage("functions"):
+            return format_structured_function_named(
+                ssa_func,
+                func_name,
+                func_start,
+                func_end,
+                function_bounds=func_bounds,
+                style=style,
+                heritage_metadata=heritage_metadata,
+                use_collapse=use_collapse
+            )
+
+    if jobs > 1 and total_funcs > 2:
+        func_texts = _format_functions_parallel(
+            sorted_funcs, _format_one, jobs, ssa_func, _progress
         )
+    else:
+        func_texts = []
+        for idx, (func_name, (func_start, func_end)) in enumerate(sorted_funcs, 1):
+            _progress(f"Function {idx}/{total_funcs}: {func_name}")
+            func_texts.append(_format_one(func_name, func_start, func_end))
 
+    for (func_name, _bounds), text in zip(sorted_funcs, func_texts):
         if func_name == "_init" and _is_trivial_init_function(text):
             continue
 
         output_parts.append(text)
         output_parts.append("")
 
-    return "\n".join(output_parts)
+    result = "\n".join(output_parts)
+    if cache_key is not None:
+        _store_decompile_artifacts(
+            cache, cache_key, result, sorted_funcs, func_texts, ssa_func, globals_usage
+        )
+    return result
+
+
+# Artifact names inside a DecompilationCache entry
+CACHE_OUTPUT = "output.c"
+CACHE_FUNCTIONS = "functions.json"
+CACHE_ANALYSIS = "analysis.json"
+
+
+def _store_decompile_artifacts(
+    cache: DecompilationCache,
+    cache_key: str,
+    result: str,
+    sorted_funcs,
+    func_texts,
+    ssa_func,
+    globals_usage,
+) -> None:
+    """Store the final C text plus intermediate artifacts of one decompilation."""
+    from dataclasses import asdict
+    from .cross_file_context import GlobalUsageSummary
+
+    cache.put_json(cache_key, CACHE_ANALYSIS, {
+        "function_bounds": {name: list(bounds) for name, bounds in sorted_funcs},
+        "ssa": {
+            "blocks": len(ssa_func.cfg.blocks),
+            "instructions": sum(len(instrs) for instrs in ssa_func.instructions.values()),
+            "values": len(ssa_func.values),
+        },
+        "globals": {
+            str(offset): asdict(GlobalUsageSummary.from_usage(usage))
+            for offset, usage in sorted(globals_usage.items())
+        },
+    })
+    cache.put_json(cache_key, CACHE_FUNCTIONS, {
+        name: text for (name, _bounds), text in zip(sorted_funcs, func_texts)
+    })
+    # Written last: its presence marks a complete entry
+    cache.put_text(cache_key, CACHE_OUTPUT, result)
+
+
+# =============================================================================
+# Parallel per-function formatting (--jobs N)
+# =============================================================================
+# Workers are forked after SSA construction, so the lifted SSA/CFG is shared
+# copy-on-write instead of being pickled per task. Only the function index
+# goes to the worker and only the rendered text comes back.
+
+# Set in the parent immediately before forking; inherited by the workers.
+_PARALLEL_STATE: Optional[dict] = None
+
+
+def _fork_available() -> bool:
+    import multiprocessing
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def _parallel_format_worker(index: int) -> str:
+    state = _PARALLEL_STATE
+    func_name, (func_start, func_end) = state["sorted_funcs"][index]
+    # Each task runs in a fresh copy of the parent's context (debug output
+    # settings, stage recorders), whatever the previous task left behind.
+    return state["context"].copy().run(state["format_one"], func_name, func_start, func_end)
+
+
+def _format_functions_parallel(
+    sorted_funcs,
+    format_one: Callable[[str, int, int], str],
+    jobs: int,
+    ssa_func,
+    progress: Callable[[str], None],
+) -> list:
+    """
+    Format functions in a fork-based process pool, preserving input order.
+
+    The first function is formatted in the parent: it performs the one-time
+    whole-program mutations (float seeding, type write-back) so that every
+    worker starts from the same SSA state the sequential loop would see for
+    the second function onwards. Shared analyses are then warmed up before
+    the fork so workers do not each recompute them.
+    """
+    import contextvars
+    import multiprocessing
+    from .analysis_context import get_analysis_context
+
+    global _PARALLEL_STATE
+
+    context = contextvars.copy_context()
+    total = len(sorted_funcs)
+    first_name, (first_start, first_end) = sorted_funcs[0]
+    progress(f"Function 1/{total}: {first_name}")
+    texts = [context.copy().run(format_one, first_name, first_start, first_end)]
+
+    get_analysis_context(ssa_func).warm_up()
+
+    _PARALLEL_STATE = {
+        "sorted_funcs": sorted_funcs,
+        "format_one": format_one,
+        "context": context,
+    }
+    try:
+        mp_context = multiprocessing.get_context("fork")
+        with mp_context.Pool(processes=min(jobs, total - 1)) as pool:
+            results = pool.imap(_parallel_format_worker, range(1, total))
+            for idx, text in enumerate(results, 2):
+                progress(f"Function {idx}/{total}: {sorted_funcs[idx - 1][0]}")
+                texts.append(text)
+    finally:
+        _PARALLEL_STATE = None
+
+    return texts
+
+
+def _debug_mode(args) -> bool:
+    """Whether args ask for DEBUG output (--debug, --verbose or --trace)."""
+    return bool(getattr(args, 'debug', False) or getattr(args, 'verbose', False)
+                or getattr(args, 'trace', None))
+
+
+def _trace_categories(args) -> Optional[List[str]]:
+    """Debug categories selected with --trace (None: all, or $VCDECOMP_TRACE)."""
+    trace = getattr(args, 'trace', None)
+    if not trace:
+        return None
+    return [name.strip() for name in trace.split(',') if name.strip()]
+
+
+def _load_scr(scr_path: Path, args):
+    """Load an .scr file and set the per-run analysis flags from args."""
+    from ..loader import SCRFile
+
+    scr = SCRFile.load(str(scr_path), variant=getattr(args, 'variant', 'auto'),
+                       use_mmap=getattr(args, 'use_mmap', True))
+
+    # Set flags on SCR object
+    scr.enable_simplify = not getattr(args, 'no_simplify', False)
+    scr.debug_simplify = getattr(args, 'debug_simplify', False)
+    scr.enable_array_detection = not getattr(args, 'no_array_detection', False)
+    scr.debug_array_detection = getattr(args, 'debug_array_detection', False)
+    scr.enable_bidirectional_types = not getattr(args, 'no_bidirectional_types', False)
+    scr.debug_type_inference = getattr(args, 'debug_type_inference', False)
+    return scr
 
 
-def run_pass1_analysis(scr_path: Path, args) -> Tuple:
+def run_pass1_analysis(scr_path: Path, args, return_lifted: bool = False) -> Tuple:
     """
     Run Pass 1 analysis on a single .scr file for cross-file context building.
 
+    Args:
+        scr_path: Path to the .scr file
+        args: Parsed CLI arguments
+        return_lifted: Also return a LiftedSCR that decompile_single_scr(lifted=...)
+            can reuse in Pass 2 (function bounds are computed for it, and SSA value
+            types are restored to their freshly lifted state after global analysis)
+
     Returns:
         Tuple of (scr, globals_usage, float_globals) - lightweight data for
-        cross-file context merging. Does not keep the full SSA graph in memory.
+        cross-file context merging. Does not keep the full SSA graph in memory
+        unless return_lifted is set, in which case the LiftedSCR is appended.
     """
-    from ..loader import SCRFile
     from .ssa import build_ssa_all_blocks, build_ssa_incremental
     from .global_resolver import GlobalResolver
     from .debug_output import set_debug_enabled
+    from .ssa_retention import restore_value_types, snapshot_value_types
 
-    debug_mode = getattr(args, 'debug', False) or getattr(args, 'verbose', False)
-    set_debug_enabled(debug_mode)
+    debug_mode = _debug_mode(args)
+    set_debug_enabled(debug_mode, _trace_categories(args))
 
-    scr = SCRFile.load(str(scr_path), variant=getattr(args, 'variant', 'auto'))
+    scr = _load_scr(scr_path, args)
 
-    # Set flags
-    scr.enable_simplify = not getattr(args, 'no_simplify', False)
-    scr.debug_simplify = getattr(args, 'debug_simplify', False)
-    scr.enable_array_detection = not getattr(args, 'no_array_detection', False)
-    scr.debug_array_detection = getattr(args, 'debug_array_detection', False)
-    scr.enable_bidirectional_types = not getattr(args, 'no_bidirectional_types', False)
-    scr.debug_type_inference = getattr(args, 'debug_type_inference', False)
+    func_bounds = None
+    if return_lifted:
+        from ..disasm import Disassembler
+        func_bounds = Disassembler(scr).get_function_boundaries_v2()
 
     # Build SSA (use legacy for speed in pass1 - we just need globals)
     use_legacy_ssa = getattr(args, 'legacy_ssa', False)
+    heritage_metadata = None
     if not use_legacy_ssa:
-        ssa_func, _ = build_ssa_incremental(scr, return_metadata=True)
+        ssa_func, heritage_metadata = build_ssa_incremental(scr, return_metadata=True)
     else:
         ssa_func = build_ssa_all_blocks(scr)
 
     # Detect float globals
     float_globals = _detect_float_globals(ssa_func)
 
+    # GlobalResolver writes inferred types back into the SSA
+    type_snapshot = snapshot_value_types(ssa_func) if return_lifted else None
+
     # Run global resolver (without cross-file context in pass 1)
     resolver = GlobalResolver(
         ssa_func,
@@ -545,5 +747,170 @@ def run_pass1_analysis(scr_path: Path, args) -> Tuple:
     )
     globals_usage = resolver.analyze()
 
-    # Return lightweight data (not the full SSA graph)
-    return scr, globals_usage, float_globals
+    if not return_lifted:
+        # Return lightweight data (not the full SSA graph)
+        return scr, globals_usage, float_globals
+
+    restore_value_types(type_snapshot)
+    lifted = LiftedSCR(
+        scr=scr,
+        ssa_func=ssa_func,
+        heritage_metadata=heritage_metadata,
+        func_bounds=func_bounds,
+    )
+    return scr, globals_usage, float_globals, lifted
+
+
+# =============================================================================
+# Parallel structure-folder passes (structure-folder --jobs N)
+# =============================================================================
+# Pass 1 workers send back only FileEvidence (no SCRFile / SSA graph); the main
+# process merges it in sorted file order. The resolved CrossFileContext is
+# pickled once and handed to every Pass 2 worker through the pool initializer.
+# With --reuse-ssa, Pass 1 workers spill their lifted SSA to a shared directory
+# and Pass 2 workers load it from there instead of re-lifting.
+# Works with any multiprocessing start method (spawn on Windows).
+
+# Per-worker state set by _init_folder_worker().
+_FOLDER_WORKER_STATE: Optional[dict] = None
+
+
+def _init_folder_worker(
+    args,
+    header_path: Optional[Path],
+    context_snapshot: Optional[bytes] = None,
+    spill_dir: Optional[Path] = None,
+) -> None:
+    """Pool initializer: load headers once per worker and unpack the context."""
+    import pickle
+    from ..headers.database import get_header_database
+
+    global _FOLDER_WORKER_STATE
+
+    hdb = get_header_database(ignore_mp=getattr(args, 'ignore_mp', None))
+    # Forked workers inherit the parent's loaded header; spawned ones do not
+    if header_path and hdb.mission_header_name != header_path.name:
+        from ..constants import _reset_constants
+        hdb.load_mission_header(header_path)
+        _reset_constants()
+
+    _FOLDER_WORKER_STATE = {
+        "args": args,
+        "header_path": header_path,
+        "cross_file_context": (
+            pickle.loads(context_snapshot) if context_snapshot is not None else None
+        ),
+        "spill_dir": spill_dir,
+    }
+
+
+def _pass1_folder_worker(
+    scr_path: Path,
+) -> Tuple[Optional[FileEvidence], Optional[str], Optional[Path]]:
+    """Pass 1 for one file in a worker. Returns (evidence, error message, spill path)."""
+    from .ssa_retention import SPILL_SUFFIX, spill_lifted
+
+    state = _FOLDER_WORKER_STATE
+    spill_dir = state["spill_dir"]
+    try:
+        results = run_pass1_analysis(scr_path, state["args"], return_lifted=spill_dir is not None)
+        scr, globals_usage, float_globals = results[:3]
+        evidence = FileEvidence.from_analysis(scr_path.name, scr, globals_usage, float_globals)
+    except Exception as e:
+        return None, str(e), None
+
+    spill_path = None
+    if spill_dir is not None:
+        spill_path = Path(spill_dir) / (scr_path.name + SPILL_SUFFIX)
+        if not spill_lifted(results[3], spill_path):
+            spill_path = None
+    return evidence, None, spill_path
+
+
+def _pass2_folder_worker(
+    task: Tuple[Path, Optional[Path]],
+) -> Tuple[Optional[str], Optional[str], bool]:
+    """Pass 2 for one file in a worker. Returns (decompiled text, error message, reused SSA)."""
+    from .ssa_retention import load_spilled
+
+    scr_path, spill_path = task
+    state = _FOLDER_WORKER_STATE
+    lifted = load_spilled(spill_path) if spill_path is not None else None
+    try:
+        result = decompile_single_scr(
+            scr_path,
+            state["args"],
+            cross_file_context=state["cross_file_context"],
+            header_path=state["header_path"],
+            header_already_loaded=True,
+            lifted=lifted,
+        )
+        return result, None, lifted is not None
+    except Exception as e:
+        return None, str(e), lifted is not None
+
+
+def _worker_args(args):
+    """Copy of args for folder workers; nested per-function pools are disabled."""
+    import argparse
+    worker_args = argparse.Namespace(**vars(args))
+    worker_args.jobs = 1
+    return worker_args
+
+
+def run_folder_pass1_parallel(
+    scr_files,
+    args,
+    jobs: int,
+    header_path: Optional[Path] = None,
+    spill_dir: Optional[Path] = None,
+):
+    """
+    Run Pass 1 over scr_files in a process pool.
+
+    Yields (scr_path, evidence, error, spill_path) in input order, as soon as
+    each file's result (and all earlier ones) are available. spill_path is set
+    when spill_dir is given and the worker spilled the file's lifted SSA there.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(scr_files)),
+        initializer=_init_folder_worker,
+        initargs=(_worker_args(args), header_path, None, spill_dir),
+    ) as pool:
+        for scr_path, (evidence, error, spill_path) in zip(
+            scr_files, pool.map(_pass1_folder_worker, scr_files)
+        ):
+            yield scr_path, evidence, error, spill_path
+
+
+def run_folder_pass2_parallel(
+    scr_files,
+    args,
+    jobs: int,
+    cross_file_context: CrossFileContext,
+    header_path: Optional[Path] = None,
+    spilled: Optional[Dict[str, Path]] = None,
+):
+    """
+    Run Pass 2 over scr_files in a process pool with a shared context snapshot.
+
+    spilled maps file names to lifted SSA spilled by Pass 1 workers.
+    Yields (scr_path, decompiled text, error, reused SSA) in input order.
+    """
+    import pickle
+    from concurrent.futures import ProcessPoolExecutor
+
+    spilled = spilled or {}
+    tasks = [(scr_path, spilled.get(scr_path.name)) for scr_path in scr_files]
+    snapshot = pickle.dumps(cross_file_context, protocol=pickle.HIGHEST_PROTOCOL)
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(scr_files)),
+        initializer=_init_folder_worker,
+        initargs=(_worker_args(args), header_path, snapshot),
+    ) as pool:
+        for scr_path, (result, error, reused) in zip(
+            scr_files, pool.map(_pass2_folder_worker, tasks)
+        ):
+            yield scr_path, result, error, reused
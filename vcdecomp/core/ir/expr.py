@@ -28,6 +28,7 @@ from ..structures import (
 from .ssa import SSAFunction, SSAInstruction, SSAValue
 from .global_resolver import resolve_globals
 from .constant_propagation import ConstantPropagator, ConstantValue
+from .analysis_context import get_analysis_context
 from .field_tracker import FieldAccessTracker
 from ..headers.database import get_header_database
 from .parenthesization import (
@@ -544,9 +545,9 @@ class ExpressionFormatter:
         self._assign_semantic_names()
         # Resolve global variable names and types
         self._resolve_global_names()
-        # Initialize constant propagation
-        self._constant_propagator = ConstantPropagator(ssa)
-        self._constant_propagator.analyze()
+        # Initialize constant propagation (shared whole-program result)
+        self._analysis = get_analysis_context(ssa)
+        self._constant_propagator = self._analysis.constant_propagator
         # Initialize field access tracking with function boundaries
         # This ensures struct types detected in one function don't leak to other functions
         self._field_tracker = FieldAccessTracker(ssa, func_name=func_name, func_start=func_start, func_end=func_end)
@@ -571,14 +572,7 @@ class ExpressionFormatter:
         self._header_db = get_header_database()
 
         # Initialize SDK constant resolver for replacing magic numbers with named constants
-        self._constant_resolver = None
-        if self._header_db and self._header_db.sdk_db:
-            try:
-                from ...sdk.constant_resolver import ConstantResolver
-                self._constant_resolver = ConstantResolver(self._header_db.sdk_db)
-            except Exception:
-                # SDK constant resolver not available, continue without it
-                pass
+        self._constant_resolver = self._analysis.constant_resolver
 
         # LOCAL TYPE TRACKER: Unified tracker for coordinating declarations with usage
         # This is set by the orchestrator after SSA pattern analysis
@@ -614,16 +608,24 @@ class ExpressionFormatter:
         This seeds SSA value_type with float for FADD/FSUB/FMUL/FDIV operands and
         results so downstream type inference has early, concrete evidence.
         """
-        for block_insts in self._ssa_func.instructions.values():
-            for inst in block_insts:
-                if inst.mnemonic not in {"FADD", "FSUB", "FMUL", "FDIV"}:
-                    continue
-                for value in (inst.inputs or []):
-                    if value and value.value_type != opcodes.ResultType.FLOAT:
-                        value.value_type = opcodes.ResultType.FLOAT
-                for value in (inst.outputs or []):
-                    if value and value.value_type != opcodes.ResultType.FLOAT:
-                        value.value_type = opcodes.ResultType.FLOAT
+        changed = False
+        if self._func_start is not None:
+            instructions = self._analysis.range_view(self._func_start, self._func_end).instructions()
+        else:
+            instructions = (inst for block_insts in self._ssa_func.instructions.values() for inst in block_insts)
+        for inst in instructions:
+            if inst.mnemonic not in {"FADD", "FSUB", "FMUL", "FDIV"}:
+                continue
+            for value in (inst.inputs or []):
+                if value and value.value_type != opcodes.ResultType.FLOAT:
+                    value.value_type = opcodes.ResultType.FLOAT
+                    changed = True
+            for value in (inst.outputs or []):
+                if value and value.value_type != opcodes.ResultType.FLOAT:
+                    value.value_type = opcodes.ResultType.FLOAT
+                    changed = True
+        if changed:
+            self._analysis.invalidate_types()
 
     def _resolve_field_name(self, base_var: str, offset: int) -> str:
         """
@@ -17,9 +17,12 @@ from dataclasses import dataclass
 from typing import Dict, Optional, Set
 
 from ..disasm import opcodes
+from .analysis_context import get_analysis_context
 from .ssa import SSAFunction, SSAValue, SSAInstruction
 from ..structures import get_verified_field_name
-from .debug_output import debug_print
+from .debug_output import get_tracer
+
+_trace = get_tracer("fields")
 
 
 # Known function signatures: func_name → (struct_type, param_index)
@@ -75,6 +78,7 @@ class FieldAccessTracker:
         # leaking between functions that reuse the same variable names (local_0, etc.)
         self._func_start = func_start
         self._func_end = func_end
+        self._blocks = None
 
         # SSA value name → FieldAccess
         self.field_map: Dict[str, FieldAccess] = {}
@@ -89,21 +93,18 @@ class FieldAccessTracker:
         """Get the struct type for a variable if tracked."""
         return self.var_struct_types.get(var_name)
 
-    def _is_block_in_function(self, block_id: int) -> bool:
-        """Check if a block belongs to the current function based on address bounds."""
-        if self._func_start is None or self._func_end is None:
-            return True  # No bounds specified, include all blocks
-
-        # BUGFIX: block_id is a sequential ID (0, 1, 2...), not an instruction address!
-        # We need to look up the block in the CFG to get its actual start address.
-        cfg = self.ssa.cfg
-        block = cfg.blocks.get(block_id)
-        if block is None:
-            return False  # Block doesn't exist
+    def _function_blocks(self):
+        """(block_id, instructions) of the blocks belonging to the current function.
 
-        block_start_addr = block.start
-        in_range = self._func_start <= block_start_addr < self._func_end
-        return in_range
+        A block belongs to the function when its start address (not its
+        sequential block ID) lies in [func_start, func_end).
+        """
+        if self._func_start is None or self._func_end is None:
+            return self.ssa.instructions.items()  # No bounds specified, include all blocks
+        if self._blocks is None:
+            context = get_analysis_context(self.ssa)
+            self._blocks = context.range_view(self._func_start, self._func_end - 1).blocks
+        return self._blocks
 
     def analyze(self):
         """Main analysis entry point - runs all tracking passes."""
@@ -144,7 +145,8 @@ class FieldAccessTracker:
 
         # DEBUG: Log field access mapping
         import sys
-        debug_print(f"DEBUG FieldTracker: {value.name} → {base_name}{operator}{field_name} (offset={field_access.field_offset}, struct={field_access.struct_type})")
+        if _trace.enabled:
+            _trace(f"DEBUG FieldTracker: {value.name} → {base_name}{operator}{field_name} (offset={field_access.field_offset}, struct={field_access.struct_type})")
 
         return f"{base_name}{operator}{field_name}"
 
@@ -191,7 +193,8 @@ class FieldAccessTracker:
 
         # DEBUG: Log detected struct type
         import sys
-        debug_print(f"DEBUG FieldTracker: {self.func_name} {param_var} detected as {struct_type}")
+        if _trace.enabled:
+            _trace(f"DEBUG FieldTracker: {self.func_name} {param_var} detected as {struct_type}")
 
     def _detect_local_structs(self):
         """
@@ -210,10 +213,8 @@ class FieldAccessTracker:
         import sys
         from ..structures import FUNCTION_STRUCT_PARAMS
 
-        for block_id, instructions in self.ssa.instructions.items():
-            # CRITICAL: Only analyze blocks belonging to this function
-            if not self._is_block_in_function(block_id):
-                continue
+        # CRITICAL: Only analyze blocks belonging to this function
+        for block_id, instructions in self._function_blocks():
             for i, inst in enumerate(instructions):
                 # Look for XCALL (external function call) instructions
                 if inst.mnemonic == "XCALL" and inst.instruction:
@@ -235,7 +236,8 @@ class FieldAccessTracker:
 
                     # DEBUG: Log all function names
                     if "GetAtgSettings" in func_name or "GetInfo" in func_name:
-                        debug_print(f"DEBUG FieldTracker: Checking func_name='{func_name}' (from '{func_name_with_sig}')")
+                        if _trace.enabled:
+                            _trace(f"DEBUG FieldTracker: Checking func_name='{func_name}' (from '{func_name_with_sig}')")
 
                     # Check if this function has known struct parameters
                     param_map = FUNCTION_STRUCT_PARAMS.get(func_name)
@@ -243,7 +245,8 @@ class FieldAccessTracker:
                         continue
 
                     # DEBUG: Log when we find a known function
-                    debug_print(f"DEBUG FieldTracker: Found known function {func_name}, scanning for LADR")
+                    if _trace.enabled:
+                        _trace(f"DEBUG FieldTracker: Found known function {func_name}, scanning for LADR")
 
                     # IMPROVED: Use XCALL inputs to match LADR to actual parameter indices
                     # inst.inputs contains the arguments in order (param 0, param 1, ...)
@@ -303,12 +306,14 @@ class FieldAccessTracker:
                                 else:
                                     semantic_name = semantic_base
                                 self.semantic_names[base_var] = semantic_name
-                                debug_print(f"DEBUG FieldTracker: Assigned semantic name {semantic_name} to {base_var}")
+                                if _trace.enabled:
+                                    _trace(f"DEBUG FieldTracker: Assigned semantic name {semantic_name} to {base_var}")
 
                             # DEBUG: Show which block this detection is from
                             block = self.ssa.cfg.blocks.get(block_id)
                             block_start = block.start if block else "?"
-                            debug_print(f"DEBUG FieldTracker: {base_var} detected as {struct_type} (from {func_name}, param {param_idx}) [block_id={block_id}, block_start={block_start}, func_range=[{self._func_start},{self._func_end})]")
+                            if _trace.enabled:
+                                _trace(f"DEBUG FieldTracker: {base_var} detected as {struct_type} (from {func_name}, param {param_idx}) [block_id={block_id}, block_start={block_start}, func_range=[{self._func_start},{self._func_end})]")
                         # NOTE: Legacy LADR scanning was removed (01-20-2026)
                         # It was fundamentally broken - it scanned ALL LADR instructions before XCALL
                         # without checking which instructions actually supply XCALL parameters,
@@ -336,10 +341,8 @@ class FieldAccessTracker:
             changed = False
             iterations += 1
 
-            for block_id, instructions in self.ssa.instructions.items():
-                # CRITICAL: Only analyze blocks belonging to this function
-                if not self._is_block_in_function(block_id):
-                    continue
+            # CRITICAL: Only analyze blocks belonging to this function
+            for block_id, instructions in self._function_blocks():
                 for inst in instructions:
                     # Pattern 1: ASGN instruction (value1 = value2)
                     if inst.mnemonic == "ASGN" and len(inst.inputs) >= 1 and inst.outputs:
@@ -355,7 +358,8 @@ class FieldAccessTracker:
                             if target_var not in self.var_struct_types:
                                 self.var_struct_types[target_var] = self.var_struct_types[source_var]
                                 self.semantic_names[target_var] = self.semantic_names.get(source_var, "info")
-                                debug_print(f"DEBUG Propagate: {target_var} = {source_var} ({self.var_struct_types[source_var]})")
+                                if _trace.enabled:
+                                    _trace(f"DEBUG Propagate: {target_var} = {source_var} ({self.var_struct_types[source_var]})")
                                 changed = True
 
                     # Pattern 2: LADR instruction (load address of variable)
@@ -371,10 +375,12 @@ class FieldAccessTracker:
                                 if target_var not in self.var_struct_types:
                                     self.var_struct_types[target_var] = self.var_struct_types[base_var]
                                     self.semantic_names[target_var] = self.semantic_names.get(base_var, "info")
-                                    debug_print(f"DEBUG Propagate LADR: {target_var} → {self.var_struct_types[base_var]}")
+                                    if _trace.enabled:
+                                        _trace(f"DEBUG Propagate LADR: {target_var} → {self.var_struct_types[base_var]}")
                                     changed = True
 
-        debug_print(f"DEBUG Propagate: Completed in {iterations} iterations, tracking {len(self.var_struct_types)} struct variables")
+        if _trace.enabled:
+            _trace(f"DEBUG Propagate: Completed in {iterations} iterations, tracking {len(self.var_struct_types)} struct variables")
 
     def _track_pnt_dcp_pattern(self):
         """
@@ -396,10 +402,8 @@ class FieldAccessTracker:
         pnt_found = 0
         dadr_found = 0
 
-        for block_id, instructions in self.ssa.instructions.items():
-            # CRITICAL: Only analyze blocks belonging to this function
-            if not self._is_block_in_function(block_id):
-                continue
+        # CRITICAL: Only analyze blocks belonging to this function
+        for block_id, instructions in self._function_blocks():
             for inst in instructions:
                 # Look for DCP instructions (dereference)
                 if inst.mnemonic != "DCP":
@@ -425,7 +429,8 @@ class FieldAccessTracker:
                     if field_access and inst.outputs:
                         # Map output of DCP to field access
                         self.field_map[inst.outputs[0].name] = field_access
-                        debug_print(f"DEBUG FieldTracker: Found PNT pattern: {inst.outputs[0].name} = {field_access.base_var}.field at offset {field_access.field_offset}")
+                        if _trace.enabled:
+                            _trace(f"DEBUG FieldTracker: Found PNT pattern: {inst.outputs[0].name} = {field_access.base_var}.field at offset {field_access.field_offset}")
                     continue
 
                 # Pattern 2: DADR followed by earlier pointer
@@ -435,10 +440,12 @@ class FieldAccessTracker:
                     field_access = self._analyze_dadr_chain(producer)
                     if field_access and inst.outputs:
                         self.field_map[inst.outputs[0].name] = field_access
-                        debug_print(f"DEBUG FieldTracker: Found DADR pattern: {inst.outputs[0].name} = {field_access.base_var}.field at offset {field_access.field_offset}")
+                        if _trace.enabled:
+                            _trace(f"DEBUG FieldTracker: Found DADR pattern: {inst.outputs[0].name} = {field_access.base_var}.field at offset {field_access.field_offset}")
                     continue
 
-        debug_print(f"DEBUG FieldTracker: Scanned {dcp_count} DCP instructions, found {pnt_found} PNT patterns, {dadr_found} DADR patterns")
+        if _trace.enabled:
+            _trace(f"DEBUG FieldTracker: Scanned {dcp_count} DCP instructions, found {pnt_found} PNT patterns, {dadr_found} DADR patterns")
 
     def _analyze_pnt_instruction(self, pnt_inst: SSAInstruction) -> Optional[FieldAccess]:
         """
@@ -451,7 +458,8 @@ class FieldAccessTracker:
         import sys
 
         if not pnt_inst.inputs:
-            debug_print(f"DEBUG PNT: Rejected - no inputs")
+            if _trace.enabled:
+                _trace(f"DEBUG PNT: Rejected - no inputs")
             return None
 
         base_value = pnt_inst.inputs[0]
@@ -462,12 +470,14 @@ class FieldAccessTracker:
         # Check if base is a known struct
         struct_type = self.var_struct_types.get(base_var)
         if not struct_type:
-            debug_print(f"DEBUG PNT: Rejected - base_var '{base_var}' not in var_struct_types {list(self.var_struct_types.keys())}")
+            if _trace.enabled:
+                _trace(f"DEBUG PNT: Rejected - base_var '{base_var}' not in var_struct_types {list(self.var_struct_types.keys())}")
             return None
 
         # Get offset from instruction arg1 (PNT uses immediate offset)
         if not pnt_inst.instruction or not pnt_inst.instruction.instruction:
-            debug_print(f"DEBUG PNT: Rejected - no instruction data")
+            if _trace.enabled:
+                _trace(f"DEBUG PNT: Rejected - no instruction data")
             return None
 
         offset = pnt_inst.instruction.instruction.arg1
@@ -475,7 +485,8 @@ class FieldAccessTracker:
         # Lookup field at this offset
         field_name = get_verified_field_name(struct_type, offset)
 
-        debug_print(f"DEBUG PNT: SUCCESS - base={base_var}, struct={struct_type}, offset={offset}, field={field_name}")
+        if _trace.enabled:
+            _trace(f"DEBUG PNT: SUCCESS - base={base_var}, struct={struct_type}, offset={offset}, field={field_name}")
 
         # CRITICAL FIX: Determine if base is a pointer or structure
         # PNT can be used on both pointers and structures
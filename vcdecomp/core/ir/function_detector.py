@@ -14,9 +14,10 @@ import logging
 
 from vcdecomp.core.loader.scr_loader import SCRFile
 from vcdecomp.core.disasm.opcodes import OpcodeResolver
-from .debug_output import debug_print
+from .debug_output import get_tracer
 
 logger = logging.getLogger(__name__)
+_trace = get_tracer("functions")
 
 
 def _find_reachable_ret_boundary(
@@ -168,10 +169,12 @@ def detect_function_boundaries_v2(
         # entry_point=-1097 means 1097 instructions from end
         if entry_point < 0:
             actual_entry = len(instructions) + entry_point
-            debug_print(f"DEBUG: Entry point = {entry_point} (resolves to {actual_entry})")
+            if _trace.enabled:
+                _trace(f"DEBUG: Entry point = {entry_point} (resolves to {actual_entry})")
             function_starts.append(actual_entry)
         else:
-            debug_print(f"DEBUG: Entry point = {entry_point}")
+            if _trace.enabled:
+                _trace(f"DEBUG: Entry point = {entry_point}")
             function_starts.append(entry_point)
         logger.debug(f"Entry point at address {entry_point}")
 
@@ -639,9 +642,10 @@ def match_header_functions(
                         'parameters': func_data.get('parameters', []),
                     }
 
-    debug_print(f"DEBUG HEADER MATCH: Matched {len(rename_map)} functions from header")
-    for old_name, new_info in sorted(rename_map.items()):
-        debug_print(f"  {old_name} -> {new_info['name']}")
+    if _trace.enabled:
+        _trace(f"DEBUG HEADER MATCH: Matched {len(rename_map)} functions from header")
+        for old_name, new_info in sorted(rename_map.items()):
+            _trace(f"  {old_name} -> {new_info['name']}")
 
     return rename_map
 
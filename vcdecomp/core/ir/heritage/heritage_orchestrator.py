@@ -23,6 +23,7 @@ from typing import Dict, List, Optional, Set, Tuple
 from ....core.loader.scr_loader import SCRFile
 from ....core.disasm import opcodes
 from ..cfg import CFG, get_iterated_dominance_frontier, _compute_dominance_frontiers
+from ..compact_ir import ValueTable
 from ..ssa import (
     SSAFunction, SSAValue, SSAInstruction,
     _propagate_types, _merge_result_types, _annotate_call_out_params, _fix_orphan_temporaries
@@ -438,7 +439,7 @@ class HeritageOrchestrator:
         Returns:
             Complete SSAFunction
         """
-        values: Dict[str, SSAValue] = {}
+        values: Dict[str, SSAValue] = ValueTable()
         instructions: Dict[int, List[SSAInstruction]] = {}
         phi_addr_counter = -1
 
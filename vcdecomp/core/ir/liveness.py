@@ -10,11 +10,10 @@ Phase 4 of the decompiler improvement plan.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Set, Tuple, Optional
-from collections import defaultdict
+from typing import Dict, Iterator, List, Set, Tuple, Optional
 
 from .ssa import SSAFunction, SSAValue, SSAInstruction
-from .cfg import CFG
+from .cfg import CFG, _postorder
 
 
 @dataclass
@@ -27,6 +26,14 @@ class LivenessInfo:
     def_set: Set[str] = field(default_factory=set)   # Values defined in block
 
 
+def _bit_indices(bits: int) -> Iterator[int]:
+    """Yield the indices of the set bits of bits, lowest first."""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
 class LivenessAnalyzer:
     """
     Compute LIVE_IN and LIVE_OUT sets for each basic block.
@@ -35,6 +42,12 @@ class LivenessAnalyzer:
     - LIVE_OUT[B] = union(LIVE_IN[S] for S in successors(B))
     - LIVE_IN[B] = USE[B] ∪ (LIVE_OUT[B] - DEF[B])
 
+    Function-local SSA values are numbered densely and the equations are
+    solved on integer bitsets (bit i = value_names[i]) with a worklist
+    visited in postorder, so a block is recomputed only when the LIVE_IN of
+    one of its successors changed. The result is converted back to the
+    per-block name sets of LivenessInfo.
+
     The liveness information is used to build an interference graph,
     which determines which SSA variables can be safely merged into
     a single C variable.
@@ -52,72 +65,106 @@ class LivenessAnalyzer:
         self.cfg = ssa_func.cfg
         self.func_block_ids = func_block_ids
         self.liveness: Dict[int, LivenessInfo] = {}
+        # Dense numbering of the function-local values (filled by compute_liveness)
+        self.value_ids: Dict[str, int] = {}
+        self.value_names: List[str] = []
 
     def compute_liveness(self) -> Dict[int, LivenessInfo]:
         """
-        Compute liveness information using iterative fixed-point algorithm.
+        Compute liveness information using a worklist fixed-point algorithm.
 
         Returns:
             Dict mapping block_id -> LivenessInfo
         """
-        # Step 0: Build set of function-local variables (variables DEFINED within this function)
+        instructions = self.ssa_func.instructions
+
+        # Step 0: Number the function-local variables (variables DEFINED within this function)
         # This prevents cross-function variable contamination when SSA is built globally
-        func_local_vars: Set[str] = set()
-        for block_id in self.func_block_ids:
-            ssa_instrs = self.ssa_func.instructions.get(block_id, [])
-            for inst in ssa_instrs:
+        value_ids = self.value_ids
+        value_names = self.value_names
+        for block_id in sorted(self.func_block_ids):
+            for inst in instructions.get(block_id, []):
                 for out in inst.outputs:
-                    if out.name:
-                        func_local_vars.add(out.name)
+                    if out.name and out.name not in value_ids:
+                        value_ids[out.name] = len(value_names)
+                        value_names.append(out.name)
 
-        # Step 1: Compute USE and DEF sets for each block (filtered to function-local vars)
+        # Step 1: USE and DEF bitsets for each block (function-local vars only)
+        use_bits: Dict[int, int] = {}
+        def_bits: Dict[int, int] = {}
         for block_id in self.func_block_ids:
-            use_set, def_set = self._compute_use_def_sets(block_id, func_local_vars)
-            self.liveness[block_id] = LivenessInfo(
-                block_id=block_id,
-                use_set=use_set,
-                def_set=def_set,
-                live_in=set(),
-                live_out=set()
-            )
-
-        # Step 2: Iterative fixed-point computation
-        # Process blocks in reverse postorder for faster convergence
-        worklist = list(self.func_block_ids)
-        changed = True
-        iterations = 0
-        max_iterations = 100  # Safety limit
-
-        while changed and iterations < max_iterations:
-            changed = False
-            iterations += 1
-
-            for block_id in worklist:
-                if block_id not in self.liveness:
-                    continue
-
-                info = self.liveness[block_id]
-                block = self.cfg.blocks.get(block_id)
-                if not block:
+            uses = defs = 0
+            for inst in instructions.get(block_id, []):
+                for inp in inst.inputs:
+                    index = value_ids.get(inp.name)
+                    if index is not None:
+                        uses |= (1 << index) & ~defs
+                for out in inst.outputs:
+                    index = value_ids.get(out.name)
+                    if index is not None:
+                        defs |= 1 << index
+            use_bits[block_id] = uses
+            def_bits[block_id] = defs
+
+        # Step 2: Worklist fixed point over the blocks present in the CFG.
+        # Postorder visits successors before their predecessors, so most
+        # values reach their definitions in a single sweep.
+        blocks = self.cfg.blocks
+        successors: Dict[int, List[int]] = {}
+        predecessors: Dict[int, List[int]] = {block_id: [] for block_id in self.func_block_ids}
+        for block_id in self.func_block_ids:
+            block = blocks.get(block_id)
+            if block is None:
+                continue
+            successors[block_id] = [succ for succ in block.successors if succ in use_bits]
+            for succ in successors[block_id]:
+                predecessors[succ].append(block_id)
+
+        order: List[int] = []
+        visited: Set[int] = set()
+        for root in sorted(successors):
+            if root not in visited:
+                postorder = _postorder(root, lambda node: [
+                    succ for succ in sorted(successors.get(node, ())) if succ not in visited
+                ])
+                visited.update(postorder)
+                order.extend(postorder)
+
+        live_in: Dict[int, int] = dict.fromkeys(use_bits, 0)
+        live_out: Dict[int, int] = dict.fromkeys(use_bits, 0)
+        pending = set(successors)
+        while pending:
+            for block_id in order:
+                if block_id not in pending:
                     continue
+                pending.discard(block_id)
 
-                # Compute LIVE_OUT = union of LIVE_IN of all successors
-                new_live_out: Set[str] = set()
-                for succ_id in block.successors:
-                    if succ_id in self.liveness:
-                        new_live_out.update(self.liveness[succ_id].live_in)
+                out = 0
+                for succ_id in successors[block_id]:
+                    out |= live_in[succ_id]
+                live_out[block_id] = out
 
-                # Compute LIVE_IN = USE ∪ (LIVE_OUT - DEF)
-                new_live_in = info.use_set | (new_live_out - info.def_set)
+                new_in = use_bits[block_id] | (out & ~def_bits[block_id])
+                if new_in != live_in[block_id]:
+                    live_in[block_id] = new_in
+                    pending.update(predecessors[block_id])
 
-                # Check if anything changed
-                if new_live_in != info.live_in or new_live_out != info.live_out:
-                    info.live_in = new_live_in
-                    info.live_out = new_live_out
-                    changed = True
+        for block_id in self.func_block_ids:
+            self.liveness[block_id] = LivenessInfo(
+                block_id=block_id,
+                live_in=self._names(live_in[block_id]),
+                live_out=self._names(live_out[block_id]),
+                use_set=self._names(use_bits[block_id]),
+                def_set=self._names(def_bits[block_id]),
+            )
 
         return self.liveness
 
+    def _names(self, bits: int) -> Set[str]:
+        """Names of the values in a liveness bitset."""
+        names = self.value_names
+        return {names[index] for index in _bit_indices(bits)}
+
     def _compute_use_def_sets(self, block_id: int, func_local_vars: Optional[Set[str]] = None) -> Tuple[Set[str], Set[str]]:
         """
         Compute USE (upward exposed) and DEF sets for a block.
@@ -219,6 +266,11 @@ class InterferenceGraph:
 
     Two SSA values interfere if they are both live at the same program point.
     Variables that interfere cannot be merged into the same C variable.
+
+    Values are numbered as they are met and the graph is an adjacency
+    bit-matrix: _rows[i] has bit j set when values i and j interfere. A
+    clique of n live values is then n integer ORs instead of n²/2 edge
+    objects.
     """
 
     # Maximum number of edges to build before giving up (for performance)
@@ -233,12 +285,47 @@ class InterferenceGraph:
             liveness: Liveness info for each block
             ssa_func: SSA function for instruction access
         """
-        self.nodes: Set[str] = set()
-        self.edges: Set[InterferenceEdge] = set()
-        self._adjacency: Dict[str, Set[str]] = defaultdict(set)
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._rows: List[int] = []
+        self._node_bits = 0
+        self._edge_count = 0
         self._truncated = False  # True if we hit the edge limit
         self._build_from_liveness(liveness, ssa_func)
 
+    @property
+    def nodes(self) -> Set[str]:
+        """Names of all values in the graph."""
+        return {self._names[index] for index in _bit_indices(self._node_bits)}
+
+    @property
+    def edges(self) -> Set[InterferenceEdge]:
+        """All interference edges (built on demand; prefer edge_count)."""
+        names = self._names
+        return {
+            InterferenceEdge(names[i], names[j])
+            for i, row in enumerate(self._rows)
+            for j in _bit_indices(row >> (i + 1) << (i + 1))
+        }
+
+    @property
+    def edge_count(self) -> int:
+        return self._edge_count
+
+    def _id(self, name: str) -> int:
+        index = self._ids.get(name)
+        if index is None:
+            index = self._ids[name] = len(self._names)
+            self._names.append(name)
+            self._rows.append(0)
+        return index
+
+    def _bits(self, names: Set[str]) -> int:
+        bits = 0
+        for name in names:
+            bits |= 1 << self._id(name)
+        return bits
+
     def _build_from_liveness(self, liveness: Dict[int, LivenessInfo], ssa_func: SSAFunction) -> None:
         """
         Build interference edges from live ranges.
@@ -253,54 +340,88 @@ class InterferenceGraph:
                 break  # Stop processing if we hit the edge limit
 
             # At block entry, all LIVE_IN values interfere with each other
-            self._add_clique(info.live_in)
+            live = self._bits(info.live_in)
+            self._add_clique(live)
 
             # Walk through block, tracking currently live values
-            ssa_instrs = ssa_func.instructions.get(block_id, [])
-            live = info.live_in.copy()
-
-            for inst in ssa_instrs:
+            for inst in ssa_func.instructions.get(block_id, []):
                 if self._truncated:
                     break  # Stop processing if we hit the edge limit
 
+                input_bits = 0
+                for inp in inst.inputs:
+                    if inp.name:
+                        input_bits |= 1 << self._id(inp.name)
+
                 # At this point, all live values interfere with new definitions
                 # (the new definition is live starting here)
+                output_bits = 0
                 for out in inst.outputs:
                     if out.name:
-                        self.nodes.add(out.name)
+                        index = self._id(out.name)
+                        self._node_bits |= 1 << index
+                        output_bits |= 1 << index
                         # The output interferes with everything currently live
                         # EXCEPT its own inputs (they can share the same register)
-                        input_names = {inp.name for inp in inst.inputs if inp.name}
-                        for live_var in live:
-                            if live_var not in input_names:
-                                if not self._add_edge(out.name, live_var):
-                                    break  # Hit edge limit
+                        self._add_edges(index, live & ~input_bits)
 
-                # Update liveness: remove definitions, add uses
-                for out in inst.outputs:
-                    if out.name:
-                        live.discard(out.name)
-                        live.add(out.name)  # Output is live from here
-
-                for inp in inst.inputs:
-                    if inp.name:
-                        self.nodes.add(inp.name)
-                        live.add(inp.name)
+                # Update liveness: outputs are live from here, and so are the
+                # values used (nothing is removed within the block)
+                live |= output_bits | input_bits
+                self._node_bits |= input_bits
 
             # At block exit, all LIVE_OUT values interfere
             if not self._truncated:
-                self._add_clique(info.live_out)
+                self._add_clique(self._bits(info.live_out))
 
-    def _add_clique(self, values: Set[str]) -> None:
-        """Add interference edges between all pairs in a set."""
+    def _add_clique(self, members: int) -> None:
+        """Add interference edges between all pairs in a value bitset."""
         if self._truncated:
             return  # Don't add more edges if we hit the limit
-        value_list = list(values)
-        for i, v1 in enumerate(value_list):
-            self.nodes.add(v1)
-            for v2 in value_list[i+1:]:
-                if not self._add_edge(v1, v2):
-                    return  # Hit edge limit
+        rows = self._rows
+        new_rows = []
+        added = 0
+        for index in _bit_indices(members):
+            new = members & ~rows[index] & ~(1 << index)
+            new_rows.append((index, new))
+            added += new.bit_count()
+        added //= 2
+
+        if self._edge_count + added <= self.MAX_EDGES:
+            for index, new in new_rows:
+                rows[index] |= new
+            self._node_bits |= members
+            self._edge_count += added
+            return
+
+        # Over the limit: add pairs in value order until it is reached
+        for index, _new in new_rows:
+            self._node_bits |= 1 << index
+            if not self._add_edges(index, members >> (index + 1) << (index + 1)):
+                return
+
+    def _add_edges(self, index: int, others: int) -> bool:
+        """Add interference edges between value index and a value bitset.
+
+        Returns:
+            True if all edges were added (or already existed), False if limit reached.
+        """
+        if self._truncated:
+            return False
+        rows = self._rows
+        new = others & ~rows[index] & ~(1 << index)
+        if not new:
+            return True
+        room = self.MAX_EDGES - self._edge_count
+        for other in _bit_indices(new):
+            if not room:
+                self._truncated = True
+                return False
+            rows[index] |= 1 << other
+            rows[other] |= 1 << index
+            self._edge_count += 1
+            room -= 1
+        return True
 
     def _add_edge(self, v1: str, v2: str) -> bool:
         """Add an interference edge between two variables.
@@ -310,17 +431,15 @@ class InterferenceGraph:
         """
         if v1 == v2:
             return True
-        if self._truncated:
-            return False
-        edge = InterferenceEdge(v1, v2)
-        if edge not in self.edges:
-            if len(self.edges) >= self.MAX_EDGES:
-                self._truncated = True
-                return False
-            self.edges.add(edge)
-            self._adjacency[v1].add(v2)
-            self._adjacency[v2].add(v1)
-        return True
+        return self._add_edges(self._id(v1), 1 << self._id(v2))
+
+    def _is_node(self, v: str) -> bool:
+        index = self._ids.get(v)
+        return index is not None and bool(self._node_bits >> index & 1)
+
+    def _degree(self, v: str) -> int:
+        index = self._ids.get(v)
+        return 0 if index is None else self._rows[index].bit_count()
 
     def interferes(self, v1: str, v2: str) -> bool:
         """
@@ -333,13 +452,18 @@ class InterferenceGraph:
         Returns:
             True if they interfere, False if they can be merged
         """
-        if v1 == v2:
+        i = self._ids.get(v1)
+        j = self._ids.get(v2)
+        if i is None or j is None:
             return False
-        return v2 in self._adjacency.get(v1, set())
+        return bool(self._rows[i] >> j & 1)
 
     def get_neighbors(self, v: str) -> Set[str]:
         """Get all variables that interfere with the given variable."""
-        return self._adjacency.get(v, set()).copy()
+        index = self._ids.get(v)
+        if index is None:
+            return set()
+        return {self._names[other] for other in _bit_indices(self._rows[index])}
 
     def get_non_interfering_groups(self, values: List[str]) -> List[List[str]]:
         """
@@ -359,7 +483,7 @@ class InterferenceGraph:
             return []
 
         # Filter to values that are in the graph
-        valid_values = [v for v in values if v in self.nodes or v not in self._adjacency]
+        valid_values = [v for v in values if self._is_node(v) or not self._degree(v)]
 
         if not valid_values:
             # All values are unknown - they can all be merged
@@ -373,7 +497,7 @@ class InterferenceGraph:
         # This gives better coloring results
         sorted_values = sorted(
             valid_values,
-            key=lambda v: len(self._adjacency.get(v, set())),
+            key=self._degree,
             reverse=True
         )
 
@@ -412,9 +536,9 @@ class InterferenceGraph:
 
     def debug_dump(self) -> str:
         """Return a debug string representation of the interference graph."""
-        lines = [f"InterferenceGraph: {len(self.nodes)} nodes, {len(self.edges)} edges"]
+        lines = [f"InterferenceGraph: {len(self.nodes)} nodes, {self._edge_count} edges"]
         for node in sorted(self.nodes):
-            neighbors = sorted(self._adjacency.get(node, set()))
+            neighbors = sorted(self.get_neighbors(node))
             if neighbors:
                 lines.append(f"  {node} interferes with: {', '.join(neighbors)}")
         return "\n".join(lines)
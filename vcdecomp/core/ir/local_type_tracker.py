@@ -22,7 +22,9 @@ from typing import Dict, Set, List, Optional, Tuple
 from ..disasm import opcodes
 from .ssa import SSAFunction, SSAValue, SSAInstruction
 from ..structures import get_struct_by_name, get_field_at_offset, get_struct_by_size
-from .debug_output import debug_print
+from .debug_output import get_tracer
+
+_trace = get_tracer("types")
 
 
 @dataclass
@@ -290,7 +292,8 @@ class LocalVariableTypeTracker:
                         struct_type = self._infer_struct_from_size(element_size)
                         info.mark_struct_array(element_size, struct_type, source="ssa_pattern")
 
-                    debug_print(f"DEBUG TypeTracker: Array pattern detected - {base_var}[*{element_size}]")
+                    if _trace.enabled:
+                        _trace(f"DEBUG TypeTracker: Array pattern detected - {base_var}[*{element_size}]")
 
                 # Check if right is small constant (struct field offset)
                 offset = self._extract_constant(right)
@@ -317,7 +320,8 @@ class LocalVariableTypeTracker:
                 # PNT with offset indicates struct access
                 existing_struct = info.struct_type
                 info.update_struct_evidence(existing_struct, offset, source="ssa_pattern")
-                debug_print(f"DEBUG TypeTracker: PNT pattern detected - {base_var}.field_{offset}")
+                if _trace.enabled:
+                    _trace(f"DEBUG TypeTracker: PNT pattern detected - {base_var}.field_{offset}")
 
     def _detect_vector3_assignments(self, func_block_ids: Set[int]) -> None:
         """
@@ -546,7 +550,8 @@ class LocalVariableTypeTracker:
             if "field_tracker" not in info.evidence_sources:
                 info.evidence_sources.append("field_tracker")
 
-            debug_print(f"DEBUG TypeTracker: Imported field_tracker type - {clean_name} = {struct_type}")
+            if _trace.enabled:
+                _trace(f"DEBUG TypeTracker: Imported field_tracker type - {clean_name} = {struct_type}")
 
     # =========================================================================
     # Pass 2: Runtime callbacks from ExpressionFormatter
@@ -571,7 +576,8 @@ class LocalVariableTypeTracker:
         if "." in notation.split("]")[-1]:
             info.is_struct_array = True
 
-        debug_print(f"DEBUG TypeTracker: Runtime array usage - {notation}")
+        if _trace.enabled:
+            _trace(f"DEBUG TypeTracker: Runtime array usage - {notation}")
 
     def record_field_usage(self, var_name: str, notation: str):
         """
@@ -590,7 +596,8 @@ class LocalVariableTypeTracker:
         if "runtime" not in info.evidence_sources:
             info.evidence_sources.append("runtime")
 
-        debug_print(f"DEBUG TypeTracker: Runtime field usage - {notation}")
+        if _trace.enabled:
+            _trace(f"DEBUG TypeTracker: Runtime field usage - {notation}")
 
     def register_array_dimensions(self, var_name: str, dimensions: List[int], struct_type: Optional[str] = None):
         """
@@ -641,10 +648,12 @@ class LocalVariableTypeTracker:
         self._finalized = True
 
         # Log final state
-        debug_print(f"DEBUG TypeTracker: Finalized with {len(self._usage_info)} tracked variables")
+        if _trace.enabled:
+            _trace(f"DEBUG TypeTracker: Finalized with {len(self._usage_info)} tracked variables")
         for name, info in sorted(self._usage_info.items()):
             type_str = self.resolve_type(name)
-            debug_print(f"DEBUG TypeTracker:   {name} -> {type_str} (confidence={info.confidence:.2f})")
+            if _trace.enabled:
+                _trace(f"DEBUG TypeTracker:   {name} -> {type_str} (confidence={info.confidence:.2f})")
 
     def resolve_type(self, var_name: str) -> str:
         """
@@ -5,12 +5,13 @@ This package provides cover-based variable merging to combine
 multiple SSA values into source-level variables.
 """
 
-from .cover import Cover, CoverPiece, compute_cover
+from .cover import Cover, CoverIndex, CoverPiece, compute_cover
 from .high_variable import HighVariable, create_high_variable
 from .merge_engine import MergeEngine, merge_ssa_values
 
 __all__ = [
     "Cover",
+    "CoverIndex",
     "CoverPiece",
     "compute_cover",
     "HighVariable",
@@ -11,8 +11,10 @@ with non-overlapping covers can share a name).
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import List, Optional, Set, TYPE_CHECKING
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ...ssa import SSAValue
@@ -39,7 +41,7 @@ class CoverPiece:
         """Check if this piece is adjacent to another (can be merged)."""
         if self.block_id != other.block_id:
             return False
-        return (self.end_addr + 1 >= other.start_addr or
+        return (self.end_addr + 1 >= other.start_addr and
                 other.end_addr + 1 >= self.start_addr)
 
     def merge(self, other: "CoverPiece") -> Optional["CoverPiece"]:
@@ -61,100 +63,201 @@ class CoverPiece:
                 self.start_addr <= addr <= self.end_addr)
 
 
-@dataclass
 class Cover:
     """
     Complete cover (live range) for an SSA value.
 
     A cover is a set of CoverPieces representing all points in the
-    program where the value is live.
+    program where the value is live. They are stored per block as two
+    parallel sorted arrays of start and end addresses, of disjoint
+    non-adjacent intervals, so inserting a piece or looking up a point is a
+    binary search and two covers intersect-test in one sweep per block.
     """
-    pieces: List[CoverPiece] = field(default_factory=list)
+
+    def __init__(self, pieces: Optional[Iterable[CoverPiece]] = None):
+        # block_id -> (starts, ends)
+        self._blocks: Dict[int, Tuple[List[int], List[int]]] = {}
+        for piece in pieces or ():
+            self.add_piece(piece)
+
+    @property
+    def pieces(self) -> List[CoverPiece]:
+        """The pieces of the cover, ordered by block and start address."""
+        return [
+            CoverPiece(block_id, start, end)
+            for block_id in sorted(self._blocks)
+            for start, end in zip(*self._blocks[block_id])
+        ]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Cover):
+            return NotImplemented
+        return self._blocks == other._blocks
+
+    def __repr__(self) -> str:
+        return f"Cover(pieces={self.pieces!r})"
 
     def add_piece(self, piece: CoverPiece):
         """Add a piece to the cover, merging with existing if possible."""
-        # Try to merge with existing pieces
-        for i, existing in enumerate(self.pieces):
-            merged = existing.merge(piece)
-            if merged is not None:
-                self.pieces[i] = merged
-                self._consolidate()
-                return
-
-        self.pieces.append(piece)
+        self.add_range(piece.block_id, piece.start_addr, piece.end_addr)
 
     def add_def_point(self, block_id: int, addr: int):
         """Add a definition point to the cover."""
-        self.add_piece(CoverPiece(block_id, addr, addr))
+        self.add_range(block_id, addr, addr)
 
     def add_use_point(self, block_id: int, addr: int):
         """Add a use point to the cover."""
-        # Extend existing piece in same block or add new
-        for piece in self.pieces:
-            if piece.block_id == block_id:
-                if addr >= piece.start_addr:
-                    piece.end_addr = max(piece.end_addr, addr)
-                    return
-                elif addr < piece.start_addr:
-                    piece.start_addr = addr
-                    return
-
-        self.add_piece(CoverPiece(block_id, addr, addr))
+        # Extend the piece the use follows (or the first piece) or add new
+        intervals = self._blocks.get(block_id)
+        if not intervals:
+            self.add_range(block_id, addr, addr)
+            return
+        starts, ends = intervals
+        i = bisect_right(starts, addr) - 1
+        if i < 0:
+            self.add_range(block_id, addr, ends[0])
+        else:
+            self.add_range(block_id, starts[i], max(ends[i], addr))
 
     def add_range(self, block_id: int, start: int, end: int):
         """Add a range to the cover."""
-        self.add_piece(CoverPiece(block_id, start, end))
+        intervals = self._blocks.get(block_id)
+        if intervals is None:
+            self._blocks[block_id] = ([start], [end])
+            return
+        starts, ends = intervals
+        # Pieces overlapping or adjacent to [start, end] form the run lo:hi
+        lo = bisect_left(ends, start - 1)
+        hi = bisect_right(starts, end + 1)
+        if lo < hi:
+            start = min(start, starts[lo])
+            end = max(end, ends[hi - 1])
+        starts[lo:hi] = [start]
+        ends[lo:hi] = [end]
 
     def intersects(self, other: "Cover") -> bool:
         """Check if this cover intersects with another."""
-        for p1 in self.pieces:
-            for p2 in other.pieces:
-                if p1.overlaps(p2):
-                    return True
+        small, large = (self, other) if len(self._blocks) <= len(other._blocks) else (other, self)
+        for block_id, (starts, ends) in small._blocks.items():
+            other_intervals = large._blocks.get(block_id)
+            if other_intervals is not None and _sweep_overlaps(starts, ends, *other_intervals):
+                return True
         return False
 
     def contains(self, block_id: int, addr: int) -> bool:
         """Check if the cover contains a specific point."""
-        for piece in self.pieces:
-            if piece.contains(block_id, addr):
-                return True
-        return False
+        intervals = self._blocks.get(block_id)
+        if not intervals:
+            return False
+        starts, ends = intervals
+        i = bisect_right(starts, addr) - 1
+        return i >= 0 and addr <= ends[i]
 
     def merge(self, other: "Cover"):
         """Merge another cover into this one."""
-        for piece in other.pieces:
-            self.add_piece(piece)
+        for block_id, (starts, ends) in other._blocks.items():
+            if block_id not in self._blocks:
+                self._blocks[block_id] = (list(starts), list(ends))
+                continue
+            for start, end in zip(starts, ends):
+                self.add_range(block_id, start, end)
 
     def is_empty(self) -> bool:
         """Check if cover is empty."""
-        return len(self.pieces) == 0
+        return not self._blocks
 
     def get_block_ids(self) -> Set[int]:
         """Get all block IDs in this cover."""
-        return {p.block_id for p in self.pieces}
+        return set(self._blocks)
 
-    def _consolidate(self):
-        """Consolidate overlapping/adjacent pieces."""
-        if len(self.pieces) <= 1:
-            return
 
-        # Sort by block then start address
-        self.pieces.sort(key=lambda p: (p.block_id, p.start_addr))
+def _sweep_overlaps(starts_a: List[int], ends_a: List[int],
+                    starts_b: List[int], ends_b: List[int]) -> bool:
+    """Check whether two sorted interval arrays share a point.
 
-        # Merge adjacent pieces
-        consolidated = []
-        current = self.pieces[0]
+    One linear sweep over both, or a binary search per interval of the
+    shorter array when the other is much longer.
+    """
+    if len(starts_a) > len(starts_b):
+        starts_a, ends_a, starts_b, ends_b = starts_b, ends_b, starts_a, ends_a
+    if len(starts_a) * 8 < len(starts_b):
+        for start, end in zip(starts_a, ends_a):
+            j = bisect_left(ends_b, start)
+            if j < len(starts_b) and starts_b[j] <= end:
+                return True
+        return False
+    i = j = 0
+    while i < len(starts_a) and j < len(starts_b):
+        if ends_a[i] < starts_b[j]:
+            i += 1
+        elif ends_b[j] < starts_a[i]:
+            j += 1
+        else:
+            return True
+    return False
+
+
+class CoverIndex:
+    """
+    Covers of many owners (e.g. HighVariables), indexed by block.
 
-        for piece in self.pieces[1:]:
-            merged = current.merge(piece)
-            if merged is not None:
-                current = merged
-            else:
-                consolidated.append(current)
-                current = piece
+    Answers "which owners can a cover be merged with" for all owners at
+    once: only the owners with a piece in one of the cover's blocks are
+    intersect-tested, every other owner is disjoint without looking at it.
+    The index holds the owners' Cover objects, so after an owner's cover
+    grows call add() again to index its new blocks.
+    """
 
-        consolidated.append(current)
-        self.pieces = consolidated
+    def __init__(self):
+        self._covers: Dict[Hashable, Cover] = {}
+        self._by_block: Dict[int, Set[Hashable]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._covers)
+
+    def add(self, key: Hashable, cover: Cover):
+        """Index (or re-index) the cover of key."""
+        self._covers[key] = cover
+        for block_id in cover._blocks:
+            self._by_block[block_id].add(key)
+
+    def _sharing_blocks(self, cover: Cover) -> Set[Hashable]:
+        """Keys with a piece in one of cover's blocks (the only possible overlaps)."""
+        keys: Set[Hashable] = set()
+        for block_id in cover._blocks:
+            keys.update(self._by_block.get(block_id, ()))
+        return keys
+
+    def overlapping(self, cover: Cover) -> Set[Hashable]:
+        """Keys whose cover intersects cover."""
+        return {key for key in self._sharing_blocks(cover) if self._covers[key].intersects(cover)}
+
+    def disjoint(self, cover: Cover) -> Iterator[Hashable]:
+        """Keys whose cover does not intersect cover, in insertion order.
+
+        The merge candidates of cover. Lazy, so a first-fit search stops at
+        the first acceptable one; each key it reaches that shares a block
+        with cover costs a binary search per piece of cover.
+        """
+        sharing = self._sharing_blocks(cover)
+        query = [
+            (block_id, start, end)
+            for block_id, (starts, ends) in cover._blocks.items()
+            for start, end in zip(starts, ends)
+        ]
+        for key, other in self._covers.items():
+            if key in sharing:
+                blocks = other._blocks
+                for block_id, start, end in query:
+                    intervals = blocks.get(block_id)
+                    if intervals is not None:
+                        i = bisect_left(intervals[1], start)
+                        if i < len(intervals[1]) and intervals[0][i] <= end:
+                            break
+                else:
+                    yield key
+            else:
+                yield key
 
 
 def compute_cover(value: "SSAValue", ssa_func) -> Cover:
@@ -15,7 +15,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Set, TYPE_CHECKING
 import logging
 
-from .cover import Cover, compute_cover
+from .cover import Cover, CoverIndex, compute_cover
 from .high_variable import HighVariable, create_high_variable
 
 if TYPE_CHECKING:
@@ -116,15 +116,23 @@ class MergeEngine:
         # Sort by name for consistent ordering
         unassigned.sort(key=lambda v: v.name)
 
+        # Index the HighVariable covers (keyed by list position) so the
+        # non-overlapping candidates come from one batched query per value
+        index = CoverIndex()
+        for position, hv in enumerate(self.high_variables):
+            index.add(position, hv.cover)
+
         # Try to merge each unassigned into existing HighVariable
         for value in unassigned:
             cover = self.covers.get(value.name, Cover())
             merged = False
 
-            # Try existing HighVariables
-            for hv in self.high_variables:
-                if self._can_merge_speculative(value, cover, hv):
+            # Try existing HighVariables, first fit among the disjoint ones
+            for position in index.disjoint(cover):
+                hv = self.high_variables[position]
+                if self._is_compatible_speculative(value, hv):
                     hv.add_instance(value, cover)
+                    index.add(position, hv.cover)
                     self.value_to_high[value.name] = hv
                     merged = True
                     break
@@ -132,6 +140,7 @@ class MergeEngine:
             # Create new HighVariable if not merged
             if not merged:
                 hv = create_high_variable(value, cover)
+                index.add(len(self.high_variables), hv.cover)
                 self.high_variables.append(hv)
                 self.value_to_high[value.name] = hv
 
@@ -246,6 +255,10 @@ class MergeEngine:
         if hv.cover.intersects(cover):
             return False
 
+        return self._is_compatible_speculative(value, hv)
+
+    def _is_compatible_speculative(self, value: "SSAValue", hv: HighVariable) -> bool:
+        """Check the type and category rules of a speculative merge (not the covers)."""
         # Types should match (if both known)
         if hasattr(value, 'value_type') and value.value_type is not None:
             if hv.data_type is not None and hv.data_type != value.value_type:
@@ -31,6 +31,8 @@ class RuleCancelAddSub(SimplificationRule):
         x + y - y → x
     """
 
+    mnemonics = frozenset({"ADD", "SUB"})
+
     def __init__(self):
         super().__init__("RuleCancelAddSub")
 
@@ -115,6 +117,8 @@ class RuleAbsorbNegation(SimplificationRule):
         x + (-y) → x - y
     """
 
+    mnemonics = frozenset({"ADD", "SUB"})
+
     def __init__(self):
         super().__init__("RuleAbsorbNegation")
 
@@ -213,6 +217,8 @@ class RuleStrengthReduction(SimplificationRule):
         x / x → 1 (when non-zero)
     """
 
+    mnemonics = frozenset({"DIV", "IDIV"})
+
     def __init__(self):
         super().__init__("RuleStrengthReduction")
 
@@ -150,6 +150,8 @@ class RuleDoubleAdd(SimplificationRule):
         (x + a) + b → x + (a + b) when a, b are constants
     """
 
+    mnemonics = frozenset({"ADD"})
+
     def __init__(self):
         super().__init__("RuleDoubleAdd")
 
@@ -222,6 +224,8 @@ class RuleDoubleSub(SimplificationRule):
         (x - a) - b → x - (a + b) when a, b are constants
     """
 
+    mnemonics = frozenset({"SUB"})
+
     def __init__(self):
         super().__init__("RuleDoubleSub")
 
@@ -293,6 +297,8 @@ class RuleNegateIdentity(SimplificationRule):
         -(-x) → x
     """
 
+    mnemonics = frozenset({"NEG"})
+
     def __init__(self):
         super().__init__("RuleNegateIdentity")
 
@@ -340,6 +346,8 @@ class RuleSubIdentity(SimplificationRule):
         x - x → 0
     """
 
+    mnemonics = frozenset({"DSUB", "FSUB", "SUB"})
+
     def __init__(self):
         super().__init__("RuleSubIdentity")
 
@@ -396,6 +404,8 @@ class RuleDivIdentity(SimplificationRule):
         x / 1 → x
     """
 
+    mnemonics = frozenset({"DDIV", "DIV", "FDIV", "IDIV"})
+
     def __init__(self):
         super().__init__("RuleDivIdentity")
 
@@ -441,6 +451,8 @@ class RuleMulByPowerOf2(SimplificationRule):
     Only applies when beneficial (shift is usually faster/clearer for indexing).
     """
 
+    mnemonics = frozenset({"MUL"})
+
     def __init__(self):
         super().__init__("RuleMulByPowerOf2")
 
@@ -510,6 +522,8 @@ class RuleDivByPowerOf2(SimplificationRule):
     Note: Only safe for unsigned division. Signed division requires arithmetic shift.
     """
 
+    mnemonics = frozenset({"DIV"})
+
     def __init__(self):
         super().__init__("RuleDivByPowerOf2")
 
@@ -579,6 +593,8 @@ class RuleModByPowerOf2(SimplificationRule):
     This optimization: x % (2^n) = x & (2^n - 1)
     """
 
+    mnemonics = frozenset({"MOD"})
+
     def __init__(self):
         super().__init__("RuleModByPowerOf2")
 
@@ -638,6 +654,8 @@ class RuleMulZero(SimplificationRule):
         0 * x → 0
     """
 
+    mnemonics = frozenset({"DMUL", "FMUL", "MUL"})
+
     def __init__(self):
         super().__init__("RuleMulZero")
 
@@ -681,6 +699,8 @@ class RuleModOne(SimplificationRule):
         x % 1 → 0 (anything mod 1 is always 0)
     """
 
+    mnemonics = frozenset({"MOD"})
+
     def __init__(self):
         super().__init__("RuleModOne")
 
@@ -728,6 +748,8 @@ class RuleMulDistribute(SimplificationRule):
     This is useful for loop index calculations and array access patterns.
     """
 
+    mnemonics = frozenset({"ADD"})
+
     def __init__(self):
         super().__init__("RuleMulDistribute")
 
@@ -827,6 +849,8 @@ class RuleCollectTerms(SimplificationRule):
     This is a complex rule that establishes canonical form for addition chains.
     """
 
+    mnemonics = frozenset({"ADD"})
+
     def __init__(self):
         super().__init__("RuleCollectTerms")
         self.is_disabled = True  # Complex - needs careful implementation
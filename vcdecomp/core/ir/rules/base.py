@@ -10,7 +10,7 @@ This module provides:
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Optional, Union, List
+from typing import FrozenSet, Optional, Union, List
 
 from ...disasm import opcodes
 from ..ssa import SSAFunction, SSAInstruction, SSAValue
@@ -22,8 +22,14 @@ class SimplificationRule(ABC):
 
     Each rule implements pattern matching (matches) and transformation (apply).
     Rules are applied iteratively by the SimplificationEngine until convergence.
+
+    Subclasses should declare `mnemonics`: the instruction mnemonics matches()
+    can accept. The engine indexes instructions by mnemonic and only offers a
+    rule the instructions it can match; None offers every instruction.
     """
 
+    mnemonics: Optional[FrozenSet[str]] = None
+
     def __init__(self, name: str):
         self.name = name
         self.apply_count = 0
@@ -215,6 +221,25 @@ def create_intermediate_value(
     return intermediate_val
 
 
+COMMUTATIVE_OPS = frozenset({
+    "ADD",
+    "MUL",  # Integer
+    "FADD",
+    "FMUL",  # Float
+    "DADD",
+    "DMUL",  # Double
+    "BA",
+    "BO",
+    "BX",  # Bitwise AND, OR, XOR
+    "EQU",
+    "NEQ",  # Equality
+    "FEQU",
+    "FNEQ",  # Float equality
+    "DEQU",
+    "DNEQ",  # Double equality
+})
+
+
 def is_commutative(mnemonic: str) -> bool:
     """
     Check if operation is commutative (a op b = b op a).
@@ -225,23 +250,6 @@ def is_commutative(mnemonic: str) -> bool:
     Returns:
         True if commutative, False otherwise
     """
-    COMMUTATIVE_OPS = {
-        "ADD",
-        "MUL",  # Integer
-        "FADD",
-        "FMUL",  # Float
-        "DADD",
-        "DMUL",  # Double
-        "BA",
-        "BO",
-        "BX",  # Bitwise AND, OR, XOR
-        "EQU",
-        "NEQ",  # Equality
-        "FEQU",
-        "FNEQ",  # Float equality
-        "DEQU",
-        "DNEQ",  # Double equality
-    }
     return mnemonic in COMMUTATIVE_OPS
 
 
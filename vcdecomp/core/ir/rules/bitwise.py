@@ -33,6 +33,8 @@ class RuleAndMask(SimplificationRule):
     From Ghidra's ruleaction.cc.
     """
 
+    mnemonics = frozenset({"BA"})
+
     def __init__(self):
         super().__init__("RuleAndMask")
 
@@ -105,6 +107,8 @@ class RuleOrMask(SimplificationRule):
         (x | m1) | m2 → x | (m1 | m2)
     """
 
+    mnemonics = frozenset({"BO"})
+
     def __init__(self):
         super().__init__("RuleOrMask")
 
@@ -177,6 +181,8 @@ class RuleXorCancel(SimplificationRule):
         x ^ 0 → x
     """
 
+    mnemonics = frozenset({"BX"})
+
     def __init__(self):
         super().__init__("RuleXorCancel")
 
@@ -234,6 +240,8 @@ class RuleShiftByZero(SimplificationRule):
         x >> 0 → x
     """
 
+    mnemonics = frozenset({"LS", "RS", "SHL", "SHR"})
+
     def __init__(self):
         super().__init__("RuleShiftByZero")
 
@@ -279,6 +287,8 @@ class RuleDoubleShift(SimplificationRule):
         (x >> 1) >> 2 → x >> 3
     """
 
+    mnemonics = frozenset({"LS", "RS", "SHL", "SHR"})
+
     def __init__(self):
         super().__init__("RuleDoubleShift")
 
@@ -353,6 +363,8 @@ class RuleAndWithOr(SimplificationRule):
     This is absorption law: x & (x | y) = x
     """
 
+    mnemonics = frozenset({"BA"})
+
     def __init__(self):
         super().__init__("RuleAndWithOr")
 
@@ -425,6 +437,8 @@ class RuleOrWithAnd(SimplificationRule):
     This is absorption law: x | (x & y) = x
     """
 
+    mnemonics = frozenset({"BO"})
+
     def __init__(self):
         super().__init__("RuleOrWithAnd")
 
@@ -495,6 +509,8 @@ class RuleAndZero(SimplificationRule):
         0 & x → 0
     """
 
+    mnemonics = frozenset({"BA"})
+
     def __init__(self):
         super().__init__("RuleAndZero")
 
@@ -539,6 +555,8 @@ class RuleOrAllOnes(SimplificationRule):
         x | -1 → -1
     """
 
+    mnemonics = frozenset({"BO"})
+
     def __init__(self):
         super().__init__("RuleOrAllOnes")
 
@@ -589,6 +607,8 @@ class RuleNotDistribute(SimplificationRule):
     further optimizations through bit manipulation analysis.
     """
 
+    mnemonics = frozenset({"BN"})
+
     def __init__(self):
         super().__init__("RuleNotDistribute")
         self.is_disabled = False  # NOW ENABLED with multi-instruction support!
@@ -682,6 +702,8 @@ class RuleHighOrderAnd(SimplificationRule):
     This makes byte extraction more obvious and enables further optimizations.
     """
 
+    mnemonics = frozenset({"RS", "RSA"})
+
     def __init__(self):
         super().__init__("RuleHighOrderAnd")
 
@@ -804,6 +826,8 @@ class RuleBitUndistribute(SimplificationRule):
     This is the reverse of distribution and can simplify complex bit manipulation.
     """
 
+    mnemonics = frozenset({"BA", "BO"})
+
     def __init__(self):
         super().__init__("RuleBitUndistribute")
 
@@ -33,6 +33,8 @@ class RuleBooleanAnd(SimplificationRule):
         x && 0 → 0
     """
 
+    mnemonics = frozenset({"AND", "BA", "LAND"})
+
     def __init__(self):
         super().__init__("RuleBooleanAnd")
 
@@ -109,6 +111,8 @@ class RuleBooleanOr(SimplificationRule):
         x || 1 → 1 (in boolean context)
     """
 
+    mnemonics = frozenset({"BO", "LOR", "OR"})
+
     def __init__(self):
         super().__init__("RuleBooleanOr")
 
@@ -195,6 +199,8 @@ class RuleBooleanNot(SimplificationRule):
         ~(~x) → x (bitwise NOT)
     """
 
+    mnemonics = frozenset({"BN", "LNOT", "NOT"})
+
     def __init__(self):
         super().__init__("RuleBooleanNot")
 
@@ -243,6 +249,8 @@ class RuleBooleanDedup(SimplificationRule):
         x || x → x
     """
 
+    mnemonics = frozenset({"AND", "BA", "BO", "LAND", "LOR", "OR"})
+
     def __init__(self):
         super().__init__("RuleBooleanDedup")
 
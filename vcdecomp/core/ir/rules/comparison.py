@@ -32,6 +32,8 @@ class RuleEqualitySelf(SimplificationRule):
         x != x → false (0)
     """
 
+    mnemonics = frozenset({"DEQU", "DNEQ", "EQU", "FEQU", "FNEQ", "NEQ"})
+
     def __init__(self):
         super().__init__("RuleEqualitySelf")
 
@@ -78,6 +80,8 @@ class RuleLessEqualSelf(SimplificationRule):
         x > x → false (0)
     """
 
+    mnemonics = frozenset({"DGEQ", "DGRE", "DLEQ", "DLES", "FGEQ", "FGRE", "FLEQ", "FLES", "GEQ", "GRE", "LEQ", "LES"})
+
     def __init__(self):
         super().__init__("RuleLessEqualSelf")
 
@@ -137,6 +141,8 @@ class RuleCompareConstants(SimplificationRule):
         7 > 20 → false
     """
 
+    mnemonics = frozenset({"DEQU", "DGEQ", "DGRE", "DLEQ", "DLES", "DNEQ", "EQU", "FEQU", "FGEQ", "FGRE", "FLEQ", "FLES", "FNEQ", "GEQ", "GRE", "LEQ", "LES", "NEQ"})
+
     def __init__(self):
         super().__init__("RuleCompareConstants")
 
@@ -248,6 +254,8 @@ class RuleNotEqual(SimplificationRule):
         !(x < y) → x >= y
     """
 
+    mnemonics = frozenset({"BN", "LNOT", "NOT"})
+
     def __init__(self):
         super().__init__("RuleNotEqual")
 
@@ -332,6 +340,8 @@ class RuleCompareZero(SimplificationRule):
     Note: Disabled by default as this is context-dependent.
     """
 
+    mnemonics = frozenset({"EQU", "NEQ"})
+
     def __init__(self):
         super().__init__("RuleCompareZero")
         # Enabled: Simplifies x==0 to !x and x!=0 to x in boolean contexts
@@ -398,6 +408,8 @@ class RuleLessEqual(SimplificationRule):
         x < y || x > y || x == y → true (always)
     """
 
+    mnemonics = frozenset({"BA", "LAND"})
+
     def __init__(self):
         super().__init__("RuleLessEqual")
 
@@ -500,6 +512,8 @@ class RuleIntLessEqual(SimplificationRule):
     Note: May reduce readability, but provides canonical form for analysis.
     """
 
+    mnemonics = frozenset({"DGEQ", "DLEQ", "FGEQ", "FLEQ", "GEQ", "LEQ"})
+
     def __init__(self):
         super().__init__("RuleIntLessEqual")
         self.is_disabled = False  # NOW ENABLED with multi-instruction support!
@@ -576,6 +590,8 @@ class RuleBxor2NotEqual(SimplificationRule):
     This pattern is common in compiled code for inequality checks.
     """
 
+    mnemonics = frozenset({"EQU", "NEQ"})
+
     def __init__(self):
         super().__init__("RuleBxor2NotEqual")
 
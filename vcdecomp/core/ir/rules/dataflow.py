@@ -270,6 +270,8 @@ class RuleIdentityCopy(SimplificationRule):
     This handles degenerate copy cases.
     """
 
+    mnemonics = frozenset({"COPY"})
+
     def __init__(self):
         super().__init__("RuleIdentityCopy")
 
@@ -304,6 +306,8 @@ class RulePhiSimplify(SimplificationRule):
     Enabled by CFG integration.
     """
 
+    mnemonics = frozenset({"PHI"})
+
     def __init__(self):
         super().__init__("RulePhiSimplify")
         self.is_disabled = False  # NOW ENABLED with CFG integration!
@@ -430,6 +434,8 @@ class RuleRedundantCopy(SimplificationRule):
     This is similar to copy propagation but simpler.
     """
 
+    mnemonics = frozenset({"COPY"})
+
     def __init__(self):
         super().__init__("RuleRedundantCopy")
 
@@ -476,6 +482,8 @@ class RuleCopyChain(SimplificationRule):
     This is handled by RuleRedundantCopy but kept for clarity.
     """
 
+    mnemonics = frozenset()  # matches() never fires yet
+
     def __init__(self):
         super().__init__("RuleCopyChain")
 
@@ -501,6 +509,8 @@ class RuleValueNumbering(SimplificationRule):
     This is a form of common subexpression elimination.
     """
 
+    mnemonics = frozenset()  # matches() never fires yet
+
     def __init__(self):
         super().__init__("RuleValueNumbering")
         self.is_disabled = True  # Requires value numbering table
@@ -589,6 +599,8 @@ class RuleTrivialPhi(SimplificationRule):
     but they're all the same value. This rule handles single-input phis.
     """
 
+    mnemonics = frozenset({"PHI"})
+
     def __init__(self):
         super().__init__("RuleTrivialPhi")
         self.is_disabled = False  # NOW ENABLED with CFG integration!
@@ -644,6 +656,8 @@ class RuleForwardSubstitution(SimplificationRule):
     Kept for Ghidra compatibility but disabled.
     """
 
+    mnemonics = frozenset()  # matches() never fires yet
+
     def __init__(self):
         super().__init__("RuleForwardSubstitution")
         # Redundant with RuleCopyPropagation + RuleConstantPropagation
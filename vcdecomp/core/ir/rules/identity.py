@@ -18,6 +18,7 @@ from .base import (
     get_constant_value,
     create_constant_value,
     is_commutative,
+    COMMUTATIVE_OPS,
 )
 from ..ssa import SSAFunction, SSAInstruction
 
@@ -35,6 +36,8 @@ class RuleTermOrder(SimplificationRule):
     equivalent expressions have identical form.
     """
 
+    mnemonics = COMMUTATIVE_OPS
+
     def __init__(self):
         super().__init__("RuleTermOrder")
 
@@ -83,6 +86,8 @@ class RuleAndIdentity(SimplificationRule):
         x & x → x    (AND with self)
     """
 
+    mnemonics = frozenset({"BA"})
+
     def __init__(self):
         super().__init__("RuleAndIdentity")
 
@@ -157,6 +162,8 @@ class RuleOrIdentity(SimplificationRule):
         x | x → x    (OR with self)
     """
 
+    mnemonics = frozenset({"BO"})
+
     def __init__(self):
         super().__init__("RuleOrIdentity")
 
@@ -232,6 +239,8 @@ class RuleAddIdentity(SimplificationRule):
         0 + x → x
     """
 
+    mnemonics = frozenset({"ADD", "DADD", "FADD"})
+
     def __init__(self):
         super().__init__("RuleAddIdentity")
 
@@ -289,6 +298,8 @@ class RuleMulIdentity(SimplificationRule):
         x * 0 → 0
     """
 
+    mnemonics = frozenset({"DMUL", "FMUL", "MUL"})
+
     def __init__(self):
         super().__init__("RuleMulIdentity")
 
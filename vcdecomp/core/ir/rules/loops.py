@@ -43,6 +43,8 @@ class RuleLoopIncrementSimplify(SimplificationRule):
     This simplifies redundant operations in loop increments.
     """
 
+    mnemonics = frozenset()  # matches() never fires yet
+
     def __init__(self):
         super().__init__("RuleLoopIncrementSimplify")
 
@@ -70,6 +72,8 @@ class RuleLoopCounterNormalize(SimplificationRule):
     This normalizes loop counter modifications to canonical form.
     """
 
+    mnemonics = frozenset({"ADD", "SUB"})
+
     def __init__(self):
         super().__init__("RuleLoopCounterNormalize")
 
@@ -143,6 +147,8 @@ class RuleLoopBoundConstant(SimplificationRule):
     This simplifies loop bound expressions.
     """
 
+    mnemonics = frozenset()  # matches() never fires yet
+
     def __init__(self):
         super().__init__("RuleLoopBoundConstant")
 
@@ -169,6 +175,8 @@ class RuleInductionSimplify(SimplificationRule):
     This is primarily for detection, not transformation.
     """
 
+    mnemonics = frozenset()  # matches() never fires yet
+
     def __init__(self):
         super().__init__("RuleInductionSimplify")
         self.is_disabled = True  # Requires loop analysis
@@ -196,6 +204,8 @@ class RuleLoopInvariantDetect(SimplificationRule):
     This requires CFG and reaching definitions analysis.
     """
 
+    mnemonics = frozenset()  # matches() never fires yet
+
     def __init__(self):
         super().__init__("RuleLoopInvariantDetect")
         self.is_disabled = True  # Requires CFG and reaching definitions
@@ -227,6 +237,8 @@ class RuleLoopStrength(SimplificationRule):
     This is a classic loop optimization requiring induction variable analysis.
     """
 
+    mnemonics = frozenset()  # matches() never fires yet
+
     def __init__(self):
         super().__init__("RuleLoopStrength")
         self.is_disabled = True  # Requires induction variable analysis
@@ -263,6 +275,8 @@ class RuleLoopUnswitch(SimplificationRule):
     This requires CFG transformation.
     """
 
+    mnemonics = frozenset()  # matches() never fires yet
+
     def __init__(self):
         super().__init__("RuleLoopUnswitch")
         self.is_disabled = True  # Requires CFG transformation
@@ -294,6 +308,8 @@ class RuleCountedLoop(SimplificationRule):
     This analyzes loop structure to determine if it's a counted loop.
     """
 
+    mnemonics = frozenset()  # matches() never fires yet
+
     def __init__(self):
         super().__init__("RuleCountedLoop")
         self.is_disabled = True  # Requires CFG and loop analysis
@@ -326,6 +342,8 @@ class RuleLoopElimination(SimplificationRule):
     This detects loops that never execute or have no side effects.
     """
 
+    mnemonics = frozenset()  # matches() never fires yet
+
     def __init__(self):
         super().__init__("RuleLoopElimination")
         self.is_disabled = True  # Requires CFG transformation
@@ -359,6 +377,8 @@ class RuleLoopRotate(SimplificationRule):
     This is a CFG transformation.
     """
 
+    mnemonics = frozenset()  # matches() never fires yet
+
     def __init__(self):
         super().__init__("RuleLoopRotate")
         self.is_disabled = True  # Requires CFG transformation
@@ -388,6 +408,8 @@ class RuleLoopFusion(SimplificationRule):
     This requires CFG analysis and dependency analysis.
     """
 
+    mnemonics = frozenset()  # matches() never fires yet
+
     def __init__(self):
         super().__init__("RuleLoopFusion")
         self.is_disabled = True  # Requires CFG and dependency analysis
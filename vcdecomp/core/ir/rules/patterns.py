@@ -44,6 +44,8 @@ class RuleConditionInvert(SimplificationRule):
     This applies boolean algebra to simplify negated comparisons.
     """
 
+    mnemonics = frozenset({"NOT"})
+
     def __init__(self):
         super().__init__("RuleConditionInvert")
 
@@ -104,6 +106,8 @@ class RuleDemorganLaws(SimplificationRule):
     Can expose further optimization opportunities in boolean logic.
     """
 
+    mnemonics = frozenset({"BN", "LN", "NOT"})
+
     def __init__(self):
         super().__init__("RuleDemorganLaws")
         self.is_disabled = False  # NOW ENABLED with multi-instruction support!
@@ -206,6 +210,8 @@ class RuleAbsoluteValue(SimplificationRule):
     This recognizes common abs() implementations.
     """
 
+    mnemonics = frozenset()  # matches() never fires yet
+
     def __init__(self):
         super().__init__("RuleAbsoluteValue")
         self.is_disabled = True  # Requires control flow analysis
@@ -233,6 +239,8 @@ class RuleMinMaxPatterns(SimplificationRule):
     This recognizes common min/max implementations.
     """
 
+    mnemonics = frozenset()  # matches() never fires yet
+
     def __init__(self):
         super().__init__("RuleMinMaxPatterns")
         self.is_disabled = True  # Requires control flow analysis
@@ -259,6 +267,8 @@ class RuleBitfieldExtract(SimplificationRule):
     This recognizes common bitfield access patterns.
     """
 
+    mnemonics = frozenset({"BA", "SHL", "SHR"})
+
     def __init__(self):
         super().__init__("RuleBitfieldExtract")
 
@@ -325,6 +335,8 @@ class RuleSignMagnitude(SimplificationRule):
     This recognizes sign/magnitude decomposition.
     """
 
+    mnemonics = frozenset()  # matches() never fires yet
+
     def __init__(self):
         super().__init__("RuleSignMagnitude")
         self.is_disabled = True  # Requires control flow analysis
@@ -350,6 +362,8 @@ class RuleRangeCheck(SimplificationRule):
     This recognizes common bounds checking patterns.
     """
 
+    mnemonics = frozenset({"AND", "OR"})
+
     def __init__(self):
         super().__init__("RuleRangeCheck")
         self.is_disabled = True  # Requires boolean expression analysis
@@ -413,6 +427,8 @@ class RuleBoolNormalize(SimplificationRule):
     This simplifies boolean comparisons.
     """
 
+    mnemonics = frozenset({"EQU", "NEQ"})
+
     def __init__(self):
         super().__init__("RuleBoolNormalize")
 
@@ -493,6 +509,8 @@ class RuleConditionMerge(SimplificationRule):
     This eliminates duplicate comparisons in boolean expressions.
     """
 
+    mnemonics = frozenset({"AND", "OR"})
+
     def __init__(self):
         super().__init__("RuleConditionMerge")
 
@@ -536,6 +554,8 @@ class RuleSelectPattern(SimplificationRule):
     Note: This operates on phi nodes in the CFG, not SSA instructions directly.
     """
 
+    mnemonics = frozenset()  # matches() never fires yet
+
     def __init__(self):
         super().__init__("RuleSelectPattern")
         self.is_disabled = True  # Requires control flow analysis
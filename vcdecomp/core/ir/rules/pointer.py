@@ -149,6 +149,8 @@ class RulePtrAddChain(SimplificationRule):
     This replaces the stub RulePointerAdd with a real implementation.
     """
 
+    mnemonics = frozenset({"ADD"})
+
     def __init__(self):
         super().__init__("RulePtrAddChain")
 
@@ -212,6 +214,8 @@ class RulePtrSubNormalize(SimplificationRule):
     This converts subtraction of negative values to addition.
     """
 
+    mnemonics = frozenset({"SUB"})
+
     def __init__(self):
         super().__init__("RulePtrSubNormalize")
 
@@ -263,6 +267,8 @@ class RulePtrArithIdentity(SimplificationRule):
     This is similar to RuleAddIdentity but specifically for pointers.
     """
 
+    mnemonics = frozenset({"ADD", "SUB"})
+
     def __init__(self):
         super().__init__("RulePtrArithIdentity")
 
@@ -308,6 +314,8 @@ class RulePtrNullCheck(SimplificationRule):
     This converts explicit null checks to implicit boolean conversion.
     """
 
+    mnemonics = frozenset({"EQU", "NEQ"})
+
     def __init__(self):
         super().__init__("RulePtrNullCheck")
         self.is_disabled = True  # Conservative: disabled until we have type info
@@ -348,6 +356,8 @@ class RulePtrCompare(SimplificationRule):
     This detects when comparing pointers with known base and offsets.
     """
 
+    mnemonics = frozenset({"EQU", "GEQ", "GRE", "LEQ", "LES", "NEQ"})
+
     def __init__(self):
         super().__init__("RulePtrCompare")
         self.is_disabled = True  # Complex analysis required
@@ -379,6 +389,8 @@ class RulePtrDiff(SimplificationRule):
     This recognizes the pattern of computing array element count from pointer difference.
     """
 
+    mnemonics = frozenset({"DIV", "SHR"})
+
     def __init__(self):
         super().__init__("RulePtrDiff")
         self.is_disabled = True  # Requires type information
@@ -422,6 +434,8 @@ class RuleArrayBase(SimplificationRule):
     This eliminates redundant address-of and dereference operations.
     """
 
+    mnemonics = frozenset()  # matches() never fires yet
+
     def __init__(self):
         super().__init__("RuleArrayBase")
         self.is_disabled = True  # Need address-of and deref opcodes
@@ -448,6 +462,8 @@ class RuleStructOffset(SimplificationRule):
     This recognizes common struct field offset patterns.
     """
 
+    mnemonics = frozenset({"ADD"})
+
     def __init__(self):
         super().__init__("RuleStructOffset")
         self.is_disabled = True  # Requires struct type information
@@ -491,6 +507,8 @@ class RuleArrayBounds(SimplificationRule):
     This performs constant folding for array indexing.
     """
 
+    mnemonics = frozenset({"ADD"})
+
     def __init__(self):
         super().__init__("RuleArrayBounds")
 
@@ -553,6 +571,8 @@ class RulePtrIndex(SimplificationRule):
     Note: This operates at the expression level, not SSA IR level.
     """
 
+    mnemonics = frozenset()  # matches() never fires yet
+
     def __init__(self):
         super().__init__("RulePtrIndex")
         self.is_disabled = True  # Presentation-only rule, handled by code emitter
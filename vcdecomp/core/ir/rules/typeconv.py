@@ -31,6 +31,8 @@ class RuleCastChain(SimplificationRule):
         int→short→int → int (preserving only conversion)
     """
 
+    mnemonics = frozenset({"CTOI", "DTOF", "DTOI", "FTOD", "FTOI", "ITOC", "ITOD", "ITOF", "ITOS", "STOI"})
+
     def __init__(self):
         super().__init__("RuleCastChain")
 
@@ -109,6 +111,8 @@ class RuleCastIdentity(SimplificationRule):
         float→float
     """
 
+    mnemonics = frozenset({"CTOI", "DTOF", "DTOI", "FTOD", "FTOI", "ITOC", "ITOD", "ITOF", "ITOS", "STOI"})
+
     def __init__(self):
         super().__init__("RuleCastIdentity")
 
@@ -173,6 +177,8 @@ class RuleCastConstant(SimplificationRule):
         char(300) → 44 (with overflow)
     """
 
+    mnemonics = frozenset({"CTOI", "DTOF", "DTOI", "FTOD", "FTOI", "ITOC", "ITOD", "ITOF", "ITOS", "STOI"})
+
     def __init__(self):
         super().__init__("RuleCastConstant")
 
@@ -266,6 +272,8 @@ class RuleSextChain(SimplificationRule):
     This simplifies nested sign extensions by keeping only the final extension.
     """
 
+    mnemonics = frozenset({"CTOI", "STOI"})
+
     def __init__(self):
         super().__init__("RuleSextChain")
 
@@ -323,6 +331,8 @@ class RuleTruncateZext(SimplificationRule):
     When we truncate then extend back, we might be able to eliminate both operations.
     """
 
+    mnemonics = frozenset({"CTOI", "STOI"})
+
     def __init__(self):
         super().__init__("RuleTruncateZext")
 
@@ -382,6 +392,8 @@ class RuleBoolZext(SimplificationRule):
     them to int is redundant.
     """
 
+    mnemonics = frozenset({"CTOI", "STOI"})
+
     def __init__(self):
         super().__init__("RuleBoolZext")
 
@@ -435,6 +447,8 @@ class RuleZextEliminate(SimplificationRule):
     Note: Conservative - only eliminates when provably safe.
     """
 
+    mnemonics = frozenset({"CTOI", "STOI"})
+
     def __init__(self):
         super().__init__("RuleZextEliminate")
 
@@ -520,6 +534,8 @@ class RulePromoteTypes(SimplificationRule):
     Note: This is primarily for analysis/annotation rather than transformation.
     """
 
+    mnemonics = frozenset({"ADD", "BA", "BO", "BX", "DIV", "MOD", "MUL", "SUB"})
+
     def __init__(self):
         super().__init__("RulePromoteTypes")
         self.is_disabled = True  # Analysis-only, doesn't transform
@@ -565,6 +581,8 @@ class RuleCastPropagation(SimplificationRule):
     This helps eliminate casts that don't change the actual value range.
     """
 
+    mnemonics = frozenset({"ITOC", "ITOS"})
+
     def __init__(self):
         super().__init__("RuleCastPropagation")
 
@@ -629,6 +647,8 @@ class RuleIntegralPromotion(SimplificationRule):
     Note: Disabled by default as it requires careful value range analysis.
     """
 
+    mnemonics = frozenset({"ADD", "MUL", "SUB"})
+
     def __init__(self):
         super().__init__("RuleIntegralPromotion")
         self.is_disabled = True  # Requires value range analysis
@@ -676,6 +696,8 @@ class RuleFloatIntRoundtrip(SimplificationRule):
     This detects unnecessary conversions through float.
     """
 
+    mnemonics = frozenset({"ITOD", "ITOF"})
+
     def __init__(self):
         super().__init__("RuleFloatIntRoundtrip")
 
@@ -718,6 +740,8 @@ class RuleConstantCast(SimplificationRule):
     This ensures constants have correct values after casting.
     """
 
+    mnemonics = frozenset({"CTOI", "ITOC", "ITOS", "STOI"})
+
     def __init__(self):
         super().__init__("RuleConstantCast")
 
@@ -784,6 +808,8 @@ class RuleSignExtendDetect(SimplificationRule):
     Note: This is primarily for type annotation rather than transformation.
     """
 
+    mnemonics = frozenset({"CTOI", "STOI"})
+
     def __init__(self):
         super().__init__("RuleSignExtendDetect")
         self.is_disabled = True  # Analysis-only
@@ -818,6 +844,8 @@ class RuleNarrowingRedundant(SimplificationRule):
     This eliminates unnecessary narrowing when value range is known.
     """
 
+    mnemonics = frozenset({"ITOC", "ITOS"})
+
     def __init__(self):
         super().__init__("RuleNarrowingRedundant")
 
@@ -908,6 +936,8 @@ class RuleTypeCoercion(SimplificationRule):
     Note: Disabled by default - needs careful semantic analysis.
     """
 
+    mnemonics = frozenset({"ADD", "DIV", "EQU", "GEQ", "GRE", "LEQ", "LES", "MUL", "SUB"})
+
     def __init__(self):
         super().__init__("RuleTypeCoercion")
         self.is_disabled = True  # Complex semantic analysis required
@@ -6,18 +6,26 @@ simplification rules iteratively until convergence (no more changes).
 
 Key features:
 - Fixed-point iteration semantics
-- Exhaustive rule application per iteration
+- Exhaustive rule application per iteration, driven by a worklist
+- Opcode index: rules declare the mnemonics they match (rule.mnemonics)
+  and are only offered those instructions
+- Incremental use-def updates after each rewrite
 - Convergence detection
-- Statistics tracking
+- Statistics tracking (including rule firings per second)
 - Rule enable/disable support
 """
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import logging
 import os
+import time
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Union
+from fractions import Fraction
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
 
 from .rules import SimplificationRule, ALL_RULES
 from .ssa import SSAFunction, SSAInstruction
@@ -26,6 +34,22 @@ from .cfg_integration import CFGIntegration
 
 logger = logging.getLogger(__name__)
 
+# Non-computational instructions no rule is applied to
+SKIP_OPCODES = frozenset({
+    "PHI",
+    "CONST",
+    "CALL",
+    "XCALL",
+    "RET",
+    "JMP",
+    "JZ",
+    "JNZ",
+    "ASGN",  # Memory stores handled separately
+})
+
+# Program-order position of an instruction: (block_id, ordinal)
+PositionKey = Tuple[int, Union[int, Fraction]]
+
 
 @dataclass
 class SimplificationStats:
@@ -35,15 +59,97 @@ class SimplificationStats:
     total_changes: int = 0
     rules_applied: Dict[str, int] = field(default_factory=dict)
     convergence_reason: str = "not_started"
+    match_attempts: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def firings_per_second(self) -> float:
+        """Successful rule applications per second of engine time."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.total_changes / self.elapsed_seconds
 
     def __repr__(self):
         return (
             f"SimplificationStats(iterations={self.iterations}, "
             f"total_changes={self.total_changes}, "
+            f"match_attempts={self.match_attempts}, "
+            f"firings_per_second={self.firings_per_second:.1f}, "
             f"reason={self.convergence_reason})"
         )
 
 
+class InstructionIndex:
+    """
+    Program-order positions and a mnemonic index of the live instructions.
+
+    Positions are (block_id, ordinal) keys that order instructions the way the
+    engine scans them. Instructions inserted by multi-instruction rewrites get
+    fractional ordinals between their neighbours, so existing keys stay valid
+    while blocks grow.
+    """
+
+    def __init__(self, ssa_func: SSAFunction):
+        self.ssa_func = ssa_func
+        # id(inst) -> (key, inst); SSAInstruction is an unhashable dataclass
+        self._live: Dict[int, Tuple[PositionKey, SSAInstruction]] = {}
+        self._by_mnemonic: Dict[str, Dict[int, SSAInstruction]] = defaultdict(dict)
+
+        for block_id in sorted(ssa_func.instructions.keys()):
+            for ordinal, inst in enumerate(ssa_func.instructions[block_id]):
+                self._add(inst, (block_id, ordinal))
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def _add(self, inst: SSAInstruction, key: PositionKey) -> None:
+        self._live[id(inst)] = (key, inst)
+        self._by_mnemonic[inst.mnemonic][id(inst)] = inst
+
+    def _remove(self, inst: SSAInstruction) -> None:
+        del self._live[id(inst)]
+        del self._by_mnemonic[inst.mnemonic][id(inst)]
+
+    def key(self, inst: SSAInstruction) -> Optional[PositionKey]:
+        """Position of inst, or None if it is no longer in the function."""
+        entry = self._live.get(id(inst))
+        if entry is None or entry[1] is not inst:
+            return None
+        return entry[0]
+
+    def instructions(self, mnemonics: Optional[FrozenSet[str]]) -> Iterable[Tuple[PositionKey, SSAInstruction]]:
+        """Live (key, instruction) pairs with one of mnemonics (None = all)."""
+        if mnemonics is None:
+            return list(self._live.values())
+        return [
+            self._live[inst_id]
+            for mnemonic in mnemonics
+            for inst_id in self._by_mnemonic.get(mnemonic, ())
+        ]
+
+    def replace(self, old: SSAInstruction, new_instructions: List[SSAInstruction]) -> None:
+        """
+        Splice new_instructions in place of old in its block.
+
+        Intermediate instructions (all but the last) are inserted before the
+        replacement, which takes over old's position.
+        """
+        block_id, ordinal = self.key(old)
+        block = self.ssa_func.instructions[block_id]
+        position = next(i for i, inst in enumerate(block) if inst is old)
+
+        intermediates = new_instructions[:-1]
+        if intermediates:
+            previous = self.key(block[position - 1])[1] if position > 0 else ordinal - 1
+            step = Fraction(ordinal - previous) / (len(intermediates) + 1)
+            for i, inst in enumerate(intermediates, start=1):
+                self._add(inst, (block_id, previous + step * i))
+
+        block[position:position + 1] = new_instructions
+        self._remove(old)
+        self._add(new_instructions[-1], (block_id, ordinal))
+
+
 class SimplificationEngine:
     """
     Fixed-point transformation engine modeled after Ghidra's ActionPool.
@@ -51,6 +157,11 @@ class SimplificationEngine:
     Applies rules iteratively until convergence (no rule makes changes).
     This enables emergent simplification where one rule enables another.
 
+    Each iteration offers every rule all instructions with the mnemonics it
+    declares, in program order. After a rewrite only the new instructions and
+    the users and producers of the values it touched are re-queued, instead of
+    rescanning the whole function.
+
     Example:
         RuleTermOrder: 3 + x → x + 3
         ↓
@@ -95,16 +206,21 @@ class SimplificationEngine:
             Statistics about the simplification process
         """
         stats = SimplificationStats()
+        start = time.perf_counter()
 
         logger.info(
             f"SimplificationEngine: Starting with {len(self.rules)} rules, max_iterations={self.max_iterations}"
         )
 
         # Build use-def chains for data flow analysis
-        # Rules can access via ssa_func.use_def_chains
+        # Rules can access via ssa_func.use_def_chains. As with a per-iteration
+        # rebuild, rules see the chains as of the start of the iteration: the
+        # iteration's rewrites are replayed into them when it ends.
         if self.debug:
             logger.debug("Building use-def chains...")
         ssa_func.use_def_chains = UseDefChain(ssa_func, debug=self.debug)
+        # The worklist follows every rewrite immediately to find affected instructions
+        live_chains = UseDefChain(ssa_func)
 
         # Build CFG integration for loop and control flow analysis
         # Rules can access via ssa_func.cfg_integration
@@ -112,15 +228,20 @@ class SimplificationEngine:
             logger.debug("Building CFG integration...")
         ssa_func.cfg_integration = CFGIntegration(ssa_func, debug=self.debug)
 
+        index = InstructionIndex(ssa_func)
+
         for iteration in range(self.max_iterations):
             changes_this_iteration = 0
+            rewrites: List[Tuple[SSAInstruction, List[SSAInstruction]]] = []
 
             # Apply each rule exhaustively
             for rule in self.rules:
                 if rule.is_disabled:
                     continue
 
-                changes = self._apply_rule_exhaustive(rule, ssa_func)
+                changes = self._apply_rule_worklist(
+                    rule, ssa_func, index, live_chains, rewrites, stats
+                )
                 changes_this_iteration += changes
                 stats.rules_applied[rule.name] = (
                     stats.rules_applied.get(rule.name, 0) + changes
@@ -134,24 +255,28 @@ class SimplificationEngine:
             stats.total_changes += changes_this_iteration
             stats.iterations = iteration + 1
 
-            # Rebuild use-def chains if changes were made
-            # This ensures accurate analysis for next iteration
-            if changes_this_iteration > 0:
+            # Bring the rules' use-def chains up to date for the next iteration
+            if rewrites:
                 if self.debug:
-                    logger.debug(f"Rebuilding use-def chains after {changes_this_iteration} changes...")
-                ssa_func.use_def_chains = UseDefChain(ssa_func, debug=False)
+                    logger.debug(f"Updating use-def chains after {changes_this_iteration} changes...")
+                for old, new_instructions in rewrites:
+                    ssa_func.use_def_chains.replace_instruction(old, new_instructions)
 
             # Check convergence
             if changes_this_iteration == 0:
                 stats.convergence_reason = "no_changes"
-                logger.info(
-                    f"SimplificationEngine: Converged after {stats.iterations} iterations "
-                    f"({stats.total_changes} total changes)"
-                )
                 break
 
+        stats.elapsed_seconds = time.perf_counter() - start
+
+        if stats.convergence_reason == "no_changes":
+            logger.info(
+                f"SimplificationEngine: Converged after {stats.iterations} iterations "
+                f"({stats.total_changes} total changes, "
+                f"{stats.firings_per_second:.1f} firings/s)"
+            )
         # Check if we hit max iterations without converging
-        if stats.iterations >= self.max_iterations:
+        elif stats.iterations >= self.max_iterations:
             stats.convergence_reason = "max_iterations"
             logger.warning(
                 f"SimplificationEngine: Reached max iterations ({self.max_iterations}) "
@@ -167,127 +292,161 @@ class SimplificationEngine:
 
         return stats
 
-    def _apply_rule_exhaustive(
-        self, rule: SimplificationRule, ssa_func: SSAFunction
+    def _candidate_mnemonics(self, rule: SimplificationRule) -> Optional[FrozenSet[str]]:
+        """Mnemonics of the instructions offered to rule (None = all but SKIP_OPCODES)."""
+        if rule.mnemonics is None:
+            return None
+        return frozenset(rule.mnemonics) - SKIP_OPCODES
+
+    def _apply_rule_worklist(
+        self,
+        rule: SimplificationRule,
+        ssa_func: SSAFunction,
+        index: InstructionIndex,
+        live_chains: UseDefChain,
+        rewrites: List[Tuple[SSAInstruction, List[SSAInstruction]]],
+        stats: SimplificationStats,
     ) -> int:
         """
         Apply a single rule to all matching instructions until no more matches.
 
         This implements the "ActionPool" behavior from Ghidra where each rule
-        is applied exhaustively before moving to the next rule.
+        is applied exhaustively before moving to the next rule. Candidates are
+        processed in program order; after a rewrite, the instructions it may
+        have enabled are re-queued, so the first match in program order is
+        always transformed next, as a full rescan would.
 
         Args:
             rule: Rule to apply
             ssa_func: SSA function
+            index: Positions and mnemonic index of the live instructions
+            live_chains: Use-def chains kept current after every rewrite
+            rewrites: Log of (old, new instructions) rewrites this iteration
+            stats: Statistics to update (match attempts)
 
         Returns:
             Number of times the rule was successfully applied
         """
+        mnemonics = self._candidate_mnemonics(rule)
+        if mnemonics is not None and not mnemonics:
+            return 0
+
         changes = 0
-        made_change = True
-        total_insts = sum(len(block) for block in ssa_func.instructions.values())
-        default_max_changes = max(1000, total_insts * 10)
+        default_max_changes = max(1000, len(index) * 10)
         try:
             max_changes = int(os.environ.get("VCDECOMP_SIMPLIFY_MAX_CHANGES", default_max_changes))
         except ValueError:
             max_changes = default_max_changes
 
-        # Keep applying this rule until it makes no more changes
-        while made_change:
-            made_change = False
-
-            for block_id in sorted(ssa_func.instructions.keys()):
-                block_insts = ssa_func.instructions[block_id]
-
-                for inst_idx in range(len(block_insts)):
-                    inst = block_insts[inst_idx]
-
-                    # Skip non-computational instructions
-                    if self._should_skip_instruction(inst):
-                        continue
-
-                    # Check if rule matches
-                    if rule.matches(inst, ssa_func):
-                        result = rule.apply(inst, ssa_func)
-
-                        if result is not None:
-                            # Handle different return types
-                            if isinstance(result, list):
-                                # Multi-instruction transformation
-                                # Insert first N-1 instructions before target
-                                # Replace target with last instruction
-                                if len(result) == 0:
-                                    # Empty list treated as None
-                                    continue
-                                elif len(result) == 1:
-                                    # Single instruction in list - same as direct return
-                                    block_insts[inst_idx] = result[0]
-                                else:
-                                    # Multiple instructions
-                                    # Insert intermediate instructions before target
-                                    intermediate_insts = result[:-1]
-                                    replacement_inst = result[-1]
-
-                                    # Update producer_inst links for intermediate values
-                                    for intermediate_inst in intermediate_insts:
-                                        for output_val in intermediate_inst.outputs:
-                                            output_val.producer_inst = intermediate_inst
-
-                                    # Update producer_inst links for replacement
-                                    for output_val in replacement_inst.outputs:
-                                        output_val.producer_inst = replacement_inst
-
-                                    # Insert intermediate instructions before current position
-                                    for i, intermediate_inst in enumerate(intermediate_insts):
-                                        block_insts.insert(inst_idx + i, intermediate_inst)
-
-                                    # Replace target instruction (now at inst_idx + len(intermediate_insts))
-                                    block_insts[inst_idx + len(intermediate_insts)] = replacement_inst
-
-                                changes += 1
-                                made_change = True
-                                if changes >= max_changes:
-                                    logger.warning(
-                                        "SimplificationEngine: Rule %s exceeded max changes (%d); "
-                                        "breaking to avoid infinite loop.",
-                                        rule.name,
-                                        max_changes,
-                                    )
-                                    return changes
-
-                                if self.debug:
-                                    logger.debug(
-                                        f"    {rule.name}: Transformed instruction at {inst.address} "
-                                        f"(generated {len(result)} instructions)"
-                                    )
-                            else:
-                                # Single instruction replacement (original behavior)
-                                block_insts[inst_idx] = result
-                                changes += 1
-                                made_change = True
-                                if changes >= max_changes:
-                                    logger.warning(
-                                        "SimplificationEngine: Rule %s exceeded max changes (%d); "
-                                        "breaking to avoid infinite loop.",
-                                        rule.name,
-                                        max_changes,
-                                    )
-                                    return changes
-
-                                if self.debug:
-                                    logger.debug(
-                                        f"    {rule.name}: Transformed instruction at {inst.address}"
-                                    )
-
-                            # After transformation, break and restart scan
-                            # (new instruction might enable other transformations)
-                            break
-
-                if made_change:
-                    break  # Restart from first block
+        def is_candidate(inst: SSAInstruction) -> bool:
+            if mnemonics is None:
+                return not self._should_skip_instruction(inst)
+            return inst.mnemonic in mnemonics
+
+        # Heap of (position, tiebreak, instruction); tiebreak keeps instructions uncompared
+        tiebreak = itertools.count()
+        worklist = [
+            (key, next(tiebreak), inst)
+            for key, inst in index.instructions(mnemonics)
+            if is_candidate(inst)
+        ]
+        heapq.heapify(worklist)
+        queued = {id(entry[2]) for entry in worklist}
+
+        while worklist:
+            key, _, inst = heapq.heappop(worklist)
+            queued.discard(id(inst))
+            if index.key(inst) != key:
+                continue  # Replaced by an earlier rewrite
+
+            stats.match_attempts += 1
+            if not rule.matches(inst, ssa_func):
+                continue
+
+            result = rule.apply(inst, ssa_func)
+            if result is None:
+                continue
+
+            # Handle different return types
+            if isinstance(result, list):
+                # Multi-instruction transformation:
+                # first N-1 instructions are inserted before the target,
+                # the last one replaces it
+                if len(result) == 0:
+                    # Empty list treated as None
+                    continue
+                new_instructions = result
+                if len(result) > 1:
+                    # Update producer_inst links for intermediate values and replacement
+                    for new_inst in result:
+                        for output_val in new_inst.outputs:
+                            output_val.producer_inst = new_inst
+            else:
+                # Single instruction replacement (original behavior)
+                new_instructions = [result]
+
+            index.replace(inst, new_instructions)
+            live_chains.replace_instruction(inst, new_instructions)
+            rewrites.append((inst, new_instructions))
+
+            changes += 1
+            if changes >= max_changes:
+                logger.warning(
+                    "SimplificationEngine: Rule %s exceeded max changes (%d); "
+                    "breaking to avoid infinite loop.",
+                    rule.name,
+                    max_changes,
+                )
+                return changes
+
+            if self.debug:
+                logger.debug(
+                    f"    {rule.name}: Transformed instruction at {inst.address} "
+                    f"(generated {len(new_instructions)} instructions)"
+                )
+
+            # The new instructions might enable other transformations
+            for affected in self._affected_instructions(inst, new_instructions, live_chains):
+                if id(affected) in queued or not is_candidate(affected):
+                    continue
+                affected_key = index.key(affected)
+                if affected_key is None:
+                    continue
+                heapq.heappush(worklist, (affected_key, next(tiebreak), affected))
+                queued.add(id(affected))
 
         return changes
 
+    @staticmethod
+    def _affected_instructions(
+        old: SSAInstruction,
+        new_instructions: List[SSAInstruction],
+        chains: UseDefChain,
+    ) -> List[SSAInstruction]:
+        """
+        Instructions whose match may have changed after old was rewritten.
+
+        These are the new instructions, the users of their outputs (and the
+        users of those users, for rules that look two producers deep), and
+        the producers and other users of every value read before or after.
+        """
+        affected: List[SSAInstruction] = list(new_instructions)
+        rewritten = [old] + new_instructions
+        for inst in rewritten:
+            for value in inst.outputs:
+                for user in chains.get_uses(value):
+                    affected.append(user)
+                    for user_output in user.outputs:
+                        affected.extend(chains.get_uses(user_output))
+            for value in inst.inputs:
+                producer = chains.get_def(value)
+                if producer is not None:
+                    affected.append(producer)
+                if value.producer_inst is not None:
+                    affected.append(value.producer_inst)
+                affected.extend(chains.get_uses(value))
+        return affected
+
     def _should_skip_instruction(self, inst: SSAInstruction) -> bool:
         """
         Check if instruction should be skipped.
@@ -304,17 +463,6 @@ class SimplificationEngine:
         Returns:
             True if should skip, False otherwise
         """
-        SKIP_OPCODES = {
-            "PHI",
-            "CONST",
-            "CALL",
-            "XCALL",
-            "RET",
-            "JMP",
-            "JZ",
-            "JNZ",
-            "ASGN",  # Memory stores handled separately
-        }
         return inst.mnemonic in SKIP_OPCODES
 
     def _log_summary(self, stats: SimplificationStats):
@@ -325,6 +473,11 @@ class SimplificationEngine:
         logger.debug(f"Iterations: {stats.iterations}")
         logger.debug(f"Total changes: {stats.total_changes}")
         logger.debug(f"Convergence: {stats.convergence_reason}")
+        logger.debug(f"Match attempts: {stats.match_attempts}")
+        logger.debug(
+            f"Elapsed: {stats.elapsed_seconds:.3f}s "
+            f"({stats.firings_per_second:.1f} firings/s)"
+        )
         logger.debug("\nRules applied:")
 
         # Sort by number of applications
@@ -20,38 +20,119 @@ For best results, use build_ssa_incremental for complex scripts.
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field
+import reprlib
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple, Iterable
 
 from ..loader.scr_loader import SCRFile
 from ..disasm import opcodes
 from .cfg import CFG, _compute_dominance_frontiers
+from .compact_ir import LazyMetadata, UseList, ValueTable, fields_equal, fields_repr, metadata_dict
 from .stack_lifter import lift_function, LiftedInstruction, StackValue, SIMPLE_ARITHMETIC_MNEMONICS
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
 class SSAValue:
-    name: str
-    value_type: opcodes.ResultType
-    producer: Optional[int] = None  # instruction address
-    uses: List[Tuple[int, int]] = field(default_factory=list)  # (instruction address, operand index)
-    phi_sources: Optional[List[Tuple[int, str]]] = None  # (pred block id, source value name)
-    alias: Optional[str] = None
-    producer_inst: Optional["SSAInstruction"] = None
-    metadata: Dict = field(default_factory=dict)  # Additional metadata for SDK integration
+    """An SSA value.
+
+    Slotted, with the uses packed into an array and the metadata dict
+    allocated on first write (see compact_ir); `uses` and `metadata` still
+    read and update like a list and a dict. `id` is the value's number in
+    SSAFunction.values (-1 until it is added there).
+    """
+
+    __slots__ = ("name", "value_type", "producer", "_uses", "phi_sources", "alias",
+                 "producer_inst", "_metadata", "id", "__dict__")
+    _FIELDS = ("name", "value_type", "producer", "uses", "phi_sources", "alias",
+               "producer_inst", "metadata")
+
+    def __init__(
+        self,
+        name: str,
+        value_type: opcodes.ResultType,
+        producer: Optional[int] = None,  # instruction address
+        uses: Optional[Iterable[Tuple[int, int]]] = None,  # (instruction address, operand index)
+        phi_sources: Optional[List[Tuple[int, str]]] = None,  # (pred block id, source value name)
+        alias: Optional[str] = None,
+        producer_inst: Optional["SSAInstruction"] = None,
+        metadata: Optional[Dict] = None,  # Additional metadata for SDK integration
+    ):
+        self.name = name
+        self.value_type = value_type
+        self.producer = producer
+        self._uses = UseList.pack(uses) if uses else None
+        self.phi_sources = phi_sources
+        self.alias = alias
+        self.producer_inst = producer_inst
+        self._metadata = metadata_dict(metadata)
+        self.id = -1
+
+    @property
+    def uses(self) -> UseList:
+        return UseList(self)
+
+    @uses.setter
+    def uses(self, uses: Iterable[Tuple[int, int]]) -> None:
+        self._uses = UseList.pack(uses)
+
+    @property
+    def metadata(self) -> Dict:
+        data = self._metadata
+        return LazyMetadata(self) if data is None else data
+
+    @metadata.setter
+    def metadata(self, metadata: Dict) -> None:
+        self._metadata = metadata_dict(metadata)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return fields_equal(self, other, self._FIELDS)
+
+    __hash__ = None
+
+    @reprlib.recursive_repr()
+    def __repr__(self) -> str:
+        return fields_repr(self, self._FIELDS)
 
 
-@dataclass
 class SSAInstruction:
-    block_id: int
-    mnemonic: str
-    address: int
-    inputs: List[SSAValue]
-    outputs: List[SSAValue]
-    instruction: Optional[LiftedInstruction] = None
-    metadata: Dict = field(default_factory=dict)  # Metadata for optimizations (array access, etc.)
+    """An SSA instruction (slotted, metadata allocated on first write)."""
+
+    __slots__ = ("block_id", "mnemonic", "address", "inputs", "outputs", "instruction", "_metadata")
+    _FIELDS = ("block_id", "mnemonic", "address", "inputs", "outputs", "instruction", "metadata")
+
+    def __init__(
+        self,
+        block_id: int,
+        mnemonic: str,
+        address: int,
+        inputs: List[SSAValue],
+        outputs: List[SSAValue],
+        instruction: Optional[LiftedInstruction] = None,
+        metadata: Optional[Dict] = None,  # Metadata for optimizations (array access, etc.)
+    ):
+        self.block_id = block_id
+        self.mnemonic = mnemonic
+        self.address = address
+        self.inputs = inputs
+        self.outputs = outputs
+        self.instruction = instruction
+        self._metadata = metadata_dict(metadata)
+
+    metadata = SSAValue.metadata
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return fields_equal(self, other, self._FIELDS)
+
+    __hash__ = None
+
+    @reprlib.recursive_repr()
+    def __repr__(self) -> str:
+        return fields_repr(self, self._FIELDS)
 
 
 @dataclass
@@ -77,7 +158,7 @@ def build_ssa_all_blocks(scr: SCRFile) -> SSAFunction:
 
 def _build_ssa_from_lifted(scr: SCRFile, resolver, cfg: CFG, lifted: Dict[int, List[LiftedInstruction]]) -> SSAFunction:
     """Internal helper to build SSA from lifted instructions."""
-    values: Dict[str, SSAValue] = {}
+    values: Dict[str, SSAValue] = ValueTable()
     instructions: Dict[int, List[SSAInstruction]] = {}
     phi_addr_counter = -1
 
@@ -92,7 +173,7 @@ def _build_ssa_from_lifted(scr: SCRFile, resolver, cfg: CFG, lifted: Dict[int, L
                 producer=stack_val.producer.address if stack_val.producer else None,
                 phi_sources=phi_sources,
                 alias=stack_val.alias,
-                metadata=dict(stack_val.metadata),
+                metadata=dict(stack_val.metadata) if stack_val.metadata else None,
             )
         val = values[stack_val.name]
         if stack_val.phi_sources and not val.phi_sources:
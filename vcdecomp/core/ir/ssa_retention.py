@@ -0,0 +1,212 @@
+"""
+Pass 1 SSA Retention for Multi-File Decompilation
+
+structure-folder lifts every .scr file twice: once in Pass 1 to collect
+cross-file evidence and again in Pass 2 to decompile it. With --reuse-ssa,
+Pass 1 hands its lifted result (SCRFile, SSAFunction, heritage metadata and
+function bounds) to an SSARetentionStore, and Pass 2 only re-runs the stages
+that depend on the CrossFileContext (global re-resolution and emission).
+
+Peak memory is bounded by the retention policy: at most `max_resident` files
+stay in memory; the rest are pickled to a spill directory, or dropped (and
+re-lifted in Pass 2) when spilling is disabled or fails.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from ..loader import SCRFile
+    from .ssa import SSAFunction, SSAValue
+
+logger = logging.getLogger(__name__)
+
+SPILL_SUFFIX = ".ssa.pickle"
+
+
+@dataclass
+class LiftedSCR:
+    """Everything Pass 2 needs from lifting one .scr file."""
+
+    scr: "SCRFile"
+    ssa_func: "SSAFunction"
+    heritage_metadata: Optional[dict]
+    func_bounds: Dict[str, Tuple[int, int]]
+
+
+def snapshot_value_types(ssa_func: "SSAFunction") -> List[Tuple["SSAValue", object]]:
+    """
+    Record the value_type of every SSA value.
+
+    Pass 1's GlobalResolver writes inferred types back into the SSA; restoring
+    the snapshot afterwards gives Pass 2 the same SSA a fresh lift would.
+    """
+    seen = set()
+    snapshot = []
+    for value in ssa_func.values.values():
+        if id(value) not in seen:
+            seen.add(id(value))
+            snapshot.append((value, value.value_type))
+    for instructions in ssa_func.instructions.values():
+        for inst in instructions:
+            for value in inst.inputs:
+                if value is not None and id(value) not in seen:
+                    seen.add(id(value))
+                    snapshot.append((value, value.value_type))
+            for value in inst.outputs:
+                if value is not None and id(value) not in seen:
+                    seen.add(id(value))
+                    snapshot.append((value, value.value_type))
+    return snapshot
+
+
+def restore_value_types(snapshot: List[Tuple["SSAValue", object]]) -> None:
+    """Undo value_type write-back recorded by snapshot_value_types()."""
+    for value, value_type in snapshot:
+        value.value_type = value_type
+
+
+def spill_lifted(lifted: LiftedSCR, path: Path) -> bool:
+    """Pickle a lifted file to path. Returns False if it cannot be pickled."""
+    try:
+        with open(path, "wb") as fh:
+            pickle.dump(lifted, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        return True
+    except (RecursionError, pickle.PicklingError, OSError, TypeError) as e:
+        logger.debug("Could not spill lifted SSA to %s: %s", path, e)
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+        return False
+
+
+def load_spilled(path: Path, remove: bool = True) -> Optional[LiftedSCR]:
+    """Load a lifted file spilled by spill_lifted(); None if it is unreadable."""
+    try:
+        with open(path, "rb") as fh:
+            lifted = pickle.load(fh)
+    except (OSError, pickle.UnpicklingError, EOFError, RecursionError) as e:
+        logger.debug("Could not load spilled SSA from %s: %s", path, e)
+        return None
+    finally:
+        if remove:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+    return lifted
+
+
+class SSARetentionStore:
+    """
+    Holds Pass 1 lifted files until Pass 2 takes them.
+
+    Pass 2 consumes files in the order Pass 1 produced them, so once
+    `max_resident` files are held in memory, newly added files are the ones
+    spilled: they are needed last.
+    """
+
+    def __init__(
+        self,
+        max_resident: int = 8,
+        spill: bool = True,
+        spill_dir: Optional[Path] = None,
+    ):
+        self.max_resident = max(0, max_resident)
+        self.spill = spill
+        self._spill_dir = Path(spill_dir) if spill_dir else None
+        self._owns_spill_dir = False
+
+        self._resident: Dict[str, LiftedSCR] = {}
+        self._spilled: Dict[str, Path] = {}
+
+        # Statistics
+        self.spill_count = 0
+        self.drop_count = 0
+        self.hit_count = 0
+        self.miss_count = 0
+
+    @property
+    def spill_dir(self) -> Optional[Path]:
+        """Directory for spilled files, created on first use (None if spilling is off)."""
+        if not self.spill:
+            return None
+        if self._spill_dir is None:
+            self._spill_dir = Path(tempfile.mkdtemp(prefix="vcdecomp-ssa-"))
+            self._owns_spill_dir = True
+        else:
+            self._spill_dir.mkdir(parents=True, exist_ok=True)
+        return self._spill_dir
+
+    def spill_path(self, key: str) -> Optional[Path]:
+        spill_dir = self.spill_dir
+        return spill_dir / (key + SPILL_SUFFIX) if spill_dir else None
+
+    def put(self, key: str, lifted: LiftedSCR) -> None:
+        """Retain a lifted file, spilling or dropping it if memory is full."""
+        if len(self._resident) < self.max_resident:
+            self._resident[key] = lifted
+            return
+        path = self.spill_path(key)
+        if path is not None and spill_lifted(lifted, path):
+            self.mark_spilled(key, path)
+        else:
+            self.drop_count += 1
+
+    def mark_spilled(self, key: str, path: Path) -> None:
+        """Record a file spilled by someone else (e.g. a Pass 1 worker process)."""
+        self._spilled[key] = path
+        self.spill_count += 1
+
+    def spilled_path(self, key: str) -> Optional[Path]:
+        return self._spilled.get(key)
+
+    def take(self, key: str) -> Optional[LiftedSCR]:
+        """Remove and return the lifted file for key; None means re-lift it."""
+        lifted = self._resident.pop(key, None)
+        if lifted is None and key in self._spilled:
+            lifted = load_spilled(self._spilled.pop(key))
+        self.record_reuse(lifted is not None)
+        return lifted
+
+    def record_reuse(self, reused: bool) -> None:
+        """Count a Pass 2 file as reused or re-lifted (also for worker processes)."""
+        if reused:
+            self.hit_count += 1
+        else:
+            self.miss_count += 1
+
+    def close(self) -> None:
+        """Release retained files and remove the spill directory if we created it."""
+        self._resident.clear()
+        for path in self._spilled.values():
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        self._spilled.clear()
+        if self._owns_spill_dir and self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+            self._owns_spill_dir = False
+
+    def summary(self) -> str:
+        return (
+            f"SSA reuse: {self.hit_count} reused, {self.miss_count} re-lifted, "
+            f"{self.spill_count} spilled, {self.drop_count} dropped"
+        )
+
+    def __enter__(self) -> "SSARetentionStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
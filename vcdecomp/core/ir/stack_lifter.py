@@ -7,15 +7,17 @@ by tracking the evaluation stack.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Sequence, Set, Tuple, Callable
 import logging
 import os
+import reprlib
 import sys
 
 from ..loader.scr_loader import Instruction, SCRFile
 from ..disasm import opcodes
 from .cfg import CFG, build_cfg, BasicBlock
+from .compact_ir import LazyMetadata, fields_equal, fields_repr, metadata_dict
 
 logger = logging.getLogger(__name__)
 STACK_DEBUG = os.environ.get("VCDECOMP_STACK_DEBUG", "0") == "1"
@@ -375,24 +377,55 @@ def _infer_type_from_opcode(mnemonic: str, resolver: opcodes.OpcodeResolver) ->
     return opcodes.ResultType.UNKNOWN
 
 
-@dataclass
 class StackValue:
-    name: str
-    producer: Optional[Instruction] = None
-    value_type: opcodes.ResultType = opcodes.ResultType.UNKNOWN
-    phi_sources: Optional[List[Tuple[int, "StackValue"]]] = None
-    alias: Optional[str] = None
-    metadata: Dict = field(default_factory=dict)
-
-    def __post_init__(self) -> None:
+    """A value on the lifted stack (slotted, metadata allocated on first write)."""
+
+    __slots__ = ("name", "producer", "value_type", "phi_sources", "alias", "_metadata")
+    _FIELDS = ("name", "producer", "value_type", "phi_sources", "alias", "metadata")
+
+    def __init__(
+        self,
+        name: str,
+        producer: Optional[Instruction] = None,
+        value_type: opcodes.ResultType = opcodes.ResultType.UNKNOWN,
+        phi_sources: Optional[List[Tuple[int, "StackValue"]]] = None,
+        alias: Optional[str] = None,
+        metadata: Optional[Dict] = None,
+    ):
+        self.name = name
+        self.producer = producer
+        self.value_type = value_type
+        self.phi_sources = phi_sources
+        self.alias = alias
+        self._metadata = metadata_dict(metadata)
         if STACK_STATS:
             global _STACK_VALUE_CREATED, _STACK_PHI_CREATED
             _STACK_VALUE_CREATED += 1
-            if self.phi_sources:
+            if phi_sources:
                 _STACK_PHI_CREATED += 1
 
+    @property
+    def metadata(self) -> Dict:
+        data = self._metadata
+        return LazyMetadata(self) if data is None else data
 
-@dataclass
+    @metadata.setter
+    def metadata(self, metadata: Dict) -> None:
+        self._metadata = metadata_dict(metadata)
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return fields_equal(self, other, self._FIELDS)
+
+    __hash__ = None
+
+    @reprlib.recursive_repr()
+    def __repr__(self) -> str:
+        return fields_repr(self, self._FIELDS)
+
+
+@dataclass(slots=True)
 class LiftedInstruction:
     instruction: Instruction
     inputs: List[StackValue]
@@ -682,9 +715,7 @@ def lift_basic_block(block_id: int, cfg: CFG, resolver: Optional[opcodes.OpcodeR
                 result_type = inferred_type
 
             alias = inferred_alias if idx == 0 else None
-            metadata = {}
-            if mnemonic in SIMPLE_ARITHMETIC_MNEMONICS:
-                metadata["simple_arithmetic"] = True
+            metadata = {"simple_arithmetic": True} if mnemonic in SIMPLE_ARITHMETIC_MNEMONICS else None
 
             stack_val = StackValue(
                 name=f"t{instr.address}_{idx}",
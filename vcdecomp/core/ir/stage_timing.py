@@ -0,0 +1,107 @@
+"""
+Per-stage timing of the decompiler pipeline.
+
+Pipeline code wraps its stages in ``timed_stage(name)``. Timing is off by
+default: the context manager then does nothing but look up the current
+recorders. The benchmark (``vcdecomp bench``) installs a StageRecorder
+around each file to collect wall-clock time and call counts per stage, and
+``--trace-spans FILE`` installs a SpanWriter that writes every stage as a
+JSON line.
+
+Recorders are context-local (a ContextVar), so concurrent decompiles in
+other threads or contexts are not recorded into each other's recorders.
+
+Stage names are dotted for stages nested inside another stage (e.g.
+"functions.collapse" runs inside "functions"); times are inclusive.
+
+Note: This is a standalone module with no dependencies on other
+vcdecomp modules to avoid circular imports.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, TextIO, Tuple
+
+
+class StageRecorder:
+    """Accumulated wall-clock seconds and call counts per stage name."""
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+
+    def add(self, stage: str, seconds: float) -> None:
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+        self.calls[stage] = self.calls.get(stage, 0) + 1
+
+
+class SpanWriter:
+    """
+    Writes every timed stage as one JSON line (a span) to a text stream.
+
+    A span has the stage name, its start (seconds since the writer was
+    created), duration, nesting depth, and the writer's extra attributes,
+    e.g. {"span": "functions.collapse", "start": 0.41, "seconds": 0.02,
+    "depth": 1, "file": "LEVEL.SCR"}. Spans are written when they end, so
+    nested spans precede their parent. Stages timed in forked worker
+    processes (--jobs) are not written, as they would share the stream.
+    """
+
+    def __init__(self, stream: TextIO, **attributes: Any):
+        self.stream = stream
+        self.attributes = attributes
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+
+    def add(self, stage: str, seconds: float) -> None:
+        if os.getpid() != self._pid:
+            return
+        start = time.perf_counter() - seconds - self._origin
+        span = {
+            "span": stage,
+            "start": round(start, 6),
+            "seconds": round(seconds, 6),
+            "depth": stage.count("."),
+        }
+        span.update(self.attributes)
+        self.stream.write(json.dumps(span) + "\n")
+
+
+# Recorders active in the current context (innermost last)
+_RECORDERS: ContextVar[Tuple[Any, ...]] = ContextVar("vcdecomp_stage_recorders", default=())
+
+
+@contextmanager
+def recording(recorder) -> Iterator[Any]:
+    """Record every timed_stage() entered in this block into recorder.
+
+    recorder is a StageRecorder, SpanWriter or any object with an
+    add(stage, seconds) method; nested recording() blocks record into all
+    active recorders.
+    """
+    token = _RECORDERS.set(_RECORDERS.get() + (recorder,))
+    try:
+        yield recorder
+    finally:
+        _RECORDERS.reset(token)
+
+
+@contextmanager
+def timed_stage(stage: str) -> Iterator[None]:
+    """Time the enclosed pipeline stage if a recorder is active."""
+    recorders = _RECORDERS.get()
+    if not recorders:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        for recorder in recorders:
+            recorder.add(stage, seconds)
@@ -17,11 +17,12 @@ Algorithm:
 2. Iteratively compute immediate dominators using intersection
 3. Build dominator tree from idom relationships
 4. Calculate depths and subtrees
+5. Number the dominator tree (preorder/postorder) for O(1) dominance queries
 """
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Set, TYPE_CHECKING
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 import logging
 
 from ..blocks.hierarchy import (
@@ -58,6 +59,11 @@ class DominatorAnalysis:
         self.dom_depth: Dict[int, int] = {}  # Depth in dominator tree
         self.postorder: List[StructuredBlock] = []  # Reverse post-order traversal
         self.virtual_root: Optional[StructuredBlock] = None  # Virtual root if needed
+        # Dominator tree (preorder, postorder) numbers: a dominates b iff a's
+        # interval contains b's
+        self.dom_interval: Dict[int, Tuple[int, int]] = {}
+        # Dominance frontiers of all blocks, computed on first request
+        self._frontiers: Optional[Dict[int, Set[StructuredBlock]]] = None
 
     def compute(self) -> None:
         """
@@ -69,6 +75,8 @@ class DominatorAnalysis:
         self._calc_forward_dominator()
         self._build_dom_tree()
         self._build_dom_depth()
+        self._build_dom_intervals()
+        self._frontiers = None
 
     def _build_postorder(self) -> None:
         """
@@ -77,24 +85,25 @@ class DominatorAnalysis:
         Reverse post-order ensures that when processing a node, we've already
         processed most of its predecessors (except back edges).
         """
-        visited: Set[int] = set()
         postorder_stack: List[StructuredBlock] = []
 
-        def dfs(block: StructuredBlock):
-            if block.block_id in visited:
-                return
-            visited.add(block.block_id)
-
-            for edge in block.out_edges:
-                target = edge.target
-                if target.block_id not in visited:
-                    dfs(target)
-
-            postorder_stack.append(block)
-
-        # Start from entry block
-        if self.graph.entry_block is not None:
-            dfs(self.graph.entry_block)
+        # Start from entry block; explicit stack instead of recursion, so deep
+        # graphs do not hit the recursion limit
+        entry = self.graph.entry_block
+        if entry is not None:
+            visited: Set[int] = {entry.block_id}
+            stack = [(entry, iter(entry.out_edges))]
+            while stack:
+                block, pending = stack[-1]
+                for edge in pending:
+                    target = edge.target
+                    if target.block_id not in visited:
+                        visited.add(target.block_id)
+                        stack.append((target, iter(target.out_edges)))
+                        break
+                else:
+                    stack.pop()
+                    postorder_stack.append(block)
 
         # Reverse to get reverse post-order
         self.postorder = list(reversed(postorder_stack))
@@ -259,6 +268,30 @@ class DominatorAnalysis:
 
         logger.debug(f"Computed dominator depths")
 
+    def _build_dom_intervals(self) -> None:
+        """
+        Number the dominator tree in preorder and postorder.
+
+        A dominates B iff pre(A) <= pre(B) and post(B) <= post(A), which
+        makes dominates() O(1) instead of a walk up the idom chain.
+        """
+        self.dom_interval.clear()
+        if not self.postorder:
+            return
+
+        root = self.postorder[0]
+        pre: Dict[int, int] = {root.block_id: 0}
+        stack = [(root, iter(self.get_dom_children(root)))]
+        while stack:
+            block, pending = stack[-1]
+            child = next(pending, None)
+            if child is not None:
+                pre[child.block_id] = len(pre)
+                stack.append((child, iter(self.get_dom_children(child))))
+            else:
+                stack.pop()
+                self.dom_interval[block.block_id] = (pre[block.block_id], len(self.dom_interval))
+
     def get_idom(self, block: StructuredBlock) -> Optional[StructuredBlock]:
         """Get the immediate dominator of a block."""
         return self.idom.get(block.block_id)
@@ -288,7 +321,12 @@ class DominatorAnalysis:
         if dominator.block_id == dominated.block_id:
             return True
 
-        # Walk up dominator tree from dominated
+        inner = self.dom_interval.get(dominated.block_id)
+        if inner is not None:
+            outer = self.dom_interval.get(dominator.block_id)
+            return outer is not None and outer[0] <= inner[0] and inner[1] <= outer[1]
+
+        # Outside the numbered tree: walk up dominator tree from dominated
         current = dominated
         while True:
             idom = self.idom.get(current.block_id)
@@ -328,13 +366,11 @@ class DominatorAnalysis:
             Set of block IDs dominated by block
         """
         dominated: Set[int] = {block.block_id}
-
-        def collect_subtree(node: StructuredBlock):
-            for child in self.get_dom_children(node):
+        stack = [block]
+        while stack:
+            for child in self.get_dom_children(stack.pop()):
                 dominated.add(child.block_id)
-                collect_subtree(child)
-
-        collect_subtree(block)
+                stack.append(child)
         return dominated
 
     def get_dominator_frontier(self, block: StructuredBlock) -> Set[StructuredBlock]:
@@ -353,22 +389,26 @@ class DominatorAnalysis:
         Returns:
             Set of blocks in the dominance frontier
         """
-        frontier: Set[StructuredBlock] = set()
-        dominated = self.get_dominated_set(block)
+        if self._frontiers is None:
+            self._frontiers = self._compute_frontiers()
+        return set(self._frontiers.get(block.block_id, ()))
 
-        # For each dominated block, check its successors
-        for dom_id in dominated:
-            dom_block = self.graph.blocks.get(dom_id)
-            if dom_block is None:
-                continue
+    def _compute_frontiers(self) -> Dict[int, Set[StructuredBlock]]:
+        """
+        Dominance frontiers of every block, in one pass over the edges.
 
-            for edge in dom_block.out_edges:
+        For an edge X -> Y, Y is in the frontier of X and of each dominator
+        of X up to (excluding) the first one that strictly dominates Y.
+        """
+        frontiers: Dict[int, Set[StructuredBlock]] = {}
+        for block in self.graph.blocks.values():
+            for edge in block.out_edges:
                 successor = edge.target
-                # If successor is not strictly dominated, it's in frontier
-                if not self.strictly_dominates(block, successor):
-                    frontier.add(successor)
-
-        return frontier
+                runner: Optional[StructuredBlock] = block
+                while runner is not None and not self.strictly_dominates(runner, successor):
+                    frontiers.setdefault(runner.block_id, set()).add(successor)
+                    runner = self.idom.get(runner.block_id)
+        return frontiers
 
 
 def compute_dominators(graph: BlockGraph) -> DominatorAnalysis:
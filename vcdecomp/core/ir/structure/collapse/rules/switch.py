@@ -8,8 +8,6 @@ fall-through cases.
 from __future__ import annotations
 
 from typing import Optional, Iterable
-import os
-import sys
 
 from .base import CollapseRule
 from ...blocks.hierarchy import (
@@ -24,13 +22,9 @@ from ...blocks.hierarchy import (
 )
 from ....expr import ExpressionFormatter, format_block_expressions
 from .....disasm import opcodes
+from ...utils.helpers import get_tracer
 
-SWITCH_EMPTY_DEBUG = os.environ.get("VCDECOMP_SWITCH_EMPTY_DEBUG", "0") == "1"
-
-
-def _switch_empty_debug(msg: str) -> None:
-    if SWITCH_EMPTY_DEBUG:
-        print(f"DEBUG SWITCH EMPTY: {msg}", file=sys.stderr)
+_trace = get_tracer("switch")
 
 
 def _get_expression_formatter(graph: BlockGraph) -> Optional[ExpressionFormatter]:
@@ -50,24 +44,29 @@ def _block_ids_have_emitted_expressions(
     context: str,
 ) -> bool:
     if graph.ssa_func is None:
-        _switch_empty_debug(f"{context}: no SSA function available")
+        if _trace.enabled:
+            _trace(f"DEBUG SWITCH EMPTY: {context}: no SSA function available")
         return False
     if formatter is None:
-        _switch_empty_debug(f"{context}: no expression formatter available")
+        if _trace.enabled:
+            _trace(f"DEBUG SWITCH EMPTY: {context}: no expression formatter available")
         return False
     ids = list(block_ids)
     if not ids:
-        _switch_empty_debug(f"{context}: no block IDs to inspect")
+        if _trace.enabled:
+            _trace(f"DEBUG SWITCH EMPTY: {context}: no block IDs to inspect")
         return False
     for block_id in ids:
         expressions = format_block_expressions(graph.ssa_func, block_id, formatter=formatter)
         for expr in expressions:
             if expr.text.strip() and not expr.text.strip().startswith("goto "):
-                _switch_empty_debug(
-                    f"{context}: emitted expression found in block {block_id} ({expr.mnemonic})"
-                )
+                if _trace.enabled:
+                    _trace(
+                        f"DEBUG SWITCH EMPTY: {context}: emitted expression found in block {block_id} ({expr.mnemonic})"
+                    )
                 return True
-    _switch_empty_debug(f"{context}: no emitted expressions found")
+    if _trace.enabled:
+        _trace(f"DEBUG SWITCH EMPTY: {context}: no emitted expressions found")
     return False
 
 
@@ -246,10 +245,11 @@ class RuleBlockSwitch(CollapseRule):
                     formatter,
                     f"case {case_info.value}",
                 ):
-                    _switch_empty_debug(
-                        f"case {case_info.value}: body has emitted expressions but entry block "
-                        f"not found; using body_block_ids fallback for flat emission"
-                    )
+                    if _trace.enabled:
+                        _trace(
+                            f"DEBUG SWITCH EMPTY: case {case_info.value}: body has emitted expressions but entry block "
+                            f"not found; using body_block_ids fallback for flat emission"
+                        )
                 case_body = None
                 has_break = case_info.has_break
 
@@ -291,7 +291,8 @@ class RuleBlockSwitch(CollapseRule):
                 formatter,
                 "default case",
             ):
-                _switch_empty_debug("default case: body has emitted expressions; refusing to discard")
+                if _trace.enabled:
+                    _trace("DEBUG SWITCH EMPTY: default case: body has emitted expressions; refusing to discard")
                 return None
 
             default_case = SwitchCase(
@@ -18,6 +18,8 @@ from ..cfg import find_loops_in_function
 from ..parenthesization import ExpressionContext, is_simple_expression
 from ...disasm import opcodes
 from ..type_inference import TypeInferenceEngine
+from ..analysis_context import get_analysis_context
+from ..stage_timing import timed_stage
 from ...headers.database import get_header_database
 from ...constants import get_known_constant_for_variable
 
@@ -30,8 +32,8 @@ from .utils.helpers import (
     _dominates,
     _is_control_flow_only,
     SHOW_BLOCK_COMMENTS,
-    set_debug_enabled,
-    debug_print,
+    debug_scope,
+    get_tracer,
 )
 from .patterns.models import SwitchPattern, IfElsePattern, CaseInfo
 from .patterns.if_else import _detect_if_else_pattern, _detect_early_return_pattern
@@ -42,6 +44,8 @@ from .analysis.condition import render_condition
 from .emit.block_formatter import _format_block_lines
 from .emit.code_emitter import _render_blocks_with_loops
 
+_trace = get_tracer("structure")
+
 
 def _find_reachable_blocks(cfg, entry_block: int) -> Set[int]:
     """
@@ -181,7 +185,8 @@ def _render_nested_switch(
     base_indent = indent
 
     # Render switch statement header
-    debug_print(f"DEBUG NESTED SWITCH: Rendering nested switch for {switch.test_var} with {len(switch.cases)} cases")
+    if _trace.enabled:
+        _trace(f"DEBUG NESTED SWITCH: Rendering nested switch for {switch.test_var} with {len(switch.cases)} cases")
     lines.append(f"{base_indent}switch ({switch.test_var}) {{")
 
     # Sort cases by detection_order to preserve bytecode/source order
@@ -191,7 +196,8 @@ def _render_nested_switch(
 
         # Handle fall-through cases
         if getattr(case, 'falls_through_to', None) is not None:
-            debug_print(f"DEBUG NESTED SWITCH: Fall-through case {case.value} -> case {case.falls_through_to}, skipping body")
+            if _trace.enabled:
+                _trace(f"DEBUG NESTED SWITCH: Fall-through case {case.value} -> case {case.falls_through_to}, skipping body")
             continue
 
         # Render case body
@@ -214,7 +220,8 @@ def _render_nested_switch(
         for ns in nested_nested_switches:
             nested_nested_header_blocks.add(ns.header_block)
             nested_nested_header_blocks.update(ns.all_blocks)
-            debug_print(f"DEBUG NESTED SWITCH: Found deeply nested switch {ns.test_var} in case {case.value} body of {switch.test_var}")
+            if _trace.enabled:
+                _trace(f"DEBUG NESTED SWITCH: Found deeply nested switch {ns.test_var} in case {case.value} body of {switch.test_var}")
 
         # Detect if/else patterns in case body (skip nested switch headers)
         for body_block_id in case_body_sorted:
@@ -246,7 +253,8 @@ def _render_nested_switch(
                 if ds.header_block != ns.header_block:  # Avoid self-reference
                     for ds_block_id in ds.all_blocks:
                         nested_nested_block_to_switch[ds_block_id] = ds
-                    debug_print(f"DEBUG NESTED SWITCH: Found 4th-level nested switch {ds.test_var} inside {ns.test_var}")
+                    if _trace.enabled:
+                        _trace(f"DEBUG NESTED SWITCH: Found 4th-level nested switch {ds.test_var} inside {ns.test_var}")
 
         # Create recursive callback for rendering deeply nested switches
         def nested_render_switch_callback(sw, ind, b2if, vis_ifs, emit_blks):
@@ -618,7 +626,8 @@ def _add_undefined_variable_declarations(
     for var_name in sorted(undefined_vars):
         # DCE filtering
         if _is_unused_temporary(var_name, use_counts):
-            debug_print(f"DEBUG: Fallback DCE - Skipping unused temp: {var_name}")
+            if _trace.enabled:
+                _trace(f"DEBUG: Fallback DCE - Skipping unused temp: {var_name}")
             continue
 
         # NOTE: We previously filtered out "used but never assigned" variables
@@ -628,7 +637,8 @@ def _add_undefined_variable_declarations(
         # The _has_assignment check is kept for reference but not used:
         has_assign = _has_assignment(var_name, lines)
         if not has_assign:
-            debug_print(f"DEBUG: Fallback - Variable used but never assigned (declaring anyway): {var_name}")
+            if _trace.enabled:
+                _trace(f"DEBUG: Fallback - Variable used but never assigned (declaring anyway): {var_name}")
             # Still declare it - compilation errors are worse than undefined behavior
 
         var_type = _infer_type_from_usage(var_name, lines)
@@ -794,14 +804,21 @@ def format_structured_function_named(ssa_func: SSAFunction, func_name: str, entr
     structure field detection. This ensures local_0 in different functions correctly
     maps to different structure types.
     """
-    # FÁZE 2 (--style): Set global debug output state
-    set_debug_enabled(style != 'quiet')
+    # FÁZE 2 (--style): debug output for this call only (context-local)
+    with debug_scope(style != 'quiet'):
+        return _format_structured_function(ssa_func, func_name, entry_addr, end_addr, function_bounds, heritage_metadata, use_collapse)
+
+
+def _format_structured_function(ssa_func: SSAFunction, func_name: str, entry_addr: int, end_addr, function_bounds, heritage_metadata: Optional[Dict], use_collapse: bool) -> str:
     cfg = ssa_func.cfg
     resolver = getattr(ssa_func.scr, "opcode_resolver", opcodes.DEFAULT_RESOLVER)
     start_to_block = _build_start_map(cfg)
     lines: List[str] = []
+    # Whole-program analyses (type evidence, constants, globals) are computed
+    # once per SSAFunction and shared by every function
+    analysis = get_analysis_context(ssa_func)
     # Load symbol database for global variable name resolution
-    symbol_db = _load_symbol_db()
+    symbol_db = analysis.symbol_db
 
     # FÁZE 3.3: Detect function signature to get parameter names
     from ..function_signature import detect_function_signature
@@ -831,30 +848,21 @@ def format_structured_function_named(ssa_func: SSAFunction, func_name: str, entr
             return f"// Function {func_name} at {entry_addr} - entry block not found"
 
     # Find blocks in this function (MOVED UP - needed for VariableRenamer)
-    func_block_ids: Set[int] = set()
-    for block_id, block in cfg.blocks.items():
-        if block.start >= entry_addr:
-            if end_addr is None or block.start <= end_addr:
-                func_block_ids.add(block_id)
-
-    # Filter out unreachable blocks (dead code elimination)
-    reachable_blocks = _find_reachable_blocks(cfg, entry_block)
-    func_block_ids = func_block_ids & reachable_blocks
+    # Reachable blocks within [entry_addr, end_addr] (dead code elimination)
+    func_view = analysis.function_view(func_name, entry_addr, end_addr, entry_block)
+    func_block_ids: Set[int] = func_view.block_ids
 
-    debug_print(f"DEBUG: {func_name} entry={entry_addr} end={end_addr} blocks={len(func_block_ids)}")
+    if _trace.enabled:
+        _trace(f"DEBUG: {func_name} entry={entry_addr} end={end_addr} blocks={len(func_block_ids)}")
 
-    logger.debug(f"{func_name}: {len(func_block_ids)} reachable blocks (out of {len([b for b in cfg.blocks.values() if entry_addr <= b.start <= (end_addr or float('inf'))])})")
+    logger.debug("%s: %d reachable blocks (out of %d)", func_name, len(func_block_ids), func_view.range_block_count)
 
     # FIX 2: Variable name collision resolution
     # Run variable renaming BEFORE creating formatter to detect and resolve collisions
-    # FÁZE 3 (01-20-26): Run quick type inference for PHI resolution with type confidence
+    # FÁZE 3 (01-20-26): Quick type inference for PHI resolution with type confidence
+    # (shared across functions; re-run only when SSA value types changed)
     from ..variable_renaming import VariableRenamer
-    quick_type_engine = None
-    try:
-        quick_type_engine = TypeInferenceEngine(ssa_func, aggressive=True)
-        quick_type_engine.integrate_with_ssa_values()
-    except Exception as e:
-        logger.debug(f"Quick type inference for PHI resolution failed: {e}")
+    quick_type_engine = analysis.type_engine
 
     renamer = VariableRenamer(ssa_func, func_block_ids, type_engine=quick_type_engine, heritage_metadata=heritage_metadata)
     rename_map = renamer.analyze_and_rename()
@@ -868,7 +876,8 @@ def format_structured_function_named(ssa_func: SSAFunction, func_name: str, entr
 
     # Build interference graph from liveness information
     interference = InterferenceGraph(liveness_info, ssa_func)
-    debug_print(f"DEBUG: Liveness analysis: {len(liveness_info)} blocks, {len(interference.edges)} interference edges")
+    if _trace.enabled:
+        _trace(f"DEBUG: Liveness analysis: {len(liveness_info)} blocks, {interference.edge_count} interference edges")
 
     # SSA LOWERING: Collapse versioned SSA variables to unversioned C variables
     # This transforms rename_map: {"t100_0": "sideA", "t200_0": "sideB"} → {"t100_0": "side", "t200_0": "side"}
@@ -943,17 +952,15 @@ def format_structured_function_named(ssa_func: SSAFunction, func_name: str, entr
     func_loops = find_loops_in_function(cfg, func_block_ids, entry_block)
 
     # Resolve global variables for better naming in for-loop conditions
-    # Cache the result on the SSA function to avoid re-computing for every function
-    from ..global_resolver import resolve_globals
-    if not hasattr(ssa_func, '_cached_global_map'):
-        ssa_func._cached_global_map = resolve_globals(ssa_func)
-    global_map = ssa_func._cached_global_map
+    # (computed once per SSA function by the shared analysis context)
+    global_map = analysis.global_map
 
     # Detect switch/case patterns
     switch_patterns = _detect_switch_patterns(ssa_func, func_block_ids, formatter, start_to_block)
-    debug_print(f"DEBUG ORCHESTRATOR: _detect_switch_patterns returned {len(switch_patterns)} switches")
-    for i, sw in enumerate(switch_patterns):
-        debug_print(f"DEBUG ORCHESTRATOR: Switch {i}: {sw.test_var} with {len(sw.cases)} cases, header_block={sw.header_block}")
+    if _trace.enabled:
+        _trace(f"DEBUG ORCHESTRATOR: _detect_switch_patterns returned {len(switch_patterns)} switches")
+        for i, sw in enumerate(switch_patterns):
+            _trace(f"DEBUG ORCHESTRATOR: Switch {i}: {sw.test_var} with {len(sw.cases)} cases, header_block={sw.header_block}")
 
     # FIX: Expand func_block_ids to include switch case body blocks that may
     # have been excluded by the reachability DFS.  Switch case bodies are
@@ -981,7 +988,8 @@ def format_structured_function_named(ssa_func: SSAFunction, func_name: str, entr
                     if blk.start >= entry_addr and (end_addr is None or blk.start <= end_addr):
                         switch_expansion.add(bid)
     if switch_expansion:
-        debug_print(f"DEBUG ORCHESTRATOR: Expanding func_block_ids with {len(switch_expansion)} switch case body blocks: {sorted(switch_expansion)}")
+        if _trace.enabled:
+            _trace(f"DEBUG ORCHESTRATOR: Expanding func_block_ids with {len(switch_expansion)} switch case body blocks: {sorted(switch_expansion)}")
         func_block_ids = func_block_ids | switch_expansion
 
     # =========================================================================
@@ -992,33 +1000,39 @@ def format_structured_function_named(ssa_func: SSAFunction, func_name: str, entr
     # complex nested control flow and irreducible regions.
     # =========================================================================
     if use_collapse:
-        debug_print(f"DEBUG ORCHESTRATOR: Using Ghidra-style collapse algorithm")
+        if _trace.enabled:
+            _trace(f"DEBUG ORCHESTRATOR: Using Ghidra-style collapse algorithm")
         from .blocks.hierarchy import BlockGraph
         from .collapse.engine import CollapseStructure
         from .emit.hierarchical_emitter import HierarchicalCodeEmitter
 
         # Build block graph from this function's blocks only (not entire CFG)
         block_graph = BlockGraph.from_cfg_subset(cfg, ssa_func, func_block_ids, entry_block)
-        debug_print(f"DEBUG COLLAPSE: Built block graph with {len(block_graph.blocks)} blocks (function has {len(func_block_ids)} blocks)")
+        if _trace.enabled:
+            _trace(f"DEBUG COLLAPSE: Built block graph with {len(block_graph.blocks)} blocks (function has {len(func_block_ids)} blocks)")
 
         # Create collapse engine with detected switch patterns
         collapser = CollapseStructure(block_graph)
         collapser.set_switch_patterns(switch_patterns)
 
         # Run collapse algorithm
-        root_block = collapser.collapse_all()
+        with timed_stage("functions.collapse"):
+            root_block = collapser.collapse_all()
 
         # Get collapse statistics
         stats = collapser.get_statistics()
-        debug_print(f"DEBUG COLLAPSE: {stats['iterations']} iterations, "
-                   f"{sum(stats['rules_applied'].values())} rules applied, "
-                   f"{stats['gotos_inserted']} gotos")
+        if _trace.enabled:
+            _trace(f"DEBUG COLLAPSE: {stats['iterations']} iterations, "
+                       f"{sum(stats['rules_applied'].values())} rules applied, "
+                       f"{stats['gotos_inserted']} gotos")
 
         # Apply post-processing transformations (Ghidra-style Actions + for-loop detection)
         if root_block is not None:
             from .post_processing import apply_post_processing
-            root_block = apply_post_processing(root_block, graph=block_graph, ssa_func=ssa_func)
-            debug_print("DEBUG POST-PROCESS: Applied post-processing transformations")
+            with timed_stage("functions.post_processing"):
+                root_block = apply_post_processing(root_block, graph=block_graph, ssa_func=ssa_func)
+            if _trace.enabled:
+                _trace("DEBUG POST-PROCESS: Applied post-processing transformations")
 
         # Emit code using hierarchical emitter
         emitter = HierarchicalCodeEmitter(
@@ -1033,7 +1047,8 @@ def format_structured_function_named(ssa_func: SSAFunction, func_name: str, entr
         )
 
         # Generate function body (emits root structure + remaining uncollapsed blocks)
-        body_lines = emitter.emit_function()
+        with timed_stage("functions.emit"):
+            body_lines = emitter.emit_function()
 
         # Build function signature early for return synthesis
         from ..function_signature import get_function_signature_string
@@ -1137,7 +1152,8 @@ def format_structured_function_named(ssa_func: SSAFunction, func_name: str, entr
                 if var_name in used_in_body:
                     filtered_decls.append(var_decl)
                 else:
-                    debug_print(f"DEBUG COLLAPSE DCE: Eliminating unused variable: {var_name}")
+                    if _trace.enabled:
+                        _trace(f"DEBUG COLLAPSE DCE: Eliminating unused variable: {var_name}")
             else:
                 filtered_decls.append(var_decl)
 
@@ -1189,10 +1205,12 @@ def format_structured_function_named(ssa_func: SSAFunction, func_name: str, entr
     # Build map: block_id -> switch pattern (for quick lookup)
     block_to_switch: Dict[int, SwitchPattern] = {}
     for switch in switch_patterns:
-        debug_print(f"DEBUG ORCHESTRATOR: Adding switch {switch.test_var} to map, all_blocks={switch.all_blocks}")
+        if _trace.enabled:
+            _trace(f"DEBUG ORCHESTRATOR: Adding switch {switch.test_var} to map, all_blocks={switch.all_blocks}")
         for block_id in switch.all_blocks:
             block_to_switch[block_id] = switch
-    debug_print(f"DEBUG ORCHESTRATOR: block_to_switch contains {len(block_to_switch)} entries")
+    if _trace.enabled:
+        _trace(f"DEBUG ORCHESTRATOR: block_to_switch contains {len(block_to_switch)} entries")
 
     # FÁZE 2A: Removed if/else pre-detection - now done during rendering
     # This allows detection to work correctly after switch emission modifies CFG structure
@@ -1214,7 +1232,8 @@ def format_structured_function_named(ssa_func: SSAFunction, func_name: str, entr
             aggressive=True,
             field_tracker=formatter._field_tracker
         )
-        type_engine.integrate_with_ssa_values()
+        if type_engine.integrate_with_ssa_values():
+            analysis.invalidate_types()
         logger.info(f"Type inference completed for {func_name}")
     except Exception as e:
         logger.warning(f"Type inference failed for {func_name}: {e}. Continuing with SSA initial types.")
@@ -1272,19 +1291,22 @@ def format_structured_function_named(ssa_func: SSAFunction, func_name: str, entr
     for var_type, var_name in lowering_result.variable_declarations:
         # PHASE 5: Skip unused temporary variables at SSA level (first pass DCE)
         if _is_unused_temporary(var_name, use_counts):
-            debug_print(f"DEBUG: PHASE 5 DCE (SSA-level) - Skipping unused temp from lowering: {var_name}")
+            if _trace.enabled:
+                _trace(f"DEBUG: PHASE 5 DCE (SSA-level) - Skipping unused temp from lowering: {var_name}")
             continue
 
         # PHASE 6: Skip undefined variables (used but never assigned)
         # These come from broken PHI nodes with no real definitions
         from .analysis.variables import _is_undefined_variable
         if _is_undefined_variable(var_name, ssa_func, func_block_ids, lowering_result.lowered_rename_map):
-            debug_print(f"DEBUG: PHASE 6 (SSA-level) - Skipping undefined tmp from lowering: {var_name}")
+            if _trace.enabled:
+                _trace(f"DEBUG: PHASE 6 (SSA-level) - Skipping undefined tmp from lowering: {var_name}")
             continue
 
         # FIX (01-25): Skip local declarations that shadow global variable names
         if var_name in global_var_names:
-            debug_print(f"DEBUG: Skipping local declaration '{var_name}' - shadows global variable")
+            if _trace.enabled:
+                _trace(f"DEBUG: Skipping local declaration '{var_name}' - shadows global variable")
             continue
 
         # FIX: Handle array types correctly (e.g., "s_SC_MP_EnumPlayers[64]")
@@ -1322,7 +1344,8 @@ def format_structured_function_named(ssa_func: SSAFunction, func_name: str, entr
 
             # FIX (01-25): Skip local declarations that shadow global variable names
             if var_name in global_var_names:
-                debug_print(f"DEBUG: Skipping old var declaration '{var_name}' - shadows global variable")
+                if _trace.enabled:
+                    _trace(f"DEBUG: Skipping old var declaration '{var_name}' - shadows global variable")
                 continue
 
             # BUGFIX: If this variable was already declared by lowering, but the old system
@@ -1432,7 +1455,8 @@ def format_structured_function_named(ssa_func: SSAFunction, func_name: str, entr
             if if_pattern:
                 # DEBUG: Check for compound patterns in func_0292 range
                 if 292 <= addr <= 354:
-                    debug_print(f"DEBUG COMPOUND: Block {block_id}@{addr} detected as if/else, compound={hasattr(if_pattern, 'compound') and if_pattern.compound is not None}")
+                    if _trace.enabled:
+                        _trace(f"DEBUG COMPOUND: Block {block_id}@{addr} detected as if/else, compound={hasattr(if_pattern, 'compound') and if_pattern.compound is not None}")
                 # Register this pattern
                 block_to_if[if_pattern.header_block] = if_pattern
                 for body_block_id in if_pattern.true_body:
@@ -1498,7 +1522,8 @@ def format_structured_function_named(ssa_func: SSAFunction, func_name: str, entr
         # Check if this is a switch header
         if block_id in block_to_switch:
             sw = block_to_switch[block_id]
-            debug_print(f"DEBUG ORCHESTRATOR: Block {block_id} is in block_to_switch, header_block={sw.header_block}, is_header={block_id == sw.header_block}")
+            if _trace.enabled:
+                _trace(f"DEBUG ORCHESTRATOR: Block {block_id} is in block_to_switch, header_block={sw.header_block}, is_header={block_id == sw.header_block}")
         if block_id in block_to_switch and block_id == block_to_switch[block_id].header_block:
             switch = block_to_switch[block_id]
             base_indent = "    " + "    " * len(active_loops)
@@ -1511,10 +1536,12 @@ def format_structured_function_named(ssa_func: SSAFunction, func_name: str, entr
                 lines.append(f"{base_indent}block_{block_id}:")
 
             # Render switch statement
-            debug_print(f"DEBUG ORCHESTRATOR: Rendering switch for {switch.test_var} with {len(switch.cases)} cases at block {block_id}")
+            if _trace.enabled:
+                _trace(f"DEBUG ORCHESTRATOR: Rendering switch for {switch.test_var} with {len(switch.cases)} cases at block {block_id}")
             switch_line = f"{base_indent}switch ({switch.test_var}) {{"
             lines.append(switch_line)
-            debug_print(f"DEBUG ORCHESTRATOR: Appended to lines: '{switch_line}'")
+            if _trace.enabled:
+                _trace(f"DEBUG ORCHESTRATOR: Appended to lines: '{switch_line}'")
             # FIX: Sort cases by detection_order to preserve bytecode/source order
             # (e.g., case 3 before case 2 in RoundEnd() if that's the original order)
             for case in sorted(switch.cases, key=lambda c: c.detection_order):
@@ -1525,7 +1552,8 @@ def format_structured_function_named(ssa_func: SSAFunction, func_name: str, entr
                 # don't render any body - just the label. The body will be rendered
                 # by the target case. This produces: "case 0:\n case 3:\n    return 0;"
                 if getattr(case, 'falls_through_to', None) is not None:
-                    debug_print(f"DEBUG ORCHESTRATOR: Fall-through case {case.value} -> case {case.falls_through_to}, skipping body")
+                    if _trace.enabled:
+                        _trace(f"DEBUG ORCHESTRATOR: Fall-through case {case.value} -> case {case.falls_through_to}, skipping body")
                     continue
 
                 # Render all blocks in case body (sorted by address) with loop support
@@ -1589,7 +1617,8 @@ def format_structured_function_named(ssa_func: SSAFunction, func_name: str, entr
                             block_to_if[body_block_id] = if_pattern
                 nested_block_to_switch: Dict[int, SwitchPattern] = {}
                 for ns in nested_switches:
-                    debug_print(f"DEBUG NESTED SWITCH: Found nested switch {ns.test_var} in case {case.value} body")
+                    if _trace.enabled:
+                        _trace(f"DEBUG NESTED SWITCH: Found nested switch {ns.test_var} in case {case.value} body")
                     for ns_block_id in ns.all_blocks:
                         nested_block_to_switch[ns_block_id] = ns
 
@@ -1653,7 +1682,8 @@ def format_structured_function_named(ssa_func: SSAFunction, func_name: str, entr
                 default_nested_switches = _detect_switch_patterns(ssa_func, set(default_body_sorted), formatter, start_to_block)
                 default_nested_block_to_switch: Dict[int, SwitchPattern] = {}
                 for ns in default_nested_switches:
-                    debug_print(f"DEBUG NESTED SWITCH: Found nested switch {ns.test_var} in default body")
+                    if _trace.enabled:
+                        _trace(f"DEBUG NESTED SWITCH: Found nested switch {ns.test_var} in default body")
                     for ns_block_id in ns.all_blocks:
                         default_nested_block_to_switch[ns_block_id] = ns
 
@@ -2209,7 +2239,8 @@ def format_structured_function_named(ssa_func: SSAFunction, func_name: str, entr
         if is_any_temp:
             from .analysis.variables import _is_undefined_variable
             if _is_undefined_variable(base_name, ssa_func, func_block_ids, lowering_result.lowered_rename_map):
-                debug_print(f"DEBUG: PHASE 6 TWO-PASS - Skipping undefined temp: {base_name}")
+                if _trace.enabled:
+                    _trace(f"DEBUG: PHASE 6 TWO-PASS - Skipping undefined temp: {base_name}")
                 continue
 
         # Check if variable actually appears in the generated output
@@ -2221,7 +2252,8 @@ def format_structured_function_named(ssa_func: SSAFunction, func_name: str, entr
             filtered_declarations.append(formatted_decl)
             seen_vars.add(base_name)
         else:
-            debug_print(f"DEBUG: PHASE 5.5 TWO-PASS DCE - Eliminating unused variable: {var_name}")
+            if _trace.enabled:
+                _trace(f"DEBUG: PHASE 5.5 TWO-PASS DCE - Eliminating unused variable: {var_name}")
 
     # Insert filtered declarations at the right position
     if filtered_declarations:
@@ -2507,7 +2539,8 @@ def format_structured_function_named(ssa_func: SSAFunction, func_name: str, entr
     for var_name in sorted(undefined_vars):
         # PHASE 5: Skip unused temporaries (dead code elimination)
         if _is_unused_temporary(var_name, use_counts):
-            debug_print(f"DEBUG: PHASE 5 DCE - Skipping unused temp from undefined vars: {var_name}")
+            if _trace.enabled:
+                _trace(f"DEBUG: PHASE 5 DCE - Skipping unused temp from undefined vars: {var_name}")
             continue
 
         # NOTE: We previously filtered out "used but never assigned" variables (PHASE 6)
@@ -2516,7 +2549,8 @@ def format_structured_function_named(ssa_func: SSAFunction, func_name: str, entr
         # to have a compile error. The user can then investigate the issue.
         has_assign = _has_assignment(var_name, lines)
         if not has_assign:
-            debug_print(f"DEBUG: PHASE 6 - Variable used but never assigned (declaring anyway): {var_name}")
+            if _trace.enabled:
+                _trace(f"DEBUG: PHASE 6 - Variable used but never assigned (declaring anyway): {var_name}")
             # Still declare it - compilation errors are worse than undefined behavior
 
         var_type = _infer_type_from_usage(var_name, lines)
@@ -2560,5 +2594,6 @@ def format_structured_function_named(ssa_func: SSAFunction, func_name: str, entr
 
     # DEBUG: Check if lines contain switches
     switch_count = sum(1 for line in lines if "switch (" in line)
-    debug_print(f"DEBUG ORCHESTRATOR FINAL: Returning {len(lines)} lines, {switch_count} contain 'switch ('")
+    if _trace.enabled:
+        _trace(f"DEBUG ORCHESTRATOR FINAL: Returning {len(lines)} lines, {switch_count} contain 'switch ('")
     return "\n".join(lines)
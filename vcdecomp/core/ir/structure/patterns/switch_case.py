@@ -31,9 +31,10 @@ from ..analysis.value_trace import (
     _has_dcp_producer_in_phi,
 )
 from .jump_table import _detect_binary_search_switch
-from ..utils.helpers import debug_print
+from ..utils.helpers import get_tracer
 
 logger = logging.getLogger(__name__)
+_trace = get_tracer("switch")
 
 # Environment-controlled debug logging for switch detection
 SWITCH_DEBUG = os.environ.get('VCDECOMP_SWITCH_DEBUG', '0') == '1'
@@ -44,7 +45,8 @@ def _switch_debug(msg: str):
     Enable with: VCDECOMP_SWITCH_DEBUG=1
     """
     if SWITCH_DEBUG:
-        debug_print(f"[SWITCH] {msg}")
+        if _trace.enabled:
+            _trace(f"[SWITCH] {msg}")
 
 
 @dataclass
@@ -1308,7 +1310,8 @@ def _pre_scan_for_nested_headers(
                 if var_name and var_name != outer_switch_var:
                     # This block tests a different variable - it's a nested switch header
                     nested_headers.add(block_id)
-                    debug_print(f"DEBUG SWITCH: Pre-scan found nested header at {block_id}: tests '{var_name}' vs outer '{outer_switch_var}'")
+                    if _trace.enabled:
+                        _trace(f"DEBUG SWITCH: Pre-scan found nested header at {block_id}: tests '{var_name}' vs outer '{outer_switch_var}'")
                     # Don't traverse into nested switch - it will be detected separately
                     continue
 
@@ -1456,14 +1459,17 @@ def _detect_switch_patterns(
     scriptmain_blocks = [bid for bid in cfg.blocks.keys() if 1090 <= cfg.blocks[bid].start <= 1200]
     scriptmain_in_func = [bid for bid in scriptmain_blocks if bid in func_block_ids]
     scriptmain_missing = [bid for bid in scriptmain_blocks if bid not in func_block_ids]
-    debug_print(f"DEBUG SWITCH: ScriptMain area blocks (1090-1200): {sorted(scriptmain_blocks)}")
-    debug_print(f"DEBUG SWITCH: ScriptMain blocks in func_block_ids: {sorted(scriptmain_in_func)}")
+    if _trace.enabled:
+        _trace(f"DEBUG SWITCH: ScriptMain area blocks (1090-1200): {sorted(scriptmain_blocks)}")
+        _trace(f"DEBUG SWITCH: ScriptMain blocks in func_block_ids: {sorted(scriptmain_in_func)}")
     if scriptmain_missing:
-        debug_print(f"DEBUG SWITCH: ScriptMain blocks MISSING from func_block_ids: {sorted(scriptmain_missing)}")
+        if _trace.enabled:
+            _trace(f"DEBUG SWITCH: ScriptMain blocks MISSING from func_block_ids: {sorted(scriptmain_missing)}")
         for bid in sorted(scriptmain_missing):
             if bid in cfg.blocks:
                 block = cfg.blocks[bid]
-                debug_print(f"DEBUG SWITCH:   Block {bid}: start={block.start}, end={block.end}, preds={len(block.predecessors)}")
+                if _trace.enabled:
+                    _trace(f"DEBUG SWITCH:   Block {bid}: start={block.start}, end={block.end}, preds={len(block.predecessors)}")
 
     # Iterate through blocks looking for switch headers
     for block_id in func_block_ids:
@@ -1475,7 +1481,8 @@ def _detect_switch_patterns(
             continue
 
         logger.debug(f"Checking block {block_id} for switch pattern (start addr: {block.start})")
-        debug_print(f"DEBUG SWITCH: Checking block {block_id} for switch pattern (start addr: {block.start})")
+        if _trace.enabled:
+            _trace(f"DEBUG SWITCH: Checking block {block_id} for switch pattern (start addr: {block.start})")
 
         # PHASE 8A: Try binary search detection first (for large switches)
         binary_switch = _detect_binary_search_switch(
@@ -1668,7 +1675,8 @@ def _detect_switch_patterns(
                     _switch_debug(f"First case established: {test_var} (SSA: {var_value.name if hasattr(var_value, 'name') else var_value})")
                     chain_debug['variables_seen'].append(test_var)
                     chain_debug['ssa_values_seen'].append(var_value.name if hasattr(var_value, 'name') else str(var_value))
-                    debug_print(f"DEBUG SWITCH: First case - variable: {test_var}, SSA: {var_value.name if hasattr(var_value, 'name') else var_value}")
+                    if _trace.enabled:
+                        _trace(f"DEBUG SWITCH: First case - variable: {test_var}, SSA: {var_value.name if hasattr(var_value, 'name') else var_value}")
                 elif test_var != var_name or _is_different_stack_source(test_ssa_value, var_value):
                     # NESTED SWITCH FIX: Different variable = likely nested switch
                     # EXCEPTION 1: If test_var is a MOD expression (contains %), and var_name is local_N,
@@ -1698,7 +1706,8 @@ def _detect_switch_patterns(
                         _switch_debug(f"MOD switch continuation: {test_var} vs {var_name} (treating as same variable)")
                         chain_debug['variables_seen'].append(var_name)
                         chain_debug['ssa_values_seen'].append(var_value.name if hasattr(var_value, 'name') else str(var_value))
-                        debug_print(f"DEBUG SWITCH: MOD switch continuation - keeping {test_var}")
+                        if _trace.enabled:
+                            _trace(f"DEBUG SWITCH: MOD switch continuation - keeping {test_var}")
                         # Don't update test_var - keep the MOD-based name
                     elif same_source:
                         # Same stack variable, different traced names - keep the first (more descriptive) name
@@ -1709,18 +1718,21 @@ def _detect_switch_patterns(
                         _switch_debug(f"Same-source continuation: {test_var} vs original (treating as same variable)")
                         chain_debug['variables_seen'].append(var_name)
                         chain_debug['ssa_values_seen'].append(var_value.name if hasattr(var_value, 'name') else str(var_value))
-                        debug_print(f"DEBUG SWITCH: Same-source continuation - keeping {test_var}")
+                        if _trace.enabled:
+                            _trace(f"DEBUG SWITCH: Same-source continuation - keeping {test_var}")
                     else:
                         # Skip this block - it will be processed when we analyze the case body
                         _switch_debug(f"Different variable seen: {test_var} -> {var_name} (skipping - likely nested switch)")
                         chain_debug['variables_seen'].append(var_name)
                         chain_debug['ssa_values_seen'].append(var_value.name if hasattr(var_value, 'name') else str(var_value))
-                        debug_print(f"DEBUG SWITCH: Variable mismatch - test_var: {test_var}, new var_name: {var_name} (skipping - nested switch)")
+                        if _trace.enabled:
+                            _trace(f"DEBUG SWITCH: Variable mismatch - test_var: {test_var}, new var_name: {var_name} (skipping - nested switch)")
 
                         # NEW: Record this block as a nested switch header
                         # This prevents case body BFS from traversing into nested switch structures
                         nested_switch_headers.add(current_block)
-                        debug_print(f"DEBUG SWITCH: Added block {current_block} to nested_switch_headers")
+                        if _trace.enabled:
+                            _trace(f"DEBUG SWITCH: Added block {current_block} to nested_switch_headers")
 
                         # Don't add successors for nested switch blocks - let them be detected later
                         # CRITICAL: Do NOT track this variable in frequency/priority - it belongs
@@ -1736,25 +1748,30 @@ def _detect_switch_patterns(
 
                 # Same variable (or first case), try to extract constant value using ConstantPropagator
                 _switch_debug(f"About to extract constant from: {const_value.name if hasattr(const_value, 'name') else const_value}")
-                debug_print(f"DEBUG SWITCH: About to extract constant from: {const_value.name if hasattr(const_value, 'name') else const_value}")
+                if _trace.enabled:
+                    _trace(f"DEBUG SWITCH: About to extract constant from: {const_value.name if hasattr(const_value, 'name') else const_value}")
                 case_val = None
                 const_info = formatter._constant_propagator.get_constant(const_value)
                 if const_info is not None:
                     case_val = const_info.value
                     _switch_debug(f"  Successfully extracted case value: {case_val}")
-                    debug_print(f"DEBUG SWITCH: Successfully extracted case value: {case_val}")
+                    if _trace.enabled:
+                        _trace(f"DEBUG SWITCH: Successfully extracted case value: {case_val}")
                 else:
                     _switch_debug(f"  Failed to extract constant - const_value alias={const_value.alias if hasattr(const_value, 'alias') else 'None'}, producer={const_value.producer_inst.mnemonic if const_value.producer_inst else 'None'}")
-                    debug_print(f"DEBUG SWITCH: Failed to extract constant for SSA value: {const_value.name}")
+                    if _trace.enabled:
+                        _trace(f"DEBUG SWITCH: Failed to extract constant for SSA value: {const_value.name}")
 
                 if case_val is not None:
                         # This is a valid case!
-                        debug_print(f"DEBUG SWITCH: case_val is not None: {case_val}")
+                        if _trace.enabled:
+                            _trace(f"DEBUG SWITCH: case_val is not None: {case_val}")
                         # Determine which successor is the case body
                         # JZ means jump if zero (condition false), so arg1 is NOT the case
                         # JNZ means jump if not zero (condition true), so arg1 IS the case
                         mnemonic = resolver.get_mnemonic(opcode)
-                        debug_print(f"DEBUG SWITCH: mnemonic={mnemonic}, opcode={opcode}")
+                        if _trace.enabled:
+                            _trace(f"DEBUG SWITCH: mnemonic={mnemonic}, opcode={opcode}")
 
                         jump_target, fallthrough = _resolve_conditional_targets(
                             curr_block_obj, start_to_block, resolver
@@ -1764,7 +1781,8 @@ def _detect_switch_patterns(
                         else:  # JZ
                             case_block_id = fallthrough
 
-                        debug_print(f"DEBUG SWITCH: case_block_id={case_block_id}")
+                        if _trace.enabled:
+                            _trace(f"DEBUG SWITCH: case_block_id={case_block_id}")
                         if case_block_id is not None:
                             # PHASE 3 FIX: Store all potential cases with their variable info
                             # Don't filter yet - we'll do that after BFS completes
@@ -1779,7 +1797,8 @@ def _detect_switch_patterns(
                             chain_blocks.append(current_block)
                             last_chain_block = current_block  # Track last test block
                             found_equ = True
-                            debug_print(f"DEBUG SWITCH: Added case: value={case_val}, block={case_block_id}, var={var_name}, confidence={var_confidence}, order={case_info.detection_order}")
+                            if _trace.enabled:
+                                _trace(f"DEBUG SWITCH: Added case: value={case_val}, block={case_block_id}, var={var_name}, confidence={var_confidence}, order={case_info.detection_order}")
 
                             # BFS: Add ALL successors of this comparison block to the queue
                             # This allows us to find comparison blocks even if they're not directly chained
@@ -1889,7 +1908,8 @@ def _detect_switch_patterns(
         # 3+ cases always becomes a switch
         # 2 cases becomes a switch only if there's a default case OR case values are non-sequential
         # (non-sequential values like 0,2 suggest intentional switch; sequential 0,1 is likely if-else)
-        debug_print(f"DEBUG SWITCH: BFS loop complete for block {block_id}: {len(cases)} unique cases collected (duplicates removed)")
+        if _trace.enabled:
+            _trace(f"DEBUG SWITCH: BFS loop complete for block {block_id}: {len(cases)} unique cases collected (duplicates removed)")
 
         # STRUCTURAL CONTINUITY CHECK: Split chain at structural gaps.
         # When two separate switch(X) statements on the same variable exist,
@@ -1937,7 +1957,8 @@ def _detect_switch_patterns(
                         kept_cases.append(case)
 
                 if kept_cases and len(kept_cases) < len(cases):
-                    debug_print(f"DEBUG SWITCH: Split chain at structural gap: kept {len(kept_cases)} cases (chain {kept_chain}), dropped {len(cases) - len(kept_cases)} cases (chain {dropped_chain})")
+                    if _trace.enabled:
+                        _trace(f"DEBUG SWITCH: Split chain at structural gap: kept {len(kept_cases)} cases (chain {kept_chain}), dropped {len(cases) - len(kept_cases)} cases (chain {dropped_chain})")
                     chain_blocks = kept_chain
                     cases = kept_cases
                     # Update last_chain_block
@@ -1953,7 +1974,8 @@ def _detect_switch_patterns(
         )
 
         should_be_switch = len(cases) >= 3 or (len(cases) >= 2 and (has_default or non_sequential))
-        debug_print(f"DEBUG SWITCH: should_be_switch={should_be_switch} (cases={len(cases)}, has_default={has_default}, non_sequential={non_sequential})")
+        if _trace.enabled:
+            _trace(f"DEBUG SWITCH: should_be_switch={should_be_switch} (cases={len(cases)}, has_default={has_default}, non_sequential={non_sequential})")
 
         if should_be_switch:
             if not _validate_switch_integrity(cases, filtered_case_sources, cfg, start_to_block, resolver):
@@ -1967,22 +1989,26 @@ def _detect_switch_patterns(
                     f"Switch integrity check failed for block {block_id}, "
                     "but simple return-switch heuristic matched"
                 )
-            debug_print(f"DEBUG SWITCH: Creating switch with {len(cases)} cases on variable '{test_var}'")
+            if _trace.enabled:
+                _trace(f"DEBUG SWITCH: Creating switch with {len(cases)} cases on variable '{test_var}'")
             logger.debug(f"Found switch with {len(cases)} cases on variable '{test_var}'")
 
             # HEURISTIC FIX: For ScriptMain with network message cases, use info->message
             # Network message constants typically include SC_NET_MES_* values (0-20)
             case_values = [case.value for case in cases if case.value is not None]
-            debug_print(f"DEBUG SWITCH: Heuristic check - test_var={test_var}, case_values={case_values[:5] if case_values else None}")
+            if _trace.enabled:
+                _trace(f"DEBUG SWITCH: Heuristic check - test_var={test_var}, case_values={case_values[:5] if case_values else None}")
             # Check if test_var is a generic parameter AND we're in ScriptMain
             if test_var and test_var.startswith('param_'):
                 # Get function name from formatter if available
                 func_name = getattr(formatter, 'func_name', None) if formatter else None
-                debug_print(f"DEBUG SWITCH: func_name from formatter = {func_name}")
+                if _trace.enabled:
+                    _trace(f"DEBUG SWITCH: func_name from formatter = {func_name}")
                 # For ScriptMain, assume first parameter field (param_0, param_1, param_2) is info->message
                 if func_name == "ScriptMain" and case_values and all(isinstance(v, int) and 0 <= v <= 20 for v in case_values):
                     test_var = "info->message"
-                    debug_print(f"DEBUG SWITCH: ScriptMain heuristic applied: {test_var}")
+                    if _trace.enabled:
+                        _trace(f"DEBUG SWITCH: ScriptMain heuristic applied: {test_var}")
 
             # Find the exit block - the convergence point where all case paths meet
             #
@@ -2010,7 +2036,8 @@ def _detect_switch_patterns(
                 nested_switch_headers.update(pre_scan_nested)
 
             if nested_switch_headers:
-                debug_print(f"DEBUG SWITCH: Pre-scan found nested_switch_headers: {sorted(nested_switch_headers)}")
+                if _trace.enabled:
+                    _trace(f"DEBUG SWITCH: Pre-scan found nested_switch_headers: {sorted(nested_switch_headers)}")
 
             # Step 1: Find preliminary body blocks for each case
             # Use case entries and nested headers as stop barriers
@@ -2057,7 +2084,8 @@ def _detect_switch_patterns(
                                 exit_candidates[succ] = set()
                             exit_candidates[succ].add(case_entry)
 
-            debug_print(f"DEBUG SWITCH: exit_candidates with reaching cases: {exit_candidates}")
+            if _trace.enabled:
+                _trace(f"DEBUG SWITCH: exit_candidates with reaching cases: {exit_candidates}")
 
             # Exit block must be reached by ALL cases (or at least multiple)
             # Also, if a block is in a case body but reached by another case, it's an exit
@@ -2083,7 +2111,8 @@ def _detect_switch_patterns(
                         # This might be the start of a nested if/else or switch
                         # It's NOT a good exit candidate if it's only reached by one case
                         if len(reaching_cases) == 1:
-                            debug_print(f"DEBUG SWITCH: Skipping potential nested structure at {bid}")
+                            if _trace.enabled:
+                                _trace(f"DEBUG SWITCH: Skipping potential nested structure at {bid}")
                             continue
 
                 # Calculate score: how many DIFFERENT cases reach this block?
@@ -2103,18 +2132,21 @@ def _detect_switch_patterns(
                     best_score = score
                     best_exit = bid
                     best_exit_addr = candidate_addr
-                    debug_print(f"DEBUG SWITCH: New best exit: {bid} (addr={candidate_addr}) with score {score} (reached by {reaching_cases})")
+                    if _trace.enabled:
+                        _trace(f"DEBUG SWITCH: New best exit: {bid} (addr={candidate_addr}) with score {score} (reached by {reaching_cases})")
 
             exit_candidates_simple: Dict[int, int] = {
                 bid: len(cases) for bid, cases in exit_candidates.items()
                 if bid not in all_case_blocks and bid not in chain_blocks
             }
-            debug_print(f"DEBUG SWITCH: exit_candidates (simplified): {exit_candidates_simple}")
+            if _trace.enabled:
+                _trace(f"DEBUG SWITCH: exit_candidates (simplified): {exit_candidates_simple}")
 
             # The exit block is the best candidate from our analysis
             exit_block = best_exit
             if exit_block is not None:
-                debug_print(f"DEBUG SWITCH: Selected exit_block: {exit_block}")
+                if _trace.enabled:
+                    _trace(f"DEBUG SWITCH: Selected exit_block: {exit_block}")
 
                 # FÁZE 1.3 FIX: If exit block is just a JMP, follow it to find the real exit
                 exit_blk = cfg.blocks.get(exit_block)
@@ -2125,38 +2157,44 @@ def _detect_switch_patterns(
                         # Follow the JMP to find real exit
                         real_exit = start_to_block.get(instr.arg1)
                         if real_exit is not None:
-                            debug_print(f"DEBUG SWITCH: Following JMP from {exit_block} to real exit {real_exit}")
+                            if _trace.enabled:
+                                _trace(f"DEBUG SWITCH: Following JMP from {exit_block} to real exit {real_exit}")
                             exit_block = real_exit
 
             # Collect all blocks belonging to the switch (initially just chain and case entries)
-            debug_print(f"DEBUG SWITCH: Building all_blocks for {test_var}, chain_blocks={chain_blocks}, header_block={block_id}")
+            if _trace.enabled:
+                _trace(f"DEBUG SWITCH: Building all_blocks for {test_var}, chain_blocks={chain_blocks}, header_block={block_id}")
             all_blocks = set(chain_blocks)
             # Include header block (use actual_header if it was adjusted,
             # but we need to compute it first - so always include block_id for now,
             # and fix up after actual_header is determined below)
             all_blocks.update(all_case_blocks)
-            debug_print(f"DEBUG SWITCH: all_blocks after adding chain and cases: {all_blocks}")
+            if _trace.enabled:
+                _trace(f"DEBUG SWITCH: all_blocks after adding chain and cases: {all_blocks}")
             if current_block is not None:
                 all_blocks.add(current_block)  # default block
 
             # Find body blocks for each case using graph traversal
             # Build stop blocks: all case entries + exit + default
             stop_blocks = all_case_blocks.copy()
-            debug_print(f"DEBUG SWITCH: Initial stop_blocks (case entries): {sorted(stop_blocks)}")
-            # NOTE: Do NOT add chain_blocks to stop_blocks. When a case entry IS a chain block
-            # (comparison falls through to case body), adding it to stop_blocks causes BFS to
-            # stop immediately, resulting in empty case bodies. The all_case_blocks set already
-            # provides sufficient boundaries between cases.
-            debug_print(f"DEBUG SWITCH: chain_blocks (NOT added to stop_blocks): {sorted(chain_blocks)}")
+            if _trace.enabled:
+                _trace(f"DEBUG SWITCH: Initial stop_blocks (case entries): {sorted(stop_blocks)}")
+                # NOTE: Do NOT add chain_blocks to stop_blocks. When a case entry IS a chain block
+                # (comparison falls through to case body), adding it to stop_blocks causes BFS to
+                # stop immediately, resulting in empty case bodies. The all_case_blocks set already
+                # provides sufficient boundaries between cases.
+                _trace(f"DEBUG SWITCH: chain_blocks (NOT added to stop_blocks): {sorted(chain_blocks)}")
 
             # FIX (01-24): Do NOT add nested_switch_headers to stop_blocks
             # Instead, let them be included in case bodies and detected as nested switches later
             # The nested_switch_headers will be stored in SwitchPattern.nested_headers for reference
             if nested_switch_headers:
-                debug_print(f"DEBUG SWITCH: Found nested_switch_headers (will NOT add to stop_blocks): {sorted(nested_switch_headers)}")
+                if _trace.enabled:
+                    _trace(f"DEBUG SWITCH: Found nested_switch_headers (will NOT add to stop_blocks): {sorted(nested_switch_headers)}")
 
             if exit_block is not None:
-                debug_print(f"DEBUG SWITCH: Adding exit_block to stop_blocks: {exit_block}")
+                if _trace.enabled:
+                    _trace(f"DEBUG SWITCH: Adding exit_block to stop_blocks: {exit_block}")
                 stop_blocks.add(exit_block)
             if current_block is not None:
                 # NOTE: Do NOT add current_block to stop_blocks here.
@@ -2302,13 +2340,15 @@ def _detect_switch_patterns(
                             if bb in other_body:
                                 pass2_stop.add(bb)
 
-                debug_print(f"DEBUG SWITCH: Finding body for case {case.value}, entry={case.block_id}, stop_blocks={sorted(pass2_stop)}")
+                if _trace.enabled:
+                    _trace(f"DEBUG SWITCH: Finding body for case {case.value}, entry={case.block_id}, stop_blocks={sorted(pass2_stop)}")
                 case.body_blocks = _find_case_body_blocks(
                     cfg, case.block_id, pass2_stop, resolver,
                     known_exit_blocks={exit_block} if exit_block else None,
                     loops=loops
                 )
-                debug_print(f"DEBUG SWITCH: Case {case.value} body_blocks: {sorted(case.body_blocks)}")
+                if _trace.enabled:
+                    _trace(f"DEBUG SWITCH: Case {case.value} body_blocks: {sorted(case.body_blocks)}")
                 # BUG FIX #3: Add this case's body to stop_blocks so next cases don't cross into it
                 stop_blocks.update(case.body_blocks)
                 # Update all_blocks to include all case body blocks
@@ -2327,9 +2367,11 @@ def _detect_switch_patterns(
                 # The "default" path just falls through to the post-switch code (exit_block).
                 # In this case, we should NOT create a default body, otherwise the post-switch
                 # code will be incorrectly rendered inside the default case.
-                debug_print(f"DEBUG SWITCH: Checking default: default_body_entry={default_body_entry}, exit_block={exit_block}, default_entry={default_entry}")
+                if _trace.enabled:
+                    _trace(f"DEBUG SWITCH: Checking default: default_body_entry={default_body_entry}, exit_block={exit_block}, default_entry={default_entry}")
                 if default_body_entry == exit_block:
-                    debug_print(f"DEBUG SWITCH: No explicit default case - default_entry equals exit_block ({exit_block})")
+                    if _trace.enabled:
+                        _trace(f"DEBUG SWITCH: No explicit default case - default_entry equals exit_block ({exit_block})")
                     default_body = None
                     current_block = None  # Clear to signal no default
                 else:
@@ -2338,7 +2380,8 @@ def _detect_switch_patterns(
                         known_exit_blocks={exit_block} if exit_block else None,
                         loops=loops
                     )
-                    debug_print(f"DEBUG SWITCH: Found default body blocks: {default_body}")
+                    if _trace.enabled:
+                        _trace(f"DEBUG SWITCH: Found default body blocks: {default_body}")
 
                     # BUG FIX #2: Check if the "default body" is actually just the exit point.
                     # If the default body is a single block that starts AFTER all case bodies,
@@ -2357,7 +2400,8 @@ def _detect_switch_patterns(
                                     if body_blk:
                                         max_case_addr = max(max_case_addr, body_blk.end)
 
-                            debug_print(f"DEBUG SWITCH: Checking if {potential_exit} (addr {potential_exit_addr}) is after all case bodies (max addr {max_case_addr})")
+                            if _trace.enabled:
+                                _trace(f"DEBUG SWITCH: Checking if {potential_exit} (addr {potential_exit_addr}) is after all case bodies (max addr {max_case_addr})")
 
                             # If the potential exit block starts after all case bodies, it's post-switch code
                             if potential_exit_addr >= max_case_addr:
@@ -2377,7 +2421,8 @@ def _detect_switch_patterns(
                                     for bid, blk in cfg.blocks.items():
                                         if blk.start == jmp_target_addr and bid != exit_block:
                                             blocks_to_check.append(blk)
-                                            debug_print(f"DEBUG SWITCH: Following JMP from default entry to block {bid} (addr {jmp_target_addr})")
+                                            if _trace.enabled:
+                                                _trace(f"DEBUG SWITCH: Following JMP from default entry to block {bid} (addr {jmp_target_addr})")
                                             break
 
                                 for blk in blocks_to_check:
@@ -2390,29 +2435,33 @@ def _detect_switch_patterns(
                                         break
 
                                 if has_meaningful_code:
-                                    debug_print(
-                                        f"DEBUG SWITCH: Keeping default body {default_body} - "
-                                        f"contains meaningful code (not just exit boilerplate)"
-                                    )
+                                    if _trace.enabled:
+                                        _trace(
+                                            f"DEBUG SWITCH: Keeping default body {default_body} - "
+                                            f"contains meaningful code (not just exit boilerplate)"
+                                        )
                                     # Don't set default_body = None, this IS the default case
                                     # Also add the JMP target block to default_body if it was followed
                                     if len(blocks_to_check) > 1:
                                         for bid, blk in cfg.blocks.items():
                                             if blk == blocks_to_check[1]:
                                                 default_body.add(bid)
-                                                debug_print(f"DEBUG SWITCH: Added JMP target block {bid} to default_body")
+                                                if _trace.enabled:
+                                                    _trace(f"DEBUG SWITCH: Added JMP target block {bid} to default_body")
                                                 break
                                 elif exit_block is None and _block_ends_with_return(cfg, potential_exit, resolver):
                                     # Special case: switch-return functions often have a single return block
                                     # as the implicit default. Keep it if there's no common exit block.
-                                    debug_print(
-                                        "DEBUG SWITCH: Keeping default body as return-only block "
-                                        f"for switch-return function (default_body={default_body})"
-                                    )
+                                    if _trace.enabled:
+                                        _trace(
+                                            "DEBUG SWITCH: Keeping default body as return-only block "
+                                            f"for switch-return function (default_body={default_body})"
+                                        )
                                 else:
-                                    debug_print(
-                                        f"DEBUG SWITCH: No explicit default case - default body {default_body} is post-switch code"
-                                    )
+                                    if _trace.enabled:
+                                        _trace(
+                                            f"DEBUG SWITCH: No explicit default case - default body {default_body} is post-switch code"
+                                        )
                                     default_body = None
                                     current_block = None
 
@@ -2445,7 +2494,8 @@ def _detect_switch_patterns(
                         last_instr = first_chain_block.instructions[-1]
                         if resolver.is_conditional_jump(last_instr.opcode):
                             actual_header = first_chain
-                            debug_print(f"DEBUG SWITCH: Using first chain block {actual_header} as header instead of BFS start {block_id}")
+                            if _trace.enabled:
+                                _trace(f"DEBUG SWITCH: Using first chain block {actual_header} as header instead of BFS start {block_id}")
                             # Remove pre-switch blocks from all_blocks - they are NOT part of the switch
                             # They'll be emitted as sequential code before the switch by the collapse engine
                             all_blocks.discard(block_id)
@@ -2465,7 +2515,8 @@ def _detect_switch_patterns(
                 dispatch_blocks=set(chain_blocks),
                 _internal_type=switch_type,
             )
-            debug_print(f"DEBUG SWITCH: Appending switch to switches list: {test_var} with {len(cases)} cases, all_blocks={sorted(all_blocks)}")
+            if _trace.enabled:
+                _trace(f"DEBUG SWITCH: Appending switch to switches list: {test_var} with {len(cases)} cases, all_blocks={sorted(all_blocks)}")
             switches.append(switch)
             processed_blocks.update(chain_blocks)
 
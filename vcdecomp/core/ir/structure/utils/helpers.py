@@ -13,6 +13,8 @@ from pathlib import Path
 from vcdecomp.core.disasm import opcodes
 from vcdecomp.parsing.symbol_db import SymbolDatabase
 
+from ...cfg import dominates
+
 
 # Configuration: Show block comments for debugging
 SHOW_BLOCK_COMMENTS = False  # Set to True to show "// Block X @addr" comments
@@ -21,7 +23,7 @@ SHOW_BLOCK_COMMENTS = False  # Set to True to show "// Block X @addr" comments
 # =============================================================================
 # Global debug output control (re-exported from vcdecomp.core.ir.debug_output)
 # =============================================================================
-from ...debug_output import set_debug_enabled, debug_print
+from ...debug_output import set_debug_enabled, debug_scope, debug_print, get_tracer
 
 
 def _load_symbol_db() -> Optional[SymbolDatabase]:
@@ -66,18 +68,7 @@ def _dominates(cfg, a: int, b: int) -> bool:
     Returns:
         True if 'a' dominates 'b', False otherwise
     """
-    if a == b:
-        return True
-    current = b
-    idom = cfg.idom
-    while current in idom:
-        parent = idom[current]
-        if parent == a:
-            return True
-        if parent == current:
-            break
-        current = parent
-    return False
+    return dominates(cfg, a, b)
 
 
 def _is_control_flow_only(ssa_block: List, resolver: opcodes.OpcodeResolver) -> bool:
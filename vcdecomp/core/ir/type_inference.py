@@ -385,7 +385,7 @@ class TypeInferenceEngine:
         # Resolve final types
         return self._resolve_all_types()
 
-    def integrate_with_ssa_values(self) -> None:
+    def integrate_with_ssa_values(self) -> int:
         """
         Two-pass integration: collect initial types from SSA, refine via dataflow, write back.
 
@@ -396,6 +396,9 @@ class TypeInferenceEngine:
 
         The integration uses SSA initial types as evidence with confidence 0.85
         (lower than conversions 0.99 but higher than propagation 0.70).
+
+        Returns:
+            Number of SSA values whose value_type was rewritten
         """
         # Phase 1: Collect initial types from SSA values as evidence
         self._collect_ssa_initial_types()
@@ -404,7 +407,7 @@ class TypeInferenceEngine:
         inferred_types = self.infer_types()
 
         # Phase 3: Write refined types back to SSA values
-        self._update_ssa_value_types(inferred_types)
+        return self._update_ssa_value_types(inferred_types)
 
     def _collect_ssa_initial_types(self) -> None:
         """Collect initial types from SSA value.value_type fields as evidence."""
@@ -438,8 +441,8 @@ class TypeInferenceEngine:
         }
         return mapping.get(result_type)
 
-    def _update_ssa_value_types(self, inferred_types: Dict[str, str]) -> None:
-        """Write refined types back to SSA value.value_type fields."""
+    def _update_ssa_value_types(self, inferred_types: Dict[str, str]) -> int:
+        """Write refined types back to SSA value.value_type fields; return change count."""
         # Reverse mapping: type string to ResultType enum
         type_to_enum = {
             'char': opcodes.ResultType.CHAR,
@@ -449,6 +452,7 @@ class TypeInferenceEngine:
             'double': opcodes.ResultType.DOUBLE,
         }
 
+        changed = 0
         for block_id, instructions in self.ssa.instructions.items():
             for inst in instructions:
                 for value in inst.outputs:
@@ -475,6 +479,8 @@ class TypeInferenceEngine:
                                 f"(confidence {confidence:.2f})"
                             )
                             value.value_type = refined_type
+                            changed += 1
+        return changed
 
     def _has_explicit_opcode_evidence(self, var_name: str, inferred_type: str) -> bool:
         """Check if a variable's type is backed by explicit opcode evidence."""
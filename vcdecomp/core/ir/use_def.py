@@ -93,6 +93,56 @@ class UseDefChain:
                         self.uses[input_val.name] = []
                     self.uses[input_val.name].append(inst)
 
+    def replace_instruction(
+        self, old: SSAInstruction, new_instructions: List[SSAInstruction]
+    ) -> None:
+        """
+        Update the chains after a rewrite replaced `old` by `new_instructions`.
+
+        This is the incremental equivalent of rebuilding the chains. New uses of
+        a value old also used take old's place in its use list, so use lists
+        stay in program order; uses of other values are appended.
+
+        Args:
+            old: Instruction that was removed from the function
+            new_instructions: Instructions inserted in its place (intermediate
+                instructions first, replacement last)
+        """
+        # Where old appeared in each use list (first occurrence)
+        insert_at: Dict[str, int] = {}
+        for input_val in old.inputs:
+            users = self.uses.get(input_val.name)
+            if not users or input_val.name in insert_at:
+                continue
+            remaining = [user for user in users if user is not old]
+            if len(remaining) != len(users):
+                insert_at[input_val.name] = next(i for i, user in enumerate(users) if user is old)
+                users[:] = remaining
+
+        for output_val in old.outputs:
+            if self.defs.get(output_val.name) is old:
+                del self.defs[output_val.name]
+        if self.inst_uses.get(old.address) is old.inputs:
+            del self.inst_uses[old.address]
+        if self.inst_defs.get(old.address) is old.outputs:
+            del self.inst_defs[old.address]
+
+        for inst in new_instructions:
+            self.inst_uses[inst.address] = inst.inputs
+            self.inst_defs[inst.address] = inst.outputs
+
+            for output_val in inst.outputs:
+                self.defs[output_val.name] = inst
+
+            for input_val in inst.inputs:
+                users = self.uses.setdefault(input_val.name, [])
+                position = insert_at.get(input_val.name)
+                if position is None:
+                    users.append(inst)
+                else:
+                    users.insert(position, inst)
+                    insert_at[input_val.name] = position + 1
+
     def get_uses(self, value: SSAValue) -> List[SSAInstruction]:
         """
         Get all instructions that use this value.
@@ -8,11 +8,22 @@ Formát SCR souboru:
 4. Code segment - instrukce (12 bajtů každá: opcode + 2 argumenty)
 5. XFN tabulka - externí funkce (28 bajtů/záznam)
 6. Save info (optional)
+
+SCRFile.load() soubor mapuje do paměti (mmap) a segmenty drží jako zero-copy
+memoryview - při hromadném skenování (xfn-aggregate, vyhledávání) se čtou jen
+stránky, na které se opravdu sáhne. Atribut raw_data vrací bytes, kopie se
+vytvoří až při prvním přístupu.
 """
 
+from array import array
+from collections import Counter
+from collections.abc import Sequence
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Tuple, BinaryIO
+from typing import Iterator, List, Optional, Dict, Tuple, BinaryIO, Union
+import mmap
+import re
 import struct
+import sys
 
 from ..disasm.opcodes import (
     OpcodeResolver,
@@ -22,6 +33,46 @@ from ..disasm.opcodes import (
 from .data_strings import extract_data_strings
 
 
+# Předkompilované formáty pro čtení z data segmentu
+_DWORD = struct.Struct('<I')
+_FLOAT = struct.Struct('<f')
+
+# Kandidát na string = maximální běh nenulových bytů; platný je jen pokud
+# obsahuje výhradně printable ASCII (0x20-0x7E) a \t, \n, \r
+_NONZERO_RUN = re.compile(rb'[^\x00]+')
+_INVALID_STRING_BYTE = re.compile(rb'[^\x20-\x7e\t\n\r]')
+
+# Buffer s daty souboru: bytes, nebo memoryview (typicky nad mmap)
+Buffer = Union[bytes, memoryview]
+
+
+def _as_bytes(buffer: Buffer) -> bytes:
+    """Vrátí buffer jako bytes (memoryview se zkopíruje)"""
+    return buffer if isinstance(buffer, bytes) else bytes(buffer)
+
+
+def _cstring_end(data: Buffer, start: int, chunk: int = 256) -> int:
+    """Index null terminátoru od `start` (nebo len(data)); funguje i pro memoryview"""
+    end = len(data)
+    pos = start
+    while pos < end:
+        nul = bytes(data[pos:pos + chunk]).find(0)
+        if nul >= 0:
+            return pos + nul
+        pos += chunk
+    return end
+
+
+def _map_file(f: BinaryIO) -> Optional[memoryview]:
+    """Namapuje otevřený soubor jen pro čtení; None pokud to nejde (prázdný soubor, pipe)"""
+    try:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        return None
+    # memoryview drží referenci na mmap - mapování žije, dokud žijí pohledy
+    return memoryview(mapped)
+
+
 @dataclass
 class SCRHeader:
     """
@@ -67,12 +118,34 @@ class DataSegment:
     Struktura:
         uint32_t data_count     - Počet 32-bit slov
         uint32_t data[]         - Data (4-byte aligned)
+
+    `buffer` je zero-copy pohled do dat souboru; `raw_data` ho vrací jako bytes.
     """
     data_count: int
-    raw_data: bytes
+    buffer: Buffer
+
+    # Extrahované stringy: offset -> string (počítají se až při prvním přístupu)
+    _strings: Optional[Dict[int, str]] = field(default=None, init=False, repr=False, compare=False)
 
-    # Extrahované stringy: offset -> string
-    strings: Dict[int, str] = field(default_factory=dict)
+    _raw_bytes: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def strings(self) -> Dict[int, str]:
+        """Stringy v datech: offset -> string"""
+        if self._strings is None:
+            self._extract_strings()
+        return self._strings
+
+    @strings.setter
+    def strings(self, value: Dict[int, str]) -> None:
+        self._strings = value
+
+    @property
+    def raw_data(self) -> bytes:
+        """Data jako bytes (z memoryview se kopíruje až při prvním přístupu)"""
+        if self._raw_bytes is None:
+            self._raw_bytes = _as_bytes(self.buffer)
+        return self._raw_bytes
 
     @property
     def size_bytes(self) -> int:
@@ -80,17 +153,17 @@ class DataSegment:
         return 4 + (4 * self.data_count)
 
     @classmethod
-    def from_bytes(cls, data: bytes, offset: int = 0) -> Tuple['DataSegment', int]:
+    def from_bytes(cls, data: Buffer, offset: int = 0) -> Tuple['DataSegment', int]:
         """
         Parsuje data segment.
         Vrací (DataSegment, new_offset)
         """
-        data_count = struct.unpack_from('<I', data, offset)[0]
+        data_count = _DWORD.unpack_from(data, offset)[0]
         offset += 4
 
-        raw_data = data[offset:offset + (data_count * 4)]
+        # Slice memoryview nic nekopíruje
+        raw_data = memoryview(data)[offset:offset + (data_count * 4)]
         segment = cls(data_count, raw_data)
-        segment._extract_strings()
 
         return segment, offset + (data_count * 4)
 
@@ -100,60 +173,40 @@ class DataSegment:
 
         Filtruje extended ASCII a binary data - přijímá jen printable ASCII (0x20-0x7E)
         plus whitespace (\n, \r, \t). Tím se eliminují false positives jako 0xFF = 'ÿ'.
+
+        String začíná na začátku dat nebo za null bytem a končí dalším null bytem,
+        tedy je to vždy celý běh nenulových bytů - stačí jeden průchod regexem.
         """
-        self.strings = {}
-        i = 0
-        while i < len(self.raw_data):
-            # Hledáme začátek stringu (nenulový byte po null nebo na začátku)
-            if i == 0 or (i > 0 and self.raw_data[i-1] == 0):
-                # Zkusíme extrahovat string
-                end = i
-                while end < len(self.raw_data) and self.raw_data[end] != 0:
-                    end += 1
-
-                if end > i:
-                    try:
-                        s = self.raw_data[i:end].decode('latin-1')
-
-                        # VYLEPŠENÝ FILTR: Jen printable ASCII (0x20-0x7E) + whitespace
-                        # Tím eliminujeme extended ASCII (0x80-0xFF) jako 'ÿ', 'à', etc.
-                        def is_valid_char(c):
-                            # Printable ASCII range (space to tilde)
-                            if 0x20 <= ord(c) <= 0x7E:
-                                return True
-                            # Allow common whitespace
-                            if c in '\n\r\t':
-                                return True
-                            return False
-
-                        # Skip single-char extended ASCII (e.g., 0xFF = 'ÿ')
-                        if len(s) == 1 and not is_valid_char(s[0]):
-                            i += 1
-                            continue
-
-                        # All characters must be valid
-                        if all(is_valid_char(c) for c in s):
-                            self.strings[i] = s
-                    except:
-                        pass
-            i += 1
+        strings = {}
+        for match in _NONZERO_RUN.finditer(self.buffer):
+            run = match.group()
+            if _INVALID_STRING_BYTE.search(run) is None:
+                strings[match.start()] = run.decode('latin-1')
+        self._strings = strings
 
     def get_dword(self, offset: int) -> int:
         """Vrátí 32-bit hodnotu na daném offsetu"""
-        if offset + 4 <= len(self.raw_data):
-            return struct.unpack_from('<I', self.raw_data, offset)[0]
+        if offset + 4 <= len(self.buffer):
+            return _DWORD.unpack_from(self.buffer, offset)[0]
         return 0
 
     def get_float(self, offset: int) -> float:
         """Vrátí float hodnotu na daném offsetu"""
-        if offset + 4 <= len(self.raw_data):
-            return struct.unpack_from('<f', self.raw_data, offset)[0]
+        if offset + 4 <= len(self.buffer):
+            return _FLOAT.unpack_from(self.buffer, offset)[0]
         return 0.0
 
     def get_string(self, offset: int) -> Optional[str]:
         """Vrátí string na daném offsetu nebo None"""
         return self.strings.get(offset)
 
+    def __getstate__(self):
+        # memoryview (mmap) nejde picklovat - ukládáme bytes
+        state = self.__dict__.copy()
+        state['buffer'] = self.raw_data
+        state['_raw_bytes'] = None
+        return state
+
 
 @dataclass
 class GlobalPointers:
@@ -208,6 +261,104 @@ class Instruction:
         return cls(address, opcode, arg1, arg2)
 
 
+# array typecode for unsigned 32-bit words ('I' is 4 bytes on all supported platforms)
+_U32 = 'I' if array('I').itemsize == 4 else 'L'
+
+
+class InstructionArray(Sequence):
+    """
+    Sloupcové uložení instrukcí: opcode/arg1/arg2 jako tři pole array('I').
+
+    Celý code segment se dekóduje jedním voláním frombytes(). Objekty
+    Instruction se vytváří až při přístupu (a pamatují si, takže identita
+    instrukce zůstává stejná) - kód, který jen skenuje opcodes/args, pracuje
+    přímo se sloupci a žádné objekty nevytváří.
+    """
+
+    __slots__ = ('opcodes', 'arg1', 'arg2', '_views')
+
+    def __init__(self, opcodes: array, arg1: array, arg2: array):
+        self.opcodes = opcodes
+        self.arg1 = arg1
+        self.arg2 = arg2
+        self._views: List[Optional[Instruction]] = [None] * len(opcodes)
+
+    @classmethod
+    def from_buffer(cls, data, offset: int, count: int) -> 'InstructionArray':
+        """Dekóduje `count` instrukcí (12 bytes each) od `offset`"""
+        size = count * 12
+        if offset + size > len(data):
+            raise struct.error(
+                f"code segment requires a buffer of {size} bytes at offset {offset} "
+                f"(actual buffer size is {len(data)})"
+            )
+        words = array(_U32)
+        words.frombytes(data[offset:offset + size])
+        if sys.byteorder != 'little':
+            words.byteswap()
+        return cls(words[0::3], words[1::3], words[2::3])
+
+    @classmethod
+    def from_instructions(cls, instructions) -> 'InstructionArray':
+        """Vytvoří sloupcové uložení ze seznamu Instruction"""
+        return cls(
+            array(_U32, (instr.opcode for instr in instructions)),
+            array(_U32, (instr.arg1 for instr in instructions)),
+            array(_U32, (instr.arg2 for instr in instructions)),
+        )
+
+    def _view(self, address: int) -> Instruction:
+        instr = self._views[address]
+        if instr is None:
+            instr = Instruction(address, self.opcodes[address], self.arg1[address], self.arg2[address])
+            self._views[address] = instr
+        return instr
+
+    def __len__(self) -> int:
+        return len(self.opcodes)
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [self._view(i) for i in range(*index.indices(len(self.opcodes)))]
+        if index < 0:
+            index += len(self.opcodes)
+        if not 0 <= index < len(self.opcodes):
+            raise IndexError("instruction index out of range")
+        return self._view(index)
+
+    def __iter__(self) -> Iterator[Instruction]:
+        view = self._view
+        for address in range(len(self.opcodes)):
+            yield view(address)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, InstructionArray):
+            return (self.opcodes == other.opcodes and self.arg1 == other.arg1
+                    and self.arg2 == other.arg2)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"InstructionArray({len(self.opcodes)} instructions)"
+
+    def __getstate__(self):
+        # Views are rebuilt lazily; only the columns are pickled
+        return (self.opcodes, self.arg1, self.arg2)
+
+    def __setstate__(self, state):
+        self.opcodes, self.arg1, self.arg2 = state
+        self._views = [None] * len(self.opcodes)
+
+
+def instruction_columns(instructions) -> Tuple[array, array, array]:
+    """Vrátí sloupce (opcodes, arg1, arg2) pro InstructionArray i obyčejný seznam"""
+    if isinstance(instructions, InstructionArray):
+        return instructions.opcodes, instructions.arg1, instructions.arg2
+    columns = InstructionArray.from_instructions(instructions)
+    return columns.opcodes, columns.arg1, columns.arg2
+
+
 @dataclass
 class CodeSegment:
     """
@@ -216,9 +367,12 @@ class CodeSegment:
     Struktura:
         uint32_t code_count     - Počet instrukcí
         Instruction code[]      - Instrukce (12 bytes each)
+
+    Instrukce jsou uloženy sloupcově (InstructionArray); pro hromadné skeny
+    použij instruction_columns(), ne iteraci přes objekty Instruction.
     """
     code_count: int
-    instructions: List[Instruction] = field(default_factory=list)
+    instructions: Sequence = field(default_factory=list)
 
     @property
     def size_bytes(self) -> int:
@@ -231,11 +385,8 @@ class CodeSegment:
         code_count = struct.unpack_from('<I', data, offset)[0]
         offset += 4
 
-        instructions = []
-        for i in range(code_count):
-            instr_data = data[offset:offset + 12]
-            instructions.append(Instruction.from_bytes(instr_data, i))
-            offset += 12
+        instructions = InstructionArray.from_buffer(data, offset, code_count)
+        offset += 12 * code_count
 
         return cls(code_count, instructions), offset
 
@@ -308,12 +459,10 @@ class XFNTable:
         entries = []
         for raw in raw_entries:
             # Čteme null-terminated string
-            name_end = names_offset
-            while name_end < len(data) and data[name_end] != 0:
-                name_end += 1
+            name_end = _cstring_end(data, names_offset)
 
             try:
-                name = data[names_offset:name_end].decode('latin-1')
+                name = str(data[names_offset:name_end], 'latin-1')
             except:
                 name = f"xfn_{raw['index']}"
 
@@ -355,7 +504,7 @@ class SaveInfo:
             return None
 
         # Kontrola magic "sav_info"
-        magic = data[offset:offset + 8]
+        magic = bytes(data[offset:offset + 8])
         if magic != b'sav_info':
             return None
 
@@ -367,10 +516,8 @@ class SaveInfo:
         items = []
         for _ in range(count):
             # Čteme jméno (null-terminated)
-            name_end = offset
-            while name_end < len(data) and data[name_end] != 0:
-                name_end += 1
-            name = data[offset:name_end].decode('latin-1')
+            name_end = _cstring_end(data, offset)
+            name = str(data[offset:name_end], 'latin-1')
             offset = name_end + 1
 
             # Dvě hodnoty
@@ -387,9 +534,12 @@ class SaveInfo:
 class SCRFile:
     """
     Kompletní parsovaný SCR soubor.
+
+    `buffer` drží data souboru (bytes nebo memoryview nad mmap), `raw_data`
+    je vrací jako bytes.
     """
     filename: str
-    raw_data: bytes
+    buffer: Buffer
     header: SCRHeader
     data_segment: DataSegment
     global_pointers: GlobalPointers
@@ -399,18 +549,33 @@ class SCRFile:
     opcode_resolver: OpcodeResolver = field(default_factory=lambda: DEFAULT_RESOLVER)
     opcode_detection_scores: Dict[str, float] = field(default_factory=dict)
     opcode_variant_forced: bool = False
-    data_strings: Dict[int, str] = field(default_factory=dict)  # offset → string
+    # offset → string (rozšířený extraktor, počítá se až při prvním přístupu)
+    _data_strings: Optional[Dict[int, str]] = field(default=None, init=False, repr=False, compare=False)
+
+    _raw_bytes: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
-    def load(cls, filename: str, variant: str = "auto") -> 'SCRFile':
-        """Načte a parsuje SCR soubor"""
+    def load(cls, filename: str, variant: str = "auto", use_mmap: bool = True) -> 'SCRFile':
+        """
+        Načte a parsuje SCR soubor.
+
+        S use_mmap se soubor mapuje do paměti a nic se nekopíruje celé -
+        OS načte jen stránky, které parser a analýzy skutečně čtou. Mapování
+        žije, dokud žije SCRFile: soubor pak na Windows nejde přepsat a jeho
+        zkrácení na POSIX shodí proces (SIGBUS). Dlouho žijící volající
+        (MCP session, GUI) proto předávají use_mmap=False.
+        """
         with open(filename, 'rb') as f:
-            data = f.read()
+            data = _map_file(f) if use_mmap else None
+            if data is None:
+                data = f.read()
         return cls.from_bytes(data, filename, variant=variant)
 
     @classmethod
-    def from_bytes(cls, data: bytes, filename: str = "<memory>", variant: str = "auto") -> 'SCRFile':
-        """Parsuje SCR soubor z bytes"""
+    def from_bytes(cls, data: Buffer, filename: str = "<memory>", variant: str = "auto") -> 'SCRFile':
+        """Parsuje SCR soubor z bytes, memoryview nebo mmap"""
+        if not isinstance(data, (bytes, memoryview)):
+            data = memoryview(data)
         offset = 0
 
         # 1. Header
@@ -443,12 +608,9 @@ class SCRFile:
             opcode_resolver = resolver
             forced = True
 
-        # Extract strings from data segment (use enhanced extractor)
-        data_strings = extract_data_strings(data_segment.raw_data, min_length=3)
-
         return cls(
             filename=filename,
-            raw_data=data,
+            buffer=data,
             header=header,
             data_segment=data_segment,
             global_pointers=global_pointers,
@@ -458,9 +620,33 @@ class SCRFile:
             opcode_resolver=opcode_resolver,
             opcode_detection_scores=detection_scores,
             opcode_variant_forced=forced,
-            data_strings=data_strings,
         )
 
+    @property
+    def data_strings(self) -> Dict[int, str]:
+        """Stringy z data segmentu (enhanced extractor): offset → string"""
+        if self._data_strings is None:
+            self._data_strings = extract_data_strings(self.data_segment.buffer, min_length=3)
+        return self._data_strings
+
+    @data_strings.setter
+    def data_strings(self, value: Dict[int, str]) -> None:
+        self._data_strings = value
+
+    @property
+    def raw_data(self) -> bytes:
+        """Celý soubor jako bytes (z memoryview se kopíruje až při prvním přístupu)"""
+        if self._raw_bytes is None:
+            self._raw_bytes = _as_bytes(self.buffer)
+        return self._raw_bytes
+
+    def __getstate__(self):
+        # memoryview (mmap) nejde picklovat - ukládáme bytes
+        state = self.__dict__.copy()
+        state['buffer'] = self.raw_data
+        state['_raw_bytes'] = None
+        return state
+
     def get_instruction(self, address: int) -> Optional[Instruction]:
         """Vrátí instrukci na dané adrese (indexu)"""
         if 0 <= address < len(self.code_segment.instructions):
@@ -477,7 +663,7 @@ class SCRFile:
         """Vrátí informace o souboru jako string"""
         lines = [
             f"=== SCR File Info: {self.filename} ===",
-            f"File size: {len(self.raw_data)} bytes",
+            f"File size: {len(self.buffer)} bytes",
             "",
             "--- Header ---",
             f"Entry parameters: {self.header.enter_size}",
@@ -487,7 +673,7 @@ class SCRFile:
             "",
             "--- Data Segment ---",
             f"Data words: {self.data_segment.data_count}",
-            f"Data size: {len(self.data_segment.raw_data)} bytes",
+            f"Data size: {len(self.data_segment.buffer)} bytes",
             f"Strings found: {len(self.data_segment.strings)}",
             "",
             "--- Global Pointers ---",
@@ -540,44 +726,55 @@ def _is_valid_xfn_index(value: int, xfn_count: int) -> bool:
     return 0 <= signed < xfn_count
 
 
-def _count_xcall_matches(instructions: List[Instruction], opcode: Optional[int], xfn_count: int) -> Tuple[int, int]:
+def _count_xcall_matches(instructions, opcode: Optional[int], xfn_count: int) -> Tuple[int, int]:
     if opcode is None or xfn_count <= 0:
         return 0, 0
 
-    hits = total = 0
-    for instr in instructions:
-        if instr.opcode == opcode:
-            total += 1
-            if _is_valid_xfn_index(instr.arg1, xfn_count):
-                hits += 1
-    return hits, total
+    opcodes, arg1, _ = instruction_columns(instructions)
+    # (opcode, arg1 is a valid XFN index) counted in one C-level pass
+    counts = Counter(zip(opcodes, map(_valid_index_predicate(xfn_count), arg1)))
+    hits = counts[(opcode, True)]
+    return hits, hits + counts[(opcode, False)]
+
+
+def _valid_index_predicate(count: int):
+    """
+    Rychlá varianta _is_valid_code_target/_is_valid_xfn_index pro map().
+
+    Pro unsigned 32-bit hodnotu platí 0 <= signed < count právě když
+    value < count (count je vždy kladný a menší než 2^31).
+    """
+    return count.__gt__
 
 
 def _detect_opcode_variant(code_segment: CodeSegment, xfn_table: XFNTable) -> Tuple[OpcodeResolver, Dict[str, float]]:
     scores: Dict[str, float] = {}
     xfn_count = xfn_table.xfn_count
     code_count = code_segment.code_count
-    instructions = code_segment.instructions
+    opcodes, arg1, _ = instruction_columns(code_segment.instructions)
+
+    # Histogramy (opcode, arg1 je platný cíl) - spočítané jednou pro všechny resolvery
+    if code_count > 0:
+        target_counts = Counter(zip(opcodes, map(_valid_index_predicate(code_count), arg1)))
+    else:
+        target_counts = Counter((op, False) for op in opcodes)
+    if xfn_count > 0:
+        xfn_counts = Counter(zip(opcodes, map(_valid_index_predicate(xfn_count), arg1)))
+    else:
+        xfn_counts = Counter()
 
     for resolver in RESOLVERS.values():
-        call_hits = call_misses = 0
-        jump_hits = jump_misses = 0
-
-        for instr in instructions:
-            if instr.opcode in resolver.internal_call_opcodes:
-                if _is_valid_code_target(instr.arg1, code_count):
-                    call_hits += 1
-                else:
-                    call_misses += 1
-            if instr.opcode in resolver.jump_opcodes:
-                if _is_valid_code_target(instr.arg1, code_count):
-                    jump_hits += 1
-                else:
-                    jump_misses += 1
+        call_hits = sum(target_counts[(op, True)] for op in resolver.internal_call_opcodes)
+        call_misses = sum(target_counts[(op, False)] for op in resolver.internal_call_opcodes)
+        jump_hits = sum(target_counts[(op, True)] for op in resolver.jump_opcodes)
+        jump_misses = sum(target_counts[(op, False)] for op in resolver.jump_opcodes)
 
         xcall_opcode = resolver.mnemonic_to_opcode.get("XCALL")
-        xcall_hits, xcall_total = _count_xcall_matches(instructions, xcall_opcode, xfn_count)
-        xcall_misses = xcall_total - xcall_hits
+        if xcall_opcode is None:
+            xcall_hits = xcall_misses = 0
+        else:
+            xcall_hits = xfn_counts[(xcall_opcode, True)]
+            xcall_misses = xfn_counts[(xcall_opcode, False)]
 
         score = (
             (call_hits * 3.0) - (call_misses * 4.0) +
@@ -0,0 +1,21 @@
+"""
+Process memory statistics.
+
+Shared by the pipeline benchmark and the MCP session pool metrics.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Optional
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process, or None where unsupported."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
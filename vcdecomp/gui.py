@@ -64,6 +64,8 @@ def _make_args(header: Optional[str] = None) -> SimpleNamespace:
         debug_type_inference=False,
         header=header,
         dump_type_evidence=None,
+        # The GUI stays open: don't keep input files mapped (see SCRFile.load)
+        use_mmap=False,
     )
 
 
@@ -75,6 +77,7 @@ def _decompile_single(scr_path: Path, output_dir: Path, header: Optional[str],
                       status_cb):
     """Decompile a single .scr file producing .c and .asm."""
     from vcdecomp.core.ir.decompile_file import decompile_single_scr
+    from vcdecomp.core.ir.decompile_cache import get_decompile_cache
     from vcdecomp.core.loader import SCRFile
     from vcdecomp.core.disasm import Disassembler
     from vcdecomp.core.headers.database import get_header_database
@@ -84,18 +87,25 @@ def _decompile_single(scr_path: Path, output_dir: Path, header: Optional[str],
 
     args = _make_args(header)
     basename = scr_path.stem
+    cache = get_decompile_cache(args)
 
     c_text = decompile_single_scr(
         scr_path, args,
         header_path=Path(header) if header else None,
-        progress_callback=lambda msg: status_cb(f"{scr_path.name}: {msg}")
+        progress_callback=lambda msg: status_cb(f"{scr_path.name}: {msg}"),
+        cache=cache,
     )
     out_c = output_dir / f"{basename}.c"
     out_c.write_text(c_text, encoding="utf-8")
 
     status_cb(f"Disassembling {scr_path.name}...")
-    scr = SCRFile.load(str(scr_path))
-    asm_text = Disassembler(scr).to_string()
+    asm_key = cache.make_key(scr_path, args, extra={"artifact": "disasm"}) if cache else None
+    asm_text = cache.get_text(asm_key, "disasm.asm") if cache else None
+    if asm_text is None:
+        scr = SCRFile.load(str(scr_path), use_mmap=False)
+        asm_text = Disassembler(scr).to_string()
+        if cache:
+            cache.put_text(asm_key, "disasm.asm", asm_text)
     out_asm = output_dir / f"{basename}.asm"
     out_asm.write_text(asm_text, encoding="utf-8")
 
@@ -163,7 +173,7 @@ def _decompile_folder(folder: Path, output_dir: Path, header: Optional[str],
             )
             (output_dir / f"{scr_path.stem}.c").write_text(c_text, encoding="utf-8")
 
-            scr = SCRFile.load(str(scr_path))
+            scr = SCRFile.load(str(scr_path), use_mmap=False)
             asm_text = Disassembler(scr).to_string()
             (output_dir / f"{scr_path.stem}.asm").write_text(asm_text, encoding="utf-8")
         except Exception as e:
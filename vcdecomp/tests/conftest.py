@@ -1,10 +1,12 @@
 """
-Shared pytest fixtures for validation tests.
+Shared pytest fixtures for validation and .sco parser tests.
 
-Provides reusable fixtures for compiler paths and validation orchestrator
-to avoid duplication across test modules.
+Provides reusable fixtures for compiler paths, validation orchestrator and
+a small synthetic .sco scene to avoid duplication across test modules.
 """
 
+import struct
+
 import pytest
 from pathlib import Path
 
@@ -55,3 +57,63 @@ def validation_orchestrator(compiler_paths):
         timeout=120,
         cache_enabled=False,  # Always fresh decompilation
     )
+
+
+def _chunk(chunk_id, payload):
+    return struct.pack("<2I", chunk_id, 8 + len(payload)) + payload
+
+
+def _transform(x, y, z):
+    return _chunk(2, struct.pack("<I", 8) + struct.pack("<13f", 1, 1, 1, 1, x, y, z, *[0.0] * 6))
+
+
+def _waypoint(wp_id, *connections):
+    payload = struct.pack("<HIB", wp_id, 7, len(connections))
+    return _chunk(6, payload + b"".join(struct.pack("<H", c) for c in connections))
+
+
+def _node(name, node_type, chunks=(), children=()):
+    header = struct.pack("<7IfIIB", 1, 0, node_type, len(children), 0, 0, 0,
+                         100.0, 0, 0, len(name)) + name.encode()
+    # A child's node version (1) doubles as the NODE_BEGIN marker
+    tail = b"".join(children) if children else struct.pack("<I", 0xFF)
+    return header + b"".join(chunks) + tail
+
+
+def _scene():
+    root = _node("root", 0, [_transform(0, 0, 0)], [
+        _node("WayPoint1", 9, [_transform(0, 0, 0), _waypoint(1, 2)]),
+        _node("Group", 6, [_transform(5, 5, 0)], [
+            _node("WayPoint2", 9, [_transform(10, 0, 0), _waypoint(2, 1, 3)]),
+            _node("WayPoint3", 9, [_transform(10, 10, 0), _waypoint(3, 9)]),
+        ]),
+        _node("USSpawn1", 0x101, [_transform(0, 20, 0), _chunk(14, b"\x01\x02\x03")]),
+        _node("Mesh1", 1),
+    ])
+    out = bytearray(struct.pack("<I8H3f2f", 0xFF000005, 2004, 1, 2, 3, 4, 5, 6, 0,
+                                1.0, 2.0, 3.0, 0.5, 0.25))
+    out += b"\0" * (100 - len(out))
+    out += struct.pack("<I", 1) + struct.pack("<I", 15) + b"models\\tree.bes"
+    out += struct.pack("<I", 1) + struct.pack("<2I", 0, 1)
+    out += root
+    out += struct.pack("<i", -1)
+    out += struct.pack("<I", 2) + struct.pack("<9f", *[0.5] * 9) + struct.pack("<6I", *range(6))
+    out += struct.pack("<3f", 100.0, 1.0, 0.5) + struct.pack("<2I", 1, 2) + struct.pack("<2I", 3, 4)
+    out += struct.pack("<I", 5) + b"level".ljust(64, b"\0") + struct.pack("<f", 60.0)
+    out += struct.pack("<I", 7) + struct.pack("<i", -1)
+    trailer = bytearray(112)
+    struct.pack_into("<I", trailer, 0, 0xABCC)
+    return bytes(out + trailer)
+
+
+@pytest.fixture
+def sco_path(tmp_path):
+    """
+    Write a small .sco scene and return its path.
+
+    The scene has 7 nodes: root > WayPoint1, Group > (WayPoint2, WayPoint3),
+    USSpawn1 and Mesh1, with three connected waypoints and a level name.
+    """
+    path = tmp_path / "level.sco"
+    path.write_bytes(_scene())
+    return path
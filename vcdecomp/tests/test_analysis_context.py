@@ -0,0 +1,170 @@
+"""
+Unit tests for the shared whole-program analysis context.
+
+Tests ProgramAnalysisContext / FunctionAnalysisView from
+vcdecomp.core.ir.analysis_context.
+"""
+
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Dict, List, Set
+
+import pytest
+
+from vcdecomp.core.ir.analysis_context import ProgramAnalysisContext, get_analysis_context
+
+
+@dataclass
+class MockBasicBlock:
+    block_id: int
+    start: int
+    successors: Set[int] = field(default_factory=set)
+
+
+@dataclass
+class MockCFG:
+    blocks: Dict[int, MockBasicBlock] = field(default_factory=dict)
+    entry_block: int = 0
+
+
+@dataclass
+class MockSSAFunction:
+    cfg: MockCFG = None
+    instructions: Dict[int, List] = field(default_factory=dict)
+
+
+def _make_program() -> MockSSAFunction:
+    """Two functions: blocks 0-2 at 0..19 (block 2 dead), blocks 3-4 at 20..29."""
+    blocks = {
+        0: MockBasicBlock(0, 0, {1}),
+        1: MockBasicBlock(1, 10, set()),
+        2: MockBasicBlock(2, 15, {1}),
+        3: MockBasicBlock(3, 20, {4}),
+        4: MockBasicBlock(4, 25, {3}),
+    }
+    return MockSSAFunction(cfg=MockCFG(blocks=blocks))
+
+
+class TestFunctionView:
+
+    def test_blocks_in_range(self):
+        ctx = ProgramAnalysisContext(_make_program())
+        assert ctx.blocks_in_range(0, 19) == [0, 1, 2]
+        assert ctx.blocks_in_range(20, None) == [3, 4]
+        assert ctx.blocks_in_range(11, 24) == [2, 3]
+
+    def test_view_filters_unreachable_blocks(self):
+        ctx = ProgramAnalysisContext(_make_program())
+        view = ctx.function_view("func_0000", 0, 19, entry_block=0)
+        assert view.block_ids == {0, 1}
+        assert view.range_block_count == 3
+
+    def test_view_matches_full_scan(self):
+        ssa = _make_program()
+        ctx = ProgramAnalysisContext(ssa)
+        view = ctx.function_view("func_0020", 20, 29, entry_block=3)
+        expected = {bid for bid, b in ssa.cfg.blocks.items() if 20 <= b.start <= 29}
+        assert view.block_ids == expected
+
+    def test_index_rebuilt_when_cfg_grows(self):
+        ssa = _make_program()
+        ctx = ProgramAnalysisContext(ssa)
+        assert ctx.blocks_in_range(30, None) == []
+        ssa.cfg.blocks[5] = MockBasicBlock(5, 30)
+        assert ctx.blocks_in_range(30, None) == [5]
+
+
+def _inst(mnemonic, inputs=(), outputs=()):
+    value = lambda name: SimpleNamespace(name=name)
+    return SimpleNamespace(mnemonic=mnemonic, inputs=[value(n) for n in inputs],
+                           outputs=[value(n) for n in outputs])
+
+
+class TestFunctionViews:
+
+    def _program(self):
+        ssa = _make_program()
+        # SSA order differs from block ID order; block 1 has no SSA block
+        for block_id in (4, 0, 2, 3):
+            ssa.instructions[block_id] = [_inst(f"OP{block_id}", [f"a{block_id}"], [f"t{block_id}"])]
+        return ssa
+
+    def test_partition_by_function(self):
+        ctx = ProgramAnalysisContext(self._program())
+        views = ctx.function_views({"func_0000": (0, 14), "func_0020": (20, 29)})
+
+        assert sorted(views) == [0, 20]
+        assert views[0].block_ids == {0, 1} and [b for b, _ in views[0].blocks] == [0]
+        assert [b for b, _ in views[20].blocks] == [4, 3]
+        assert [inst.mnemonic for inst in views[20].instructions()] == ["OP4", "OP3"]
+        assert views[20].defined_values == {"t3", "t4"} and views[20].used_values == {"a3", "a4"}
+
+    def test_partition_shared_across_renames(self):
+        ctx = ProgramAnalysisContext(self._program())
+        views = ctx.function_views({"func_0000": (0, 19)})
+        assert ctx.function_views({"main": (0, 19)}) is views
+        assert [b for b, _ in views[0].blocks] == [0, 2]
+
+    def test_range_view(self):
+        ctx = ProgramAnalysisContext(self._program())
+        view = ctx.range_view(10, 25)
+        assert view.block_ids == {1, 2, 3, 4} and [b for b, _ in view.blocks] == [4, 2, 3]
+        assert ctx.range_view(10, 25) is view
+
+
+class TestSharedAnalyses:
+
+    def test_context_is_cached_on_ssa_function(self):
+        ssa = _make_program()
+        assert get_analysis_context(ssa) is get_analysis_context(ssa)
+
+    def test_constant_propagator_recomputed_after_type_change(self, monkeypatch):
+        built = []
+
+        class FakePropagator:
+            def __init__(self, ssa_func):
+                built.append(self)
+
+            def analyze(self):
+                pass
+
+        monkeypatch.setattr(
+            "vcdecomp.core.ir.constant_propagation.ConstantPropagator", FakePropagator
+        )
+        ctx = ProgramAnalysisContext(_make_program())
+        first = ctx.constant_propagator
+        assert ctx.constant_propagator is first
+        ctx.invalidate_types()
+        assert ctx.constant_propagator is not first
+        assert len(built) == 2
+
+    @pytest.mark.parametrize("changes, expected_runs", [((0,), 1), ((3, 0), 2)])
+    def test_type_engine_rerun_until_fixed_point(self, monkeypatch, changes, expected_runs):
+        runs = []
+        pending = list(changes)
+
+        class FakeEngine:
+            def __init__(self, ssa_func, aggressive=False, field_tracker=None):
+                runs.append(self)
+
+            def integrate_with_ssa_values(self):
+                return pending.pop(0) if pending else 0
+
+        monkeypatch.setattr(
+            "vcdecomp.core.ir.type_inference.TypeInferenceEngine", FakeEngine
+        )
+        ctx = ProgramAnalysisContext(_make_program())
+        for _ in range(4):
+            ctx.type_engine
+        assert len(runs) == expected_runs
+
+    def test_type_engine_failure_returns_none(self, monkeypatch):
+        class BrokenEngine:
+            def __init__(self, *args, **kwargs):
+                raise RuntimeError("boom")
+
+        monkeypatch.setattr(
+            "vcdecomp.core.ir.type_inference.TypeInferenceEngine", BrokenEngine
+        )
+        ctx = ProgramAnalysisContext(_make_program())
+        assert ctx.type_engine is None
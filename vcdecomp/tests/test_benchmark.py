@@ -0,0 +1,103 @@
+"""
+Unit tests for the pipeline benchmark.
+
+Tests stage_timing and BenchmarkReport / run_benchmark / compare_reports
+from vcdecomp.core.ir.benchmark.
+"""
+
+import pytest
+
+from vcdecomp.core.ir import benchmark, decompile_file
+from vcdecomp.core.ir.benchmark import (
+    TOTAL,
+    BenchmarkReport,
+    FileBenchmark,
+    bench_args,
+    compare_reports,
+    find_scr_files,
+    run_benchmark,
+)
+from vcdecomp.core.ir.stage_timing import StageRecorder, recording, timed_stage
+
+
+def _report(**files):
+    return BenchmarkReport(files={
+        name: FileBenchmark(file=name, stages=stages) for name, stages in files.items()
+    })
+
+
+def test_timed_stage_records_only_inside_recording():
+    with timed_stage("ssa"):
+        pass
+
+    recorder = StageRecorder()
+    with recording(recorder):
+        for _ in range(2):
+            with timed_stage("functions"):
+                with timed_stage("functions.emit"):
+                    pass
+    with timed_stage("ssa"):
+        pass
+
+    assert recorder.calls == {"functions": 2, "functions.emit": 2}
+    assert recorder.seconds["functions"] >= recorder.seconds["functions.emit"] >= 0.0
+
+
+def test_find_scr_files_recurses_case_insensitively(tmp_path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "LEVEL.SCR").write_bytes(b"")
+    (tmp_path / "b.scr").write_bytes(b"")
+    (tmp_path / "b.c").write_text("")
+
+    assert [p.name for p in find_scr_files([tmp_path, tmp_path / "b.scr"])] == ["LEVEL.SCR", "b.scr"]
+    with pytest.raises(FileNotFoundError):
+        find_scr_files([tmp_path / "missing"])
+
+
+def test_run_benchmark_collects_stages_and_errors(tmp_path, monkeypatch):
+    good, bad = tmp_path / "GOOD.SCR", tmp_path / "BAD.SCR"
+    good.write_bytes(b"")
+    bad.write_bytes(b"")
+
+    def fake_decompile(scr_path, args):
+        with timed_stage("ssa"):
+            if scr_path == bad:
+                raise ValueError("broken")
+        with timed_stage("functions"):
+            pass
+        return ""
+
+    monkeypatch.setattr(decompile_file, "decompile_single_scr", fake_decompile)
+    report = run_benchmark([good, bad], bench_args(), repeat=2, trace_memory=True)
+
+    assert set(report.files["GOOD.SCR"].stages) == {"ssa", "functions", TOTAL}
+    assert report.files["GOOD.SCR"].calls == {"ssa": 1, "functions": 1}
+    assert report.files["GOOD.SCR"].peak_memory_bytes is not None
+    assert report.files["BAD.SCR"].error == "ValueError: broken"
+    assert set(report.totals()) == {"ssa", "functions", TOTAL}
+    assert "GOOD.SCR" in benchmark.format_report(report)
+
+
+def test_report_round_trip(tmp_path):
+    report = _report(**{"A.SCR": {"ssa": 0.5, TOTAL: 1.0}})
+    report.peak_rss_bytes = 1024
+    path = tmp_path / "baseline.json"
+    report.save(path)
+
+    loaded = BenchmarkReport.load(path)
+    assert loaded.files["A.SCR"].stages == {"ssa": 0.5, TOTAL: 1.0}
+    assert loaded.peak_rss_bytes == 1024
+    assert loaded.totals() == report.totals()
+
+
+def test_compare_reports_flags_slow_stages():
+    baseline = _report(**{"A.SCR": {"ssa": 1.0, "load": 0.001, TOTAL: 2.0},
+                          "B.SCR": {"ssa": 1.0, TOTAL: 1.0}})
+    current = _report(**{"A.SCR": {"ssa": 1.5, "load": 0.004, TOTAL: 2.1},
+                         "C.SCR": {"ssa": 9.0, TOTAL: 9.0}})
+
+    regressions = compare_reports(baseline, current, threshold=0.25)
+
+    # load quadrupled but by less than min_seconds; C.SCR has no baseline
+    assert [(r.file, r.stage) for r in regressions] == [("A.SCR", "ssa"), ("", "ssa")]
+    assert regressions[0].ratio == pytest.approx(1.5)
@@ -0,0 +1,60 @@
+"""
+Unit tests for CFG dominator computation.
+
+Tests the iterative traversals and interval-numbered dominance queries in
+vcdecomp.core.ir.cfg.
+"""
+
+import sys
+
+from vcdecomp.core.ir.cfg import (
+    BasicBlock,
+    CFG,
+    _compute_dominators,
+    dominates,
+    find_loops_in_function,
+)
+
+
+def _cfg(edges, entry=0):
+    blocks = {block_id: BasicBlock(block_id=block_id, start=block_id, end=block_id) for block_id in edges}
+    for source, targets in edges.items():
+        for target in targets:
+            blocks[source].add_successor(target)
+            blocks[target].predecessors.add(source)
+    cfg = CFG(blocks=blocks, entry_block=entry)
+    _compute_dominators(cfg)
+    return cfg
+
+
+def test_dominance_queries_and_frontiers():
+    # 0 -> 1 -> {2, 3} -> 4 -> 1 (loop), 4 -> 5; 6 unreachable
+    cfg = _cfg({0: [1], 1: [2, 3], 2: [4], 3: [4], 4: [1, 5], 5: [], 6: [4]})
+
+    assert cfg.idom == {0: 0, 1: 0, 2: 1, 3: 1, 4: 1, 5: 4}
+    assert cfg.dom_order[:2] == [0, 1] and sorted(cfg.dom_order) == [0, 1, 2, 3, 4, 5]
+    assert dominates(cfg, 1, 5) and dominates(cfg, 4, 4)
+    assert not dominates(cfg, 2, 4) and not dominates(cfg, 5, 1)
+    assert not dominates(cfg, 6, 4) and not dominates(cfg, 0, 6)
+    assert cfg.dominance_frontiers[2] == {4}
+    assert cfg.dominance_frontiers[4] == {1}
+
+    loops = find_loops_in_function(cfg, set(cfg.blocks) - {6}, 0)
+    assert [(loop.header, loop.body, loop.exits) for loop in loops] == [(1, {1, 2, 3, 4}, {5})]
+
+
+def test_deep_cfg_does_not_recurse():
+    depth = sys.getrecursionlimit() * 2
+    edges = {block_id: [block_id + 1] for block_id in range(depth)}
+    edges[depth] = [0]
+    cfg = _cfg(edges)
+
+    assert len(cfg.dom_order) == depth + 1
+    assert dominates(cfg, 0, depth) and not dominates(cfg, depth, 1)
+    loops = find_loops_in_function(cfg, set(cfg.blocks), 0)
+    assert len(loops) == 1 and len(loops[0].body) == depth + 1
+
+
+def test_hand_built_idom_still_supported():
+    cfg = CFG(blocks={}, entry_block=0, idom={0: 0, 1: 0, 2: 1})
+    assert dominates(cfg, 0, 2) and not dominates(cfg, 2, 1)
@@ -0,0 +1,82 @@
+"""
+Unit tests for the compact SSA IR storage.
+
+Tests the slotted SSAValue/SSAInstruction/StackValue classes and the
+LazyMetadata, UseList and ValueTable helpers from vcdecomp.core.ir.compact_ir.
+"""
+
+import pickle
+
+import pytest
+
+from vcdecomp.core.disasm import opcodes
+from vcdecomp.core.ir.compact_ir import LazyMetadata, ValueTable
+from vcdecomp.core.ir.ssa import SSAInstruction, SSAValue
+from vcdecomp.core.ir.stack_lifter import StackValue
+
+INT = opcodes.ResultType.INT
+
+
+def test_metadata_is_allocated_on_first_write():
+    value = SSAValue("t1_0", INT)
+    assert isinstance(value.metadata, LazyMetadata)
+    assert value._metadata is None
+    assert value.metadata == {} and value.metadata.get("dead") is None and "dead" not in value.metadata
+
+    value.metadata["dead"] = True
+    assert value.metadata == {"dead": True} and type(value.metadata) is dict
+
+    # Passing another object's metadata shares the dict, as before.
+    inst = SSAInstruction(0, "ADD", 1, [], [])
+    copy = SSAInstruction(0, "ADD", 1, [], [], metadata=inst.metadata)
+    copy.metadata["array"] = 1
+    assert inst.metadata == {"array": 1}
+
+
+def test_uses_behave_like_a_list():
+    value = SSAValue("t1_0", INT, uses=[(4, 0)])
+    value.uses.append((8, 1))
+    value.uses.extend([(12, 0), (-1, 2)])
+    assert value.uses == [(4, 0), (8, 1), (12, 0), (-1, 2)]
+    assert len(value.uses) == 4 and value.uses[-1] == (-1, 2) and (8, 1) in value.uses
+
+    value.uses.remove((8, 1))
+    assert [address for address, _ in value.uses] == [4, 12, -1]
+    with pytest.raises(ValueError):
+        value.uses.remove((8, 1))
+
+    value.uses = []
+    assert not value.uses and value._uses is None
+
+
+def test_value_table_numbers_values():
+    values = ValueTable()
+    for name in ("a", "b", "c"):
+        values[name] = SSAValue(name, INT)
+    replacement = SSAValue("b", INT)
+    values["b"] = replacement
+    del values["a"]
+
+    assert [values[name].id for name in ("b", "c")] == [1, 2]
+    assert values.names == ["a", "b", "c"]
+    assert values.by_id(1) is replacement and values.by_id(0) is None
+
+
+def test_pickle_and_equality():
+    stack = StackValue("t1_0", metadata={"simple_arithmetic": True})
+    assert stack == StackValue("t1_0", metadata={"simple_arithmetic": True}) != StackValue("t1_0")
+
+    values = ValueTable()
+    source = values["t1_0"] = SSAValue("t1_0", INT, producer=1)
+    result = values["t2_0"] = SSAValue("t2_0", INT, producer=2)
+    inst = SSAInstruction(0, "NEG", 2, [source], [result])
+    result.producer_inst = inst
+    source.uses.append((2, 0))
+    source.constant_value = 5
+    repr(inst)
+
+    loaded = pickle.loads(pickle.dumps(values))
+    assert isinstance(loaded, ValueTable) and loaded.names == ["t1_0", "t2_0"]
+    assert loaded["t1_0"] == source and loaded["t1_0"].uses == [(2, 0)]
+    assert loaded["t1_0"].constant_value == 5
+    assert loaded["t2_0"].producer_inst.inputs[0] is loaded["t1_0"]
@@ -4,7 +4,7 @@ Tests for the cover (live range) module.
 
 import pytest
 
-from vcdecomp.core.ir.merge.cover import Cover, CoverPiece, compute_cover
+from vcdecomp.core.ir.merge.cover import Cover, CoverIndex, CoverPiece, compute_cover
 
 
 class TestCoverPiece:
@@ -228,6 +228,57 @@ class TestCover:
         assert cover.pieces[0].start_addr == 100
         assert cover.pieces[0].end_addr == 200
 
+    def test_disjoint_pieces_same_block(self):
+        """Test that separate ranges in one block stay separate and sorted."""
+        cover = Cover()
+        cover.add_range(1, 300, 350)
+        cover.add_range(1, 100, 150)
+        cover.add_range(1, 151, 160)  # adjacent: joins the first piece
+        assert [(p.start_addr, p.end_addr) for p in cover.pieces] == [(100, 160), (300, 350)]
+        assert not cover.contains(1, 200)
+
+        cover.add_use_point(1, 320)  # extends the piece it follows
+        cover.add_use_point(1, 400)
+        assert [(p.start_addr, p.end_addr) for p in cover.pieces] == [(100, 160), (300, 400)]
+
+        cover.add_range(1, 140, 310)  # bridges both
+        assert [(p.start_addr, p.end_addr) for p in cover.pieces] == [(100, 400)]
+
+    def test_intersects_between_gaps(self):
+        """Test intersection of interleaved pieces."""
+        cover1 = Cover([CoverPiece(1, 0, 9), CoverPiece(1, 20, 29), CoverPiece(2, 0, 5)])
+        cover2 = Cover([CoverPiece(1, 10, 19), CoverPiece(1, 30, 39)])
+        assert not cover1.intersects(cover2)
+
+        cover2.add_range(2, 5, 6)
+        assert cover1.intersects(cover2)
+        assert cover2.intersects(cover1)
+
+
+class TestCoverIndex:
+    """Test batched candidate queries over many covers."""
+
+    def test_disjoint_and_overlapping(self):
+        """Test that candidates come in insertion order and track cover growth."""
+        covers = {
+            "a": Cover([CoverPiece(1, 0, 10)]),
+            "b": Cover([CoverPiece(1, 20, 30)]),
+            "c": Cover([CoverPiece(2, 0, 10)]),
+            "d": Cover([CoverPiece(1, 5, 25)]),
+        }
+        index = CoverIndex()
+        for key, cover in covers.items():
+            index.add(key, cover)
+
+        query = Cover([CoverPiece(1, 12, 18)])
+        assert list(index.disjoint(query)) == ["a", "b", "c"]
+        assert index.overlapping(query) == {"d"}
+
+        covers["c"].add_range(1, 15, 15)
+        index.add("c", covers["c"])
+        assert list(index.disjoint(query)) == ["a", "b"]
+        assert index.overlapping(query) == {"c", "d"}
+
 
 class TestComputeCover:
     """Test compute_cover function."""
@@ -0,0 +1,104 @@
+"""
+Unit tests for cross-file context merging.
+
+Tests CrossFileContext / FileEvidence from vcdecomp.core.ir.cross_file_context.
+"""
+
+import pickle
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from vcdecomp.core.ir.cross_file_context import CrossFileContext, FileEvidence
+
+
+@dataclass
+class MockGlobalUsage:
+    name: str = ""
+    source: str = ""
+    read_count: int = 0
+    write_count: int = 0
+    inferred_type: Optional[str] = None
+    header_type: Optional[str] = None
+    saveinfo_size_dwords: Optional[int] = None
+    array_element_size: Optional[int] = None
+    array_dimensions: Optional[list] = None
+    sgi_index: Optional[int] = None
+    sgi_name: Optional[str] = None
+    # Not part of the evidence; must not be required by the merge
+    read_locations: list = field(default_factory=list)
+
+
+@dataclass
+class MockSaveInfo:
+    items: List[dict] = field(default_factory=list)
+
+
+@dataclass
+class MockSCR:
+    save_info: Optional[MockSaveInfo] = None
+
+
+def _files():
+    return [
+        (
+            "LEVEL.SCR",
+            MockSCR(MockSaveInfo([{"name": "gphase", "val1": 2, "val2": 1}])),
+            {
+                0: MockGlobalUsage(name="gvar_0", source="SGI_constant", read_count=2,
+                                   inferred_type="int", sgi_index=3, sgi_name="SGI_LEVEL"),
+                8: MockGlobalUsage(name="gphase", source="save_info", write_count=1),
+                12: MockGlobalUsage(source="read_only_constant", read_count=1),
+            },
+            {4},
+        ),
+        (
+            "PLAYER.SCR",
+            MockSCR(),
+            {
+                0: MockGlobalUsage(name="other", source="SGI_runtime", write_count=1,
+                                   header_type="float"),
+                16: MockGlobalUsage(read_count=1, array_element_size=4,
+                                    array_dimensions=[8], saveinfo_size_dwords=8),
+            },
+            {4, 16},
+        ),
+    ]
+
+
+def _state(ctx: CrossFileContext):
+    return {
+        offset: (ev.best_name, ev.name_source, ev.names, ev.inferred_types,
+                 ev.readers, ev.writers, ev.float_evidence, ev.saveinfo_size_dwords,
+                 ev.array_element_size, ev.array_dimensions, ev.sgi_index, ev.sgi_name,
+                 ev.best_type, ev.int_evidence)
+        for offset, ev in ctx.globals.items()
+    }
+
+
+def test_file_evidence_merge_matches_add_file_analysis():
+    direct = CrossFileContext()
+    via_evidence = CrossFileContext()
+    for filename, scr, usage, floats in _files():
+        direct.add_file_analysis(filename, scr, usage, floats)
+        evidence = pickle.loads(pickle.dumps(
+            FileEvidence.from_analysis(filename, scr, usage, floats)
+        ))
+        via_evidence.add_file_evidence(evidence)
+
+    direct.resolve()
+    via_evidence.resolve()
+    assert _state(direct) == _state(via_evidence)
+    assert direct.sgi_mappings == via_evidence.sgi_mappings
+    assert 12 not in via_evidence.globals
+
+
+def test_resolved_context_survives_pickling():
+    ctx = CrossFileContext()
+    for filename, scr, usage, floats in _files():
+        ctx.add_file_analysis(filename, scr, usage, floats)
+    ctx.resolve()
+
+    snapshot = pickle.loads(pickle.dumps(ctx))
+    assert _state(snapshot) == _state(ctx)
+    assert snapshot.get_global_name(8) == ctx.get_global_name(8)
+    assert snapshot.get_global_type(4) == ctx.get_global_type(4)
@@ -0,0 +1,50 @@
+"""
+Unit tests for data segment string extraction.
+
+Tests DataSegment.strings (lazy, single-pass extraction) and the lazy
+SCRFile.data_strings from vcdecomp.core.loader.scr_loader.
+"""
+
+import struct
+
+import pytest
+
+from vcdecomp.core.loader.scr_loader import DataSegment
+
+
+def _segment(data: bytes, view: bool = False) -> DataSegment:
+    return DataSegment(len(data) // 4, memoryview(data) if view else data)
+
+
+@pytest.mark.parametrize("view", [False, True])
+@pytest.mark.parametrize("data, expected", [
+    (b"", {}),
+    (b"\x00\x00\x00\x00", {}),
+    (b"abc\x00", {0: "abc"}),
+    # Strings start only at offset 0 or right after a null byte
+    (b"\x00ab\x00cd", {1: "ab", 4: "cd"}),
+    (b"a\tb\r\n\x00~ \x00", {0: "a\tb\r\n", 6: "~ "}),
+    # Any non-printable byte rejects the whole run, including its suffixes
+    (b"ab\xffcd\x00", {}),
+    (b"\xff\x00x\x7f\x00y\x1f\x00", {}),
+    (b"\x00\x00*\x00\x00\x00", {2: "*"}),
+])
+def test_strings_extracted(data, expected, view):
+    assert _segment(data, view).strings == expected
+
+
+def test_strings_extracted_lazily():
+    segment = _segment(b"abc\x00")
+    assert segment._strings is None
+
+    assert segment.get_string(0) == "abc"
+    assert segment._strings == {0: "abc"}
+
+
+def test_from_bytes_defers_extraction():
+    data = b"hello\x00\x00\x00"
+    segment, offset = DataSegment.from_bytes(struct.pack("<I", 2) + data)
+
+    assert offset == 4 + len(data)
+    assert segment._strings is None
+    assert segment.strings == {0: "hello"}
@@ -0,0 +1,79 @@
+"""
+Unit tests for context-local debug output and stage spans.
+
+Tests vcdecomp.core.ir.debug_output and SpanWriter from
+vcdecomp.core.ir.stage_timing.
+"""
+
+import io
+import json
+import threading
+
+from vcdecomp.core.ir import debug_output
+from vcdecomp.core.ir.debug_output import debug_enabled, debug_scope, get_tracer, set_debug_enabled
+from vcdecomp.core.ir.stage_timing import SpanWriter, StageRecorder, recording, timed_stage
+
+
+def test_scope_selects_categories(capsys):
+    switch, fields = get_tracer("test-switch"), get_tracer("test-fields")
+    assert get_tracer("test-switch") is switch
+
+    with debug_scope(True, categories=["test-switch"]):
+        assert switch.enabled and debug_enabled("test-switch") and not debug_enabled("test-fields")
+        switch("case 1")
+        fields("DEBUG field")
+        # A nested plain enable keeps the selection
+        with debug_scope(True):
+            fields("DEBUG field")
+    switch("after scope")
+
+    assert capsys.readouterr().err == "DEBUG: case 1\n"
+    assert not debug_enabled()
+
+
+def test_environment_selects_categories(monkeypatch):
+    monkeypatch.setenv("VCDECOMP_TRACE", "test-a, test-b")
+    with debug_scope(True):
+        assert debug_enabled("test-b") and not debug_enabled("test-c")
+
+
+def test_debug_state_is_context_local(capsys):
+    tracer = get_tracer("test-thread")
+    seen = {}
+
+    def worker():
+        seen["enabled"] = debug_enabled()
+        tracer("from worker")
+
+    with debug_scope(True):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+    assert seen == {"enabled": False}
+    assert capsys.readouterr().err == ""
+
+
+def test_set_debug_enabled_persists_in_context():
+    try:
+        set_debug_enabled(True, categories=["test-persist"])
+        assert debug_enabled("test-persist") and not debug_enabled(debug_output.GENERAL)
+    finally:
+        set_debug_enabled(False)
+    assert not debug_enabled()
+
+
+def test_span_writer_emits_json_lines():
+    stream = io.StringIO()
+    recorder = StageRecorder()
+    with recording(recorder), recording(SpanWriter(stream, file="S0.SCR")):
+        with timed_stage("functions"):
+            with timed_stage("functions.emit"):
+                pass
+
+    spans = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [(s["span"], s["depth"], s["file"]) for s in spans] == [
+        ("functions.emit", 1, "S0.SCR"), ("functions", 0, "S0.SCR"),
+    ]
+    assert spans[1]["start"] <= spans[0]["start"] and spans[1]["seconds"] >= spans[0]["seconds"]
+    assert recorder.calls == {"functions": 1, "functions.emit": 1}
@@ -0,0 +1,129 @@
+"""
+Unit tests for the persistent decompilation cache.
+
+Tests DecompilationCache / get_decompile_cache from
+vcdecomp.core.ir.decompile_cache and its use in decompile_single_scr.
+"""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from vcdecomp.core.ir import decompile_cache, decompile_file
+from vcdecomp.core.ir.decompile_cache import DecompilationCache, get_decompile_cache
+
+
+@pytest.fixture
+def scr_file(tmp_path):
+    path = tmp_path / "LEVEL.SCR"
+    path.write_bytes(b"\x00" * 64)
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DecompilationCache(cache_dir=tmp_path / "cache")
+
+
+def _args(**overrides):
+    args = SimpleNamespace(variant="auto", no_collapse=False, no_simplify=False)
+    args.__dict__.update(overrides)
+    return args
+
+
+class TestKeys:
+
+    def test_key_is_stable(self, cache, scr_file):
+        assert cache.make_key(scr_file, _args()) == cache.make_key(scr_file, _args())
+
+    def test_key_depends_on_content_flags_and_header(self, cache, scr_file, tmp_path):
+        base = cache.make_key(scr_file, _args())
+        assert cache.make_key(scr_file, _args(no_collapse=True)) != base
+
+        header = tmp_path / "LEVEL_H.H"
+        header.write_text("#define A 1\n")
+        assert cache.make_key(scr_file, _args(), header) != base
+
+        scr_file.write_bytes(b"\x01" * 64)
+        assert cache.make_key(scr_file, _args()) != base
+
+    def test_irrelevant_flags_ignored(self, cache, scr_file):
+        assert cache.make_key(scr_file, _args(jobs=4)) == cache.make_key(scr_file, _args())
+
+    @pytest.mark.parametrize("rel_path", [
+        "core/headers/data/sc_global.json",
+        "parsing/data_segment_initializers.py",
+        "data/INGAME_TEXT.TXT",
+    ])
+    def test_key_depends_on_package_data(self, cache, scr_file, tmp_path, monkeypatch, rel_path):
+        package = tmp_path / "package"
+        data_file = package / rel_path
+        data_file.parent.mkdir(parents=True)
+        data_file.write_text("a")
+        monkeypatch.setattr(decompile_cache, "_PACKAGE_ROOT", package)
+        monkeypatch.setattr(decompile_cache, "_code_fingerprint", None)
+        base = cache.make_key(scr_file, _args())
+
+        data_file.write_text("b")
+        monkeypatch.setattr(decompile_cache, "_code_fingerprint", None)
+        assert cache.make_key(scr_file, _args()) != base
+
+
+class TestStorage:
+
+    def test_round_trip(self, cache, scr_file):
+        key = cache.make_key(scr_file, _args())
+        assert cache.get_text(key, "output.c") is None
+
+        cache.put_text(key, "output.c", "void main(void) {}\n")
+        cache.put_json(key, "functions.json", {"main": "void main(void) {}"})
+        cache.put_object(key, "state.pickle", {"bounds": (0, 10)})
+
+        assert cache.get_text(key, "output.c") == "void main(void) {}\n"
+        assert cache.get_json(key, "functions.json") == {"main": "void main(void) {}"}
+        assert cache.get_object(key, "state.pickle") == {"bounds": (0, 10)}
+        assert cache.statistics.hits == 3
+        assert cache.statistics.misses == 1
+
+    def test_disabled_cache_stores_nothing(self, tmp_path):
+        cache = DecompilationCache(cache_dir=tmp_path / "cache", enabled=False)
+        assert not cache.put_text("ab" * 32, "output.c", "x")
+        assert cache.get_text("ab" * 32, "output.c") is None
+
+    def test_lru_eviction(self, tmp_path):
+        cache = DecompilationCache(cache_dir=tmp_path / "cache", max_bytes=350)
+        keys = [f"{i:02d}" * 32 for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.put_text(key, "output.c", "x" * 100)
+            # Distinct, increasing access times
+            os.utime(cache._entry_dir(key), (1000 + i, 1000 + i))
+
+        # Touch the oldest entry so the middle one becomes least recently used
+        assert cache.get_text(keys[0], "output.c") is not None
+        cache.put_text("ff" * 32, "output.c", "y" * 100)
+
+        assert cache.get_text(keys[1], "output.c") is None
+        assert cache.get_text(keys[0], "output.c") is not None
+        assert cache.size_bytes() <= 350
+
+
+class TestConfiguration:
+
+    def test_no_cache_flag_and_debug_disable_cache(self, tmp_path):
+        assert get_decompile_cache(_args(no_cache=True)) is None
+        assert get_decompile_cache(_args(debug=True)) is None
+        cache = get_decompile_cache(_args(cache_dir=str(tmp_path)))
+        assert cache.cache_dir == tmp_path
+
+
+def test_decompile_single_scr_served_from_cache(cache, scr_file, monkeypatch):
+    args = _args(header=None)
+    key = cache.make_key(scr_file, args)
+    cache.put_text(key, decompile_file.CACHE_OUTPUT, "// cached\n")
+
+    def fail_load(*_args, **_kwargs):
+        raise AssertionError("pipeline should not run on a cache hit")
+
+    monkeypatch.setattr(decompile_file, "_load_scr", fail_load)
+    assert decompile_file.decompile_single_scr(scr_file, args, cache=cache) == "// cached\n"
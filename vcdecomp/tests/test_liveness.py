@@ -257,6 +257,27 @@ class TestLivenessAnalyzer:
         # z should be live at exit of B2
         assert 'z' in liveness[2].live_out
 
+    def test_long_chain_converges(self):
+        """Test that liveness reaches the definition across hundreds of blocks."""
+        # B0: x = ...; B1..B299: straight line; B299 uses x
+        length = 300
+        cfg = MockCFG()
+        ssa_func = MockSSAFunction(cfg=cfg)
+        for block_id in range(length):
+            cfg.blocks[block_id] = MockBasicBlock(
+                block_id=block_id, start=block_id, end=block_id,
+                successors={block_id + 1} if block_id + 1 < length else set()
+            )
+            ssa_func.instructions[block_id] = []
+        ssa_func.instructions[0] = [MockSSAInstruction("DEF", 0, outputs=[MockSSAValue("x")])]
+        ssa_func.instructions[length - 1] = [MockSSAInstruction("USE", 1, inputs=[MockSSAValue("x")])]
+
+        liveness = LivenessAnalyzer(ssa_func, set(range(length))).compute_liveness()
+
+        assert 'x' not in liveness[0].live_in
+        assert all(liveness[b].live_in == {'x'} for b in range(1, length))
+        assert all(liveness[b].live_out == {'x'} for b in range(length - 1))
+
 
 # ============================================================================
 # InterferenceGraph Tests
@@ -423,6 +444,40 @@ class TestInterferenceGraph:
         assert 'b' in neighbors_a
         assert 'c' in neighbors_a
 
+    def test_hundreds_of_temporaries(self):
+        """Test the clique of many simultaneously live values."""
+        names = {f"t{i}" for i in range(300)}
+        liveness = {0: LivenessInfo(block_id=0, live_in=names, live_out=names)}
+        cfg = MockCFG()
+        cfg.blocks[0] = MockBasicBlock(block_id=0, start=0, end=0)
+        ssa_func = MockSSAFunction(cfg=cfg)
+        ssa_func.instructions[0] = [
+            MockSSAInstruction("ADD", 0, inputs=[MockSSAValue("t0")], outputs=[MockSSAValue("sum")]),
+        ]
+
+        graph = InterferenceGraph(liveness, ssa_func)
+
+        assert graph.edge_count == len(graph.edges) == 300 * 299 // 2 + 299
+        assert graph.nodes == names | {'sum'}
+        assert graph.get_neighbors('sum') == names - {'t0'}
+        assert not graph.interferes('sum', 't0') and graph.interferes('t1', 't299')
+        assert len(graph.get_non_interfering_groups(['t0', 't1', 'sum'])) == 2
+
+    def test_edge_limit(self, monkeypatch):
+        """Test that the graph stops growing at MAX_EDGES."""
+        monkeypatch.setattr(InterferenceGraph, "MAX_EDGES", 6)
+        cfg = MockCFG()
+        cfg.blocks[0] = MockBasicBlock(block_id=0, start=0, end=0)
+        ssa_func = MockSSAFunction(cfg=cfg)
+
+        four = {0: LivenessInfo(block_id=0, live_in={'a', 'b', 'c', 'd'})}
+        graph = InterferenceGraph(four, ssa_func)
+        assert graph.edge_count == 6 and not graph._truncated
+
+        five = {0: LivenessInfo(block_id=0, live_in={'a', 'b', 'c', 'd', 'e'})}
+        graph = InterferenceGraph(five, ssa_func)
+        assert graph.edge_count == len(graph.edges) == 6 and graph._truncated
+
 
 # ============================================================================
 # InterferenceEdge Tests
@@ -0,0 +1,92 @@
+"""
+Unit tests for the memory-bounded MCP session pool.
+
+Tests SessionPool from vcdecomp_mcp.pool and WarmSession eviction/reload.
+"""
+
+import threading
+
+from vcdecomp_mcp import warmup
+from vcdecomp_mcp.pool import SessionPool
+from vcdecomp_mcp.session import LoadedBinary
+from vcdecomp_mcp.warmup import WarmSession, WarmupScheduler
+
+TIMEOUT = 10
+MB = 1024 * 1024
+
+
+class FakeSession:
+    """Stands in for an analyzed SCRSession of a given size."""
+
+    def __init__(self, path, annotations=None):
+        self.path = path
+        self.func_bounds = {"main": (0, 9)}
+        self._lock = threading.RLock()
+        self._annotations = annotations or {"func_renames": {}}
+
+    def memory_footprint(self):
+        return 4 * MB
+
+    def annotations(self):
+        return self._annotations
+
+    def functions_by_centrality(self):
+        return []
+
+
+def _pool(monkeypatch, budget):
+    built = []
+
+    def from_binary(binary, handle, annotations=None):
+        built.append((handle, annotations))
+        return FakeSession(binary.path, annotations)
+
+    monkeypatch.setattr(warmup.SCRSession, "from_binary", from_binary)
+    monkeypatch.setattr(warmup.SCRSession, "load_binary",
+                        lambda path, use_cache=True: _binary(path))
+    return SessionPool(budget_bytes=budget), built
+
+
+def _binary(path):
+    return LoadedBinary(path=path, state={"func_bounds": {"main": (0, 9)}})
+
+
+def _open(pool, handle, scheduler):
+    pool.add(handle, WarmSession(handle, _binary(f"{handle}.scr"), scheduler))
+    return pool.get(handle).session(TIMEOUT)
+
+
+def test_least_recently_used_sessions_are_evicted(monkeypatch):
+    pool, _built = _pool(monkeypatch, 10 * MB)
+    scheduler = WarmupScheduler()
+    for handle in ("a", "b"):
+        _open(pool, handle, scheduler)
+    pool.get("a")  # b is now least recently used
+    _open(pool, "c", scheduler)
+    pool.get("c")
+
+    metrics = pool.metrics()
+    assert [(s["handle"], s["state"]) for s in metrics["sessions"]] == [
+        ("b", "evicted"), ("a", "ready"), ("c", "ready"),
+    ]
+    assert (metrics["estimated_bytes"], metrics["evictions"]) == (8 * MB, 1)
+
+
+def test_evicted_session_reloads_with_its_annotations(monkeypatch):
+    pool, built = _pool(monkeypatch, 10 * MB)
+    scheduler = WarmupScheduler()
+    for handle in ("a", "b"):
+        _open(pool, handle, scheduler)
+    pool.budget_bytes = 5 * MB
+    assert pool.enforce_budget(keep="b") == ["a"]
+
+    a = pool.get("a")
+    assert a.evicted and a.status()["state"] == "evicted"
+    renames = {"func_0010": "init"}
+    a._annotations["func_renames"] = renames
+
+    session = a.session(TIMEOUT)
+    assert built[-1] == ("a", a._annotations)
+    assert session.annotations()["func_renames"] is renames
+    assert (a.evictions, a.reloads) == (1, 1)
+    assert pool.get("a") is a and pool.get("b").evicted  # b made room for a
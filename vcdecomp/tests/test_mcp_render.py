@@ -0,0 +1,104 @@
+"""
+Unit tests for incremental re-rendering in MCP sessions.
+
+Tests AnnotatedText/compose_renames from vcdecomp_mcp.render_cache and the
+selective invalidation SCRSession does on renames and type overrides.
+"""
+
+import re
+from types import SimpleNamespace
+
+import pytest
+
+import vcdecomp.core.ir.structure as structure
+from vcdecomp_mcp.render_cache import AnnotatedText, compose_renames
+from vcdecomp_mcp.session import SCRSession
+
+BOUNDS = {"main": (0, 9), "helper": (10, 19), "leaf": (20, 29)}
+
+SOURCES = {
+    "main": "void main(void) {\n    int local_0;\n    gphase = helper(local_0);\n}",
+    "helper": "int helper(int param_0) {\n    dword  gcount;\n    return gcount + param_0;\n}",
+    "leaf": "void leaf(void) {\n    leaf_done();\n}",
+}
+
+
+def _regex_renames(text, steps):
+    for old, new in steps:
+        text = re.sub(r'\b' + re.escape(old) + r'\b', new, text)
+    return text
+
+
+def test_token_render_matches_sequential_regexes():
+    text = SOURCES["main"] + "\n" + SOURCES["helper"]
+    # Chained (helper -> aux -> util) and swapped (gphase <-> local_0) renames
+    steps = [("helper", "aux"), ("gphase", "local_0"), ("local_0", "gphase"),
+             ("aux", "util"), ("gcount", "total")]
+    annotated = AnnotatedText(text)
+    rendered = annotated.render(compose_renames(steps), {"total": "float"})
+
+    expected = _regex_renames(text, steps)
+    expected = re.sub(r'\b(int|float|dword|char|short|double)\s+total\b', 'float total', expected)
+    assert rendered == expected
+    assert "float total;" in rendered
+    assert annotated.text == text
+
+
+@pytest.fixture
+def session(monkeypatch):
+    structured = []
+
+    def format_structured_function_named(ssa_func, name, start, end, **kwargs):
+        structured.append(name)
+        return SOURCES[name]
+
+    monkeypatch.setattr(structure, "format_structured_function_named", format_structured_function_named)
+
+    blocks = {0: SimpleNamespace(start=0), 10: SimpleNamespace(start=10)}
+    gcp = SimpleNamespace(address=12, mnemonic="GCP", instruction=None,
+                          inputs=[SimpleNamespace(alias="data_3")], outputs=[])
+    session = SCRSession(
+        handle="t", path="t.scr",
+        scr=SimpleNamespace(get_xfn=lambda index: None),
+        disasm=None,
+        func_bounds=dict(BOUNDS),
+        ssa_func=SimpleNamespace(cfg=SimpleNamespace(blocks=blocks), instructions={0: [], 10: [gcp]}),
+        heritage_metadata=None,
+        globals_usage={
+            8: SimpleNamespace(name="gphase"),
+            12: SimpleNamespace(name="gcount", inferred_type=None, type_confidence=0.0,
+                                is_struct_base=False),
+        },
+        float_globals=set(),
+        array_strides={},
+    )
+    monkeypatch.setattr(session, "_auto_save", lambda: None)
+    for name in BOUNDS:
+        session.decompile_func(name)
+    structured.clear()
+    session.structured = structured
+    return session
+
+
+def test_renames_rerender_without_restructuring(session):
+    leaf = session.decompile_func("leaf")
+
+    session.rename("global", "gphase", "g_phase")
+    session.rename("function", "helper", "get_offset")
+    session.rename("local", "param_0", "offset", func_context="get_offset")
+
+    assert "g_phase = get_offset(local_0);" in session.decompile_func("main")
+    assert "int get_offset(int offset)" in session.decompile_func("get_offset")
+    assert session.decompile_func("leaf") is leaf  # untouched by every rename
+    assert session.structured == []
+
+
+def test_global_type_restructures_only_its_users(session):
+    main = session.decompile_func("main")
+
+    session.set_type("global:gcount", "float")
+
+    assert "float gcount;" in session.decompile_func("helper")
+    assert session.decompile_func("main") is main
+    assert session.structured == ["helper"]
+    assert session.globals_usage[12].inferred_type == "float"
@@ -0,0 +1,195 @@
+"""
+Unit tests for MCP background warm-up.
+
+Tests WarmupScheduler and WarmSession from vcdecomp_mcp.warmup, and the
+mission header scope shared by background work (session._MissionHeader).
+"""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from vcdecomp_mcp import warmup
+from vcdecomp_mcp.session import LoadedBinary, SCRSession, _MissionHeader
+from vcdecomp_mcp.warmup import RECENT, URGENT, WarmSession, WarmupScheduler
+
+TIMEOUT = 10
+
+
+class FakeSession:
+    """Stands in for an analyzed SCRSession."""
+
+    def __init__(self, gates=None):
+        self.gates = gates or {}  # function name -> Event its decompilation waits for
+        self.started = threading.Event()
+        self.calls = []
+
+    def functions_by_centrality(self):
+        return ["hub", "main", "leaf"]
+
+    def decompile_func(self, name):
+        self.started.set()
+        if name in self.gates:
+            self.gates[name].wait(TIMEOUT)
+        self.calls.append(name)
+        return f"void {name}(void) {{}}"
+
+    def get_callees(self, name):
+        return {"calls": ["leaf"] if name == "main" else [], "xcalls": []}
+
+
+def _binary():
+    return LoadedBinary(path="t.scr", state={"func_bounds": {"hub": (0, 1), "main": (2, 3), "leaf": (4, 5)}})
+
+
+def _blocked_scheduler():
+    """A scheduler whose single worker is held until the returned event is set."""
+    scheduler = WarmupScheduler()
+    started, release = threading.Event(), threading.Event()
+
+    def block():
+        started.set()
+        release.wait(TIMEOUT)
+
+    scheduler.submit(block, URGENT)
+    started.wait(TIMEOUT)
+    return scheduler, release
+
+
+def test_scheduler_runs_by_priority_and_promotion():
+    scheduler, release = _blocked_scheduler()
+    order = []
+    tasks = {name: scheduler.submit(lambda name=name: order.append(name))
+             for name in ("a", "b", "c")}
+    scheduler.promote(tasks["c"], RECENT)
+    cancelled = scheduler.submit(lambda: order.append("cancelled"))
+    assert scheduler.cancel(cancelled)
+    assert scheduler.queued() == 3
+
+    release.set()
+    for task in tasks.values():
+        task.future.result(TIMEOUT)
+    assert order == ["c", "a", "b"]
+    assert cancelled.future.cancelled()
+
+
+def test_scheduler_delivers_exceptions():
+    task = WarmupScheduler().submit(lambda: 1 / 0)
+    with pytest.raises(ZeroDivisionError):
+        task.future.result(TIMEOUT)
+
+
+def test_warm_session_decompiles_speculatively(monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(warmup.SCRSession, "from_binary", lambda binary, handle: session)
+    warm = WarmSession("t", _binary(), WarmupScheduler())
+
+    assert warm.session(TIMEOUT) is session
+    for task in warm._functions.values():
+        task.future.result(TIMEOUT)
+
+    status = warm.status()
+    assert status["state"] == "ready"
+    assert (status["decompiled"], status["pending"], status["progress"]) == (3, 0, 1.0)
+    assert session.calls == ["hub", "main", "leaf"]
+
+    # Already decompiled: waits on the finished task rather than re-queueing it
+    assert warm.decompile("main") == "void main(void) {}"
+
+
+def test_queued_function_is_decompiled_on_request(monkeypatch):
+    # The worker is held inside "hub", so the remaining tasks stay queued
+    release = threading.Event()
+    session = FakeSession(gates={"hub": release})
+    monkeypatch.setattr(warmup.SCRSession, "from_binary", lambda binary, handle: session)
+    warm = WarmSession("t", _binary(), WarmupScheduler())
+    warm.session(TIMEOUT)
+    session.started.wait(TIMEOUT)
+    main, leaf = warm._functions["main"], warm._functions["leaf"]
+
+    assert warm.decompile("main") == "void main(void) {}"
+    assert main.future.cancelled()
+    assert leaf.priority == RECENT  # callee of the requested function
+
+    warm.close()
+    release.set()
+    warm._functions["hub"].future.result(TIMEOUT)
+    assert leaf.future.cancelled()
+    assert warm.status()["on_demand"] == 2
+
+
+def test_analysis_error_is_reported(monkeypatch):
+    def fail(binary, handle):
+        raise ValueError("corrupt file")
+
+    monkeypatch.setattr(warmup.SCRSession, "from_binary", fail)
+    warm = WarmSession("t", _binary(), WarmupScheduler())
+
+    with pytest.raises(ValueError):
+        warm.session(TIMEOUT)
+    assert warm.status()["state"] == "error"
+    assert warm.status()["error"] == "ValueError: corrupt file"
+
+
+def test_mission_header_switch_waits_for_users(monkeypatch):
+    loads = []
+
+    def load(self, path):
+        loads.append(path)
+        self._path = path
+
+    monkeypatch.setattr(_MissionHeader, "_load", load)
+    header = _MissionHeader()
+    a, b = Path("a/LEVEL_H.H"), Path("b/LEVEL_H.H")
+    entered, leave, switched = threading.Event(), threading.Event(), threading.Event()
+    seen = []
+
+    def use(path, entered, hold=None):
+        with header.use(path):
+            seen.append(header.path)
+            entered.set()
+            if hold is not None:
+                hold.wait(TIMEOUT)
+
+    first = threading.Thread(target=use, args=(a, entered, leave))
+    first.start()
+    entered.wait(TIMEOUT)
+    with header.use(a):  # Shared with the running user
+        assert loads == [a]
+
+    second = threading.Thread(target=use, args=(b, switched))
+    second.start()
+    assert not switched.wait(0.2)  # Still in use with a
+    leave.set()
+    assert switched.wait(TIMEOUT)
+    first.join(TIMEOUT)
+    second.join(TIMEOUT)
+    assert seen == [a, b] and loads == [a, b]
+
+    with header.use(None), header.use(b), header.use(b):
+        assert header.path == b
+    assert loads == [a, b]
+
+
+def test_reload_from_cache_leaves_header_database_alone(monkeypatch, tmp_path):
+    from vcdecomp.core.headers.database import HeaderDatabase
+    from vcdecomp.core.ir import decompile_cache, decompile_file
+
+    def load_mission_header(self, path):
+        raise AssertionError("header loaded outside of the header scope")
+
+    class Cache:
+        def make_key(self, *args, **kwargs):
+            return "key"
+
+        def get_object(self, key, artifact):
+            return {"func_bounds": {"main": (0, 9)}, "ssa_func": object()}
+
+    header = tmp_path / "LEVEL_H.H"
+    monkeypatch.setattr(HeaderDatabase, "load_mission_header", load_mission_header)
+    monkeypatch.setattr(decompile_file, "resolve_mission_header", lambda scr_dir: header)
+    monkeypatch.setattr(decompile_cache, "get_decompile_cache", Cache)
+
+    binary = SCRSession.load_binary(str(tmp_path / "t.scr"))
+    assert binary.analyzed and binary.header_path == header
@@ -0,0 +1,86 @@
+"""
+Unit tests for the MCP session xref index.
+
+Tests XrefIndex from vcdecomp_mcp.xrefs and the SCRSession queries built on
+it (get_xrefs_to, get_callees, get_callgraph, rename).
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from vcdecomp_mcp.session import SCRSession
+
+# Function name -> (start, end)
+BOUNDS = {"main": (0, 9), "helper": (10, 19), "leaf": (20, 29)}
+
+
+def _inst(address, mnemonic, arg1=0, aliases=()):
+    values = [SimpleNamespace(alias=alias) for alias in aliases]
+    raw = SimpleNamespace(instruction=SimpleNamespace(arg1=arg1))
+    return SimpleNamespace(address=address, mnemonic=mnemonic, instruction=raw,
+                           inputs=values, outputs=[])
+
+
+@pytest.fixture
+def session(monkeypatch):
+    blocks = {b: SimpleNamespace(start=b) for b in (0, 5, 10, 20, 40)}
+    instructions = {
+        0: [_inst(1, "CALL", 10), _inst(2, "XCALL", 0), _inst(3, "GCP", aliases=["data_2"])],
+        5: [_inst(6, "CALL", 20), _inst(7, "ASGN", aliases=["&data_2", "data_2"])],
+        10: [_inst(11, "CALL", 20), _inst(12, "XCALL", 1), _inst(13, "GCP", aliases=["data_3"])],
+        20: [_inst(21, "XCALL", 0)],
+        # Outside every function: ignored
+        40: [_inst(41, "CALL", 10)],
+    }
+    xfns = {0: SimpleNamespace(name="SC_P_GetPos(int,void*)void"),
+            1: SimpleNamespace(name="SC_Log(char*)void")}
+    globals_usage = {8: SimpleNamespace(name="gphase"), 12: SimpleNamespace(name="gcount")}
+
+    session = SCRSession(
+        handle="t", path="t.scr",
+        scr=SimpleNamespace(get_xfn=xfns.get),
+        disasm=None,
+        func_bounds=dict(BOUNDS),
+        ssa_func=SimpleNamespace(cfg=SimpleNamespace(blocks=blocks), instructions=instructions),
+        heritage_metadata=None,
+        globals_usage=globals_usage,
+        float_globals=set(),
+        array_strides={},
+    )
+    monkeypatch.setattr(session, "_auto_save", lambda: None)
+    return session
+
+
+def _addrs(xrefs):
+    return [(x["func"], x["addr"]) for x in xrefs]
+
+
+def test_xrefs_to_functions_globals_and_xfns(session):
+    assert _addrs(session.get_xrefs_to("leaf")) == [("main", 6), ("helper", 11)]
+    assert _addrs(session.get_xrefs_to("gphase")) == [("main", 3), ("main", 7)]
+    assert _addrs(session.get_xrefs_to("gcount")) == [("helper", 13)]
+    # XFN targets match by substring, in program order across XFNs
+    assert _addrs(session.get_xrefs_to("xfn:SC_")) == [("main", 2), ("helper", 12), ("leaf", 21)]
+    assert session.get_xrefs_to("unknown") == []
+
+
+def test_callees_and_callgraph(session):
+    assert session.get_callees("main") == {"calls": ["helper", "leaf"], "xcalls": ["SC_P_GetPos"]}
+    assert session.get_callees("leaf") == {"calls": [], "xcalls": ["SC_P_GetPos"]}
+
+    graph = session.get_callgraph(["main"])
+    assert graph["node_count"] == 5
+    assert {"from": "helper", "to": "SC_Log", "type": "xcall"} in graph["edges"]
+
+
+def test_renames_update_index(session):
+    session.rename("function", "leaf", "get_position")
+    assert session.get_callees("main")["calls"] == ["get_position", "helper"]
+    assert _addrs(session.get_xrefs_to("get_position")) == [("main", 6), ("helper", 11)]
+    assert _addrs(session.get_xrefs_to("xfn:SC_Log")) == [("helper", 12)]
+
+    assert session.rename("global", "gphase", "g_phase")["offset"] == 8
+    assert session.get_xrefs_to("gphase") == []
+    assert _addrs(session.get_xrefs_to("g_phase")) == [("main", 3), ("main", 7)]
+    assert "error" in session.rename("global", "gphase", "other")
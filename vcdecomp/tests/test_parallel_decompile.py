@@ -0,0 +1,58 @@
+"""
+Tests for the fork-based parallel function formatting in decompile_file.
+"""
+
+import pytest
+
+from vcdecomp.core.ir import decompile_file
+from vcdecomp.core.ir import debug_output
+from vcdecomp.core.ir.analysis_context import ProgramAnalysisContext
+
+
+pytestmark = pytest.mark.skipif(
+    not decompile_file._fork_available(), reason="fork start method not available"
+)
+
+
+class _FakeSSA:
+    pass
+
+
+def _format_one(func_name, start, end):
+    return f"{func_name}:{start}:{end}:{debug_output.debug_enabled()}"
+
+
+@pytest.fixture
+def no_warm_up(monkeypatch):
+    monkeypatch.setattr(ProgramAnalysisContext, "warm_up", lambda self: None)
+
+
+def test_parallel_preserves_order(no_warm_up):
+    funcs = [(f"func_{i:04d}", (i * 10, i * 10 + 9)) for i in range(7)]
+    messages = []
+
+    texts = decompile_file._format_functions_parallel(
+        funcs, _format_one, 3, _FakeSSA(), messages.append
+    )
+
+    assert texts == [f"{name}:{s}:{e}:False" for name, (s, e) in funcs]
+    assert messages == [f"Function {i}/7: func_{i - 1:04d}" for i in range(1, 8)]
+    assert decompile_file._PARALLEL_STATE is None
+
+
+def test_worker_debug_flag_reset_per_task(no_warm_up):
+    funcs = [(f"func_{i:04d}", (i, i)) for i in range(4)]
+
+    def leaky_format(func_name, start, end):
+        text = _format_one(func_name, start, end)
+        # Simulate a function that turns debug output on and leaves it on
+        debug_output.set_debug_enabled(True)
+        return text
+
+    texts = decompile_file._format_functions_parallel(
+        funcs, leaky_format, 1, _FakeSSA(), lambda msg: None
+    )
+
+    # Every task, including the first one in the parent, starts clean
+    assert all(text.endswith(":False") for text in texts)
+    assert not debug_output.debug_enabled()
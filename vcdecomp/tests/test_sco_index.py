@@ -0,0 +1,38 @@
+"""
+Unit tests for .sco node indexes.
+
+Tests ScoIndex from sco_parser.index over lazily and eagerly parsed copies
+of a small synthetic scene.
+"""
+
+from sco_parser.index import ScoIndex
+from sco_parser.parser import parse_sco
+
+
+def _index_state(index):
+    table = index.waypoint_table
+    return (list(index.paths), list(index.positions()), list(table.nodes), list(table.wp_ids),
+            list(table.offsets), list(table.connections))
+
+
+def test_index_lookups(sco_path):
+    sco = parse_sco(str(sco_path), lazy=True)
+    try:
+        index = ScoIndex(sco)
+        assert _index_state(index) == _index_state(ScoIndex(parse_sco(str(sco_path))))
+
+        assert [index.names[i] for i in index.find("WayPoint*")] == ["WayPoint1", "WayPoint2", "WayPoint3"]
+        assert [index.names[i] for i in index.find("*", "Player")] == ["USSpawn1"]
+        assert index.find("Nothing*") == []
+
+        node = index.by_path["/root/Group/WayPoint3"]
+        assert index.names[node] == "WayPoint3" and index.paths[node] == "/root/Group/WayPoint3"
+        assert [index.names[i] for i in index.children(index.by_path["/root/Group"])] == ["WayPoint2", "WayPoint3"]
+        assert [index.names[i] for i in index.of_type("dummy")] == ["WayPoint1", "Group", "WayPoint2", "WayPoint3"]
+
+        assert index.position(node) == (10.0, 10.0, 0.0)
+        assert index.position(index.by_path["/root/Mesh1"]) is None
+        assert [index.names[i] for i in index.waypoints] == ["WayPoint1", "WayPoint2", "WayPoint3"]
+        assert list(index.waypoint_table.connections_of(1)) == [1, 3]
+    finally:
+        sco.close()
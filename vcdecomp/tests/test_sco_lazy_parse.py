@@ -0,0 +1,37 @@
+"""
+Unit tests for lazy .sco parsing.
+
+Tests parse_sco(lazy=True) and the NodeTable-backed lazy nodes from
+sco_parser.parser against eager parsing of a small synthetic scene.
+"""
+
+import dataclasses
+
+from sco_parser.models import SceneNode
+from sco_parser.parser import parse_sco
+
+
+def _tree(node):
+    """Comparable form of a node and its subtree."""
+    values = {}
+    for f in dataclasses.fields(SceneNode):
+        value = getattr(node, f.name)
+        if f.name == "children":
+            value = [_tree(child) for child in value]
+        elif f.name == "raw_chunks":
+            value = {k: bytes(v) for k, v in value.items()}
+        values[f.name] = value
+    return values
+
+
+def test_lazy_tree_matches_eager(sco_path):
+    eager = parse_sco(str(sco_path))
+    lazy = parse_sco(str(sco_path), lazy=True)
+    try:
+        assert lazy.node_count == eager.node_count == 7
+        assert _tree(lazy.root_node) == _tree(eager.root_node)
+        assert lazy.parse_warnings == eager.parse_warnings
+        assert lazy.level_name == eager.level_name
+        assert lazy.nodes is not None and eager.nodes is None
+    finally:
+        lazy.close()
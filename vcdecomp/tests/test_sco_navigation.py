@@ -0,0 +1,111 @@
+"""
+Unit tests for waypoint navigation over .sco scenes.
+
+Tests NavGraph from sco_parser.navigation (routes, shortest paths, the
+all-pairs matrix and connected components) against a plain Dijkstra.
+"""
+
+import heapq
+import math
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from sco_parser import navigation
+from sco_parser.index import ScoIndex
+from sco_parser.models import WaypointTable
+from sco_parser.navigation import NavGraph
+from sco_parser.parser import parse_sco
+
+
+def _graph(rng, count, positioned=True):
+    """NavGraph of count random waypoints with IDs 100.. and a few dangling connections."""
+    nodes = list(range(0, 2 * count, 2))
+    connections = [[100 + rng.randrange(count + 3) for _ in range(rng.randrange(4))] for _ in nodes]
+    positions = {node: (rng.uniform(0, 100), rng.uniform(0, 100), 0.0) for node in nodes}
+    if not positioned:
+        positions.pop(nodes[-1])
+    table = WaypointTable.build(
+        (node, SimpleNamespace(wp_id=100 + v, connections=connections[v])) for v, node in enumerate(nodes))
+    index = SimpleNamespace(waypoint_table=table, position=positions.get)
+    return NavGraph(index), connections, positions
+
+
+def _dijkstra(graph, connections, positions, source):
+    """Distances from source over the raw waypoint connections."""
+    nodes = list(graph.nodes)
+    dist = {source: 0.0}
+    heap = [(0.0, source)]
+    while heap:
+        d, v = heapq.heappop(heap)
+        if d > dist[v]:
+            continue
+        for wp_id in connections[v]:
+            t = wp_id - 100
+            if t >= len(nodes):
+                continue  # Dangling
+            a, b = positions.get(nodes[v]), positions.get(nodes[t])
+            nd = d + (math.dist(a, b) if a and b else math.inf)
+            if nd < dist.get(t, math.inf):
+                dist[t] = nd
+                heapq.heappush(heap, (nd, t))
+    return dist
+
+
+@pytest.mark.parametrize("positioned", [True, False])
+def test_routes_match_dijkstra(positioned):
+    rng = random.Random(11)
+    graph, connections, positions = _graph(rng, 60, positioned)
+    assert graph.dangling == sum(1 for conns in connections for c in conns if c >= 160)
+
+    for source in range(0, 60, 7):
+        expected = _dijkstra(graph, connections, positions, source)
+        dist, _ = graph.shortest_paths((source,))
+        for target in range(60):
+            length = expected.get(target, math.inf)
+            assert dist[target] == pytest.approx(length)
+            route = graph.route(source, target)
+            if length == math.inf:
+                assert route is None
+                continue
+            found, path = route
+            assert found == pytest.approx(length)
+            assert path[0] == source and path[-1] == target
+            assert all(b in graph.neighbors(a) for a, b in zip(path, path[1:]))
+            assert sum(graph.distance(a, b) for a, b in zip(path, path[1:])) == pytest.approx(length)
+        # Cached answers are the same
+        assert graph.route(source, 59) == graph.route(source, 59)
+
+
+def test_all_pairs_rows_match_shortest_paths(monkeypatch):
+    graph, _, _ = _graph(random.Random(3), 25)
+    matrix = graph.all_pairs()
+    for v in range(25):
+        assert list(matrix[25 * v:25 * (v + 1)]) == list(graph.shortest_paths((v,))[0])
+    assert graph.all_pairs() is matrix
+
+    # Kept per graph: an identical graph computes its own
+    other, _, _ = _graph(random.Random(3), 25)
+    monkeypatch.setattr(navigation, "MAX_ALL_PAIRS", 24)
+    with pytest.raises(ValueError):
+        other.all_pairs()
+    assert graph.all_pairs() is matrix
+
+
+def test_components_cover_every_waypoint():
+    graph, _, _ = _graph(random.Random(5), 40)
+    components = graph.components()
+    assert sorted(v for component in components for v in component) == list(range(40))
+    assert [len(c) for c in components] == sorted((len(c) for c in components), reverse=True)
+    for v in range(40):
+        owner = next(c for c in components if v in c)
+        assert all(t in owner for t in graph.neighbors(v))
+
+
+def test_scene_waypoints(sco_path):
+    graph = ScoIndex(parse_sco(str(sco_path))).navigation()
+    assert (len(graph), graph.edge_count, graph.dangling) == (3, 3, 1)
+    assert graph.route(0, 2) == (pytest.approx(20.0), [0, 1, 2])
+    assert graph.route(2, 0) is None  # WayPoint3 only connects to a missing ID
+    assert graph.components() == [[0, 1, 2]]
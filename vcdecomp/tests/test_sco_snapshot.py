@@ -0,0 +1,123 @@
+"""
+Unit tests for binary .sco snapshots.
+
+Tests parse_sco(snapshot_dir=...) with the snapshot cache from
+sco_parser.snapshot on a small synthetic scene.
+"""
+
+import dataclasses
+import os
+
+import pytest
+
+from sco_parser import snapshot
+from sco_parser.index import ScoIndex
+from sco_parser.models import SceneNode
+from sco_parser.parser import parse_sco
+from sco_parser.snapshot import snapshot_path
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path):
+    return tmp_path / "snapshots"
+
+
+def _tree(node):
+    """Comparable form of a node and its subtree."""
+    values = {}
+    for f in dataclasses.fields(SceneNode):
+        value = getattr(node, f.name)
+        if f.name == "children":
+            value = [_tree(child) for child in value]
+        elif f.name == "raw_chunks":
+            value = {k: bytes(v) for k, v in value.items()}
+        values[f.name] = value
+    return values
+
+
+def _summary(sco):
+    return (sco.node_count, _tree(sco.root_node), sco.level_name, sco.parse_warnings)
+
+
+def _loaded_from_snapshot(sco):
+    return sco.nodes is not None and sco.nodes.snapshot is not None
+
+
+def _index_state(index):
+    table = index.waypoint_table
+    return (list(index.paths), list(index.positions()), list(table.nodes), list(table.wp_ids),
+            list(table.offsets), list(table.connections))
+
+
+class TestSnapshot:
+
+    def test_round_trip(self, sco_path, snapshot_dir):
+        reference = parse_sco(str(sco_path), lazy=True)
+        cold = parse_sco(str(sco_path), snapshot_dir=str(snapshot_dir))
+        warm = parse_sco(str(sco_path), snapshot_dir=str(snapshot_dir))
+        try:
+            assert not _loaded_from_snapshot(cold) and _loaded_from_snapshot(warm)
+            assert _summary(warm) == _summary(cold) == _summary(reference)
+            assert _index_state(ScoIndex(warm)) == _index_state(ScoIndex(reference))
+        finally:
+            for sco in (reference, cold, warm):
+                sco.close()
+
+    def _reopen(self, sco_path, snapshot_dir):
+        sco = parse_sco(str(sco_path), snapshot_dir=str(snapshot_dir))
+        try:
+            return _loaded_from_snapshot(sco), sco.node_count
+        finally:
+            sco.close()
+
+    def test_touched_file_is_revalidated_by_hash(self, sco_path, snapshot_dir):
+        self._reopen(sco_path, snapshot_dir)
+        os.utime(sco_path, ns=(10**18, 10**18))
+        assert self._reopen(sco_path, snapshot_dir) == (True, 7)
+
+    @pytest.mark.parametrize("change", ["size", "content"])
+    def test_changed_file_rebuilds(self, sco_path, snapshot_dir, change):
+        self._reopen(sco_path, snapshot_dir)
+        data = bytearray(sco_path.read_bytes())
+        if change == "size":
+            data += b"\0"
+        else:
+            data[-1] ^= 0xFF  # Same size, new mtime and hash
+        sco_path.write_bytes(bytes(data))
+        os.utime(sco_path, ns=(10**18, 10**18))
+
+        assert self._reopen(sco_path, snapshot_dir) == (False, 7)
+        assert self._reopen(sco_path, snapshot_dir) == (True, 7)
+
+    @pytest.mark.parametrize("constant", ["FORMAT_VERSION", "SNAPSHOT_VERSION"])
+    def test_version_change_rebuilds(self, sco_path, snapshot_dir, monkeypatch, constant):
+        self._reopen(sco_path, snapshot_dir)
+        monkeypatch.setattr(snapshot, constant, getattr(snapshot, constant) + 1)
+        assert self._reopen(sco_path, snapshot_dir) == (False, 7)
+        assert self._reopen(sco_path, snapshot_dir) == (True, 7)
+
+    @pytest.mark.parametrize("damage", ["half", "300", "minus3", "header", "flip"])
+    def test_damaged_snapshot_is_rebuilt(self, sco_path, snapshot_dir, damage):
+        reference = parse_sco(str(sco_path), lazy=True)
+        expected = _summary(reference)
+        reference.close()
+        self._reopen(sco_path, snapshot_dir)
+        target = snapshot_path(snapshot_dir, sco_path)
+        good = target.read_bytes()
+        damaged = {
+            "half": good[:len(good) // 2],
+            "300": good[:300],
+            "minus3": good[:-3],
+            "header": good[:20],
+            "flip": good[:-8] + bytes(b ^ 0x10 for b in good[-8:]),
+        }[damage]
+        target.write_bytes(damaged)
+
+        sco = parse_sco(str(sco_path), snapshot_dir=str(snapshot_dir))
+        try:
+            assert not _loaded_from_snapshot(sco)
+            assert _summary(sco) == expected
+        finally:
+            sco.close()
+        assert target.read_bytes() == good
+        assert self._reopen(sco_path, snapshot_dir) == (True, 7)
@@ -0,0 +1,65 @@
+"""
+Unit tests for spatial queries over .sco scenes.
+
+Tests KDTree from sco_parser.spatial against brute force, and the
+sco_nearest_many MCP tool, including its validation of query points.
+"""
+
+import math
+import random
+
+import pytest
+
+from sco_parser.index import ScoIndex
+from sco_parser.parser import parse_sco
+from sco_parser.spatial import KDTree
+
+
+def _points(rng, count):
+    points = [(i, rng.uniform(-50, 50), rng.uniform(-50, 50), rng.choice([0.0, rng.uniform(-5, 5)]))
+              for i in range(count)]
+    points += [(count, *points[3][1:]), (count + 1, math.nan, 0.0, 0.0)]  # Duplicate, non-finite
+    return points
+
+
+def _brute_force(points, query):
+    x, y, z = query
+    found = sorted(((x - px) ** 2 + (y - py) ** 2 + (z - pz) ** 2, i) for i, px, py, pz in points
+                   if all(map(math.isfinite, (px, py, pz))))
+    return [(math.sqrt(d2), i) for d2, i in found]
+
+
+def test_kdtree_matches_brute_force():
+    rng = random.Random(7)
+    points = _points(rng, 300)
+    tree = KDTree(points)
+    assert len(tree) == 300 + 1
+
+    for _ in range(50):
+        query = (rng.uniform(-60, 60), rng.uniform(-60, 60), rng.uniform(-6, 6))
+        expected = _brute_force(points, query)
+        for k in (1, 5, 40):
+            assert tree.nearest(*query, k) == expected[:k]
+        radius = rng.uniform(0, 30)
+        assert tree.within(*query, radius) == [e for e in expected if e[0] <= radius]
+
+    assert tree.nearest(*points[3][1:], 2) == [(0.0, 3), (0.0, 300)]
+    assert tree.nearest(0, 0, 0, 0) == [] and tree.within(0, 0, 0, -1) == []
+    assert KDTree([]).nearest(0, 0, 0, 3) == []
+
+
+def test_nearest_many(monkeypatch, sco_path):
+    pytest.importorskip("mcp")
+    from sco_parser import mcp_server
+
+    index = ScoIndex(parse_sco(str(sco_path)))
+    monkeypatch.setattr(mcp_server, "_get_index", lambda handle: index)
+    found = mcp_server.sco_nearest_many("h", [[10, 9, 0], (0, 19.5, 0)])
+    assert [[(e["path"], e["distance"]) for e in row] for row in found] == [
+        [("/root/Group/WayPoint3", 1.0)], [("/root/USSpawn1", 0.5)]]
+    found = mcp_server.sco_nearest_many("h", [[0, 0, 0]], k=3, node_type="Player")
+    assert [[(e["path"], e["distance"]) for e in row] for row in found] == [[("/root/USSpawn1", 20.0)]]
+
+    # Malformed points are reported, not raised
+    for points in ([[1.0, 2.0]], [[1.0, 2.0, "x"]], ["abc"], [[0, 0, 0], [1, 2, 3, 4]]):
+        assert "error" in mcp_server.sco_nearest_many("h", points)
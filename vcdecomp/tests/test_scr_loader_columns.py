@@ -0,0 +1,75 @@
+"""
+Unit tests for columnar instruction storage.
+
+Tests InstructionArray / instruction_columns from vcdecomp.core.loader.scr_loader
+and the column-based opcode scans built on them.
+"""
+
+import pickle
+import struct
+
+import pytest
+
+from vcdecomp.core.loader.scr_loader import (
+    CodeSegment,
+    Instruction,
+    InstructionArray,
+    _count_xcall_matches,
+    instruction_columns,
+)
+
+RAW = [(39, 4, 0), (1, 8, 0), (7, 0xFFFFFFFF, 3), (8, 4, 0)]
+
+
+def _code_bytes(raw):
+    return struct.pack("<I", len(raw)) + b"".join(struct.pack("<III", *ins) for ins in raw)
+
+
+def test_from_bytes_decodes_columns():
+    segment, offset = CodeSegment.from_bytes(_code_bytes(RAW))
+
+    assert offset == 4 + 12 * len(RAW)
+    assert isinstance(segment.instructions, InstructionArray)
+    assert [tuple(col) for col in instruction_columns(segment.instructions)] == [
+        (39, 1, 7, 8), (4, 8, 0xFFFFFFFF, 4), (0, 0, 3, 0),
+    ]
+    assert segment.instructions == [
+        Instruction(i, *ins) for i, ins in enumerate(RAW)
+    ]
+
+
+def test_truncated_code_segment_raises():
+    with pytest.raises(struct.error):
+        CodeSegment.from_bytes(_code_bytes(RAW)[:-1])
+
+
+def test_views_are_cached_and_indexable():
+    instructions = InstructionArray.from_instructions(
+        [Instruction(i, *ins) for i, ins in enumerate(RAW)]
+    )
+
+    assert instructions[1] is instructions[1]
+    assert instructions[-1].address == 3
+    assert [ins.address for ins in instructions[1:3]] == [1, 2]
+    with pytest.raises(IndexError):
+        instructions[len(RAW)]
+
+
+def test_pickle_keeps_columns_only():
+    instructions = InstructionArray.from_buffer(_code_bytes(RAW), 4, len(RAW))
+    first = instructions[0]
+
+    restored = pickle.loads(pickle.dumps(instructions))
+    assert restored == instructions
+    assert restored[0] == first and restored[0] is not first
+
+
+def test_xcall_matches_same_for_list_and_columns():
+    as_list = [Instruction(i, *ins) for i, ins in enumerate(RAW)]
+    columns = InstructionArray.from_instructions(as_list)
+
+    # arg1 0xFFFFFFFF is -1 as a signed index and must not count as valid
+    assert _count_xcall_matches(as_list, 7, 10) == (0, 1)
+    assert _count_xcall_matches(columns, 1, 10) == (1, 1)
+    assert _count_xcall_matches(columns, 1, 5) == (0, 1)
+    assert _count_xcall_matches(columns, None, 10) == (0, 0)
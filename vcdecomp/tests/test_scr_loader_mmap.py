@@ -0,0 +1,95 @@
+"""
+Unit tests for memory-mapped SCR loading.
+
+Tests SCRFile.load(use_mmap=...) and the zero-copy DataSegment views from
+vcdecomp.core.loader.scr_loader, and that long-lived sessions read files
+instead of mapping them.
+"""
+
+import pickle
+import struct
+from types import SimpleNamespace
+
+import pytest
+
+from vcdecomp.core.ir.decompile_file import _load_scr
+from vcdecomp.core.loader.scr_loader import SCRFile
+from vcdecomp_mcp.session import SCRSession
+
+DATA = b"abc\x00" + struct.pack("<I", 42) + struct.pack("<f", 1.5)
+
+
+def _scr_bytes():
+    header = struct.pack("<IiI", 0, 0, 0)
+    data = struct.pack("<I", len(DATA) // 4) + DATA
+    gptr = struct.pack("<I", 0)
+    code = struct.pack("<I", 1) + struct.pack("<III", 8, 0, 0)
+    xfn = struct.pack("<I", 1) + struct.pack("<7I", 0, 0, 1, 0, 0, 0, 1) + b"Print\x00"
+    save = b"sav_info\x00" + struct.pack("<I", 1) + b"gphase\x00" + struct.pack("<II", 2, 1)
+    return header + data + gptr + code + xfn + save
+
+
+@pytest.fixture
+def scr_path(tmp_path):
+    path = tmp_path / "LEVEL.SCR"
+    path.write_bytes(_scr_bytes())
+    return path
+
+
+def test_mapped_load_matches_read(scr_path):
+    mapped = SCRFile.load(str(scr_path))
+    read = SCRFile.load(str(scr_path), use_mmap=False)
+
+    assert isinstance(mapped.buffer, memoryview)
+    assert isinstance(read.buffer, bytes)
+    assert mapped.raw_data == read.raw_data == _scr_bytes()
+    assert mapped.data_segment.raw_data == DATA
+    assert mapped.data_segment.strings == read.data_segment.strings
+    assert mapped.data_segment.get_string(0) == "abc"
+    assert mapped.xfn_table.entries[0].name == "Print"
+    assert mapped.save_info.items == [{"name": "gphase", "val1": 2, "val2": 1}]
+
+
+def test_data_accessors_read_through_view(scr_path):
+    segment = SCRFile.load(str(scr_path)).data_segment
+
+    assert segment.get_dword(4) == 42
+    assert segment.get_float(8) == 1.5
+    assert segment.get_dword(len(DATA)) == 0
+    assert segment.get_float(len(DATA) - 2) == 0.0
+
+
+def test_pickle_materializes_bytes(scr_path):
+    scr = SCRFile.load(str(scr_path))
+    restored = pickle.loads(pickle.dumps(scr))
+
+    assert isinstance(restored.buffer, bytes)
+    assert isinstance(restored.data_segment.buffer, bytes)
+    assert restored.data_segment.get_dword(4) == 42
+    assert restored.raw_data == scr.raw_data
+
+
+def test_empty_file_falls_back_to_read(tmp_path):
+    path = tmp_path / "EMPTY.SCR"
+    path.write_bytes(b"")
+    # Empty files cannot be mapped; the parser sees (and rejects) an empty buffer
+    with pytest.raises(struct.error):
+        SCRFile.load(str(path))
+
+
+def test_load_scr_honours_use_mmap(scr_path):
+    assert isinstance(_load_scr(scr_path, SimpleNamespace()).buffer, memoryview)
+    assert isinstance(_load_scr(scr_path, SimpleNamespace(use_mmap=False)).buffer, bytes)
+
+
+def test_session_does_not_keep_file_mapped(scr_path, monkeypatch):
+    calls = []
+
+    def fake_load(filename, **kwargs):
+        calls.append(kwargs)
+        raise RuntimeError("stop")
+
+    monkeypatch.setattr(SCRFile, "load", staticmethod(fake_load))
+    with pytest.raises(RuntimeError):
+        SCRSession._load_and_detect(str(scr_path), None)
+    assert calls[0]["use_mmap"] is False
@@ -0,0 +1,113 @@
+"""
+Unit tests for the worklist-driven simplification engine.
+
+Tests InstructionIndex, UseDefChain.replace_instruction and the rule
+mnemonic filtering in vcdecomp.core.ir.simplify_engine.
+"""
+
+from vcdecomp.core.disasm import opcodes
+from vcdecomp.core.ir.cfg import CFG, BasicBlock
+from vcdecomp.core.ir.rules import ALL_RULES
+from vcdecomp.core.ir.simplify_engine import InstructionIndex, SimplificationEngine
+from vcdecomp.core.ir.ssa import SSAFunction, SSAInstruction, SSAValue
+from vcdecomp.core.ir.use_def import UseDefChain
+
+
+def _function(program):
+    """Build a one-block function from (mnemonic, input names) tuples."""
+    cfg = CFG(
+        blocks={0: BasicBlock(block_id=0, start=0, end=100, predecessors=set(), successors=set())},
+        entry_block=0,
+        idom={0: 0},
+        dom_tree={0: []},
+        dom_order=[0],
+    )
+    ssa_func = SSAFunction(cfg=cfg, values={}, instructions={0: []}, scr=None)
+
+    def value(name):
+        if name not in ssa_func.values:
+            metadata = {}
+            if name.startswith("const_"):
+                metadata["constant_value"] = int(name[len("const_"):])
+            ssa_func.values[name] = SSAValue(
+                name=name, value_type=opcodes.ResultType.INT, producer=None, metadata=metadata
+            )
+        return ssa_func.values[name]
+
+    for address, (mnemonic, inputs) in enumerate(program):
+        output = value(f"t{address}")
+        inst = SSAInstruction(
+            block_id=0, mnemonic=mnemonic, address=address,
+            inputs=[value(name) for name in inputs], outputs=[output],
+        )
+        output.producer_inst = inst
+        ssa_func.instructions[0].append(inst)
+    return ssa_func
+
+
+def _in_order(pairs):
+    return [inst for _, inst in sorted(pairs, key=lambda pair: pair[0])]
+
+
+def _chain_snapshot(chains):
+    return (
+        {name: [inst.address for inst in users] for name, users in chains.uses.items() if users},
+        {name: inst.address for name, inst in chains.defs.items()},
+        set(chains.inst_uses),
+        set(chains.inst_defs),
+    )
+
+
+def test_rules_declare_mnemonics_consistent_with_matches():
+    ssa_func = _function([("NOP", ["x", "const_5"])])
+    inst = ssa_func.instructions[0][0]
+    for rule in ALL_RULES:
+        if rule.mnemonics is not None and "NOP" not in rule.mnemonics:
+            assert not rule.matches(inst, ssa_func), rule.name
+
+
+def test_instruction_index_lookup_and_replace():
+    ssa_func = _function([("ADD", ["x", "y"]), ("MUL", ["t0", "y"]), ("ADD", ["t1", "x"])])
+    index = InstructionIndex(ssa_func)
+    first, mul, last = ssa_func.instructions[0]
+
+    assert _in_order(index.instructions(frozenset({"ADD"}))) == [first, last]
+    assert len(list(index.instructions(None))) == 3
+
+    helper = SSAInstruction(block_id=0, mnemonic="SHL", address=1,
+                            inputs=list(mul.inputs), outputs=[ssa_func.values["t0"]])
+    replacement = SSAInstruction(block_id=0, mnemonic="ADD", address=1,
+                                 inputs=list(mul.inputs), outputs=list(mul.outputs))
+    index.replace(mul, [helper, replacement])
+
+    assert ssa_func.instructions[0] == [first, helper, replacement, last]
+    assert index.key(mul) is None
+    assert index.key(first) < index.key(helper) < index.key(replacement) < index.key(last)
+    assert _in_order(index.instructions(frozenset({"ADD"}))) == [first, replacement, last]
+
+
+def test_replace_instruction_matches_rebuild():
+    ssa_func = _function([("ADD", ["x", "y"]), ("MUL", ["x", "t0"]), ("SUB", ["x", "t1"])])
+    chains = UseDefChain(ssa_func)
+    mul = ssa_func.instructions[0][1]
+
+    new = SSAInstruction(block_id=0, mnemonic="SHL", address=1,
+                         inputs=[ssa_func.values["t0"]], outputs=list(mul.outputs))
+    ssa_func.instructions[0][1] = new
+    chains.replace_instruction(mul, [new])
+
+    assert _chain_snapshot(chains) == _chain_snapshot(UseDefChain(ssa_func))
+
+
+def test_fixpoint_stats():
+    ssa_func = _function([("ADD", ["const_5", "x"]), ("MUL", ["const_3", "t0"]), ("SUB", ["t1", "x"])])
+    stats = SimplificationEngine().simplify_to_fixpoint(ssa_func)
+
+    assert stats.total_changes > 0
+    assert stats.match_attempts > 0
+    assert stats.elapsed_seconds >= 0.0
+    assert stats.firings_per_second >= 0.0
+    # Constants were ordered to the right of commutative operations
+    add, mul, _ = ssa_func.instructions[0]
+    assert [v.name for v in add.inputs] == ["x", "const_5"]
+    assert [v.name for v in mul.inputs] == ["t0", "const_3"]
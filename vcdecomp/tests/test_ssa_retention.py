@@ -0,0 +1,94 @@
+"""
+Unit tests for Pass 1 SSA retention (structure-folder --reuse-ssa).
+
+Tests SSARetentionStore and the value-type snapshot helpers from
+vcdecomp.core.ir.ssa_retention.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from vcdecomp.core.ir.ssa_retention import (
+    LiftedSCR,
+    SSARetentionStore,
+    restore_value_types,
+    snapshot_value_types,
+)
+
+
+@dataclass
+class MockValue:
+    name: str
+    value_type: str
+
+
+@dataclass
+class MockInstruction:
+    inputs: List[MockValue] = field(default_factory=list)
+    outputs: List[MockValue] = field(default_factory=list)
+
+
+@dataclass
+class MockSSAFunction:
+    values: Dict[str, MockValue] = field(default_factory=dict)
+    instructions: Dict[int, List[MockInstruction]] = field(default_factory=dict)
+
+
+def _lifted(tag: str) -> LiftedSCR:
+    return LiftedSCR(scr=tag, ssa_func=MockSSAFunction(), heritage_metadata=None,
+                     func_bounds={"func_0000": (0, 10)})
+
+
+def test_value_types_restored_after_write_back():
+    a = MockValue("a", "int")
+    b = MockValue("b", "unknown")  # only reachable through an instruction
+    ssa = MockSSAFunction(values={"a": a}, instructions={0: [MockInstruction([a], [b])]})
+
+    snapshot = snapshot_value_types(ssa)
+    a.value_type = "float"
+    b.value_type = "ptr"
+    restore_value_types(snapshot)
+
+    assert (a.value_type, b.value_type) == ("int", "unknown")
+
+
+def test_resident_files_are_returned_once():
+    store = SSARetentionStore(max_resident=2)
+    first = _lifted("A")
+    store.put("A.SCR", first)
+
+    assert store.take("A.SCR") is first
+    assert store.take("A.SCR") is None
+    assert (store.hit_count, store.miss_count) == (1, 1)
+    store.close()
+
+
+def test_files_over_limit_are_spilled(tmp_path):
+    with SSARetentionStore(max_resident=1, spill_dir=tmp_path) as store:
+        store.put("A.SCR", _lifted("A"))
+        store.put("B.SCR", _lifted("B"))
+
+        assert store.spill_count == 1
+        assert store.spilled_path("B.SCR").exists()
+
+        restored = store.take("B.SCR")
+        assert restored.scr == "B"
+        assert restored.func_bounds == {"func_0000": (0, 10)}
+        assert not list(tmp_path.iterdir())
+
+
+def test_files_over_limit_dropped_without_spill():
+    store = SSARetentionStore(max_resident=0, spill=False)
+    store.put("A.SCR", _lifted("A"))
+
+    assert store.drop_count == 1
+    assert store.take("A.SCR") is None
+
+
+def test_close_removes_owned_spill_dir():
+    store = SSARetentionStore(max_resident=0)
+    store.put("A.SCR", _lifted("A"))
+    spill_dir = store.spill_dir
+
+    store.close()
+    assert not spill_dir.exists()
@@ -12,7 +12,10 @@ from enum import Enum
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
-from ..core.loader.scr_loader import SCRFile, SCRHeader, DataSegment, CodeSegment, XFNTable, Instruction, XFNEntry
+from ..core.loader.scr_loader import (
+    SCRFile, SCRHeader, DataSegment, CodeSegment, XFNTable, Instruction, XFNEntry,
+    instruction_columns,
+)
 
 
 class DifferenceType(Enum):
@@ -185,6 +188,23 @@ class ComparisonResult:
         return result
 
 
+def _differing_addresses(orig_code: CodeSegment, recomp_code: CodeSegment) -> List[int]:
+    """
+    Addresses where two equally long code segments differ in opcode or arguments.
+
+    Compares the columnar instruction storage, so identical segments (the common
+    case) cost three array comparisons instead of one Python call per instruction.
+    """
+    orig_cols = instruction_columns(orig_code.instructions)
+    recomp_cols = instruction_columns(recomp_code.instructions)
+    if orig_cols == recomp_cols:
+        return []
+    return [
+        i for i, (a, b) in enumerate(zip(zip(*orig_cols), zip(*recomp_cols)))
+        if a != b
+    ]
+
+
 class BytecodeComparator:
     """
     Compares two .SCR files at the bytecode level.
@@ -860,8 +880,8 @@ class BytecodeComparator:
             # If counts differ, can't do instruction-by-instruction comparison
             return comparison
 
-        # Compare instructions
-        for i in range(orig_code.code_count):
+        # Compare instructions (only addresses whose columns differ)
+        for i in _differing_addresses(orig_code, recomp_code):
             orig_instr = orig_code.instructions[i]
             recomp_instr = recomp_code.instructions[i]
 
@@ -3,27 +3,42 @@
 import os
 import shutil
 import subprocess
-from typing import Dict, Optional
+from typing import Optional
 from mcp.server.fastmcp import FastMCP
 
+from .pool import DEFAULT_BUDGET_BYTES, SessionPool
 from .session import SCRSession
+from .warmup import WarmSession, WarmupScheduler
 
 mcp = FastMCP(
     "vcdecomp-mcp",
     instructions=(
         "Vietcong .scr bytecode decompiler. Use scr_open to load a file, "
         "then query functions, globals, data, XFNs, and decompile individual functions. "
+        "Analysis continues in the background after scr_open; scr_status shows progress. "
         "Use scr_rename/scr_set_type to mutate analysis — changes propagate on next query."
     ),
 )
 
-_sessions: Dict[str, SCRSession] = {}
+# Background analysis/decompilation workers (VCDECOMP_MCP_WORKERS, default 1)
+_warmup = WarmupScheduler(workers=int(os.environ.get("VCDECOMP_MCP_WORKERS", "1")))
 
+# Analyzed sessions beyond the memory budget (VCDECOMP_MCP_MEMORY_MB) are
+# evicted least recently used first and rebuilt on their next use
+_sessions = SessionPool(budget_bytes=int(
+    float(os.environ.get("VCDECOMP_MCP_MEMORY_MB", DEFAULT_BUDGET_BYTES / (1024 * 1024))) * 1024 * 1024
+))
 
-def _get_session(handle: str) -> SCRSession:
+
+def _get_warm_session(handle: str) -> WarmSession:
     if handle not in _sessions:
         raise ValueError(f"No file loaded with handle '{handle}'. Use scr_open first.")
-    return _sessions[handle]
+    return _sessions.get(handle)
+
+
+def _get_session(handle: str) -> SCRSession:
+    """The analyzed session; waits for background analysis to finish."""
+    return _get_warm_session(handle).session()
 
 
 def _make_handle(path: str) -> str:
@@ -43,28 +58,32 @@ def _make_handle(path: str) -> str:
 
 @mcp.tool()
 def scr_open(path: str) -> dict:
-    """Open and analyze a .scr bytecode file. Runs parsing, SSA construction,
-    and global variable resolution. Returns handle + metadata summary.
+    """Open a .scr bytecode file. Returns handle + metadata summary as soon as
+    the binary is loaded; SSA construction, global variable resolution and
+    decompilation of all functions continue in the background (see scr_status).
+    Other tools wait for the analysis when they need it.
 
     Args:
         path: Absolute or relative path to the .scr file
     """
     handle = _make_handle(path)
-    session = SCRSession.open(path, handle=handle)
-    _sessions[handle] = session
+    binary = SCRSession.load_binary(path)
+    warm = WarmSession(handle, binary, _warmup)
+    _sessions.add(handle, warm)
 
-    scr = session.scr
+    scr = binary.scr
     return {
         "handle": handle,
-        "path": session.path,
+        "path": warm.path,
         "entry_point": scr.header.enter_ip,
         "instruction_count": scr.code_segment.code_count,
-        "function_count": len(session.func_bounds),
+        "function_count": len(binary.func_bounds),
         "xfn_count": scr.xfn_table.xfn_count,
         "data_segment_dwords": scr.data_segment.data_count,
-        "data_segment_bytes": len(scr.data_segment.raw_data),
-        "globals_resolved": len(session.globals_usage),
+        "data_segment_bytes": len(scr.data_segment.buffer),
+        "globals_resolved": len(binary.state["globals_usage"]) if binary.analyzed else None,
         "string_count": len(scr.data_strings),
+        "analysis": warm.status()["state"],
     }
 
 
@@ -76,7 +95,7 @@ def scr_close(handle: str) -> dict:
         handle: Handle returned by scr_open
     """
     if handle in _sessions:
-        del _sessions[handle]
+        _sessions.pop(handle).close()
         return {"status": "ok", "handle": handle}
     return {"status": "not_found", "handle": handle}
 
@@ -88,12 +107,41 @@ def scr_list() -> list:
         {
             "handle": h,
             "path": s.path,
-            "function_count": len(s.func_bounds),
+            "function_count": len(s.binary.func_bounds),
+            "analysis": s.status()["state"],
         }
         for h, s in _sessions.items()
     ]
 
 
+@mcp.tool()
+def scr_status(handle: Optional[str] = None) -> dict:
+    """Background warm-up progress: analysis state and how many functions are
+    already decompiled, per open file.
+
+    Args:
+        handle: Handle returned by scr_open (default: all open files)
+    """
+    if handle is not None:
+        return _get_warm_session(handle).status()
+    return {
+        "queued_tasks": _warmup.queued(),
+        "workers": _warmup.workers,
+        "sessions": [s.status() for s in _sessions.values()],
+    }
+
+
+@mcp.tool()
+def scr_memory() -> dict:
+    """Approximate memory use of the open files against the session memory
+    budget (VCDECOMP_MCP_MEMORY_MB). Files over budget are evicted least
+    recently used first: their analysis is dropped and transparently rebuilt
+    (from the decompilation cache when possible) on their next use, keeping
+    renames, types and comments.
+    """
+    return _sessions.metrics()
+
+
 @mcp.tool()
 def scr_info(handle: str) -> dict:
     """Get detailed file info: header fields, entry point, segment sizes, counts.
@@ -112,7 +160,7 @@ def scr_info(handle: str) -> dict:
         "function_count": len(s.func_bounds),
         "xfn_count": scr.xfn_table.xfn_count,
         "data_segment_dwords": scr.data_segment.data_count,
-        "data_segment_bytes": len(scr.data_segment.raw_data),
+        "data_segment_bytes": len(scr.data_segment.buffer),
         "globals_resolved": len(s.globals_usage),
         "string_count": len(scr.data_strings),
         "has_save_info": scr.save_info is not None,
@@ -150,9 +198,9 @@ def scr_decompile(handle: str, func: str) -> dict:
         handle: Handle returned by scr_open
         func: Function name (as shown by scr_list_funcs)
     """
-    s = _get_session(handle)
+    warm = _get_warm_session(handle)
     try:
-        code = s.decompile_func(func)
+        code = warm.decompile(func)
         return {"func": func, "code": code}
     except ValueError as e:
         return {"error": str(e)}
@@ -0,0 +1,109 @@
+"""Memory-bounded pool of open MCP sessions.
+
+Every open file keeps its handle, path, function list and user annotations.
+The heavy part, the analyzed pipeline state and the decompilation caches,
+counts against a memory budget. When the analyzed sessions exceed it, the
+least recently used ones are evicted (WarmSession.evict) and rebuilt on
+their next access, from the persistent decompilation cache when possible.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from .warmup import WarmSession
+
+# Default memory budget of the analyzed sessions (VCDECOMP_MCP_MEMORY_MB)
+DEFAULT_BUDGET_BYTES = 1024 * 1024 * 1024
+
+
+class SessionPool:
+    """Open sessions by handle, in least-recently-used order."""
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self._sessions: "OrderedDict[str, WarmSession]" = OrderedDict()
+        self._last_access: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, handle: str) -> bool:
+        return handle in self._sessions
+
+    def items(self) -> List[tuple]:
+        with self._lock:
+            return list(self._sessions.items())
+
+    def values(self) -> List[WarmSession]:
+        with self._lock:
+            return list(self._sessions.values())
+
+    def add(self, handle: str, warm: WarmSession) -> None:
+        with self._lock:
+            self._sessions[handle] = warm
+            self._last_access[handle] = time.monotonic()
+        self.enforce_budget(keep=handle)
+
+    def pop(self, handle: str) -> WarmSession:
+        with self._lock:
+            self._last_access.pop(handle, None)
+            return self._sessions.pop(handle)
+
+    def get(self, handle: str) -> WarmSession:
+        """The session for handle, marked as most recently used.
+
+        Raises KeyError for unknown handles.
+        """
+        with self._lock:
+            warm = self._sessions[handle]
+            self._sessions.move_to_end(handle)
+            self._last_access[handle] = time.monotonic()
+        self.enforce_budget(keep=handle)
+        return warm
+
+    def enforce_budget(self, keep: Optional[str] = None) -> List[str]:
+        """Evict least recently used sessions until the pool fits its budget.
+
+        The session keep (the one being accessed) is never evicted.
+        Returns the evicted handles.
+        """
+        footprints = [(handle, warm, warm.footprint()) for handle, warm in self.items()]
+        total = sum(size for _handle, _warm, size in footprints)
+        evicted = []
+        for handle, warm, size in footprints:
+            if total <= self.budget_bytes:
+                break
+            if handle == keep or size == 0:
+                continue
+            if warm.evict():
+                total -= size
+                evicted.append(handle)
+        return evicted
+
+    def metrics(self) -> dict:
+        """Memory use of the pool, per session in least-recently-used order."""
+        from vcdecomp.core.memory_usage import peak_rss_bytes
+
+        now = time.monotonic()
+        sessions = []
+        for handle, warm in self.items():
+            status = warm.status()
+            sessions.append({
+                "handle": handle,
+                "path": warm.path,
+                "state": status["state"],
+                "estimated_bytes": warm.footprint(),
+                "idle_seconds": round(now - self._last_access.get(handle, now), 1),
+                "evictions": warm.evictions,
+                "reloads": warm.reloads,
+            })
+        return {
+            "budget_bytes": self.budget_bytes,
+            "estimated_bytes": sum(s["estimated_bytes"] for s in sessions),
+            "peak_rss_bytes": peak_rss_bytes(),
+            "evictions": sum(s["evictions"] for s in sessions),
+            "reloads": sum(s["reloads"] for s in sessions),
+            "sessions": sessions,
+        }
@@ -0,0 +1,174 @@
+"""Per-function cache of structured output, annotated for cheap re-rendering.
+
+Structuring a function is expensive; applying user renames and type
+overrides to its output is not, as long as the output is kept in a form
+where identifiers can be looked up directly. AnnotatedText splits the
+structured C text once into literal runs and identifier tokens (the words
+the \\b-delimited override regexes used to match). Renames then become a
+dictionary lookup per token, and the identifier indexes of RenderCache
+tell which functions a rename can affect at all.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+# Identifier tokens, i.e. what \bNAME\b matches as a whole
+WORD = re.compile(r'\w+')
+
+# Declaration types the type overrides replace (see SCRSession._apply_overrides)
+BASE_TYPES = frozenset({"int", "float", "dword", "char", "short", "double"})
+
+
+def compose_renames(steps: Iterable[Tuple[str, str]]) -> Dict[str, str]:
+    """Collapse sequential whole-word renames into one token -> name map.
+
+    Applying the result to every identifier token once gives the same text
+    as applying the steps one after another, for identifier-only names.
+    """
+    final: Dict[str, str] = {}
+    for old, new in steps:
+        for token, current in final.items():
+            if current == old:
+                final[token] = new
+        if old not in final:
+            final[old] = new
+    return final
+
+
+def changed_tokens(before: Mapping[str, str], after: Mapping[str, str]) -> Set[str]:
+    """Tokens that two composed rename maps render differently."""
+    return {
+        token for token in set(before) | set(after)
+        if before.get(token, token) != after.get(token, token)
+    }
+
+
+class AnnotatedText:
+    """Structured C text split into literal runs and identifier tokens."""
+
+    __slots__ = ("parts", "symbols")
+
+    def __init__(self, text: str):
+        parts: List[str] = []
+        pos = 0
+        for match in WORD.finditer(text):
+            parts.append(text[pos:match.start()])
+            parts.append(match.group())
+            pos = match.end()
+        parts.append(text[pos:])
+        # Literal runs at even indices, identifiers at odd indices
+        self.parts = parts
+        self.symbols = frozenset(parts[1::2])
+
+    @property
+    def text(self) -> str:
+        return "".join(self.parts)
+
+    def render(self, names: Mapping[str, str], types: Mapping[str, str]) -> str:
+        """Rename identifiers, then retype declarations of the names in types.
+
+        A declaration is a BASE_TYPES word, whitespace and the (renamed)
+        variable name; the whitespace becomes a single space.
+        """
+        out = list(self.parts)
+        if names:
+            for i in range(1, len(out), 2):
+                name = names.get(out[i])
+                if name is not None:
+                    out[i] = name
+        if types:
+            for i in range(3, len(out), 2):
+                new_type = types.get(out[i])
+                if new_type is not None and out[i - 2] in BASE_TYPES and out[i - 1].isspace():
+                    out[i - 2] = new_type
+                    out[i - 1] = " "
+        return "".join(out)
+
+
+class RenderCache:
+    """Structured and rendered text per function, keyed by function start.
+
+    Identifier indexes map each identifier to the functions whose
+    structured (resp. rendered) text contains it, so invalidation after a
+    rename or type override touches only the functions involved.
+    """
+
+    def __init__(self):
+        self._structured: Dict[int, AnnotatedText] = {}
+        self._rendered: Dict[int, Tuple[str, frozenset]] = {}
+        self._structured_index: Dict[str, Set[int]] = {}
+        self._rendered_index: Dict[str, Set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._rendered)
+
+    def structured(self, start: int) -> Optional[AnnotatedText]:
+        return self._structured.get(start)
+
+    def structured_starts(self) -> List[int]:
+        """Functions with a cached structured form."""
+        return list(self._structured)
+
+    def rendered(self, start: int) -> Optional[str]:
+        entry = self._rendered.get(start)
+        return entry[0] if entry is not None else None
+
+    def put_structured(self, start: int, annotated: AnnotatedText) -> None:
+        self.invalidate_structured([start])
+        self._structured[start] = annotated
+        for symbol in annotated.symbols:
+            self._structured_index.setdefault(symbol, set()).add(start)
+
+    def put_rendered(self, start: int, text: str) -> None:
+        self.invalidate_rendered([start])
+        symbols = frozenset(WORD.findall(text))
+        self._rendered[start] = (text, symbols)
+        for symbol in symbols:
+            self._rendered_index.setdefault(symbol, set()).add(start)
+
+    def structured_users(self, symbols: Iterable[str]) -> Set[int]:
+        """Functions whose structured text contains any of symbols."""
+        starts: Set[int] = set()
+        for symbol in symbols:
+            starts |= self._structured_index.get(symbol, set())
+        return starts
+
+    def rendered_users(self, symbols: Iterable[str]) -> Set[int]:
+        """Functions whose rendered text contains any of symbols."""
+        starts: Set[int] = set()
+        for symbol in symbols:
+            starts |= self._rendered_index.get(symbol, set())
+        return starts
+
+    def invalidate_rendered(self, starts: Iterable[int]) -> None:
+        """Forget rendered text; the structured form is kept for re-rendering."""
+        for start in list(starts):
+            entry = self._rendered.pop(start, None)
+            if entry is not None:
+                _unindex(self._rendered_index, entry[1], start)
+
+    def invalidate_structured(self, starts: Iterable[int]) -> None:
+        """Forget everything about the functions; they will be re-structured."""
+        starts = list(starts)
+        self.invalidate_rendered(starts)
+        for start in starts:
+            annotated = self._structured.pop(start, None)
+            if annotated is not None:
+                _unindex(self._structured_index, annotated.symbols, start)
+
+    def clear(self) -> None:
+        self._structured.clear()
+        self._rendered.clear()
+        self._structured_index.clear()
+        self._rendered_index.clear()
+
+
+def _unindex(index: Dict[str, Set[int]], symbols: Iterable[str], start: int) -> None:
+    for symbol in symbols:
+        users = index.get(symbol)
+        if users is not None:
+            users.discard(start)
+            if not users:
+                del index[symbol]
@@ -6,10 +6,29 @@ import json
 import os
 import re
 import struct
+import threading
 from argparse import Namespace
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import wraps
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .render_cache import BASE_TYPES, AnnotatedText, RenderCache, changed_tokens, compose_renames
+from .xrefs import XrefIndex
+
+
+# Pipeline state artifact in the persistent decompilation cache
+_SESSION_CACHE_ARTIFACT = "session.pickle"
+
+# Approximate heap cost per bytecode instruction, measured with tracemalloc
+# on mission scripts: pipeline state after analysis, and the extra state a
+# decompiled function keeps (structuring caches, rendered text)
+_ANALYSIS_BYTES_PER_INSTRUCTION = 1700
+_DECOMPILE_BYTES_PER_INSTRUCTION = 1300
+
+# Names the token-level override pass handles exactly (see _render)
+_IDENTIFIER = re.compile(r'\w+')
 
 
 def _default_args() -> Namespace:
@@ -31,6 +50,114 @@ def _default_args() -> Namespace:
     )
 
 
+def _locked(method):
+    """Run a session method under the session lock (see SCRSession._lock)."""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class _MissionHeader:
+    """The mission header applied to the process-wide header database.
+
+    The header database and the constant tables derived from it are shared
+    by all sessions. Work that reads them (analysis, decompilation) runs in
+    use(header_path): any number of threads may share the loaded header,
+    while switching to another one waits until they have all left, and
+    holds back new users of the old header meanwhile.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._path: Optional[Path] = None
+        self._users = 0
+        self._switches = 0  # threads waiting to load another header
+        self._local = threading.local()  # per-thread nesting depth
+
+    @property
+    def path(self) -> Optional[Path]:
+        return self._path
+
+    @contextmanager
+    def use(self, header_path: Optional[Path]):
+        """Run the block with header_path loaded (None: any header will do)."""
+        if getattr(self._local, "depth", 0):
+            # Nested in a use() of this thread, which holds its header already
+            self._local.depth += 1
+            try:
+                yield
+            finally:
+                self._local.depth -= 1
+            return
+
+        with self._cond:
+            waiting = False
+            try:
+                while True:
+                    if header_path is None or header_path == self._path:
+                        if self._switches == int(waiting):
+                            break
+                    elif not self._users:
+                        self._load(header_path)
+                        break
+                    elif not waiting:
+                        waiting = True
+                        self._switches += 1
+                    self._cond.wait()
+            finally:
+                if waiting:
+                    self._switches -= 1
+                    self._cond.notify_all()
+            self._users += 1
+        self._local.depth = 1
+        try:
+            yield
+        finally:
+            self._local.depth = 0
+            with self._cond:
+                self._users -= 1
+                if not self._users:
+                    self._cond.notify_all()
+
+    def _load(self, header_path: Path) -> None:
+        from vcdecomp.core.headers.database import get_header_database
+        from vcdecomp.core.constants import _reset_constants
+
+        self._path = None  # Unknown if loading fails halfway
+        get_header_database().load_mission_header(header_path)
+        _reset_constants()
+        self._path = header_path
+
+
+_mission_header = _MissionHeader()
+
+
+@dataclass
+class LoadedBinary:
+    """A loaded .scr file awaiting analysis (see SCRSession.load_binary)."""
+
+    path: str
+    state: Dict[str, Any]  # SCRSession pipeline fields computed so far
+    cache: Optional[object] = None  # DecompilationCache
+    cache_key: Optional[str] = None
+    header_path: Optional[Path] = None  # mission header, see _MissionHeader
+
+    @property
+    def analyzed(self) -> bool:
+        """True if the state came complete from the persistent cache."""
+        return "ssa_func" in self.state
+
+    @property
+    def scr(self):
+        return self.state["scr"]
+
+    @property
+    def func_bounds(self) -> Dict[str, Tuple[int, int]]:
+        return self.state["func_bounds"]
+
+
 @dataclass
 class SCRSession:
     """Holds all cached pipeline state for an open .scr file."""
@@ -46,9 +173,16 @@ class SCRSession:
     float_globals: Set[int]
     array_strides: Dict[int, Set[int]]
     saveinfo_sizes: Dict[int, int] = field(default_factory=dict)
+    header_path: Optional[Path] = None  # mission header the state was built with
 
     # Lazy caches (invalidated on mutation)
-    _decompiled: Dict[str, str] = field(default_factory=dict)
+    _render_cache: RenderCache = field(default_factory=RenderCache, repr=False, compare=False)
+    _renames: Optional[Dict[str, str]] = None  # global + function renames, composed
+    _xrefs: Optional[XrefIndex] = None  # updated in place on rename
+
+    # Serializes use of the pipeline state between the request thread and
+    # background decompilation (see warmup.py); reentrant for nested calls
+    _lock: threading.RLock = field(default_factory=threading.RLock, repr=False, compare=False)
 
     # User overrides
     func_renames: Dict[str, str] = field(default_factory=dict)
@@ -58,21 +192,94 @@ class SCRSession:
     comments: Dict[int, str] = field(default_factory=dict)
 
     @classmethod
-    def open(cls, path: str, handle: str = "") -> 'SCRSession':
-        """Run the cheap part of the pipeline and cache everything."""
-        from vcdecomp.core.loader import SCRFile
-        from vcdecomp.core.disasm import Disassembler
-        from vcdecomp.core.ir.ssa import build_ssa_incremental
-        from vcdecomp.core.ir.global_resolver import GlobalResolver
-        from vcdecomp.core.ir.decompile_file import (
-            _detect_float_globals, _detect_array_strides, resolve_mission_header,
-        )
+    def open(cls, path: str, handle: str = "", use_cache: bool = True) -> 'SCRSession':
+        """Run the cheap part of the pipeline and cache everything.
+
+        Unless use_cache is False, the pipeline state is also kept in the
+        persistent decompilation cache, so reopening an unchanged file (with an
+        unchanged mission header) skips SSA construction and global analysis.
+        """
+        return cls.from_binary(cls.load_binary(path, use_cache=use_cache), handle=handle)
+
+    @classmethod
+    def load_binary(cls, path: str, use_cache: bool = True) -> 'LoadedBinary':
+        """First stage of open(): load the file and detect its functions.
+
+        On a persistent cache hit the returned binary already carries the
+        complete pipeline state, so from_binary() has nothing left to compute.
+        The mission header is only matched against the detected functions
+        here; the shared header database is left alone until analysis.
+        """
+        from vcdecomp.core.ir.decompile_cache import get_decompile_cache
+        from vcdecomp.core.ir.decompile_file import resolve_mission_header
         from vcdecomp.core.ir.debug_output import set_debug_enabled
 
         set_debug_enabled(False)
 
+        # Mission header auto-detection
+        scr_dir = Path(path).parent
+        header_path = resolve_mission_header(scr_dir)
+
+        cache = get_decompile_cache() if use_cache else None
+        cache_key = None
+        state = None
+        if cache is not None:
+            cache_key = cache.make_key(
+                path, _default_args(), header_path, extra={"artifact": "mcp-session"}
+            )
+            state = cache.get_object(cache_key, _SESSION_CACHE_ARTIFACT)
+
+        if state is None:
+            state = cls._load_and_detect(path, header_path)
+
+        return LoadedBinary(
+            path=str(path), state=state, cache=cache, cache_key=cache_key,
+            header_path=header_path,
+        )
+
+    @classmethod
+    def from_binary(cls, binary: 'LoadedBinary', handle: str = "",
+                    annotations: Optional[Dict[str, dict]] = None) -> 'SCRSession':
+        """Second stage of open(): lift and analyze a loaded binary into a session.
+
+        annotations (see annotations()) replace the ones persisted in the
+        .vcdb sidecar, e.g. when rebuilding an evicted session.
+        """
+        state = binary.state
+        if not binary.analyzed:
+            # No other header can be loaded until the state is cached
+            with _mission_header.use(binary.header_path):
+                state.update(cls._analyze(state["scr"]))
+                if binary.cache is not None:
+                    # Pickled now, before user annotations mutate the state
+                    binary.cache.put_object(binary.cache_key, _SESSION_CACHE_ARTIFACT, state)
+
+        if not handle:
+            handle = _make_handle_from_path(binary.path)
+
+        session = cls(handle=handle, path=binary.path, header_path=binary.header_path, **state)
+
+        if annotations is not None:
+            session.restore_annotations(annotations)
+        else:
+            # Load persisted annotations from .vcdb sidecar if it exists
+            session.load_session()
+
+        # Index xrefs once, after persisted renames are applied
+        session._xref_index()
+
+        return session
+
+    @staticmethod
+    def _load_and_detect(path: str, header_path: Optional[Path]) -> dict:
+        """Load the file, detect functions and match them to the mission header."""
+        from vcdecomp.core.loader import SCRFile
+        from vcdecomp.core.disasm import Disassembler
+
         # Load binary
-        scr = SCRFile.load(str(path), variant='auto')
+        # Sessions live long: read the file instead of keeping it mapped,
+        # so it can be rewritten (recompiled) while the session is open
+        scr = SCRFile.load(str(path), variant='auto', use_mmap=False)
         scr.enable_simplify = True
         scr.debug_simplify = False
         scr.enable_array_detection = True
@@ -84,20 +291,14 @@ class SCRSession:
         disasm = Disassembler(scr)
         func_bounds = disasm.get_function_boundaries_v2()
 
-        # Mission header auto-detection
-        scr_dir = Path(path).parent
-        header_path = resolve_mission_header(scr_dir)
+        # Mission header
         if header_path:
-            from vcdecomp.core.headers.database import get_header_database
-            from vcdecomp.core.constants import _reset_constants
-            hdb = get_header_database()
-            hdb.load_mission_header(header_path)
-            _reset_constants()
-
+            from vcdecomp.core.headers.database import parse_mission_header
             from vcdecomp.core.ir.function_detector import match_header_functions
             header_source = header_path.read_text(encoding='latin-1')
             rename_map = match_header_functions(
-                scr, func_bounds, hdb.mission_functions, header_source
+                scr, func_bounds, parse_mission_header(header_path).get('functions', {}),
+                header_source
             )
             scr._header_function_signatures = {}
             for old_name, new_info in rename_map.items():
@@ -105,6 +306,17 @@ class SCRSession:
                 if old_name in func_bounds:
                     func_bounds[new_info['name']] = func_bounds.pop(old_name)
 
+        return {"scr": scr, "disasm": disasm, "func_bounds": func_bounds}
+
+    @staticmethod
+    def _analyze(scr) -> dict:
+        """Lift and analyze a loaded file; returns the remaining pipeline fields."""
+        from vcdecomp.core.ir.ssa import build_ssa_incremental
+        from vcdecomp.core.ir.global_resolver import GlobalResolver
+        from vcdecomp.core.ir.decompile_file import (
+            _detect_float_globals, _detect_array_strides,
+        )
+
         # Build SSA
         ssa_func, heritage_metadata = build_ssa_incremental(scr, return_metadata=True)
 
@@ -125,28 +337,16 @@ class SCRSession:
                 size_dwords = item['val2']
                 saveinfo_sizes[byte_offset] = size_dwords
 
-        if not handle:
-            handle = _make_handle_from_path(path)
-
-        session = cls(
-            handle=handle,
-            path=str(path),
-            scr=scr,
-            disasm=disasm,
-            func_bounds=func_bounds,
-            ssa_func=ssa_func,
-            heritage_metadata=heritage_metadata,
-            globals_usage=globals_usage,
-            float_globals=float_globals,
-            array_strides=array_strides,
-            saveinfo_sizes=saveinfo_sizes,
-        )
-
-        # Load persisted annotations from .vcdb sidecar if it exists
-        session.load_session()
-
-        return session
+        return {
+            "ssa_func": ssa_func,
+            "heritage_metadata": heritage_metadata,
+            "globals_usage": globals_usage,
+            "float_globals": float_globals,
+            "array_strides": array_strides,
+            "saveinfo_sizes": saveinfo_sizes,
+        }
 
+    @_locked
     def decompile_func(self, func_name: str) -> str:
         """Decompile a single function, with caching and override application."""
         # Resolve renamed functions
@@ -162,28 +362,32 @@ class SCRSession:
                 raise ValueError(f"Function '{func_name}' not found")
             actual_name = func_name
 
-        cache_key = func_name
-        if cache_key in self._decompiled:
-            return self._decompiled[cache_key]
-
-        from vcdecomp.core.ir.structure import format_structured_function_named
-
         func_start, func_end = self.func_bounds[actual_name]
-        text = format_structured_function_named(
-            self.ssa_func,
-            actual_name,
-            func_start,
-            func_end,
-            function_bounds=self.func_bounds,
-            style='quiet',
-            heritage_metadata=self.heritage_metadata,
-            use_collapse=True,
-        )
+        text = self._render_cache.rendered(func_start)
+        if text is not None:
+            return text
+
+        annotated = self._render_cache.structured(func_start)
+        if annotated is None:
+            from vcdecomp.core.ir.structure import format_structured_function_named
+
+            with _mission_header.use(self.header_path):
+                annotated = AnnotatedText(format_structured_function_named(
+                    self.ssa_func,
+                    actual_name,
+                    func_start,
+                    func_end,
+                    function_bounds=self.func_bounds,
+                    style='quiet',
+                    heritage_metadata=self.heritage_metadata,
+                    use_collapse=True,
+                ))
+            self._render_cache.put_structured(func_start, annotated)
 
         # Apply overrides
-        text = self._apply_overrides(text, actual_name)
+        text = self._render(annotated, actual_name)
 
-        self._decompiled[cache_key] = text
+        self._render_cache.put_rendered(func_start, text)
         return text
 
     def get_disasm_func(self, func_name: str) -> str:
@@ -241,6 +445,7 @@ class SCRSession:
             strings.append({"offset": offset, "value": s})
         return strings
 
+    @_locked
     def get_globals_list(self, filter_pattern: str = "") -> List[dict]:
         """Get resolved global variables."""
         results = []
@@ -285,33 +490,29 @@ class SCRSession:
             results.append(info)
         return results
 
+    @_locked
     def rename(self, target_type: str, old_name: str, new_name: str,
                func_context: str = "") -> dict:
         """Rename a function, global, or local variable."""
         if target_type == "function":
             if old_name not in self.func_bounds:
                 return {"error": f"Function '{old_name}' not found"}
+            renames_before = self._shared_renames()
             self.func_renames[old_name] = new_name
             # Update func_bounds key
             self.func_bounds[new_name] = self.func_bounds.pop(old_name)
-            self._decompiled.clear()
-            # Invalidate block-to-func cache
-            if hasattr(self, '_block_to_func_cache'):
-                del self._block_to_func_cache
+            self._xref_index().rename_function(self.func_bounds[new_name][0], old_name, new_name)
+            self._invalidate_renamed(renames_before)
             self._auto_save()
             return {"status": "ok", "old": old_name, "new": new_name}
         elif target_type == "global":
-            # Find by name
-            offset = None
-            for off, usage in self.globals_usage.items():
-                current_name = self.global_renames.get(off, usage.name)
-                if current_name == old_name:
-                    offset = off
-                    break
+            offset = self._xref_index().global_offset(old_name)
             if offset is None:
                 return {"error": f"Global '{old_name}' not found"}
+            renames_before = self._shared_renames()
             self.global_renames[offset] = new_name
-            self._decompiled.clear()
+            self._xref_index().rename_global(offset, old_name, new_name)
+            self._invalidate_renamed(renames_before)
             self._auto_save()
             return {"status": "ok", "old": old_name, "new": new_name, "offset": offset}
         elif target_type == "local":
@@ -320,11 +521,12 @@ class SCRSession:
             if func_context not in self.local_renames:
                 self.local_renames[func_context] = {}
             self.local_renames[func_context][old_name] = new_name
-            self._decompiled.pop(func_context, None)
+            self._invalidate_rendered_function(func_context)
             self._auto_save()
             return {"status": "ok", "func": func_context, "old": old_name, "new": new_name}
         return {"error": f"Unknown target_type '{target_type}'"}
 
+    @_locked
     def set_type(self, target: str, new_type: str) -> dict:
         """Override type of a global or local variable.
 
@@ -335,115 +537,74 @@ class SCRSession:
         if target.startswith("local:"):
             parts = target.split(":", 2)
             if len(parts) >= 2:
-                self._decompiled.pop(parts[1], None)
-        else:
+                self._invalidate_rendered_function(parts[1])
+        elif target.startswith("global:"):
             # Patch GlobalUsage so decompiler sees the new type
             self._apply_type_overrides_to_globals()
-            self._decompiled.clear()
+            self._invalidate_global_type(target[7:])
         self._auto_save()
         return {"status": "ok", "target": target, "type": new_type}
 
+    @_locked
     def get_xrefs_to(self, target: str) -> List[dict]:
         """Find all references to a global, function, or XFN.
 
-        target: global name, function name, or "xfn:<name>"
+        target: global name, function name, or "xfn:<name>" (substring match)
         """
-        results = []
-        is_xfn = target.startswith("xfn:")
-        xfn_name = target[4:] if is_xfn else None
-
-        # Find target offset for globals
-        target_offset = None
-        if not is_xfn and target not in self.func_bounds:
-            for off, usage in self.globals_usage.items():
-                name = self.global_renames.get(off, usage.name)
-                if name == target:
-                    target_offset = off
-                    break
-
-        # Build block_id -> func_name mapping
-        block_to_func = self._build_block_to_func_map()
-
-        for block_id, instrs in self.ssa_func.instructions.items():
-            func_name = block_to_func.get(block_id)
-            if not func_name:
-                continue
-            for inst in instrs:
-                matched = False
-                if is_xfn and inst.mnemonic == "XCALL":
-                    if inst.instruction and inst.instruction.instruction:
-                        xfn_idx = inst.instruction.instruction.arg1
-                        xfn_entry = self.scr.get_xfn(xfn_idx)
-                        if xfn_entry:
-                            entry_name = xfn_entry.name.split("(")[0]
-                            if xfn_name == entry_name or xfn_name in entry_name:
-                                matched = True
-                elif target in self.func_bounds and inst.mnemonic == "CALL":
-                    if inst.instruction and inst.instruction.instruction:
-                        call_target = inst.instruction.instruction.arg1
-                        if call_target == self.func_bounds[target][0]:
-                            matched = True
-                elif target_offset is not None:
-                    for val in list(inst.inputs) + list(inst.outputs):
-                        if val.alias:
-                            if val.alias == f"data_{target_offset // 4}":
-                                matched = True
-                                break
-                            if val.alias == f"&data_{target_offset // 4}":
-                                matched = True
-                                break
-                if matched:
-                    results.append({
-                        "func": func_name,
-                        "addr": inst.address,
-                        "mnemonic": inst.mnemonic,
-                    })
-        return results
-
+        xrefs = self._xref_index()
+        if target.startswith("xfn:"):
+            return xrefs.xcalls_to(target[4:])
+        if target in self.func_bounds:
+            return xrefs.calls_to(self.func_bounds[target][0])
+        target_offset = xrefs.global_offset(target)
+        if target_offset is None:
+            return []
+        return xrefs.global_refs(target_offset)
+
+    @_locked
     def get_callees(self, func_name: str) -> dict:
         """List functions/XFNs called by a function."""
         actual_name = self._resolve_func_name(func_name)
         if actual_name not in self.func_bounds:
             raise ValueError(f"Function '{func_name}' not found")
 
-        block_to_func = self._build_block_to_func_map()
-        calls = []
-        xcalls = []
-
-        for block_id, instrs in self.ssa_func.instructions.items():
-            if block_to_func.get(block_id) != actual_name:
-                continue
-            for inst in instrs:
-                if inst.mnemonic == "CALL" and inst.instruction and inst.instruction.instruction:
-                    target_addr = inst.instruction.instruction.arg1
-                    # Find function name by address
-                    for fn, (fs, _fe) in self.func_bounds.items():
-                        if fs == target_addr:
-                            calls.append(fn)
-                            break
-                elif inst.mnemonic == "XCALL" and inst.instruction and inst.instruction.instruction:
-                    xfn_idx = inst.instruction.instruction.arg1
-                    xfn_entry = self.scr.get_xfn(xfn_idx)
-                    if xfn_entry:
-                        # Extract just the function name (before the '(' signature)
-                        xfn_name = xfn_entry.name.split("(")[0]
-                        xcalls.append(xfn_name)
-
-        return {"calls": sorted(set(calls)), "xcalls": sorted(set(xcalls))}
+        calls, xcalls = self._xref_index().callees(self.func_bounds[actual_name][0])
+        return {"calls": calls, "xcalls": xcalls}
+
+    @_locked
+    def functions_by_centrality(self) -> List[str]:
+        """Function names, most-called first (ties in address order)."""
+        xrefs = self._xref_index()
+        return [
+            name for name, (start, _end) in sorted(
+                self.func_bounds.items(),
+                key=lambda item: (-xrefs.caller_count(item[1][0]), item[1][0]),
+            )
+        ]
+
+    @_locked
+    def memory_footprint(self) -> int:
+        """Approximate bytes held by the pipeline state and decompilation caches."""
+        ends = {start: end for start, end in self.func_bounds.values()}
+        decompiled = sum(
+            ends[start] - start + 1 for start in self._render_cache.structured_starts()
+            if start in ends
+        )
+        return (self.scr.code_segment.code_count * _ANALYSIS_BYTES_PER_INSTRUCTION
+                + decompiled * _DECOMPILE_BYTES_PER_INSTRUCTION)
 
+    @_locked
     def get_basic_blocks(self, func_name: str) -> List[dict]:
         """Get CFG basic blocks for a function."""
         actual_name = self._resolve_func_name(func_name)
         if actual_name not in self.func_bounds:
             raise ValueError(f"Function '{func_name}' not found")
 
-        block_to_func = self._build_block_to_func_map()
-        blocks = []
         cfg = self.ssa_func.cfg
+        blocks = []
 
-        for block_id, block in cfg.blocks.items():
-            if block_to_func.get(block_id) != actual_name:
-                continue
+        for block_id in self._function_view(actual_name).block_ids:
+            block = cfg.blocks[block_id]
             blocks.append({
                 "id": block.start,
                 "start": block.start,
@@ -498,6 +659,7 @@ class SCRSession:
 
         return results
 
+    @_locked
     def get_callgraph(self, root_funcs: Optional[List[str]] = None,
                       max_depth: int = 10) -> dict:
         """Build recursive call graph from root functions."""
@@ -580,21 +742,18 @@ class SCRSession:
             "fields": fields,
         }
 
+    @_locked
     def get_ssa_form(self, func_name: str) -> dict:
         """View SSA form for a function."""
         actual_name = self._resolve_func_name(func_name)
         if actual_name not in self.func_bounds:
             raise ValueError(f"Function '{func_name}' not found")
 
-        block_to_func = self._build_block_to_func_map()
         cfg = self.ssa_func.cfg
         blocks = []
 
-        for block_id in sorted(self.ssa_func.instructions.keys()):
-            if block_to_func.get(block_id) != actual_name:
-                continue
+        for block_id, instrs in sorted(self._function_view(actual_name).blocks, key=lambda item: item[0]):
             block = cfg.blocks.get(block_id)
-            instrs = self.ssa_func.instructions[block_id]
             formatted_instrs = []
             for inst in instrs:
                 inputs = []
@@ -619,39 +778,36 @@ class SCRSession:
 
         return {"func": func_name, "block_count": len(blocks), "blocks": blocks}
 
+    @_locked
     def get_stack_frame(self, func_name: str) -> dict:
         """View stack frame layout for a function."""
         actual_name = self._resolve_func_name(func_name)
         if actual_name not in self.func_bounds:
             raise ValueError(f"Function '{func_name}' not found")
 
-        block_to_func = self._build_block_to_func_map()
         frame_accesses: Dict[int, dict] = {}  # offset -> info
 
-        for block_id, instrs in self.ssa_func.instructions.items():
-            if block_to_func.get(block_id) != actual_name:
+        for inst in self._function_view(actual_name).instructions():
+            if inst.mnemonic not in ("LCP", "SSP", "LADR"):
                 continue
-            for inst in instrs:
-                if inst.mnemonic not in ("LCP", "SSP", "LADR"):
-                    continue
-                if not inst.instruction or not inst.instruction.instruction:
-                    continue
-                offset = inst.instruction.instruction.arg1
-                if offset not in frame_accesses:
-                    frame_accesses[offset] = {
-                        "offset": offset,
-                        "reads": 0,
-                        "writes": 0,
-                        "alias": None,
-                    }
-                if inst.mnemonic in ("LCP", "LADR"):
-                    frame_accesses[offset]["reads"] += 1
-                elif inst.mnemonic == "SSP":
-                    frame_accesses[offset]["writes"] += 1
-                # Capture alias from outputs/inputs
-                for v in inst.outputs:
-                    if v and v.alias:
-                        frame_accesses[offset]["alias"] = v.alias
+            if not inst.instruction or not inst.instruction.instruction:
+                continue
+            offset = inst.instruction.instruction.arg1
+            if offset not in frame_accesses:
+                frame_accesses[offset] = {
+                    "offset": offset,
+                    "reads": 0,
+                    "writes": 0,
+                    "alias": None,
+                }
+            if inst.mnemonic in ("LCP", "LADR"):
+                frame_accesses[offset]["reads"] += 1
+            elif inst.mnemonic == "SSP":
+                frame_accesses[offset]["writes"] += 1
+            # Capture alias from outputs/inputs
+            for v in inst.outputs:
+                if v and v.alias:
+                    frame_accesses[offset]["alias"] = v.alias
 
         # Separate params (negative offsets or first N slots) from locals
         params = []
@@ -673,27 +829,24 @@ class SCRSession:
 
     # --- Private helpers ---
 
-    def _build_block_to_func_map(self) -> Dict[int, str]:
-        """Map CFG block IDs to function names using block start addresses."""
-        if hasattr(self, '_block_to_func_cache'):
-            return self._block_to_func_cache
-        import bisect
-        # Build sorted list of (func_start, func_end, func_name) for bisect lookup
-        sorted_funcs = sorted(
-            [(fstart, fend, fname) for fname, (fstart, fend) in self.func_bounds.items()]
-        )
-        starts = [f[0] for f in sorted_funcs]
+    def _xref_index(self) -> XrefIndex:
+        """The session's xref index, built on first use."""
+        if self._xrefs is None:
+            self._xrefs = XrefIndex(
+                self.ssa_func,
+                self.func_bounds,
+                self.scr,
+                [(off, self.global_renames.get(off, usage.name))
+                 for off, usage in self.globals_usage.items()],
+            )
+        return self._xrefs
 
-        cfg = self.ssa_func.cfg
-        result = {}
-        for block_id, block in cfg.blocks.items():
-            idx = bisect.bisect_right(starts, block.start) - 1
-            if idx >= 0:
-                fstart, fend, fname = sorted_funcs[idx]
-                if fstart <= block.start <= fend:
-                    result[block_id] = fname
-        self._block_to_func_cache = result
-        return result
+    def _function_view(self, func_name: str):
+        """The SSA blocks of a function (FunctionView of the shared partition)."""
+        from vcdecomp.core.ir.analysis_context import get_analysis_context
+
+        views = get_analysis_context(self.ssa_func).function_views(self.func_bounds)
+        return views[self.func_bounds[func_name][0]]
 
     # ── Session persistence (.vcdb sidecar) ──────────────────────────
 
@@ -702,13 +855,14 @@ class SCRSession:
 
     def save_session(self) -> str:
         """Persist user annotations to .vcdb sidecar file."""
+        annotations = self.annotations()
         data = {
             "version": 1,
-            "func_renames": self.func_renames,
-            "global_renames": {str(k): v for k, v in self.global_renames.items()},
-            "local_renames": self.local_renames,
-            "type_overrides": self.type_overrides,
-            "comments": {str(k): v for k, v in self.comments.items()},
+            "func_renames": annotations["func_renames"],
+            "global_renames": {str(k): v for k, v in annotations["global_renames"].items()},
+            "local_renames": annotations["local_renames"],
+            "type_overrides": annotations["type_overrides"],
+            "comments": {str(k): v for k, v in annotations["comments"].items()},
         }
         p = self._vcdb_path()
         p.write_text(json.dumps(data, indent=2), encoding='utf-8')
@@ -724,11 +878,33 @@ class SCRSession:
         except (json.JSONDecodeError, OSError):
             return
 
-        self.func_renames = data.get("func_renames", {})
-        self.global_renames = {int(k): v for k, v in data.get("global_renames", {}).items()}
-        self.local_renames = data.get("local_renames", {})
-        self.type_overrides = data.get("type_overrides", {})
-        self.comments = {int(k): v for k, v in data.get("comments", {}).items()}
+        self.restore_annotations({
+            "func_renames": data.get("func_renames", {}),
+            "global_renames": {int(k): v for k, v in data.get("global_renames", {}).items()},
+            "local_renames": data.get("local_renames", {}),
+            "type_overrides": data.get("type_overrides", {}),
+            "comments": {int(k): v for k, v in data.get("comments", {}).items()},
+        })
+
+    def annotations(self) -> Dict[str, dict]:
+        """The user annotations (live dicts, not copies)."""
+        return {
+            "func_renames": self.func_renames,
+            "global_renames": self.global_renames,
+            "local_renames": self.local_renames,
+            "type_overrides": self.type_overrides,
+            "comments": self.comments,
+        }
+
+    def restore_annotations(self, annotations: Dict[str, dict]):
+        """Adopt user annotations, e.g. from a session whose state was evicted."""
+        self.func_renames = annotations["func_renames"]
+        self.global_renames = annotations["global_renames"]
+        self.local_renames = annotations["local_renames"]
+        self.type_overrides = annotations["type_overrides"]
+        self.comments = annotations["comments"]
+        self._renames = None
+        self._render_cache.clear()
 
         # Apply function renames to func_bounds
         for old, new in self.func_renames.items():
@@ -798,6 +974,105 @@ class SCRSession:
             return list(usage.possible_types)[0]
         return "dword"
 
+    def _rename_steps(self) -> List[Tuple[str, str]]:
+        """Global and function renames, in the order _apply_overrides applies them."""
+        steps = []
+        for offset, new_name in self.global_renames.items():
+            usage = self.globals_usage.get(offset)
+            if usage and usage.name:
+                steps.append((usage.name, new_name))
+        steps.extend(self.func_renames.items())
+        return steps
+
+    def _shared_renames(self) -> Dict[str, str]:
+        """Global and function renames composed into one token -> name map."""
+        if self._renames is None:
+            self._renames = compose_renames(self._rename_steps())
+        return self._renames
+
+    def _render(self, annotated: AnnotatedText, func_name: str) -> str:
+        """Apply user renames and type overrides to a structured function.
+
+        Token-level equivalent of _apply_overrides, which remains the path for
+        names the token pass cannot reproduce (non-identifiers, overlapping
+        type overrides).
+        """
+        local_steps = list(self.local_renames.get(func_name, {}).items())
+        types = self._declaration_types(func_name)
+        if types is None or not all(
+            _IDENTIFIER.fullmatch(name)
+            for step in self._rename_steps() + local_steps for name in step
+        ):
+            return self._apply_overrides(annotated.text, func_name)
+
+        names = self._shared_renames()
+        if local_steps:
+            names = compose_renames(list(names.items()) + local_steps)
+        return annotated.render(names, types)
+
+    def _declaration_types(self, func_name: str) -> Optional[Dict[str, str]]:
+        """Displayed variable name -> overriding type, for one function.
+
+        None when the overrides interact (same variable twice, a type that is
+        itself an overridden name), which only the sequential regexes model.
+        """
+        display_names: Dict[str, str] = {}
+        for offset, new_name in self.global_renames.items():
+            usage = self.globals_usage.get(offset)
+            if usage and usage.name:
+                display_names.setdefault(usage.name, new_name)
+
+        types: Dict[str, str] = {}
+        for target, new_type in self.type_overrides.items():
+            if target.startswith("global:"):
+                name = display_names.get(target[7:], target[7:])
+            elif target.startswith("local:"):
+                parts = target.split(":", 2)
+                if len(parts) != 3 or parts[1] != func_name:
+                    continue
+                name = parts[2]
+            else:
+                continue
+            if (name in types or name in BASE_TYPES or not _IDENTIFIER.fullmatch(name)
+                    or not _IDENTIFIER.fullmatch(new_type)):
+                return None
+            types[name] = new_type
+        if any(new_type in types for new_type in types.values()):
+            return None
+        return types
+
+    def _invalidate_renamed(self, renames_before: Dict[str, str]) -> None:
+        """Re-render the functions whose text a global/function rename changes."""
+        self._renames = None
+        renames_after = self._shared_renames()
+        if all(_IDENTIFIER.fullmatch(name) for step in self._rename_steps() for name in step):
+            tokens = changed_tokens(renames_before, renames_after)
+            self._render_cache.invalidate_rendered(self._render_cache.structured_users(tokens))
+        else:
+            self._render_cache.invalidate_rendered(start for start, _end in self.func_bounds.values())
+
+    def _invalidate_rendered_function(self, func_name: str) -> None:
+        """Re-render one function after a local rename or type override."""
+        bounds = self.func_bounds.get(func_name)
+        if bounds is not None:
+            self._render_cache.invalidate_rendered([bounds[0]])
+
+    def _invalidate_global_type(self, var_name: str) -> None:
+        """Re-structure the users of a global whose type was overridden."""
+        cache = self._render_cache
+        names = {var_name}
+        for offset, usage in self.globals_usage.items():
+            current_name = self.global_renames.get(offset, usage.name)
+            if current_name == var_name or usage.name == var_name:
+                names.update(name for name in (usage.name, current_name) if name)
+                cache.invalidate_structured(
+                    self._xref_index().global_ref_functions(offset)
+                    | cache.structured_users([usage.name or f"data_{offset // 4}"])
+                )
+                break
+        # The declaration retyping keys on the displayed name
+        cache.invalidate_rendered(cache.rendered_users(names))
+
     def _apply_overrides(self, text: str, func_name: str) -> str:
         """Apply user renames and type overrides to rendered C code."""
         # Global renames
@@ -0,0 +1,294 @@
+"""Background analysis and speculative decompilation for MCP sessions.
+
+scr_open only loads the binary and detects functions. SSA construction and
+global analysis then run on a WarmupScheduler worker, followed by
+speculative decompilation of every function, most-called first. A request
+for a function that is being decompiled waits for that work; one that is
+still queued is computed on the request thread instead. Callees of a
+requested function move to the front of the queue.
+
+Work on one session is serialized by the session lock (SCRSession._lock),
+so extra workers only help when several files are open. Analysis and
+decompilation also hold the mission header they were built with (see
+session._MissionHeader), so files from different mission folders take turns.
+
+A WarmSession can also drop its analysis state (evict(), see pool.py) and
+rebuild it on the next access, keeping its user annotations.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .session import LoadedBinary, SCRSession
+
+# Task priorities (lower runs first)
+URGENT = 0        # analysis of a newly opened file
+RECENT = 1        # callees of a recently requested function
+SPECULATIVE = 2   # warm-up, in call-graph centrality order
+
+
+class _Task:
+    """A scheduled callable and the future receiving its result."""
+
+    __slots__ = ("fn", "future", "priority")
+
+    def __init__(self, fn: Callable[[], object], priority: int):
+        self.fn = fn
+        self.future: Future = Future()
+        self.priority = priority
+
+
+class WarmupScheduler:
+    """Priority queue of background tasks served by daemon worker threads."""
+
+    def __init__(self, workers: int = 1):
+        self.workers = max(1, workers)
+        self._heap: List[Tuple[int, int, _Task]] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._threads: List[threading.Thread] = []
+
+    def submit(self, fn: Callable[[], object], priority: int = SPECULATIVE) -> _Task:
+        """Queue fn; its result (or exception) is delivered via task.future."""
+        task = _Task(fn, priority)
+        with self._cond:
+            heapq.heappush(self._heap, (priority, next(self._seq), task))
+            self._start_workers()
+            self._cond.notify()
+        return task
+
+    def promote(self, task: _Task, priority: int) -> None:
+        """Move a queued task up to priority (no-op if it already ranks higher)."""
+        with self._cond:
+            if task.future.done() or task.future.running() or priority >= task.priority:
+                return
+            task.priority = priority
+            # The old heap entry goes stale and is skipped when popped
+            heapq.heappush(self._heap, (priority, next(self._seq), task))
+            self._cond.notify()
+
+    def cancel(self, task: _Task) -> bool:
+        """Cancel a task that has not started; False if running or finished."""
+        return task.future.cancel()
+
+    def queued(self) -> int:
+        """Number of tasks waiting to run."""
+        with self._cond:
+            return sum(
+                1 for priority, _seq, task in self._heap
+                if priority == task.priority and not task.future.done()
+                and not task.future.running()
+            )
+
+    def _start_workers(self) -> None:
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(
+                target=self._work, name=f"vcdecomp-warmup-{len(self._threads)}", daemon=True
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                while not self._heap:
+                    self._cond.wait()
+                priority, _seq, task = heapq.heappop(self._heap)
+                if priority != task.priority:
+                    continue  # superseded by promote()
+                if not task.future.set_running_or_notify_cancel():
+                    continue  # cancelled
+            try:
+                result = task.fn()
+            except BaseException as e:
+                task.future.set_exception(e)
+            else:
+                task.future.set_result(result)
+
+
+class WarmSession:
+    """An opened file whose analysis and decompilation proceed in the background."""
+
+    def __init__(self, handle: str, binary: LoadedBinary, scheduler: WarmupScheduler,
+                 speculative: bool = True):
+        self.handle = handle
+        self.binary = binary
+        self.speculative = speculative
+        self.analysis_seconds: Optional[float] = None
+        self.evictions = 0
+        self.reloads = 0
+        self._scheduler = scheduler
+        self._functions: Dict[str, _Task] = {}
+        self._closed = False
+        self._state_lock = threading.Lock()  # guards eviction and reload
+        self._analysis: Optional[_Task] = scheduler.submit(self._analyze, URGENT)  # None while evicted
+        self._annotations: Optional[dict] = None  # user annotations kept across eviction
+
+    @property
+    def path(self) -> str:
+        return self.binary.path
+
+    @property
+    def ready(self) -> bool:
+        """True once analysis finished successfully (and was not evicted since)."""
+        analysis = self._analysis
+        if analysis is None:
+            return False
+        future = analysis.future
+        return future.done() and not future.cancelled() and future.exception() is None
+
+    @property
+    def evicted(self) -> bool:
+        return self._analysis is None
+
+    def session(self, timeout: Optional[float] = None) -> SCRSession:
+        """The analyzed session, waiting for the analysis if needed.
+
+        An evicted session is rebuilt first. Raises whatever the analysis raised.
+        """
+        with self._state_lock:
+            if self._analysis is None:
+                self.reloads += 1
+                self._analysis = self._scheduler.submit(self._reload, URGENT)
+            analysis = self._analysis
+        return analysis.future.result(timeout)
+
+    def footprint(self) -> int:
+        """Approximate bytes held by the analysis state (0 unless ready)."""
+        analysis = self._analysis
+        if analysis is None or not self.ready:
+            return 0
+        return analysis.future.result().memory_footprint()
+
+    def evict(self) -> bool:
+        """Drop the analysis state and caches, keeping metadata and annotations.
+
+        The next session() call rebuilds the state, from the persistent cache
+        when the file was opened with one. False if there is nothing to drop.
+        """
+        with self._state_lock:
+            if not self.ready:
+                return False
+            for task in self._functions.values():
+                self._scheduler.cancel(task)
+            session = self._analysis.future.result()
+            with session._lock:
+                self._annotations = session.annotations()
+                self.binary = LoadedBinary(
+                    path=self.path,
+                    state={"func_bounds": dict(session.func_bounds)},
+                    cache=self.binary.cache,
+                    cache_key=self.binary.cache_key,
+                    header_path=self.binary.header_path,
+                )
+            self._functions = {}
+            self._analysis = None
+            self.evictions += 1
+        return True
+
+    def decompile(self, func_name: str) -> str:
+        """Decompile a function, reusing speculative work where possible."""
+        session = self.session()
+        task = self._functions.get(func_name)
+        if task is not None and not self._scheduler.cancel(task):
+            # Running or finished: wait instead of structuring it twice
+            try:
+                task.future.result()
+            except Exception:
+                pass  # Recomputed below, which reports the error
+        # Served from the session render cache unless a rename invalidated it since
+        text = session.decompile_func(func_name)
+
+        try:
+            callees = session.get_callees(func_name)["calls"]
+        except ValueError:
+            callees = []
+        for callee in callees:
+            callee_task = self._functions.get(callee)
+            if callee_task is not None:
+                self._scheduler.promote(callee_task, RECENT)
+        return text
+
+    def close(self) -> None:
+        """Drop all queued work for this session."""
+        self._closed = True
+        if self._analysis is not None:
+            self._scheduler.cancel(self._analysis)
+        for task in self._functions.values():
+            self._scheduler.cancel(task)
+
+    def status(self) -> dict:
+        """Warm-up progress of this session."""
+        analysis = self._analysis
+        future = analysis.future if analysis is not None else None
+        if future is None:
+            state = "evicted"
+        elif future.cancelled():
+            state = "closed"
+        elif future.running():
+            state = "analyzing"
+        elif not future.done():
+            state = "queued"
+        elif future.exception() is not None:
+            state = "error"
+        else:
+            state = "ready"
+
+        tasks = list(self._functions.values())
+        decompiled = failed = on_demand = 0
+        for task in tasks:
+            if task.future.cancelled():
+                on_demand += 1
+            elif task.future.done():
+                if task.future.exception() is None:
+                    decompiled += 1
+                else:
+                    failed += 1
+        finished = decompiled + failed + on_demand
+
+        status = {
+            "handle": self.handle,
+            "path": self.path,
+            "state": state,
+            "analysis_seconds": self.analysis_seconds,
+            "function_count": len(self.binary.func_bounds),
+            "speculative": self.speculative,
+            "evictions": self.evictions,
+            "reloads": self.reloads,
+            "decompiled": decompiled,
+            "failed": failed,
+            "on_demand": on_demand,
+            "pending": len(tasks) - finished,
+            "progress": round(finished / len(tasks), 3) if tasks else (1.0 if state in ("ready", "evicted") else 0.0),
+        }
+        if state == "error":
+            status["error"] = f"{type(future.exception()).__name__}: {future.exception()}"
+        return status
+
+    def _analyze(self) -> SCRSession:
+        start = time.perf_counter()
+        session = SCRSession.from_binary(self.binary, handle=self.handle)
+        self.analysis_seconds = round(time.perf_counter() - start, 3)
+        if self.speculative and not self._closed:
+            self._functions = {
+                name: self._scheduler.submit(
+                    lambda name=name: session.decompile_func(name), SPECULATIVE
+                )
+                for name in session.functions_by_centrality()
+            }
+        return session
+
+    def _reload(self) -> SCRSession:
+        """Rebuild the state of an evicted session (no speculative warm-up)."""
+        start = time.perf_counter()
+        binary = SCRSession.load_binary(self.path, use_cache=self.binary.cache is not None)
+        session = SCRSession.from_binary(binary, handle=self.handle, annotations=self._annotations)
+        self.binary = binary
+        self.analysis_seconds = round(time.perf_counter() - start, 3)
+        return session
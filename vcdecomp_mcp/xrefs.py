@@ -0,0 +1,161 @@
+"""Cross-reference index over a session's SSA: globals, calls and XFN calls."""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Global variable aliases produced by SSA construction: data_N / &data_N
+_DATA_ALIAS = re.compile(r'&?data_(0|[1-9][0-9]*)$')
+
+# (sequence number in program scan order, function start, address, mnemonic)
+Site = Tuple[int, int, int, str]
+
+
+class XrefIndex:
+    """Use sites of globals, functions and XFNs, built in one pass over the SSA.
+
+    Sites and call edges are keyed by stable identities (function start
+    addresses, global dword indices, XFN names), so renames only touch the
+    name maps: rename_function() and rename_global() are cheap incremental
+    updates. Lookups return sites in program scan order.
+    """
+
+    def __init__(self, ssa_func, func_bounds: Dict[str, Tuple[int, int]], scr,
+                 global_names: Iterable[Tuple[int, Optional[str]]]):
+        """
+        Args:
+            ssa_func: SSAFunction of the whole program
+            func_bounds: function name -> (start, end) address
+            scr: SCRFile (for XFN names)
+            global_names: (offset, current name) of every global, in resolver order
+        """
+        # Function start -> current name (first function with that start)
+        self._func_names: Dict[int, str] = {}
+        for name, (start, _end) in func_bounds.items():
+            self._func_names.setdefault(start, name)
+
+        self._calls_to: Dict[int, List[Site]] = {}        # call target address -> sites
+        self._xcalls_to: Dict[str, List[Site]] = {}       # XFN name -> sites
+        self._global_refs: Dict[int, List[Site]] = {}     # global dword index -> sites
+        self._callees: Dict[int, Set[int]] = {}           # function start -> call targets
+        self._callers: Dict[int, Set[int]] = {}           # call target -> calling function starts
+        self._xcallees: Dict[int, Set[str]] = {}          # function start -> XFN names
+
+        # Global name -> offsets in resolver order (first one wins on lookup)
+        self._global_order: Dict[int, int] = {}
+        self._global_offsets: Dict[str, List[int]] = {}
+        for position, (offset, name) in enumerate(global_names):
+            self._global_order[offset] = position
+            if name is not None:
+                self._global_offsets.setdefault(name, []).append(offset)
+
+        self._build(ssa_func, func_bounds, scr)
+
+    def _build(self, ssa_func, func_bounds, scr) -> None:
+        sorted_funcs = sorted((start, end) for start, end in func_bounds.values())
+        starts = [start for start, _end in sorted_funcs]
+        blocks = ssa_func.cfg.blocks
+        xfn_names: Dict[int, Optional[str]] = {}
+        seq = 0
+
+        for block_id, instrs in ssa_func.instructions.items():
+            block = blocks.get(block_id)
+            if block is None:
+                continue
+            idx = bisect.bisect_right(starts, block.start) - 1
+            if idx < 0 or block.start > sorted_funcs[idx][1]:
+                continue
+            func_start = sorted_funcs[idx][0]
+
+            for inst in instrs:
+                site = (seq, func_start, inst.address, inst.mnemonic)
+                seq += 1
+                raw = inst.instruction.instruction if inst.instruction else None
+
+                if inst.mnemonic == "CALL" and raw:
+                    self._calls_to.setdefault(raw.arg1, []).append(site)
+                    self._callees.setdefault(func_start, set()).add(raw.arg1)
+                    self._callers.setdefault(raw.arg1, set()).add(func_start)
+                elif inst.mnemonic == "XCALL" and raw:
+                    if raw.arg1 not in xfn_names:
+                        entry = scr.get_xfn(raw.arg1)
+                        xfn_names[raw.arg1] = entry.name.split("(")[0] if entry else None
+                    xfn_name = xfn_names[raw.arg1]
+                    if xfn_name is not None:
+                        self._xcalls_to.setdefault(xfn_name, []).append(site)
+                        self._xcallees.setdefault(func_start, set()).add(xfn_name)
+
+                referenced = set()
+                for val in list(inst.inputs) + list(inst.outputs):
+                    if val is not None and val.alias:
+                        match = _DATA_ALIAS.match(val.alias)
+                        if match:
+                            referenced.add(int(match.group(1)))
+                for dword in referenced:
+                    self._global_refs.setdefault(dword, []).append(site)
+
+    # --- Renames ---
+
+    def rename_function(self, start: int, old_name: str, new_name: str) -> None:
+        """Record that the function starting at start was renamed."""
+        if self._func_names.get(start) == old_name:
+            self._func_names[start] = new_name
+
+    def rename_global(self, offset: int, old_name: Optional[str], new_name: str) -> None:
+        """Record that the global at offset was renamed from old_name."""
+        if old_name is not None:
+            offsets = self._global_offsets.get(old_name, [])
+            if offset in offsets:
+                offsets.remove(offset)
+                if not offsets:
+                    del self._global_offsets[old_name]
+        offsets = self._global_offsets.setdefault(new_name, [])
+        order = [self._global_order.get(off, len(self._global_order)) for off in offsets]
+        position = bisect.bisect(order, self._global_order.get(offset, len(self._global_order)))
+        offsets.insert(position, offset)
+
+    # --- Queries ---
+
+    def global_offset(self, name: str) -> Optional[int]:
+        """Offset of the (first) global currently named name."""
+        offsets = self._global_offsets.get(name)
+        return offsets[0] if offsets else None
+
+    def calls_to(self, func_start: int) -> List[dict]:
+        """CALL sites targeting the function starting at func_start."""
+        return self._to_dicts(self._calls_to.get(func_start, ()))
+
+    def xcalls_to(self, xfn_name: str) -> List[dict]:
+        """XCALL sites of every XFN whose name contains xfn_name."""
+        matching = [sites for name, sites in self._xcalls_to.items() if xfn_name in name]
+        return self._to_dicts(heapq.merge(*matching))
+
+    def global_refs(self, offset: int) -> List[dict]:
+        """Instructions referencing the global at byte offset."""
+        return self._to_dicts(self._global_refs.get(offset // 4, ()))
+
+    def global_ref_functions(self, offset: int) -> Set[int]:
+        """Starts of the functions referencing the global at byte offset."""
+        return {func_start for _seq, func_start, _addr, _mn in self._global_refs.get(offset // 4, ())}
+
+    def callees(self, func_start: int) -> Tuple[List[str], List[str]]:
+        """Sorted (called function names, called XFN names) of a function."""
+        calls = {
+            self._func_names[target]
+            for target in self._callees.get(func_start, ())
+            if target in self._func_names
+        }
+        return sorted(calls), sorted(self._xcallees.get(func_start, ()))
+
+    def caller_count(self, func_start: int) -> int:
+        """Number of distinct functions calling the function at func_start."""
+        return len(self._callers.get(func_start, ()))
+
+    def _to_dicts(self, sites: Iterable[Site]) -> List[dict]:
+        return [
+            {"func": self._func_names[func_start], "addr": addr, "mnemonic": mnemonic}
+            for _seq, func_start, addr, mnemonic in sites
+        ]